@@ -46,17 +46,17 @@ from . import response_common #  noqa: E402
 __all__.extend(exporting(response_common, ...))
 from .response_common import *  #  noqa: F403, E402
 
+## model classes will be imported on demand, at first access to each name
+## in this module or in the models package
 from . import models  #  noqa: E402
-__all__.extend(exporting(models, ...))
-from .models import *  #  noqa: F403, E402
+__all__.extend(models.__all__)
 
 from . import exceptions  #  noqa: E402
 __all__.extend(exporting(exceptions, ...))
 from .exceptions import *  #  noqa: F403, E402
 
+## classes in the api package will be imported on demand
 from . import api  #  noqa: E402
-__all__.extend(exporting(api, ...))
-from .api import *  #  noqa: F403, E402
 
 from . import api_client  #  noqa: E402
 __all__.extend(exporting(api_client, ...))
@@ -71,3 +71,7 @@ __all__.extend(exporting(config_manager, ...))
 from .config_manager import *  #  noqa: F403, E402
 
 __all__ = tuple(__all__)  # type: ignore
+
+from .util.imports import lazy_imports  # noqa: E402
+
+__getattr__, __dir__ = lazy_imports(__name__, {name: ".models" for name in models.__all__})
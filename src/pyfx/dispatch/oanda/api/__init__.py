@@ -1,14 +1,20 @@
 ## pyfx.dispatch.oanda.api
 
-from ..util import exporting
+from collections.abc import Mapping
+from immutables import Map
 
-from . import default_api  # noqa: E402
-__all__ = exporting(default_api, ...)
-from .default_api import *  # noqa: F403, E402
+from ..util.imports import lazy_imports
 
-from ..models import price_component  # noqa: E402
-__all__ = exporting(price_component, ...)
-from ..models.price_component import *  # noqa: F403, E402
+## names will be imported on demand, at first access to each name in this module
+API_IMPORTS: Mapping[str, str] = Map({
+    "ApiController": ".default_api",
+    "DefaultApi": ".default_api",
+    "DT_ORDINAL_ONE": ".default_api",
+    "validate_request": ".default_api",
+    "PriceComponent": "..models.price_component",
+    "PriceComponentType": "..models.price_component",
+})
 
-__all__ = tuple(__all__)  # type: ignore
+__getattr__, __dir__ = lazy_imports(__name__, API_IMPORTS)
 
+__all__ = tuple(API_IMPORTS.keys())  # type: ignore
@@ -0,0 +1,273 @@
+"""Client-side request rate limiting for the v20 API
+
+Each request will acquire a token from a token bucket for the request's host
+before the request is sent. When no token is available, the request will wait
+in a priority lane for the host. A waiting request in a higher-priority lane
+will receive the next available token before any request waiting in a
+lower-priority lane, such that e.g order requests will preempt bulk requests
+for historical data.
+
+For a request rate ceiling `rate` and a burst size `burst`, each bucket will
+hold at most `burst` tokens and will be refilled at `rate - burst` tokens per
+second. Thus, no more than `rate` requests will be sent to a host within any
+one-second interval.
+"""
+
+import asyncio as aio
+from collections import deque
+from enum import IntEnum
+import logging
+import time
+from typing import Mapping, Optional
+
+from ..util.aio import await_future, safe_running_loop
+from ..util.naming import exporting
+
+logger = logging.getLogger(__name__)
+
+
+class RequestPriority(IntEnum):
+    """Priority lane for a rate-limited request
+
+    Lower values denote a higher priority
+    """
+
+    HIGH = 0
+    """Order placement, order cancellation, and position or trade closes"""
+
+    NORMAL = 1
+    """Account state and pricing requests"""
+
+    BULK = 2
+    """Bulk requests for historical data, e.g candlestick requests"""
+
+
+class TokenBucket:
+    """Token bucket for a request rate ceiling
+
+    This class is not thread-safe
+    """
+
+    __slots__ = ("rate", "capacity", "tokens", "stamp")
+
+    rate: float
+    """Refill rate, in tokens per second"""
+
+    capacity: float
+    """Maximum number of tokens in the bucket"""
+
+    tokens: float
+    """Number of tokens at the time of `stamp`"""
+
+    stamp: float
+    """Monotonic time of the last refill"""
+
+    def __init__(self, rate: float, capacity: float):
+        if __debug__:
+            if rate <= 0 or capacity < 1:
+                raise AssertionError("Invalid token bucket parameters", rate, capacity)
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.stamp = time.monotonic()
+
+    @classmethod
+    def for_ceiling(cls, rate: float, burst: int = 1) -> "TokenBucket":
+        """Return a token bucket such that will not exceed `rate` requests in any one-second interval"""
+        burst = max(1, min(burst, int(rate) - 1)) if rate > 1 else 1
+        return cls(rate - burst if rate > burst else rate, burst)
+
+    def refill(self, now: float):
+        tokens = self.tokens + (now - self.stamp) * self.rate
+        self.tokens = tokens if tokens < self.capacity else self.capacity
+        self.stamp = now
+
+    def take(self, now: float) -> float:
+        """Take one token from the bucket if available, returning zero. Else, return
+        the time in seconds until one token will be available."""
+        self.refill(now)
+        ## allowing for rounding error in the refill computation
+        if self.tokens >= 1 - 1e-9:
+            self.tokens -= 1
+            return 0.0
+        return (1 - self.tokens) / self.rate
+
+
+class WaitStats:
+    """Wait time statistics, for one priority lane"""
+
+    __slots__ = ("requests", "delayed", "total_wait", "max_wait")
+
+    requests: int
+    """Number of requests that acquired a token"""
+
+    delayed: int
+    """Number of requests that waited for a token"""
+
+    total_wait: float
+    """Total wait time for all requests, in seconds"""
+
+    max_wait: float
+    """Maximum wait time for any request, in seconds"""
+
+    def __init__(self):
+        self.requests = 0
+        self.delayed = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    @property
+    def mean_wait(self) -> float:
+        return self.total_wait / self.requests if self.requests else 0.0
+
+    def add(self, wait: float):
+        self.requests += 1
+        if wait > 0:
+            self.delayed += 1
+            self.total_wait += wait
+            if wait > self.max_wait:
+                self.max_wait = wait
+
+    def __repr__(self) -> str:
+        return "<%s %d requests, %d delayed, mean %.4fs max %.4fs>" % (
+            self.__class__.__name__, self.requests, self.delayed, self.mean_wait, self.max_wait
+        )
+
+
+class HostRateLimit:
+    """Token bucket and priority lanes for requests to one host
+
+    Instances are bound to a single event loop
+    """
+
+    __slots__ = ("host", "bucket", "lanes", "stats", "pump")
+
+    host: str
+
+    bucket: TokenBucket
+
+    lanes: tuple[deque[aio.Future], ...]
+    """Waiting requests, for each RequestPriority"""
+
+    stats: tuple[WaitStats, ...]
+    """Wait time statistics, for each RequestPriority"""
+
+    pump: Optional[aio.Task]
+    """Task releasing waiting requests, if any request is waiting"""
+
+    def __init__(self, host: str, bucket: TokenBucket):
+        self.host = host
+        self.bucket = bucket
+        self.lanes = tuple(deque() for _ in RequestPriority)
+        self.stats = tuple(WaitStats() for _ in RequestPriority)
+        self.pump = None
+
+    def waiting(self, priority: RequestPriority = RequestPriority.BULK) -> int:
+        """Return the number of requests waiting at or above the priority"""
+        return sum(len(lane) for lane in self.lanes[:priority + 1])
+
+    async def acquire(self, priority: RequestPriority = RequestPriority.NORMAL) -> float:
+        """Wait for a token for one request, returning the wait time in seconds"""
+        start = time.monotonic()
+        if not self.waiting(priority) and self.bucket.take(start) == 0:
+            self.stats[priority].add(0.0)
+            return 0.0
+        waiter = aio.get_running_loop().create_future()
+        self.lanes[priority].append(waiter)
+        if self.pump is None:
+            self.pump = aio.ensure_future(self.release_waiters())
+        await waiter
+        wait = time.monotonic() - start
+        self.stats[priority].add(wait)
+        if __debug__:
+            logger.debug("Request to %s waited %.4fs at priority %s", self.host, wait, priority.name)
+        return wait
+
+    def next_waiter(self) -> Optional[deque[aio.Future]]:
+        ## return the highest-priority lane with a waiting request, removing any
+        ## cancelled waiters
+        for lane in self.lanes:
+            while lane and lane[0].done():
+                lane.popleft()
+            if lane:
+                return lane
+        return None
+
+    async def release_waiters(self):
+        ## release waiting requests in priority order, as tokens become available.
+        ##
+        ## the lanes will be checked again after each delay, such that a request
+        ## added to a higher-priority lane will receive the next token
+        try:
+            while True:
+                lane = self.next_waiter()
+                if lane is None:
+                    return
+                delay = self.bucket.take(time.monotonic())
+                if delay:
+                    await aio.sleep(delay)
+                    continue
+                lane.popleft().set_result(None)
+        finally:
+            self.pump = None
+
+    def __repr__(self) -> str:
+        return "<%s %s %.1f/s waiting %d at 0x%x>" % (
+            self.__class__.__name__, self.host, self.bucket.rate, self.waiting(), id(self)
+        )
+
+
+class RateLimiter:
+    """Client-side request rate limiter, with a token bucket for each host
+
+    All token buckets will be managed within the provided event loop. Requests
+    from other event loops will be scheduled in that loop.
+    """
+
+    __slots__ = ("loop", "rate", "burst", "host_rates", "hosts")
+
+    loop: aio.AbstractEventLoop
+
+    rate: float
+    """Default request rate ceiling, in requests per second"""
+
+    burst: int
+    """Maximum number of requests to send without delay, in each bucket"""
+
+    host_rates: Mapping[str, float]
+    """Request rate ceiling for individual hosts, overriding the default rate"""
+
+    hosts: dict[str, HostRateLimit]
+
+    def __init__(self, loop: aio.AbstractEventLoop, rate: float, burst: int = 1,
+                 host_rates: Optional[Mapping[str, float]] = None):
+        self.loop = loop
+        self.rate = rate
+        self.burst = burst
+        self.host_rates = host_rates or {}
+        self.hosts = {}
+
+    def get_host_limit(self, host: str) -> HostRateLimit:
+        limit = self.hosts.get(host, None)
+        if limit is None:
+            rate = self.host_rates.get(host, self.rate)
+            limit = HostRateLimit(host, TokenBucket.for_ceiling(rate, self.burst))
+            self.hosts[host] = limit
+        return limit
+
+    async def acquire(self, host: str, priority: RequestPriority = RequestPriority.NORMAL) -> float:
+        """Wait for a token for one request to the host, returning the wait time in seconds"""
+        loop = self.loop
+        if safe_running_loop() is loop:
+            return await self.get_host_limit(host).acquire(priority)
+        ## the request is dispatched from another thread
+        cf = aio.run_coroutine_threadsafe(self.get_host_limit(host).acquire(priority), loop)
+        return await await_future(cf)
+
+    def wait_stats(self, host: str) -> Mapping[RequestPriority, WaitStats]:
+        """Return the wait time statistics for requests to the host, for each priority"""
+        limit = self.get_host_limit(host)
+        return {priority: limit.stats[priority] for priority in RequestPriority}
+
+
+__all__ = exporting(__name__, ...)
@@ -0,0 +1,38 @@
+## pyfx.dispatch.oanda.api.request
+
+from collections.abc import Mapping
+from immutables import Map
+import sys
+
+from ...util.imports import lazy_imports
+
+## request classes will be imported on demand, at first access to each name in this module
+REQUEST_IMPORTS: Mapping[str, str] = Map({
+    "GetAccountRequest": ".get_account",
+    "GetAccountSummaryRequest": ".get_account_summary",
+    "GetAccountInstrumentsRequest": ".get_account_instruments",
+    "GetInstrumentCandlesRequest": ".get_instrument_candles",
+    "GetAccountInstrumentCandlesRequest": ".get_instrument_candles",
+    "GetLatestQuotesRequest": ".get_instrument_candles",
+    "CandleSpec": ".get_instrument_candles",
+    "ListAcccountsRequest": ".list_accounts",
+    "ListOpenTradesRequest": ".list_open_trades",
+    "ListTradesRequest": ".list_trades",
+    "StreamPricingRequest": ".stream_pricing",
+})
+
+__getattr__, __dir__ = lazy_imports(__name__, REQUEST_IMPORTS)
+
+
+def load_requests():
+    """Import all request classes
+
+    This will be called before the transport types repository is finalized, such that
+    a transport type will be defined for each request field.
+    """
+    module = sys.modules[__name__]
+    for name in REQUEST_IMPORTS.keys():
+        getattr(module, name)
+
+
+__all__ = tuple(REQUEST_IMPORTS.keys())  # type: ignore
@@ -27,6 +27,9 @@ class GetAccountInstrumentsRequest(ApiRestRequest[GetAccountInstruments200Respon
     request_path: ClassVar[str] = '/accounts/{accountID}/instruments'
     response_types: Mapping[int, ApiClass] = SingularMap(200, GetAccountInstruments200Response)
 
+    ## instrument definitions for an account change rarely
+    cache_ttl: ClassVar[Optional[float]] = 3600
+
     account_id: Annotated[AccountId, path_param(..., alias="accountID")]
 
     instruments: Annotated[Optional[list[InstrumentName]], query_param(None)]
@@ -1,24 +1,31 @@
 """Request dispatch for GetInstrumentCandles200Response"""
 
 from abc import ABC
+import asyncio as aio
 from collections.abc import Collection
 from datetime import datetime
 from itertools import chain
 from click.core import Context as Context
 from functools import partial
+import sys
 from pandas import Timestamp, Period, NaT
 
-from typing import Annotated, Iterator, Mapping, Optional, Union
+from typing import Annotated, Awaitable, Iterator, Mapping, Optional, Union
 from typing_extensions import TYPE_CHECKING, Self, ClassVar, TypeAlias
 
 
+from ...util.cofuture import CoFuture
 from ...util.naming import exporting
 from ...util.singular_map import SingularMap
 
-from ...api.request_base import ApiRestRequest, T_request_co
+from ...api.request_base import ApiRestRequest, T_request_co, set_future_exception, set_future_result
+from ...api.rate_limit import RequestPriority
+from ...candle_columns import CandleColumns, CandleColumnsBuilder
+from ...parser import InstanceBuilder
 from ...request_constants import RequestMethod
 from ..param_info import ParamInterface, ParamValues
-from ...transport.data import ApiClass
+from ...transport.data import ApiClass, ApiObject
+from ...transport.application_fields import application_field
 from ...models.get_instrument_candles200_response import GetInstrumentCandles200Response, GetAccountCandlesLatest200Response
 from ...models.candlestick import Candlestick
 from ...models.candlestick_granularity import CandlestickGranularity
@@ -118,10 +125,32 @@ class InstrumentQuotesRequest(QuotesRequest[GetInstrumentCandles200Response], AB
 
     response_types: ClassVar[Mapping[int, ApiClass]] = SingularMap(200, GetInstrumentCandles200Response)
 
+    ## historical candle requests will yield to other requests, under the client-side rate limit
+    request_priority: ClassVar[RequestPriority] = RequestPriority.BULK
+
     @classmethod
-    def response_iter(cls, response: GetInstrumentCandles200Response) -> Iterator[Candlestick]:
+    def response_iter(cls, response: Union[GetInstrumentCandles200Response, CandleColumns]) -> Iterator[Candlestick]:
         return response.candles
 
+    columnar: Annotated[
+        bool,
+        application_field(
+            False,
+            description="""If True, candles in the response will be decoded directly
+            to NumPy arrays, providing a CandleColumns object as the response value.
+
+            The CandleColumns object can produce a DataFrame with the same layout
+            as for `GetInstrumentCandles200Response.to_df()`
+            """
+        )]
+
+    coalesce_fields: ClassVar[tuple[str, ...]] = (*QuotesRequest.coalesce_fields, "columnar")
+
+    def get_response_builder(self, response_type: type[ApiObject]) -> InstanceBuilder:
+        if self.columnar and response_type is GetInstrumentCandles200Response:
+            return CandleColumnsBuilder(self.count, self.price)
+        return super().get_response_builder(response_type)
+
     #
     # additional path parameters
     #
@@ -229,6 +258,49 @@ class GetInstrumentCandlesRequest(InstrumentQuotesRequest):
     command_label: ClassVar[str] = "get_instrument_candles"
     request_path: ClassVar[str] = '/instruments/{instrument}/candles'
 
+    use_cache: Annotated[
+        bool,
+        application_field(
+            True,
+            description="""If True and a candle cache is configured for the request controller,
+            completed candles for a request with a `time_from` value and no `count` will be
+            read from the candle cache. Only the ranges of time not yet cached, and any
+            trailing incomplete candle, will be requested from the API.
+            """
+        )]
+
+    coalesce_fields: ClassVar[tuple[str, ...]] = (*InstrumentQuotesRequest.coalesce_fields, "use_cache")
+
+    def cacheable(self) -> bool:
+        """Return True if the response for this request can be served from the candle cache"""
+        fields = self.model_fields_set
+        return self.use_cache and self.time_from is not None and "time_from" in fields and \
+            "count" not in fields and self.response_fields is None
+
+    async def dispatch_request(self) -> Awaitable[CoFuture[GetInstrumentCandles200Response]]:
+        cache = getattr(self.controller, "candle_cache", None)
+        if cache is None or not self.cacheable():
+            return await super().dispatch_request()
+        ## localized import, avoiding a circular dependency
+        from ...candle_cache import fetch_cached
+        future = self.future
+        try:
+            columns = await fetch_cached(self, cache)
+        except aio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as exc:
+            set_future_exception(future, exc)
+            self.controller.present_exception(*sys.exc_info())
+        else:
+            if self.columnar:
+                set_future_result(future, columns)
+            else:
+                set_future_result(future, GetInstrumentCandles200Response.model_construct(
+                    instrument=columns.instrument, granularity=columns.granularity, candles=list(columns.candles)
+                ))
+        return future
+
 
 #
 # other quotes requests for the FxTrade API
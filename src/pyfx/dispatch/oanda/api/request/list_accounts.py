@@ -1,6 +1,6 @@
 """Request dispatch for ListAccounts200Response"""
 
-from typing import Iterator, Mapping
+from typing import Iterator, Mapping, Optional
 from typing_extensions import ClassVar
 
 from ...util.singular_map import SingularMap
@@ -18,6 +18,9 @@ class ListAcccountsRequest(ApiRestRequest[ListAccounts200Response, AccountProper
     request_path: ClassVar[str] = '/accounts'
     response_types: Mapping[int, ApiClass] = SingularMap(200, ListAccounts200Response)
 
+    ## account properties change rarely
+    cache_ttl: ClassVar[Optional[float]] = 3600
+
     @classmethod
     def response_iter(cls, response: ListAccounts200Response) -> Iterator[AccountProperties]:
         return response.accounts
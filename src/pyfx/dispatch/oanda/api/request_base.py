@@ -10,6 +10,7 @@ import click
 from collections import ChainMap
 import concurrent.futures as cofutures
 from contextlib import asynccontextmanager, contextmanager, suppress
+from enum import Enum
 from functools import partial
 import httpx
 import inspect
@@ -23,11 +24,13 @@ from pydantic import field_validator
 from queue import SimpleQueue, Empty
 import re
 import sys
+import threading
+import time
 import warnings
 
 from typing import (
     Annotated, Any, AsyncIterator, Awaitable, Callable,
-    Generator, Generic, Iterator, Literal,
+    Generator, Generic, Hashable, Iterator, Literal,
     Mapping, Optional, Union,
     TYPE_CHECKING
 )
@@ -35,16 +38,18 @@ from typing_extensions import ClassVar, Self, TypeAlias, TypeVar
 
 from ..finalizable import Finalizable
 from ..util.singular_map import SingularMap
-from ..util.aio import safe_running_loop, chain_cancel_callback, cancel_when_done
+from ..util.aio import safe_running_loop, safe_add_callback, chain_cancel_callback, cancel_when_done, await_future, wake_event
 from ..util.log import configure_logger
 from ..util.cofuture import CoFuture
 
 from ..configuration import FxHostInfo
 
 from ..api.transport_client import TransportClient
+from ..api.rate_limit import RequestPriority
+from ..api.response_cache import CacheEntry, ResponseCache
 from ..exceptions import ApiException
 from ..response_common import REST_CONTENT_TYPE
-from ..parser import ModelBuilder
+from ..parser import InstanceBuilder, ModelBuilder, get_projection, json_backend, parse_buffered, parse_lazy
 from ..io.segment import AsyncSegmentChannel, DataError
 
 from ..models.response_mixins import ApiResponse, ApiErrorResponse, UnknownErrorResponse
@@ -62,6 +67,9 @@ from ..mapped_enum import MappedEnum
 
 from .param_info import ParamInfo, PathParamInfo, QueryParamInfo, path_param, ParamTypesRepository
 
+if TYPE_CHECKING:
+    from ..candle_cache import CandleCache
+
 
 logger = logging.getLogger(__name__)
 
@@ -120,6 +128,24 @@ def set_future_result(future: aio.Future, result: Any) -> Optional[aio.Handle]:
             return loop.call_soon_threadsafe(future.set_result, result)
 
 
+def executor_call(main_loop: aio.AbstractEventLoop, func: Callable[..., Any], *args) -> aio.Future:
+    """Return a future for a blocking function call, e.g for file I/O.
+
+    Under the main loop, the call will be run in the default executor for the
+    loop, i.e the controller's executor. Under any other loop, e.g in a worker
+    thread, the call will be run directly, with the future completed before return.
+    """
+    loop = aio.get_running_loop()
+    if loop is main_loop:
+        return loop.run_in_executor(None, func, *args)
+    future = loop.create_future()
+    try:
+        future.set_result(func(*args))
+    except Exception as exc:
+        future.set_exception(exc)
+    return future
+
+
 #
 # Controller Base
 #
@@ -139,10 +165,42 @@ Response_contra = TypeVar("Response_contra", bound=ApiResponse, contravariant=Tr
 class RequestController(ExecController):
     ## Stateless request controller class for the v20 API
 
-    __slots__ = tuple(list(ExecController.__slots__) + ["rest_client"])
+    __slots__ = tuple(list(ExecController.__slots__) + ["rest_client", "trusted_parse",
+                                                         "coalesce_requests", "inflight_requests",
+                                                         "candle_cache", "response_cache"])
 
     rest_client: TransportClient
 
+    trusted_parse: bool
+    """If True, API responses will be parsed without model validation
+
+    This value will be initialized from the controller's configuration
+    """
+
+    coalesce_requests: bool
+    """If True, concurrent identical GET requests will share one HTTP request
+
+    This value will be initialized from the controller's configuration
+    """
+
+    inflight_requests: dict[Hashable, "ApiRestRequest"]
+    """In-flight REST requests, for each request coalescing key
+
+    see also: ApiRestRequest.coalesce_key()
+    """
+
+    candle_cache: Optional["CandleCache"]
+    """On-disk cache for completed candles, or None if no candle cache is configured
+
+    This value will be initialized from the controller's configuration
+    """
+
+    response_cache: Optional[ResponseCache]
+    """Conditional-request cache for REST responses, or None if no response cache is configured
+
+    This value will be initialized from the controller's configuration
+    """
+
     @classmethod
     def configure_loggers(cls):
         super().configure_loggers()
@@ -154,6 +212,22 @@ class RequestController(ExecController):
         super().initialize_defaults()
         if not hasattr(self, "rest_client"):
             self.rest_client = TransportClient(self)
+        if not hasattr(self, "trusted_parse"):
+            self.trusted_parse = self.config.trusted_parse
+        if not hasattr(self, "coalesce_requests"):
+            self.coalesce_requests = self.config.coalesce_requests
+        if not hasattr(self, "inflight_requests"):
+            self.inflight_requests = dict()
+        if not hasattr(self, "candle_cache"):
+            cache_dir = self.config.candle_cache_dir
+            if cache_dir:
+                from ..candle_cache import CandleCache
+                self.candle_cache = CandleCache(cache_dir)
+            else:
+                self.candle_cache = None
+        if not hasattr(self, "response_cache"):
+            cache_dir = self.config.response_cache_dir
+            self.response_cache = ResponseCache(cache_dir) if cache_dir else None
 
     class RequestBuilder(Finalizable, Generic[T_request_co]):
         __slots__ = "request_class", "request_args"
@@ -359,6 +433,106 @@ class RequestCommand(click.Command, Generic[T_request_co]):
 #
 PathTokens: TypeAlias = tuple[Union[bytes, ParamInfo]]
 
+QUERY_CACHE_SIZE: int = 256
+"""Maximum number of encoded values to store for each query parameter, in each request class"""
+
+
+class PathTemplate:
+    """Compiled request path, for a sequence of path tokens
+
+    The path will be represented as a fixed sequence of literal path segments,
+    with one segment before each path parameter and one trailing segment. Each
+    literal segment will include any '/' separators adjacent to the parameter.
+    """
+
+    __slots__ = ("segments", "params", "pairs")
+
+    segments: tuple[str, ...]
+    """Literal path segments, one more than the number of path parameters"""
+
+    params: tuple[ParamInfo, ...]
+    """Path parameters, in order of syntax in the request path"""
+
+    pairs: tuple[tuple[str, ParamInfo, str], ...]
+    """JSON name, parameter info, and trailing segment, for each path parameter"""
+
+    def __init__(self, tokens: PathTokens):
+        segments = []
+        params = []
+        text = ""
+        for n, token in enumerate(tokens):
+            if n:
+                text += "/"
+            if isinstance(token, str):
+                text += token
+            else:
+                if __debug__:
+                    if not isinstance(token, ParamInfo):
+                        raise AssertionError("Parameter token is not str or a ParamInfo object", token)
+                segments.append(text)
+                params.append(token)
+                text = ""
+        segments.append(text)
+        self.segments = tuple(segments)
+        self.params = tuple(params)
+        self.pairs = tuple((info.json_name, info, segments[n + 1]) for n, info in enumerate(params))
+
+    def fill(self, values: Optional[Mapping[str, Any]]) -> str:
+        """Return the request path for a mapping of JSON parameter names to values"""
+        path = self.segments[0]
+        for name, info, segment in self.pairs:
+            if __debug__:
+                if values is None or name not in values:
+                    raise AssertionError("No value provided for parameter", name, info, values)
+            path += info.unparse(values[name]) + segment  # type: ignore[index]
+        return path
+
+    def __repr__(self) -> str:
+        return "<%s %r>" % (self.__class__.__name__,
+                            "".join(chain.from_iterable(zip(self.segments, ["{" + p.json_name + "}" for p in self.params] + [""]))))
+
+
+def query_cache_key(value: Any) -> Optional[Hashable]:
+    """Return a key for memoized query encoding of a request parameter value, or None
+    if the value's encoding should not be memoized
+
+    Memoized encoding is supported for string and enum values, such as granularities,
+    and for lists and tuples of hashable values, such as instrument lists. Numeric and
+    timestamp values are inexpensive to encode or would generally differ across
+    requests, and will not be memoized.
+    """
+    vcls = value.__class__
+    if vcls is list or vcls is tuple:
+        key = tuple(value)
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        return key
+    elif vcls is str or isinstance(value, Enum):
+        return value
+    return None
+
+
+
+def encode_query_param(info: TransportFieldInfo, caches: dict[str, dict[Hashable, str]],
+                       name: str, value: Any) -> str:
+    ## return the URL query component for a parameter value, memoized in caches[name]
+    ## if supported for the value
+    key = query_cache_key(value)
+    if key is None:
+        return info.json_name + "=" + info.transport_type.unparse_url_str(value)
+    cache = caches.get(name, None)
+    if cache is None:
+        cache = caches.setdefault(name, dict())
+    encoded = cache.get(key, None)
+    if encoded is None:
+        encoded = info.json_name + "=" + info.transport_type.unparse_url_str(value)
+        if len(cache) >= QUERY_CACHE_SIZE:
+            cache.clear()
+        cache[key] = encoded
+    return encoded
+
 
 class ApiRequestClass(InterfaceClass, type):
     """Metaclass for ApiRequest definitions"""
@@ -378,6 +552,16 @@ class ApiRequestClass(InterfaceClass, type):
     """
     path_tokens: PathTokens
 
+    path_template: PathTemplate
+    """Compiled request path, produced from the `path_tokens` at class creation"""
+
+    query_cache: dict[str, dict[Hashable, str]]
+    """Memoized query string encoding for request parameter values, for this class.
+
+    For each query parameter field name, a mapping of `query_cache_key(value)` to
+    the URL query component for the value, `<json_name>=<encoded_value>`
+    """
+
     path_params: Optional[Map[str, ParamInfo]]
     """Parameters for the request path, if applicable.
 
@@ -584,8 +768,12 @@ class ApiRequestClass(InterfaceClass, type):
         new_cls.path_params = new_cls.simplify_param_model(new_cls.path_params)
         new_cls.query_params = new_cls.simplify_param_model(new_cls.query_params)
 
-        if hasattr(new_cls, "request_path") and not hasattr(new_cls, "path_tokens"):
+        if hasattr(new_cls, "request_path") and ("request_path" in attrs or not hasattr(new_cls, "path_tokens")):
             new_cls.path_tokens = tuple(new_cls.tokenize_path(new_cls.request_path))
+            new_cls.path_template = PathTemplate(new_cls.path_tokens)
+
+        ## not inherited, as query_params may differ in each subclass
+        new_cls.query_cache = dict()
 
         # using the param types repository, for request classes
         new_cls.types_repository = new_cls.default_types_repository()
@@ -641,6 +829,12 @@ class ApiRequest(InterfaceModel, ABC, Generic[T_response, T_value], metaclass=Ap
     path_tokens: ClassVar[PathTokens]
     """Metaclass instance attribute, described in {py:obj}`ApiRequestClass.path_tokens`"""
 
+    path_template: ClassVar[PathTemplate]
+    """Metaclass instance attribute, described in {py:obj}`ApiRequestClass.path_template`"""
+
+    query_cache: ClassVar[dict[str, dict[Hashable, str]]]
+    """Metaclass instance attribute, described in {py:obj}`ApiRequestClass.query_cache`"""
+
     path_params: ClassVar[Optional[Map[str, PathParamInfo]]]
     """Metaclass instance attribute, described in {py:obj}`ApiRequestClass.path_params`"""
 
@@ -659,6 +853,9 @@ class ApiRequest(InterfaceModel, ABC, Generic[T_response, T_value], metaclass=Ap
     command_label: ClassVar[str]
     """Metaclass instance attribute, described in {py:obj}`ApiRequestClass.command_label`"""
 
+    request_priority: ClassVar[RequestPriority] = RequestPriority.NORMAL
+    """Priority lane for requests of this class, under the client-side rate limit"""
+
     #
     # Common ApiRequest instance fields
     #
@@ -669,6 +866,17 @@ class ApiRequest(InterfaceModel, ABC, Generic[T_response, T_value], metaclass=Ap
     controller: Annotated[RequestController, application_field(...)]
     """Request controller for the API request"""
 
+    response_fields: Annotated[Any, application_field(None)]
+    """Field selection for the primary response type, or None to parse all fields
+
+    If provided, only the selected JSON fields will be parsed from each response
+    object of the primary response type, e.g for a GetAccountRequest
+
+        {"account": {"balance", "NAV", "lastTransactionID"}}
+
+    see also: parser.get_projection()
+    """
+
     host: Annotated[FxHostInfo, path_param(...)]
     """Destination host definition for the API request
 
@@ -738,7 +946,7 @@ class ApiRequest(InterfaceModel, ABC, Generic[T_response, T_value], metaclass=Ap
 
         this string will not include any generally optional query segment
         """
-        return "/".join(cls.process_param_str(token, values) for token in cls.path_tokens)
+        return cls.path_template.fill(values)
 
     @classmethod
     def path_values(cls, instance: Self) -> Optional[Mapping[str, Any]]:
@@ -800,12 +1008,19 @@ class ApiRequest(InterfaceModel, ABC, Generic[T_response, T_value], metaclass=Ap
           parameters
         """
         if values:
-            query_fields: Optional[Mapping[str, TransportFieldInfo]] = cls.query_params
-            if query_fields:
-                return "&".join(
-                    query_fields[name].json_name + "=" + query_fields[name].transport_type.unparse_url_str(value)
-                    for name, value in values.items()
-                )
+            params = cls.query_params
+            if params:
+                caches = cls.query_cache
+                return "&".join(encode_query_param(params[name], caches, name, value) for name, value in values.items())
+
+    @classmethod
+    def encode_query_param(cls, name: str, value: Any) -> str:
+        """Return the URL query component for a query parameter value
+
+        The encoding will be memoized in the class' `query_cache`, for
+        values supported under `query_cache_key()`
+        """
+        return encode_query_param(cls.query_params[name], cls.query_cache, name, value)  # type: ignore[index]
 
     #
     # Shell API support
@@ -990,8 +1205,62 @@ class ApiRequest(InterfaceModel, ABC, Generic[T_response, T_value], metaclass=Ap
     async def aeach_object(self, timeout: Union[int, float] = 0) -> AsyncIterator[T_value]:
         raise NotImplementedError(self.aeach_object)
 
+    def trusted_parse_p(self) -> bool:
+        """Return True if API responses for this request should be parsed without model validation
+
+        see also: RequestController.trusted_parse
+        """
+        ## the request may not be bound to a controller, e.g when constructed for tests
+        controller = getattr(self, "controller", None)
+        return controller.trusted_parse if controller else False
+
+    def get_response_builder(self, response_type: type[ApiObject]) -> InstanceBuilder:
+        """Return a parser builder for a response object of the provided response type
+
+        Derived classes may override this method, e.g to provide an alternate
+        decoding for the primary response type.
+        """
+        fields = self.response_fields
+        trusted = self.trusted_parse_p()
+        if fields is not None and response_type is self.primary_type:
+            return ModelBuilder(response_type, None, get_projection(fields), trusted)
+        return ModelBuilder(response_type, trusted=trusted)
+
+    def get_content_type(self, client_response: httpx.Response) -> Optional[str]:
+        """Return the media type from the Content-Type header of the client response, if provided"""
+        response_headers = client_response.headers
+        # Implementation Note
+        #
+        # The response header names will be received here as downcased,
+        # mainly in the syntax presented by the v20 API servers
+        #
+        content_info = response_headers["content-type"] if "content-type" in response_headers else None
+        return content_info.split(';', maxsplit=1)[0] if content_info else None
+
+    def get_unknown_response(self, client_response: httpx.Response, data: bytes,
+                             content_type: Optional[str]) -> UnknownErrorResponse:
+        """Return an UnknownErrorResponse for a response not of any expected response type
+
+        The response may have originated from a proxy server
+        """
+        status = client_response.status_code
+        charset = client_response.charset_encoding
+        content = data.decode(charset) if charset else data.decode()
+        if __debug__:
+            logger.warning(
+                "unexpected %s response %d (truncated) %r...",
+                content_type or "<content type undefined>",
+                status, content[:70]
+            )
+        return UnknownErrorResponse(
+            error_code=status,
+            reason=client_response.reason_phrase,
+            content_type=content_type,
+            content=content
+        )
+
     async def get_response_type(self, client_response: httpx.Response,
-                                stream: AsyncSegmentChannel[bytes]) -> Optional[Union[type[ApiObject], Literal[False]]]:
+                                stream: Optional[AsyncSegmentChannel[bytes]]) -> Optional[Union[type[ApiObject], Literal[False]]]:
         status = client_response.status_code
         if status == self.primary_status:
             return self.primary_type
@@ -1066,9 +1335,11 @@ class ApiRequest(InterfaceModel, ABC, Generic[T_response, T_value], metaclass=Ap
         if response_future.done():
             logger.critical("response future is closed: %r, %r", response_future, self)
             return
-        client = controller.rest_client.client
+        rest_client = controller.rest_client
+        client = rest_client.client
         main = controller.main_loop
         th_loop = aio.get_running_loop()
+        await rest_client.await_rate_limit(request, self.request_priority)
         coro = client.send(request, stream=True)
         if client.is_closed:
             raise RuntimeError("Client is closed", client, self)
@@ -1078,10 +1349,7 @@ class ApiRequest(InterfaceModel, ABC, Generic[T_response, T_value], metaclass=Ap
             # here, the request is probably initialized under a worker thread.
             cf = aio.run_coroutine_threadsafe(coro, main)
             chain_cancel_callback(response_future, cf)
-            interval = sys.getswitchinterval()
-            while not cf.done():
-                await aio.sleep(interval)
-            client_response = cf.result()
+            client_response = await await_future(cf)
         try:
             yield client_response
         finally:
@@ -1093,6 +1361,9 @@ class ApiRequest(InterfaceModel, ABC, Generic[T_response, T_value], metaclass=Ap
 
     async def dispatch_request(self) -> Awaitable[CoFuture[T_response]]:
         request = await self.prepare_request()
+        return await self.send_request(request)
+
+    async def send_request(self, request: httpx.Request) -> Awaitable[CoFuture[T_response]]:
         response_future = self.future
         async with self.request_stream(request) as client_response:
             proc_coro = self.process_response(client_response, request)
@@ -1192,21 +1463,15 @@ class ApiRequest(InterfaceModel, ABC, Generic[T_response, T_value], metaclass=Ap
         response_future = self.future
         try:
             response_type = await self.get_response_type(client_response, stream)
+            content_type = None
             if response_type is None:
-                response_headers = client_response.headers
-                # Implementation Note
-                #
-                # The response header names will be received here as downcased,
-                # mainly in the syntax presented by the v20 API servers
-                #
-                content_info = response_headers["content-type"] if "content-type" in response_headers else None
-                content_type = content_info.split(';', maxsplit=1)[0] if content_info else None
+                content_type = self.get_content_type(client_response)
                 if content_type == REST_CONTENT_TYPE:
                     # unexpected JSON formatted response
                     response_type = ApiErrorResponse
 
             if response_type:
-                builder = ModelBuilder(response_type)
+                builder = self.get_response_builder(response_type)
                 ## main parser - deserialize an object for a model class determined
                 ## per the server response status code
                 ##
@@ -1242,7 +1507,7 @@ class ApiRequest(InterfaceModel, ABC, Generic[T_response, T_value], metaclass=Ap
                         else:
                             # create a new builder for processing subsequent response objects,
                             # generally for a streaming endpoint
-                            builder = ModelBuilder(response_type)
+                            builder = self.get_response_builder(response_type)
             elif response_type is False:
                 await self.dispatch_response(False, client_response, initial_request)
                 return
@@ -1250,24 +1515,8 @@ class ApiRequest(InterfaceModel, ABC, Generic[T_response, T_value], metaclass=Ap
                 #
                 # not an expected server response and not a JSON response
                 #
-                # the response may have originated from a proxy server
-                #
-                status = client_response.status_code
                 data: bytes = await stream.read()
-                charset = client_response.charset_encoding
-                content = data.decode(charset) if charset else data.decode()
-                if __debug__:
-                    logger.warning(
-                        "parse_response_async: unexpected %s response %d (truncated) %r...",
-                        content_type or "<content type undefined>",
-                        status, content[:70]
-                    )
-                response = UnknownErrorResponse(
-                    error_code=status,
-                    reason=client_response.reason_phrase,
-                    content_type=content_type,
-                    content=content
-                )
+                response = self.get_unknown_response(client_response, data, content_type)
                 await self.dispatch_response(response, client_response, initial_request)
         except Exception:
             # parse failed, return
@@ -1280,11 +1529,251 @@ class ApiRequest(InterfaceModel, ABC, Generic[T_response, T_value], metaclass=Ap
 
 class ApiRestRequest(ApiRequest[T_response, T_value], ABC):
 
+    buffered_response_limit: ClassVar[int] = 65536
+    """Content length limit for REST responses to be parsed from a buffered response body
+
+    A response with a Content-Length header not greater than this limit will be read
+    with a single `aread()` call and parsed synchronously, within the event loop.
+    Other responses will be parsed from the response stream, in a worker thread.
+
+    If zero, all responses will be parsed from the response stream.
+    """
+
+    lazy_response: Annotated[bool, application_field(False)]
+    """If True, the primary response object will be parsed with lazy field materialization
+
+    The response body will be read completely. Nested objects and arrays in the
+    primary response object will then be parsed on first access, e.g for the
+    positions, orders, and trades of the account in a GetAccountRequest response.
+
+    see also: parser.parse_lazy()
+    """
+
     @classmethod
     @abstractmethod
     def response_iter(cls, response: T_response) -> Iterator[T_value]:
         raise NotImplementedError(cls.response_iter)
 
+    coalesce: ClassVar[bool] = True
+    """If True, concurrent GET requests of this class for the same request URL may share
+    one HTTP request and response object.
+
+    see also: RequestController.coalesce_requests
+    """
+
+    coalesce_fields: ClassVar[tuple[str, ...]] = ("lazy_response",)
+    """Application fields that may affect the response object for a request of this class
+
+    The value of each field will be included in the coalescing key for the request.
+    """
+
+    def coalesce_key(self, request: httpx.Request) -> Optional[Hashable]:
+        """Return a key for coalescing this request with identical in-flight requests, or
+        None if the request should not be coalesced
+
+        The key will represent the request class, method, host, path, and query string
+        for the request, with the value of each field in `coalesce_fields`. Requests with
+        a field selection in `response_fields` will not be coalesced.
+        """
+        cls = self.__class__
+        if cls.coalesce and cls.request_method is RequestMethod.GET and self.response_fields is None:
+            return (cls, request.method, str(request.url), *(getattr(self, name) for name in cls.coalesce_fields))
+        return None
+
+    def join_inflight(self, key: Hashable) -> Optional["ApiRestRequest"]:
+        """Return the in-flight request for the coalescing key, if the request's future
+        is not done. Else, register this request as the in-flight request for the key
+        and return None.
+        """
+        inflight = self.controller.inflight_requests
+        leader = inflight.setdefault(key, self)
+        if leader is not self:
+            if not leader.future.done():
+                return leader
+            ## a completed request, not yet released
+            inflight[key] = self
+        safe_add_callback(self.future, partial(release_inflight, inflight, key, self))
+        return None
+
+    def follow_response(self, leader: "ApiRestRequest"):
+        """Complete this request's future with the response or exception for the leader request
+
+        If the leader's future is cancelled, this request will be dispatched
+        """
+        safe_add_callback(leader.future, self.share_response)
+
+    def share_response(self, leader_future: aio.Future):
+        ## callback for a leader request's future, under follow_response()
+        future = self.future
+        if future.done():
+            return
+        if leader_future.cancelled():
+            self.controller.add_task(self.dispatch_request())
+            return
+        exc = leader_future.exception()
+        if exc:
+            set_future_exception(future, exc)
+        else:
+            set_future_result(future, leader_future.result())
+
+    cache_ttl: ClassVar[Optional[float]] = None
+    """Default freshness lifetime in seconds for cached responses of this class, for a response
+    without a `Cache-Control` max-age. If None, responses of this class will not be cached.
+
+    see also: RequestController.response_cache
+    """
+
+    cache_key: Annotated[Any, application_field(None)]
+    """Response cache key for this request, if the response should be cached"""
+
+    cache_entry: Annotated[Any, application_field(None)]
+    """Cached response being revalidated with this request, if any"""
+
+    def response_cache_key(self, request: httpx.Request) -> Optional[str]:
+        """Return the response cache key for this request, or None if the response should
+        not be cached
+
+        Responses may be cached for GET requests of a class defining a `cache_ttl`, without
+        a field selection in `response_fields`
+        """
+        cls = self.__class__
+        if cls.cache_ttl is not None and cls.request_method is RequestMethod.GET and self.response_fields is None:
+            return ResponseCache.request_key(request.method, str(request.url), request.headers)
+        return None
+
+    async def dispatch_cached(self, cache: ResponseCache, key: str, request: httpx.Request) -> bool:
+        ## provide any fresh cached response without sending the request, or any usable
+        ## stale response while revalidating in the background. Returns True if the
+        ## request's future was set from the cache.
+        ##
+        ## Else, the request will be prepared for caching the response, and for any
+        ## revalidation of a cached response before the future is set
+        entry = cache.cached(key)
+        if entry is None:
+            ## an entry not yet loaded is read from the cache directory in the executor
+            entry = await executor_call(self.controller.main_loop, cache.get, key, self.__class__.primary_type)
+        if entry is not None:
+            now = time.time()
+            if entry.fresh(now):
+                set_future_result(self.future, entry.response)
+                return True
+            if entry.usable_stale(self.controller.config.response_max_stale, now):
+                set_future_result(self.future, entry.response)
+                self.revalidate_later(entry, request)
+                return True
+            self.cache_entry = entry
+            request.headers.update(entry.validators())
+        self.cache_key = key
+        return False
+
+    def revalidate_later(self, entry: CacheEntry, request: httpx.Request):
+        ## dispatch a conditional request for a stale cache entry, in a background task
+        if entry.revalidating:
+            return
+        entry.revalidating = True
+        if __debug__:
+            logger.debug("request: Revalidating %r", entry)
+        request.headers.update(entry.validators())
+        revalidation = self.model_copy(update=dict(future=CoFuture(), cache_key=entry.key, cache_entry=entry))
+        task = self.controller.add_task(revalidation.send_request(request))
+        safe_add_callback(revalidation.future, lambda _: setattr(entry, "revalidating", False))
+        chain_cancel_callback(task, revalidation.future)
+
+    async def dispatch_request(self) -> Awaitable[CoFuture[T_response]]:
+        request = await self.prepare_request()
+        cache = getattr(self.controller, "response_cache", None) if self.cache_ttl is not None else None
+        if cache is not None:
+            cache_key = self.response_cache_key(request)
+            if cache_key is not None and await self.dispatch_cached(cache, cache_key, request):
+                return self.future
+        ## a request not served from the response cache may be coalesced, including
+        ## for a cache miss or a revalidation before the future is set
+        key = self.coalesce_key(request) if self.controller.coalesce_requests else None
+        leader = None if key is None else self.join_inflight(key)
+        if leader is None:
+            return await self.send_request(request)
+        if __debug__:
+            logger.info("request: Sharing in-flight request %r for %r", leader, self)
+        self.follow_response(leader)
+        with suppress(Exception, aio.CancelledError, cofutures.CancelledError):
+            await self.future
+        return self.future
+
+    def buffered_response_p(self, client_response: httpx.Response) -> bool:
+        """Return True if the client response should be parsed from a buffered response body"""
+        if self.lazy_response:
+            return True
+        length = client_response.headers.get("content-length", None)
+        return length is not None and length.isdigit() and 0 < int(length) <= self.buffered_response_limit
+
+    async def process_response(self, client_response: httpx.Response, initial_request: httpx.Request):
+        entry = self.cache_entry
+        if entry is not None and client_response.status_code == 304:
+            ## the cached response was not modified
+            await client_response.aclose()
+            cache, ttl = self.controller.response_cache, self.cache_ttl
+            if cache is not None and ttl is not None:
+                cache.renew(entry, client_response.headers, ttl)
+                executor_call(self.controller.main_loop, cache.persist, entry.key)
+            self.put_response(entry.response)
+            return
+        if self.buffered_response_p(client_response):
+            return await self.process_buffered_response(client_response, initial_request)
+        return await super().process_response(client_response, initial_request)
+
+    async def dispatch_response(self,
+                                response: Union[ApiObject, Literal[False]],
+                                client_response: httpx.Response,
+                                initial_request: httpx.Request):
+        key, ttl = self.cache_key, self.cache_ttl
+        cache = None if key is None else self.controller.response_cache
+        if cache is not None and ttl is not None and client_response.status_code == 200 and \
+           isinstance(response, self.__class__.primary_type):
+            ## the in-memory entry is updated before the response is dispatched, while
+            ## the entry is saved to the cache directory in the executor
+            cache.update(key, response, client_response.headers, ttl)
+            executor_call(self.controller.main_loop, cache.persist, key)
+        return await super().dispatch_response(response, client_response, initial_request)
+
+    def parse_buffered_response(self, response_type: type[ApiObject], data: bytes) -> Any:
+        if self.lazy_response and response_type is self.primary_type:
+            return parse_lazy(response_type, data, fields=self.response_fields)
+        builder = self.get_response_builder(response_type)
+        if builder.__class__ is ModelBuilder and builder.projection is None and not builder.trusted:
+            ## default parsing for the response type
+            return parse_buffered(response_type, data)
+        evt = builder.event
+        for event, value in json_backend.basic_parse(data, use_float=True):
+            evt(event, value)
+        return builder.instance
+
+    async def process_buffered_response(self, client_response: httpx.Response, initial_request: httpx.Request):
+        ## parse a complete response body and dispatch the response directly,
+        ## without the response stream and worker thread used in process_response()
+        response_future = self.future
+        try:
+            data = await client_response.aread()
+            response_type = await self.get_response_type(client_response, None)
+            content_type = None
+            if response_type is None:
+                content_type = self.get_content_type(client_response)
+                if content_type == REST_CONTENT_TYPE:
+                    # unexpected JSON formatted response
+                    response_type = ApiErrorResponse
+            response: Any
+            if response_type:
+                response = self.parse_buffered_response(response_type, data)
+            elif response_type is False:
+                response = False
+            else:
+                response = self.get_unknown_response(client_response, data, content_type)
+            await self.dispatch_response(response, client_response, initial_request)
+        except Exception:
+            etyp, exc, tb = sys.exc_info()
+            set_future_exception(response_future, exc)
+            self.controller.present_exception(etyp, exc, tb)
+            raise
+
     async def aeach_object(self, interval: Union[int, float] = 0) -> AsyncIterator[T_value]:
         future = self.future
         try:
@@ -1302,24 +1791,67 @@ class ApiRestRequest(ApiRequest[T_response, T_value], ABC):
             await aio.sleep(interval)
 
 
+def release_inflight(inflight: dict[Hashable, ApiRestRequest], key: Hashable, request: ApiRestRequest, _future):
+    ## callback for an in-flight request's future, under ApiRestRequest.join_inflight()
+    if inflight.get(key, None) is request:
+        with suppress(KeyError):
+            del inflight[key]
+
+
+
 class ApiIterativeRequest(ApiRequest[T_response, T_value], ABC):
 
     response_queue: Annotated[SimpleQueue[T_response], application_field(..., default_factory=SimpleQueue)]
 
-    async def aeach_response(self, interval: Union[int, float] = 0) -> AsyncIterator[T_response]:
-        # non-blocking iterator for response member objects @ stream I/O
+    response_waiters: Annotated[list[tuple[aio.AbstractEventLoop, aio.Event]], application_field(..., default_factory=list)]
+    """Event loop and event for each active response iterator, set when a response is appended"""
+
+    async def aeach_response(self, interval: Union[int, float, None] = None) -> AsyncIterator[T_response]:
+        """Asynchronous iterator for response objects
+
+        The iterator will wait for each response under an asyncio event bound to the
+        running loop, and will be notified from the response processing thread when
+        a response is available or when the request future is done.
+
+        If a non-zero `interval` is provided, the iterator will also check the
+        response queue after each `interval` seconds, while waiting.
+        """
         q = self.response_queue
         f = self.future
-        while True:
-            with suppress(Empty):
-                yield q.get(timeout=0)
-            if f.done() and q.empty():
-                return
-            else:
-                await aio.sleep(interval)
+        event = aio.Event()
+        waiter = (aio.get_running_loop(), event)
+        waiters = self.response_waiters
+        waiters.append(waiter)
+        safe_add_callback(f, lambda _: self.notify_response())
+        try:
+            while True:
+                ## clear before reading the queue, such that no notification
+                ## will be missed for any response added after the queue is read
+                event.clear()
+                while True:
+                    try:
+                        response = q.get_nowait()
+                    except Empty:
+                        break
+                    yield response
+                if f.done() and q.empty():
+                    return
+                elif interval:
+                    with suppress(aio.TimeoutError):
+                        await aio.wait_for(event.wait(), interval)
+                else:
+                    await event.wait()
+        finally:
+            waiters.remove(waiter)
+
+    def notify_response(self):
+        """Set the event for each active response iterator, in a thread-safe approach"""
+        for loop, event in tuple(self.response_waiters):
+            wake_event(loop, event)
 
     def append_response(self, response: type[ApiObject]):
         self.response_queue.put(response)
+        self.notify_response()
 
     @abstractmethod
     def chain_response_p(self, client_response: httpx.Response):
@@ -1343,46 +1875,172 @@ class ApiIterativeRequest(ApiRequest[T_response, T_value], ABC):
                 self.append_response(response)
             ## dispatch to set the response future
             return await super().dispatch_response(response, client_response, initial_request)
-        ## dispatch to any next request
-        future = self.future
-        if not future.done():
-            next_url = self.get_next_url(response, client_response)
-            if next_url:
-                if __debug__:
-                    logger.info("Processing next request")
 
-                ## updating the initial_request object for the next URL
-                initial_request.url = httpx.URL(next_url)
-
-                async def process_next(self: Self, next_request, future):
-                    ## coroutine for request=>response model with modified initial_request
-                    ## to be run under the same loop as self.future, typically the loop where
-                    ## the initial async HTTP client was created
-                    if future.done():
-                        return
-                    async with self.request_stream(next_request) as linked_response:
-                        await self.process_response(linked_response, next_request)
-
-                loop = self.controller.main_loop
-                cf: cofutures.Future = aio.run_coroutine_threadsafe(process_next(self, initial_request, future), loop=loop)
-                self.future.add_done_callback(lambda _: cf.cancel())
-                # poll until next request has completed
-                interval = sys.getswitchinterval()
-                while not cf.done():
-                    try:
-                        return cf.result(0)
-                    except cofutures.TimeoutError:
-                        await aio.sleep(interval)
-            else:
-                logger.warning("Received no next URL for linked response in %r", self)
+
+class LinkedPages:
+    """Dispatch order for the response pages of a linked request
+
+    Each page is registered with the HTTP request for the page, in the order
+    in which the pages are linked. A parsed page may be dispatched once every
+    previous page has been dispatched.
+
+    The page state is shared between the main loop, where each page is requested,
+    and the worker threads where each page is parsed and dispatched.
+    """
+
+    __slots__ = "lock", "pages", "n_pages", "next_page", "waiters"
+
+    lock: threading.Lock
+    pages: dict[int, int]
+    """Mapping of the id for each page request not yet dispatched, to the index of the page"""
+
+    n_pages: int
+    """Number of pages registered"""
+
+    next_page: int
+    """Index of the next page to dispatch"""
+
+    waiters: list[tuple[aio.AbstractEventLoop, aio.Event]]
+    """Event loop and event for each pending `await_window()` call"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.pages = dict()
+        self.n_pages = 0
+        self.next_page = 0
+        self.waiters = []
+
+    def add_page(self, request: httpx.Request) -> int:
+        """Register the page for the HTTP request, if not already registered. Returns the page index"""
+        key = id(request)
+        with self.lock:
+            pages = self.pages
+            if key in pages:
+                return pages[key]
+            n = self.n_pages
+            pages[key] = n
+            self.n_pages = n + 1
+            return n
+
+    def get_page(self, request: httpx.Request) -> int:
+        return self.pages[id(request)]
+
+    async def await_window(self, request: httpx.Request, window: int, future: aio.Future) -> bool:
+        """Wait until the page for the HTTP request is within `window` pages of the next page to dispatch
+
+        Returns False if the future is completed before then, else True
+        """
+        n = self.get_page(request)
+        if n - self.next_page < window or future.done():
+            return not future.done()
+        event = aio.Event()
+        waiter = (aio.get_running_loop(), event)
+        waiters = self.waiters
+        waiters.append(waiter)
+        safe_add_callback(future, lambda _: wake_event(*waiter))
+        try:
+            while n - self.next_page >= window:
+                if future.done():
+                    return False
+                event.clear()
+                ## check again after clear, for any page completed in the interim
+                if n - self.next_page < window:
+                    break
+                await event.wait()
+        finally:
+            waiters.remove(waiter)
+        return not future.done()
+
+    def complete_page(self, request: httpx.Request):
+        """Mark the page for the HTTP request as dispatched"""
+        with self.lock:
+            del self.pages[id(request)]
+            self.next_page += 1
+        for loop, event in tuple(self.waiters):
+            wake_event(loop, event)
+
+    def release_page(self, request: httpx.Request):
+        """Release the page for the HTTP request, if not yet dispatched
+
+        Used when the page cannot be requested or processed. Any pending
+        `await_window()` call will be woken.
+        """
+        with self.lock:
+            if self.pages.pop(id(request), None) is not None:
+                self.next_page += 1
+        for loop, event in tuple(self.waiters):
+            wake_event(loop, event)
 
 
 class ApiLinkedRequest(ApiIterativeRequest[T_response, T_value], ABC):
 
+    linked_window: ClassVar[int] = 2
+    """Maximum number of linked pages in flight, for each request
+
+    When a response page provides a link header, the linked page will be requested
+    as soon as the headers are received, within this window of pages not yet
+    dispatched. Response pages will be dispatched in the order in which they are
+    linked.
+    """
+
+    linked_pages: Annotated[LinkedPages, application_field(..., default_factory=LinkedPages)]
+
     def chain_response_p(self, client_response: httpx.Response):
         ## header syntax: see below
         return "link" in client_response.headers
 
+    async def process_response(self, client_response: httpx.Response, initial_request: httpx.Request):
+        pages = self.linked_pages
+        ## register the first page, if not registered when linked
+        pages.add_page(initial_request)
+        future = self.future
+        if self.chain_response_p(client_response) and not future.done():
+            next_url = self.get_next_url(False, client_response)
+            if next_url:
+                ## request the next page, while this page is parsed
+                client = self.controller.rest_client.client
+                next_request = client.build_request(initial_request.method, next_url)
+                pages.add_page(next_request)
+                next_task = self.controller.add_task(self.process_linked_page(next_request))
+                chain_cancel_callback(future, next_task)
+            else:
+                logger.warning("Received no next URL for linked response in %r", self)
+        return await super().process_response(client_response, initial_request)
+
+    async def process_linked_page(self, next_request: httpx.Request):
+        ## coroutine for request=>response processing for a linked page,
+        ## run under the same loop as self.future, typically the loop where
+        ## the async HTTP client was created
+        ## the task for this coroutine is detached from the initial request.
+        ## Any error is set to the request future, such that the request
+        ## will not wait on a page that cannot be dispatched
+        try:
+            if await self.linked_pages.await_window(next_request, self.linked_window, self.future):
+                if __debug__:
+                    logger.info("Processing next request")
+                async with self.request_stream(next_request) as linked_response:
+                    await self.process_response(linked_response, next_request)
+        except Exception:
+            etyp, exc, tb = sys.exc_info()
+            if not self.future.done():
+                ## not presented when raised from the completed future, on exit from request_stream()
+                set_future_exception(self.future, exc)
+                self.controller.present_exception(etyp, exc, tb)
+            self.linked_pages.release_page(next_request)
+
+    async def dispatch_response(self,
+                                response: Union[ApiObject, Literal[False]],
+                                client_response: httpx.Response,
+                                initial_request: httpx.Request):
+        ## dispatch each page in order, e.g while a later page may have been parsed
+        ## concurrently in another worker thread
+        pages = self.linked_pages
+        if await pages.await_window(initial_request, 1, self.future):
+            try:
+                return await super().dispatch_response(response, client_response, initial_request)
+            finally:
+                pages.complete_page(initial_request)
+
     def get_next_url(self,
                      response: Union[ApiObject, Literal[False]],
                      client_response: httpx.Response) -> Optional[str]:
@@ -1406,19 +2064,6 @@ class ApiStreamRequest(ApiIterativeRequest[T_abstract_co, T_abstract_co], ABC):
     def chain_response_p(self, client_response: httpx.Response):
         return not client_response.is_closed
 
-    async def dispatch_response(self,
-                                response: Union[ApiObject, Literal[False]],
-                                client_response: httpx.Response,
-                                initial_request: httpx.Request):
-        if self.chain_response_p(client_response):
-            self.append_response(response)
-        else:
-            if client_response.status_code < 300:
-                ## append a final response object
-                self.append_response(response)
-            ## dispatch to set the response future
-            return await super().dispatch_response(response, client_response, initial_request)
-
-    async def aeach_object(self, interval: Union[int, float] = 0) -> AsyncIterator[T_abstract_co]:
+    async def aeach_object(self, interval: Union[int, float, None] = None) -> AsyncIterator[T_abstract_co]:
         async for obj in self.aeach_response(interval):
             yield obj
@@ -0,0 +1,290 @@
+"""Conditional-request response cache for slowly changing REST endpoints
+
+A REST request class defining a `cache_ttl` may have its responses cached, when a
+response cache is configured for the request controller. Each parsed response
+will be retained in memory and persisted to a file in the cache directory, with
+any `ETag` and `Last-Modified` validators received for the response.
+
+A cached response will be fresh for the `max-age` of any `Cache-Control` header
+in the response, else for the `cache_ttl` of the request class. A fresh response
+will be provided to later requests without sending the request. A stale response
+will be provided immediately, while the request is revalidated in the background
+with a conditional request, unless the response has been stale for longer than
+the configured `response_max_stale` or was received with `no-cache` or
+`must-revalidate`. Responses received with `no-store` will not be cached.
+
+see also: Configuration.response_cache_dir
+"""
+
+from hashlib import sha256
+import json
+import logging
+import os
+from pathlib import Path
+import threading
+import time
+from typing import Mapping, NamedTuple, Optional
+
+from ..parser import parse_buffered
+from ..transport.data import ApiObject
+from ..util.naming import exporting
+from ..util.paths import Pathname, expand_path
+
+logger = logging.getLogger(__name__)
+
+
+ENTRY_SUFFIX: str = ".cache"
+
+KEY_HEADERS: tuple[str, ...] = ("authorization", "accept-datetime-format")
+"""Request headers that select a distinct response, for the cache key"""
+
+
+class CachePolicy(NamedTuple):
+    """Cache directives for a response"""
+
+    store: bool
+    """False if the response should not be cached"""
+
+    lifetime: float
+    """Freshness lifetime for the response, in seconds"""
+
+    revalidate: bool
+    """True if the response should not be provided when stale, before revalidation"""
+
+    @classmethod
+    def from_headers(cls, headers: Mapping[str, str], default_ttl: float) -> "CachePolicy":
+        """Return the cache policy for response headers and a default time-to-live"""
+        directives = {}
+        for directive in headers.get("cache-control", "").split(","):
+            name, _, value = directive.strip().partition("=")
+            if name:
+                directives[name.lower()] = value.strip('"')
+        if "no-store" in directives:
+            return cls(False, 0, True)
+        lifetime = default_ttl
+        max_age = directives.get("max-age", None)
+        if max_age is not None and max_age.isdigit():
+            lifetime = int(max_age)
+            age = headers.get("age", "")
+            if age.isdigit():
+                lifetime = max(0, lifetime - int(age))
+        if "no-cache" in directives:
+            return cls(True, 0, True)
+        return cls(True, lifetime, "must-revalidate" in directives)
+
+
+class CacheEntry:
+    """A cached response, with validators and freshness for the response"""
+
+    __slots__ = ("key", "response", "etag", "last_modified", "stored", "expires", "revalidate", "revalidating")
+
+    key: str
+
+    response: ApiObject
+
+    etag: Optional[str]
+
+    last_modified: Optional[str]
+
+    stored: float
+    """Time of the response or last revalidation, in seconds since the epoch"""
+
+    expires: float
+    """Time when the response will become stale, in seconds since the epoch"""
+
+    revalidate: bool
+    """True if the response should not be provided when stale, before revalidation"""
+
+    revalidating: bool
+    """True while a background revalidation is in progress"""
+
+    def __init__(self, key: str, response: ApiObject, etag: Optional[str], last_modified: Optional[str],
+                 stored: float, expires: float, revalidate: bool):
+        self.key = key
+        self.response = response
+        self.etag = etag
+        self.last_modified = last_modified
+        self.stored = stored
+        self.expires = expires
+        self.revalidate = revalidate
+        self.revalidating = False
+
+    def fresh(self, now: Optional[float] = None) -> bool:
+        return (time.time() if now is None else now) < self.expires
+
+    def usable_stale(self, max_stale: float, now: Optional[float] = None) -> bool:
+        """Return True if the stale response may be provided while revalidating"""
+        return not self.revalidate and (time.time() if now is None else now) < self.expires + max_stale
+
+    def validators(self) -> dict[str, str]:
+        """Return the conditional request headers for revalidating this entry"""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+    def __repr__(self) -> str:
+        return "<%s %s %s at 0x%x>" % (self.__class__.__name__, self.key,
+                                       "fresh" if self.fresh() else "stale", id(self))
+
+
+class ResponseCache:
+    """In-memory and on-disk store for cached responses
+
+    Methods of this class are thread-safe. Files in the cache directory are
+    read and written outside of the cache lock, such that `cached()`, `update()`
+    and `renew()` will not wait on file I/O in another thread.
+    """
+
+    __slots__ = ("root", "entries", "lock")
+
+    root: Path
+
+    entries: dict[str, CacheEntry]
+
+    lock: threading.RLock
+
+    def __init__(self, root: Pathname):
+        self.root = Path(expand_path(root))
+        self.entries = dict()
+        self.lock = threading.RLock()
+
+    @staticmethod
+    def request_key(method: str, url: str, headers: Mapping[str, str]) -> str:
+        """Return the cache key for a request
+
+        Request headers selecting a distinct response will be represented with a
+        digest of the header values, such that no credential is stored in the key
+        """
+        values = "\n".join(headers.get(name, "") for name in KEY_HEADERS)
+        return "%s %s %s" % (method, url, sha256(values.encode()).hexdigest()[:16])
+
+    def entry_path(self, key: str) -> Path:
+        return self.root / (sha256(key.encode()).hexdigest() + ENTRY_SUFFIX)
+
+    def cached(self, key: str) -> Optional[CacheEntry]:
+        """Return the cached entry for the key, if loaded. The cache directory will not be read"""
+        with self.lock:
+            return self.entries.get(key, None)
+
+    def get(self, key: str, response_type: type[ApiObject]) -> Optional[CacheEntry]:
+        """Return the cached entry for the key, loading the entry from the cache
+        directory if not already loaded. Returns None if no entry is available"""
+        entry = self.cached(key)
+        if entry is None:
+            ## the entry file is read outside of the lock
+            entry = self.load(key, response_type)
+            if entry is not None:
+                with self.lock:
+                    entry = self.entries.setdefault(key, entry)
+        return entry
+
+    def load(self, key: str, response_type: type[ApiObject]) -> Optional[CacheEntry]:
+        ## each entry file contains one line of JSON metadata, followed by
+        ## the JSON encoding of the response
+        path = self.entry_path(key)
+        if not path.exists():
+            return None
+        try:
+            with path.open("rb") as stream:
+                meta = json.loads(stream.readline())
+                data = stream.read()
+            if meta["key"] != key or meta["type"] != response_type.__name__:
+                return None
+            response = parse_buffered(response_type, data)
+            return CacheEntry(key, response, meta["etag"], meta["last_modified"],
+                              meta["stored"], meta["expires"], meta["revalidate"])
+        except Exception:
+            logger.warning("Discarding cached response %s", path, exc_info=True)
+            return None
+
+    def save(self, entry: CacheEntry):
+        with self.lock:
+            meta = dict(key=entry.key, type=entry.response.__class__.__name__, etag=entry.etag,
+                        last_modified=entry.last_modified, stored=entry.stored, expires=entry.expires,
+                        revalidate=entry.revalidate)
+        path = self.entry_path(entry.key)
+        ## a temporary file for each thread, for any concurrent save of the entry
+        tmp_path = path.with_name("%s.%x.tmp" % (path.stem, threading.get_ident()))
+        try:
+            self.root.mkdir(parents=True, exist_ok=True)
+            with tmp_path.open("wb") as stream:
+                stream.write(json.dumps(meta).encode())
+                stream.write(b"\n")
+                stream.write(entry.response.write_json())
+            os.replace(tmp_path, path)
+        except OSError:
+            logger.warning("Unable to store cached response %s", path, exc_info=True)
+
+    def persist(self, key: str):
+        """Save the cached entry for the key to the cache directory, or remove any
+        file for the key if no entry is cached"""
+        entry = self.cached(key)
+        if entry is not None:
+            self.save(entry)
+            return
+        try:
+            self.entry_path(key).unlink()
+        except FileNotFoundError:
+            pass
+
+    def update(self, key: str, response: ApiObject, headers: Mapping[str, str],
+               default_ttl: float) -> Optional[CacheEntry]:
+        """Cache a response received with the response headers, returning the cache
+        entry. Returns None if the response should not be cached, removing any entry
+        for the key
+
+        The cache directory will not be updated. see persist()
+        """
+        policy = CachePolicy.from_headers(headers, default_ttl)
+        if not policy.store:
+            with self.lock:
+                self.entries.pop(key, None)
+            return None
+        now = time.time()
+        entry = CacheEntry(key, response, headers.get("etag", None), headers.get("last-modified", None),
+                           now, now + policy.lifetime, policy.revalidate)
+        with self.lock:
+            self.entries[key] = entry
+        return entry
+
+    def put(self, key: str, response: ApiObject, headers: Mapping[str, str],
+            default_ttl: float) -> Optional[CacheEntry]:
+        """Cache a response received with the response headers, as with `update()`,
+        then update the cache directory for the key"""
+        entry = self.update(key, response, headers, default_ttl)
+        self.persist(key)
+        return entry
+
+    def renew(self, entry: CacheEntry, headers: Mapping[str, str], default_ttl: float):
+        """Update the freshness of an entry, for a `304 Not Modified` response
+
+        The cache directory will not be updated. see persist()
+        """
+        policy = CachePolicy.from_headers(headers, default_ttl)
+        now = time.time()
+        with self.lock:
+            entry.stored = now
+            entry.expires = now + policy.lifetime
+            entry.revalidate = policy.revalidate
+            entry.etag = headers.get("etag", entry.etag)
+            entry.last_modified = headers.get("last-modified", entry.last_modified)
+
+    def refresh(self, entry: CacheEntry, headers: Mapping[str, str], default_ttl: float):
+        """Update the freshness of an entry, as with `renew()`, then save the entry
+        to the cache directory"""
+        self.renew(entry, headers, default_ttl)
+        self.save(entry)
+
+    def invalidate(self, key: str):
+        with self.lock:
+            self.entries.pop(key, None)
+        self.persist(key)
+
+    def __repr__(self) -> str:
+        return "<%s %s %d entries at 0x%x>" % (self.__class__.__name__, self.root, len(self.entries), id(self))
+
+
+__all__ = exporting(__name__, ...)
@@ -9,9 +9,11 @@ from quattro import move_on_after
 from immutables import Map
 import ssl
 import sys
+from typing import Optional
 
 from ..exec_controller import ExecController
 from ..response_common import REST_CONTENT_TYPE_BYTES
+from .rate_limit import RateLimiter, RequestPriority
 
 
 logger = logging.getLogger(__name__)
@@ -23,12 +25,15 @@ class TransportClient():
     with OpenAPI Generator.
 
     """
-    __slots__ = "transport", "client", "controller"
+    __slots__ = "transport", "client", "controller", "rate_limiter"
 
     transport: httpx.AsyncHTTPTransport
     client: httpx.AsyncClient
     controller: ExecController
 
+    rate_limiter: Optional[RateLimiter]
+    """Client-side rate limiter for requests, or None if requests are not rate limited"""
+
     def __init__(self, controller: ExecController):
         self.controller = controller
         controller.exit_future.add_done_callback(lambda _: self.close())
@@ -81,6 +86,20 @@ class TransportClient():
                                    headers=headers)
         self.client = client
 
+        rate = config.rate_limit
+        self.rate_limiter = None if rate is None else RateLimiter(
+            controller.main_loop, rate, config.rate_limit_burst, config.host_rate_limits
+        )
+
+    async def await_rate_limit(self, request: httpx.Request,
+                               priority: RequestPriority = RequestPriority.NORMAL) -> float:
+        """Wait until the request can be sent within the client-side rate limit
+        for the request's host, returning the wait time in seconds"""
+        limiter = self.rate_limiter
+        if limiter is None:
+            return 0.0
+        return await limiter.acquire(request.url.host, priority)
+
     async def aclose(self):
         # Implementation Note: For connection pooling with HTTP/2
         # via HTTPX and HTTPCore, the same transport and client
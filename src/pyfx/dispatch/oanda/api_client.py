@@ -121,7 +121,8 @@ class ApiClient(object):
                 **{k: ensure_str(v) for k, v in path_params.items()}
             )
 
-        body_text = None if body is None else body.to_json_bytes()
+        ## encoded into a buffer, to be sent without a copy to bytes
+        body_buf = None if body is None else body.write_json()
 
         ## generalization for fxPractice and fxLive endpoints
         # fmt: off
@@ -142,7 +143,7 @@ class ApiClient(object):
             base_url,
             response_types_map,  # type: ignore
             headers=header_params,
-            body=body_text,
+            body=body_buf,
             receiver=receiver,
             future=future,
         )
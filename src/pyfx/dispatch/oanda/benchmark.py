@@ -0,0 +1,355 @@
+## benchmark.py - parser and encoder benchmarks for pyfx.dispatch.oanda development
+##
+## Usage: python -m pyfx.dispatch.oanda.benchmark --help
+##
+## Requirements: the 'dev' optional dependencies, for synthetic data under MockFactory
+##
+## Memory figures are reported per operation with tracemalloc. The peak resident
+## set size for the process is reported once, after all operations
+
+import asyncio as aio
+from collections import defaultdict
+from collections.abc import Mapping, Sequence
+from functools import cache
+import gc
+import io
+import os
+import sys
+import time
+import tracemalloc
+import types
+from typing import Any, Callable, Iterator, NamedTuple, Optional
+from typing_extensions import TypeAlias
+
+from . import models
+from .models import (
+    MODEL_IMPORTS, Candlestick, GetInstrumentCandles200Response, GetTransactionRange200Response,
+    ListTrades200Response, Trade, Transaction
+)
+from .parser import ModelBuilder, json_backend
+from .transport import ApiObject
+from .transport.data import JsonTypesRepository
+from .util.args import argparser
+
+try:
+    import resource
+except ImportError:
+    ## e.g on Windows platforms
+    resource = None  # type: ignore[assignment]
+
+
+BenchmarkSample: TypeAlias = tuple[str, type[ApiObject], bytes]
+
+SAMPLES_DIR: str = os.path.join("test", "sample_data")
+"""Default directory for JSON sample files, relative to the working directory"""
+
+SYNTHETIC_SCALE: Mapping[str, int] = {
+    "candles": 5000,
+    "trades": 2000,
+    "transactions": 10000,
+}
+"""Default number of members for each synthetic response"""
+
+SYNTHETIC_VARIETY: int = 16
+"""Default number of distinct mock objects per member class, for synthetic responses"""
+
+
+class BenchmarkResult(NamedTuple):
+    """Benchmark measurements for one operation onto one sample"""
+
+    sample: str
+    operation: str
+    rounds: int
+    n_tokens: int
+    """Number of JSON parser events in the sample"""
+    n_objects: int
+    """Number of ApiObject instances in the sample"""
+    seconds: float
+    """Total time for all rounds"""
+    peak_bytes: int
+    """Peak memory allocated under one round, via tracemalloc"""
+    blocks: int
+    """Memory blocks retained by the result of one round"""
+
+    @property
+    def tokens_per_second(self) -> float:
+        return self.n_tokens * self.rounds / self.seconds if self.seconds else 0.0
+
+    @property
+    def objects_per_second(self) -> float:
+        return self.n_objects * self.rounds / self.seconds if self.seconds else 0.0
+
+    @property
+    def blocks_per_object(self) -> float:
+        return self.blocks / self.n_objects if self.n_objects else 0.0
+
+
+class ConstructResult(NamedTuple):
+    """Construction cost for objects of one model class, with and without validation"""
+
+    model_class: str
+    n_objects: int
+    validated: float
+    """Mean seconds per object, when parsed with validation"""
+    trusted: float
+    """Mean seconds per object, when parsed without validation"""
+
+    @property
+    def speedup(self) -> float:
+        return self.validated / self.trusted if self.trusted else 0.0
+
+
+def count_tokens(data: bytes) -> int:
+    """Return the number of JSON parser events for the data"""
+    return sum(1 for _ in json_backend.basic_parse(data, use_float=True))
+
+
+def count_objects(value: Any) -> int:
+    """Return the number of ApiObject instances within the value, including the value"""
+    if isinstance(value, ApiObject):
+        return 1 + sum(count_objects(getattr(value, name)) for name in value.model_fields_set)
+    elif isinstance(value, Sequence) and not isinstance(value, (str, bytes)):
+        return sum(count_objects(member) for member in value)
+    return 0
+
+
+def collect_objects(value: Any, objects: dict[type[ApiObject], list[ApiObject]]):
+    """Add each ApiObject within the value, including the value, to the mapping of objects by class"""
+    if isinstance(value, ApiObject):
+        objects[value.__class__].append(value)
+        for name in value.model_fields_set:
+            collect_objects(getattr(value, name), objects)
+    elif isinstance(value, Sequence) and not isinstance(value, (str, bytes)):
+        for member in value:
+            collect_objects(member, objects)
+
+
+def get_peak_rss() -> Optional[int]:
+    """Return the peak resident set size for the process, in bytes, or None if not available
+
+    This value is a process-wide peak, not specific to any one operation
+    """
+    if resource is None:
+        return None
+    usage = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    ## ru_maxrss is provided in bytes on macOS, else in kilobytes
+    return usage if sys.platform == "darwin" else usage * 1024
+
+
+def find_model_class(name: str) -> Optional[type[ApiObject]]:
+    """Return the ApiObject class with the provided class name, or None if not defined"""
+    if name in MODEL_IMPORTS:
+        ## model classes are imported on demand
+        found = getattr(models, name)
+        return found if isinstance(found, type) and issubclass(found, ApiObject) else None
+    queue = [ApiObject]
+    while queue:
+        cls = queue.pop()
+        if cls.__name__ == name:
+            return cls
+        queue.extend(cls.__subclasses__())
+    return None
+
+
+def read_samples(samples_dir: str) -> Iterator[BenchmarkSample]:
+    """Yield a benchmark sample for each JSON file in the directory, named for an ApiObject class"""
+    for filename in sorted(os.listdir(samples_dir)):
+        name, ext = os.path.splitext(filename)
+        if ext != ".json":
+            continue
+        model_cls = find_model_class(name)
+        if model_cls is None:
+            continue
+        with open(os.path.join(samples_dir, filename), "rb") as stream:
+            yield name, model_cls, stream.read()
+
+
+@cache
+def mock_factory(model_cls: type[ApiObject]):
+    ## localizing the import, as the test module requires the dev dependencies
+    try:
+        from .test import MockFactory
+    except ImportError as exc:
+        raise ImportError("Synthetic benchmark samples require the 'dev' optional dependencies, "
+                          "e.g pip install 'pyfx.dispatch.oanda[dev]'") from exc
+    return types.new_class(model_cls.__name__ + "Factory", (MockFactory[model_cls],))
+
+
+def gen_members(classes: Sequence[type[ApiObject]], count: int, variety: int) -> list[ApiObject]:
+    """Return `count` mock objects, repeating at most `variety` distinct objects per class"""
+    mocks = []
+    for model_cls in classes:
+        factory = mock_factory(model_cls)
+        mocks.extend(factory.build() for _ in range(max(1, min(variety, count // len(classes)))))
+    n_mocks = len(mocks)
+    return [mocks[n % n_mocks] for n in range(count)]
+
+
+def gen_synthetic(scale: Mapping[str, int] = SYNTHETIC_SCALE,
+                  variety: int = SYNTHETIC_VARIETY) -> Iterator[BenchmarkSample]:
+    """Yield a benchmark sample for each synthetic response, at the provided scale"""
+    n_candles = scale.get("candles", 0)
+    if n_candles:
+        candles = gen_members((Candlestick,), n_candles, variety)
+        response = mock_factory(GetInstrumentCandles200Response).build(candles=candles)
+        yield "Synthetic Candles [%d]" % n_candles, GetInstrumentCandles200Response, response.to_json_bytes()
+
+    n_trades = scale.get("trades", 0)
+    if n_trades:
+        trades = gen_members((Trade,), n_trades, variety)
+        response = mock_factory(ListTrades200Response).build(trades=trades)
+        yield "Synthetic Trades [%d]" % n_trades, ListTrades200Response, response.to_json_bytes()
+
+    n_txns = scale.get("transactions", 0)
+    if n_txns:
+        ## each concrete transaction class, for a variety of transaction types
+        txn_classes = tuple(Transaction.load_types().values())
+        txns = gen_members(txn_classes, n_txns, max(1, variety // len(txn_classes)))
+        response = mock_factory(GetTransactionRange200Response).build(transactions=txns)
+        yield "Synthetic Transactions [%d]" % n_txns, GetTransactionRange200Response, response.to_json_bytes()
+
+
+def measure(sample: str, operation: str, func: Callable[[], Any],
+            rounds: int, n_tokens: int, n_objects: int) -> BenchmarkResult:
+    """Measure throughput and memory use for one operation onto one sample"""
+    ## memory measurements, for a single call outside of the timed rounds
+    gc.collect()
+    blocks_initial = sys.getallocatedblocks()
+    tracemalloc.start()
+    try:
+        result = func()
+        _, peak_bytes = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    gc.collect()
+    blocks = sys.getallocatedblocks() - blocks_initial
+    del result
+
+    t_start = time.perf_counter()
+    for _ in range(rounds):
+        func()
+    seconds = time.perf_counter() - t_start
+    return BenchmarkResult(sample, operation, rounds, n_tokens, n_objects, seconds,
+                           peak_bytes, max(blocks, 0))
+
+
+def run_benchmarks(samples: Iterator[BenchmarkSample], rounds: int = 3) -> Iterator[BenchmarkResult]:
+    """Yield benchmark results for ModelBuilder, with and without validation, the async and
+    stream parse modes, to_json_bytes() and to_dict(), for each sample
+
+    The async parse mode will be measured under an event loop created for this call. This
+    function should not be called from within a running event loop.
+    """
+    JsonTypesRepository.__finalize_instance__()
+    loop = aio.new_event_loop()
+    try:
+        for name, model_cls, data in samples:
+            n_tokens = count_tokens(data)
+            inst = ModelBuilder.from_text(model_cls, data)
+            n_objects = count_objects(inst)
+            yield measure(name, "ModelBuilder", lambda: ModelBuilder.from_text(model_cls, data),
+                          rounds, n_tokens, n_objects)
+            yield measure(name, "trusted", lambda: ModelBuilder.from_text(model_cls, data, trusted=True),
+                          rounds, n_tokens, n_objects)
+            ## async parse over an AsyncSegmentChannel, as for a streaming response
+            yield measure(name, "async",
+                          lambda: loop.run_until_complete(ModelBuilder.from_text_async(model_cls, data, loop)),
+                          rounds, n_tokens, n_objects)
+            yield measure(name, "from_stream", lambda: ModelBuilder.from_stream(model_cls, io.BytesIO(data)),
+                          rounds, n_tokens, n_objects)
+            yield measure(name, "to_json_bytes", inst.to_json_bytes, rounds, n_tokens, n_objects)
+            yield measure(name, "to_dict", inst.to_dict, rounds, n_tokens, n_objects)
+    finally:
+        loop.close()
+
+
+def measure_construct(samples: Iterator[BenchmarkSample], rounds: int = 3,
+                      limit: int = 100) -> Iterator[ConstructResult]:
+    """Yield the construction cost per model class, for objects within each sample
+
+    For each model class, at most `limit` objects will be parsed from the JSON
+    encoding of each object, with and without validation. The cost for each
+    object will include the cost for any nested objects.
+    """
+    JsonTypesRepository.__finalize_instance__()
+    objects: dict[type[ApiObject], list[ApiObject]] = defaultdict(list)
+    for _, model_cls, data in samples:
+        collect_objects(ModelBuilder.from_text(model_cls, data), objects)
+    for model_cls, members in sorted(objects.items(), key=lambda item: item[0].__name__):
+        encoded = [obj.to_json_bytes() for obj in members[:limit]]
+        costs = []
+        for trusted in (False, True):
+            t_start = time.perf_counter()
+            for _ in range(rounds):
+                for data in encoded:
+                    ModelBuilder.from_text(model_cls, data, trusted=trusted)
+            costs.append((time.perf_counter() - t_start) / (rounds * len(encoded)))
+        yield ConstructResult(model_cls.__name__, len(encoded), *costs)
+
+
+def format_result(result: BenchmarkResult) -> str:
+    return "%-36s %-14s %8d tok %7d obj %12.0f tok/s %10.0f obj/s %10.1f KiB peak %8.1f blk/obj" % (
+        result.sample, result.operation, result.n_tokens, result.n_objects,
+        result.tokens_per_second, result.objects_per_second,
+        result.peak_bytes / 1024, result.blocks_per_object
+    )
+
+
+def format_construct(result: ConstructResult) -> str:
+    return "%-44s %6d obj %10.2f us validated %10.2f us trusted (x%.2f)" % (
+        result.model_class, result.n_objects, result.validated * 1e6, result.trusted * 1e6, result.speedup
+    )
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    with argparser("pyfx.dispatch.oanda.benchmark",
+                   description="Parser and encoder benchmarks for sample and synthetic API responses") as parser:
+        parser.add_argument("--rounds", type=int, default=3, help="Number of timed rounds per operation (default: 3)")
+        parser.add_argument("--samples", default=SAMPLES_DIR,
+                            help="Directory of JSON sample files (default: %s)" % SAMPLES_DIR)
+        parser.add_argument("--no-samples", action="store_true", help="Skip the JSON sample files")
+        for name, count in SYNTHETIC_SCALE.items():
+            parser.add_argument("--" + name, type=int, default=count,
+                                help="Number of %s in the synthetic response, 0 to skip (default: %d)" % (name, count))
+        parser.add_argument("--variety", type=int, default=SYNTHETIC_VARIETY,
+                            help="Distinct mock objects per class, for synthetic responses (default: %d)" % SYNTHETIC_VARIETY)
+        parser.add_argument("--construct", action="store_true",
+                            help="Report the construction cost per model class, with and without validation")
+    options = parser.parse_args(argv)
+
+    def all_samples() -> Iterator[BenchmarkSample]:
+        if not options.no_samples:
+            if os.path.isdir(options.samples):
+                yield from read_samples(options.samples)
+            else:
+                print("Samples directory not found: %s" % options.samples, file=sys.stderr)
+        scale = {name: getattr(options, name) for name in SYNTHETIC_SCALE}
+        try:
+            yield from gen_synthetic(scale, options.variety)
+        except ImportError as exc:
+            print("%s. Skipping the synthetic samples" % exc, file=sys.stderr)
+
+    print("ijson backend: %s, rounds: %d" % (json_backend.backend, options.rounds))
+    for result in run_benchmarks(all_samples(), options.rounds):
+        print(format_result(result), flush=True)
+    if options.construct:
+        print()
+        for construct in measure_construct(all_samples(), options.rounds):
+            print(format_construct(construct), flush=True)
+    rss = get_peak_rss()
+    if rss is not None:
+        print()
+        print("Process peak RSS: %.1f MiB" % (rss / 1048576))
+    return 0
+
+
+__all__ = (
+    "BenchmarkSample", "BenchmarkResult", "ConstructResult", "count_tokens", "count_objects",
+    "collect_objects", "get_peak_rss", "find_model_class", "read_samples", "gen_members",
+    "gen_synthetic", "measure", "run_benchmarks", "measure_construct", "format_result",
+    "format_construct", "main",
+)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
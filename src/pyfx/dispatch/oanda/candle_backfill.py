@@ -0,0 +1,327 @@
+"""Chunked backfill for candlestick history
+
+A candlestick request for the fxTrade v20 API will provide at most 5000 candles.
+The backfill functions in this module will split an arbitrary time range into
+windows of at most that many candles, for each candle spec (instrument,
+granularity, and price component). The windows will be fetched concurrently with
+bounded parallelism, under the controller's shared HTTP client, and the results
+will be stitched into one DataFrame for each candle spec.
+
+### Usage
+
+In an application:
+```python
+df = await backfill(controller, ["EUR_USD:M1:M", "USD_JPY:M1:BA"], "2020-01-01", "2024-01-01")
+```
+
+From the command line:
+```
+python -m pyfx.dispatch.oanda.candle_backfill --from 2020-01-01 -o eur_usd.csv EUR_USD:M1:M
+```
+"""
+
+import argparse as ap
+import asyncio as aio
+import concurrent.futures as cofutures
+from contextlib import contextmanager, suppress
+from datetime import datetime
+import logging
+import os
+import sys
+from typing import Iterator, Optional, Sequence, Union
+from typing_extensions import TypeAlias
+
+import pandas as pd
+from quattro import TaskGroup
+
+from .api.request_base import RequestController
+from .api.request.get_instrument_candles import (
+    CandleSpec, GetInstrumentCandlesRequest, InstrumentQuotesRequest, TransportCandleSpec
+)
+from .candle_columns import CandleColumns
+from .models.candlestick_granularity import CandlestickGranularity
+from .transport.timestamps import UTC
+from .util.naming import exporting
+
+logger = logging.getLogger(__name__)
+
+
+MAX_WINDOW_CANDLES: int = 5000
+"""Maximum number of candles for one candlestick request, under the fxTrade v20 API"""
+
+BACKFILL_CONCURRENCY: int = 8
+"""Default number of candlestick requests to dispatch concurrently, for a backfill"""
+
+GRANULARITY_UNITS: dict[str, str] = {"S": "s", "M": "min", "H": "h"}
+"""Timedelta units for each fixed-duration granularity prefix"""
+
+CALENDAR_SPANS: dict[str, pd.Timedelta] = {
+    ## the minimum interval between candle start times, for calendar granularities.
+    ##
+    ## daily and weekly candles are aligned within the alignment timezone, such
+    ## that the interval may be one hour shorter at a DST transition
+    "D": pd.Timedelta(hours=23),
+    "W": pd.Timedelta(days=7, hours=-1),
+    "M": pd.Timedelta(days=28, hours=-1),
+}
+"""Minimum candle interval for each calendar granularity"""
+
+TimeArg: TypeAlias = Union[datetime, str]
+
+SpecArg: TypeAlias = Union[CandleSpec, str]
+
+
+def granularity_span(granularity: Union[CandlestickGranularity, str]) -> pd.Timedelta:
+    """Return the minimum interval between the start times of consecutive candles
+    for a candlestick granularity"""
+    name = granularity.value if isinstance(granularity, CandlestickGranularity) else granularity
+    span = CALENDAR_SPANS.get(name, None)
+    if span is None:
+        span = pd.Timedelta(int(name[1:]), unit=GRANULARITY_UNITS[name[0]])
+    return span
+
+
+def parse_spec(value: SpecArg) -> CandleSpec:
+    """Return a candle spec for a CandleSpec or a string `instrument[:granularity[:price]]`
+
+    The default granularity and price component will be used for any field omitted
+    from the string
+    """
+    if isinstance(value, CandleSpec):
+        return value
+    fields = value.split(":")
+    if __debug__:
+        if len(fields) > 3:
+            raise AssertionError("Unrecognized candle spec syntax", value)
+    return TransportCandleSpec.parse_arg(":".join(fields + [""] * (3 - len(fields))))
+
+
+def parse_time(value: TimeArg) -> pd.Timestamp:
+    ## return a timezone-aware timestamp, interpreting a naive time as UTC
+    ts = pd.Timestamp(value)
+    return ts.tz_localize(UTC) if ts.tzinfo is None else ts
+
+
+class BackfillWindow:
+    """Time range for one candlestick request in a backfill"""
+
+    __slots__ = "spec", "start", "end"
+
+    spec: CandleSpec
+
+    start: pd.Timestamp
+    """Inclusive start of the window"""
+
+    end: pd.Timestamp
+    """End of the window, also the start of any next window"""
+
+    def __init__(self, spec: CandleSpec, start: pd.Timestamp, end: pd.Timestamp):
+        self.spec = spec
+        self.start = start
+        self.end = end
+
+    def request_args(self) -> dict:
+        """Return the request args for a candlestick request for this window"""
+        spec = self.spec
+        return dict(instrument=spec.instrument, granularity=spec.granularity, price=spec.component,
+                    time_from=self.start, time_to=self.end, columnar=True)
+
+    def __repr__(self) -> str:
+        return "<%s %s [%s, %s) at 0x%x>" % (self.__class__.__name__, self.spec, self.start, self.end, id(self))
+
+
+def plan_windows(spec: SpecArg, start: TimeArg, end: TimeArg,
+                 max_count: int = MAX_WINDOW_CANDLES) -> list[BackfillWindow]:
+    """Split the range from `start` to `end` into consecutive windows, each spanning
+    at most `max_count` candles for the candle spec
+
+    Each window will span the maximum duration for `max_count` candles at the minimum
+    candle interval for the granularity, excepting the last window in the range.
+    """
+    if __debug__:
+        if max_count < 2:
+            raise AssertionError("Invalid max_count for backfill windows", max_count)
+    spec = parse_spec(spec)
+    t_start = parse_time(start)
+    t_end = parse_time(end)
+    ## the last candle in a window may begin at the window's `to` time,
+    ## if the API interprets that time as an inclusive bound
+    span = granularity_span(spec.granularity) * (max_count - 1)
+    windows = []
+    while t_start < t_end:
+        w_end = min(t_start + span, t_end)
+        windows.append(BackfillWindow(spec, t_start, w_end))
+        t_start = w_end
+    return windows
+
+
+def stitch_frames(frames: Sequence[pd.DataFrame]) -> pd.DataFrame:
+    """Return one DataFrame for the candle frames of consecutive windows, ordered by
+    time, retaining only the last candle for any time present in more than one frame"""
+    frames = [df for df in frames if len(df)]
+    if not frames:
+        return pd.DataFrame()
+    df = pd.concat(frames) if len(frames) > 1 else frames[0]
+    if not df.index.is_monotonic_increasing:
+        df = df.sort_index(kind="stable")
+    duplicated = df.index.duplicated(keep="last")
+    return df[~duplicated] if duplicated.any() else df
+
+
+async def fetch_columns(controller: RequestController, window: BackfillWindow,
+                        request_cls: type[InstrumentQuotesRequest] = GetInstrumentCandlesRequest,
+                        **args) -> CandleColumns:
+    """Fetch the candles for one backfill window, returning a CandleColumns object
+
+    Any `args` will override the request args for the window. An arg with a value
+    of None will not be provided to the request.
+    """
+    request_args = window.request_args()
+    request_args.update(args)
+    builder = controller.get_request_builder(request_cls, {k: v for k, v in request_args.items() if v is not None})
+    request, future = builder.build()
+    await request.dispatch_request()
+    response = await future
+    if __debug__:
+        if not isinstance(response, CandleColumns):
+            raise AssertionError("Unexpected response for columnar request", response)
+        logger.debug("backfill: %d candles for %r", len(response), window)
+    return response
+
+
+async def fetch_window(controller: RequestController, window: BackfillWindow,
+                       request_cls: type[InstrumentQuotesRequest] = GetInstrumentCandlesRequest
+                       ) -> pd.DataFrame:
+    """Fetch the candles for one backfill window, returning a DataFrame"""
+    columns = await fetch_columns(controller, window, request_cls)
+    return columns.to_df()
+
+
+async def backfill_spec(controller: RequestController, spec: SpecArg,
+                        start: TimeArg, end: Optional[TimeArg] = None,
+                        max_concurrency: int = BACKFILL_CONCURRENCY,
+                        semaphore: Optional[aio.Semaphore] = None,
+                        request_cls: type[InstrumentQuotesRequest] = GetInstrumentCandlesRequest
+                        ) -> pd.DataFrame:
+    """Fetch all candles for the candle spec between `start` and `end`, returning a DataFrame
+
+    If `end` is not provided, the range will end at the current time.
+
+    The windows for the range will be fetched concurrently, with at most `max_concurrency`
+    requests in flight. A `semaphore` may be provided, such as to share one bound on
+    concurrency among several backfills.
+    """
+    t_end = pd.Timestamp.now(UTC) if end is None else end
+    windows = plan_windows(spec, start, t_end)
+    sem = semaphore or aio.Semaphore(max_concurrency)
+
+    async def fetch(window: BackfillWindow) -> pd.DataFrame:
+        async with sem:
+            return await fetch_window(controller, window, request_cls)
+
+    async with TaskGroup() as tg:
+        tasks = [tg.create_task(fetch(window)) for window in windows]
+    return stitch_frames([task.result() for task in tasks])
+
+
+async def backfill(controller: RequestController, specs: Sequence[SpecArg],
+                   start: TimeArg, end: Optional[TimeArg] = None,
+                   max_concurrency: int = BACKFILL_CONCURRENCY,
+                   request_cls: type[InstrumentQuotesRequest] = GetInstrumentCandlesRequest
+                   ) -> pd.DataFrame:
+    """Fetch all candles for each candle spec between `start` and `end`
+
+    Returns a DataFrame indexed by candle spec and candle time. All windows, for all
+    candle specs, will share one bound on concurrency.
+    """
+    t_end = pd.Timestamp.now(UTC) if end is None else end
+    parsed = [parse_spec(spec) for spec in specs]
+    sem = aio.Semaphore(max_concurrency)
+    async with TaskGroup() as tg:
+        tasks = [tg.create_task(backfill_spec(controller, spec, start, t_end, semaphore=sem, request_cls=request_cls))
+                 for spec in parsed]
+    keys = [str(spec) for spec in parsed]
+    frames = [task.result() for task in tasks]
+    if len(frames) == 1:
+        return frames[0]
+    return pd.concat(frames, keys=keys, names=["spec", frames[0].index.name or "time"])
+
+
+def write_frame(df: pd.DataFrame, path: Optional[str]):
+    ## write a DataFrame to a file, in a format selected by the file type,
+    ## or as CSV to stdout
+    if path is None:
+        df.to_csv(sys.stdout)
+        return
+    ext = os.path.splitext(path)[1].lower()
+    if ext == ".parquet":
+        df.to_parquet(path)
+    elif ext in (".pkl", ".pickle"):
+        df.to_pickle(path)
+    else:
+        df.to_csv(path)
+
+
+class BackfillController(RequestController):
+    """Command line application for candlestick backfill"""
+
+    __slots__ = tuple(list(RequestController.__slots__) + [
+        "specs", "start", "end", "max_concurrency", "output"
+    ])
+
+    specs: list[CandleSpec]
+    start: pd.Timestamp
+    end: Optional[pd.Timestamp]
+    max_concurrency: int
+    output: Optional[str]
+
+    @classmethod
+    @contextmanager
+    def argparser(
+        cls, prog: Optional[str] = None, description: Optional[str] = None
+    ) -> Iterator[ap.ArgumentParser]:
+        desc = description or "Fetch candlestick history for one or more candle specs"
+        with super().argparser(prog or __name__, desc) as parser:
+            # fmt: off
+            grp = parser.add_argument_group("backfill")
+            grp.add_argument("specs", nargs="+", metavar="instrument[:granularity[:price]]",
+                             help="Candle spec, e.g EUR_USD:M1:BA")
+            grp.add_argument("--from", dest="start", required=True,
+                             help="Start of the time range, as any time string for pd.Timestamp()")
+            grp.add_argument("--to", dest="end", default=None,
+                             help="End of the time range. default: the current time")
+            grp.add_argument("-j", "--concurrency", dest="max_concurrency", type=int,
+                             default=BACKFILL_CONCURRENCY,
+                             help="Maximum number of concurrent requests. default: %(default)s")
+            grp.add_argument("-o", "--output", dest="output", default=None,
+                             help="Output file, written as CSV, or as Parquet or pickle by file type. default: stdout")
+            # fmt: on
+            yield parser
+
+    def process_args(self, namespace: ap.Namespace, unparsed: list[str]):
+        if len(unparsed) > 0:
+            raise ValueError("Unparsed args", unparsed)
+        self.specs = [parse_spec(spec) for spec in namespace.specs]
+        self.start = parse_time(namespace.start)
+        self.end = None if namespace.end is None else parse_time(namespace.end)
+        self.max_concurrency = namespace.max_concurrency
+        self.output = namespace.output
+
+    async def run_async(self):
+        try:
+            df = await backfill(self, self.specs, self.start, self.end, self.max_concurrency)
+            await aio.get_running_loop().run_in_executor(self.executor, write_frame, df, self.output)
+        except Exception as exc:
+            logger.critical("Backfill failed", exc_info=sys.exc_info())
+            with suppress(cofutures.InvalidStateError):
+                self.exit_future.set_exception(exc)
+        else:
+            with suppress(cofutures.InvalidStateError):
+                self.exit_future.set_result(0)
+
+
+__all__ = exporting(__name__, ...)
+
+
+if __name__ == "__main__":
+    sys.exit(BackfillController.run_main())
@@ -0,0 +1,469 @@
+"""Persistent on-disk cache for completed candles
+
+A completed candle will not change, once received. The candle cache will store the
+completed candles received for each candle key, i.e for each instrument, granularity,
+price component, and alignment parameters of a candle request. Each key is stored in
+a directory of append-friendly column files:
+
+- `time.i8`: candle start times, as int64 nanoseconds UTC
+- `prices.f8`: float64 o, h, l, c quotes for each price component, one row per candle
+- `volume.u4`: uint32 volume for each candle
+- `meta.json`: price component labels, the number of stored rows, and a time-range
+  index for the ranges of time known to be fully stored
+
+Rows are stored in order of candle time. Candles later than the last stored candle
+will be appended to the column files. Candles for an earlier range of time will be
+merged into new column files. The windows fetched for one request will be stored
+together, with one write to the column files.
+
+When a candle cache is configured for the request controller, a
+`GetInstrumentCandlesRequest` for a time range will be served from the cache,
+fetching only the missing sub-ranges and any trailing incomplete candle from the
+fxTrade v20 API.
+
+see also: Configuration.candle_cache_dir
+"""
+
+import asyncio as aio
+import json
+import logging
+import os
+from pathlib import Path
+import re
+import threading
+from typing import Any, NamedTuple, Optional, Sequence, TYPE_CHECKING
+import numpy as np
+import numpy.typing as npt
+import pandas as pd
+
+from .candle_columns import CandleColumns, N_QUOTES
+from .models.candlestick_granularity import CandlestickGranularity
+from .models.common_types import InstrumentName
+from .models.currency_pair import CurrencyPair
+from .transport.timestamps import UTC
+from .util.naming import exporting
+from .util.paths import Pathname, expand_path
+
+if TYPE_CHECKING:
+    from .api.request_base import RequestController
+    from .api.request.get_instrument_candles import GetInstrumentCandlesRequest
+
+logger = logging.getLogger(__name__)
+
+
+CACHE_FORMAT: int = 1
+"""Format version for the candle cache metadata"""
+
+TIME_FILE: str = "time.i8"
+PRICES_FILE: str = "prices.f8"
+VOLUME_FILE: str = "volume.u4"
+META_FILE: str = "meta.json"
+
+KEY_SEPARATOR: str = "_"
+
+UNSAFE_NAME_CHARS = re.compile(r"[^A-Za-z0-9.+-]")
+
+
+def param_value(request: "GetInstrumentCandlesRequest", name: str) -> Any:
+    ## return the value of a query parameter for the request, or the default value
+    ## for the parameter if the request value is None. The fxTrade v20 API will use
+    ## the default value for any parameter not provided in the request
+    value = getattr(request, name)
+    return request.model_fields[name].default if value is None else value
+
+
+class CandleKey(NamedTuple):
+    """Key for a series of candles in the candle cache"""
+
+    instrument: str
+    granularity: str
+    component: str
+    smooth: bool
+    daily_alignment: int
+    alignment_timezone: str
+    weekly_alignment: str
+
+    @classmethod
+    def for_request(cls, request: "GetInstrumentCandlesRequest") -> "CandleKey":
+        granularity, price, smooth, daily_alignment, alignment_timezone, weekly_alignment = (
+            param_value(request, name) for name in
+            ("granularity", "price", "smooth", "daily_alignment", "alignment_timezone", "weekly_alignment")
+        )
+        return cls(str(request.instrument), granularity.value, price.value, bool(smooth),
+                   daily_alignment, alignment_timezone, weekly_alignment.value)
+
+    @property
+    def dirname(self) -> str:
+        """Directory name for the key, within the cache directory"""
+        return KEY_SEPARATOR.join(UNSAFE_NAME_CHARS.sub("-", str(elt)) for elt in self)
+
+
+class CoverageIndex:
+    """Time-range index for a candle store
+
+    The index provides a sorted sequence of disjoint ranges `[start, end)`, in
+    nanoseconds UTC, such that all completed candles starting within each range
+    have been stored.
+    """
+
+    __slots__ = ("ranges",)
+
+    ranges: list[tuple[int, int]]
+
+    def __init__(self, ranges: Sequence[Sequence[int]] = ()):
+        self.ranges = []
+        for start, end in ranges:
+            self.add(start, end)
+
+    def add(self, start: int, end: int):
+        """Add a range to the index, merging any adjacent or overlapping ranges"""
+        if end <= start:
+            return
+        merged = []
+        for r_start, r_end in self.ranges:
+            if r_end < start or r_start > end:
+                merged.append((r_start, r_end))
+            else:
+                start = min(start, r_start)
+                end = max(end, r_end)
+        merged.append((start, end))
+        merged.sort()
+        self.ranges = merged
+
+    def missing(self, start: int, end: int) -> list[tuple[int, int]]:
+        """Return the sub-ranges of `[start, end)` not covered in the index"""
+        gaps = []
+        for r_start, r_end in self.ranges:
+            if r_end <= start:
+                continue
+            if r_start >= end:
+                break
+            if r_start > start:
+                gaps.append((start, r_start))
+            start = max(start, r_end)
+            if start >= end:
+                break
+        if start < end:
+            gaps.append((start, end))
+        return gaps
+
+    def __repr__(self) -> str:
+        return "<%s %d ranges at 0x%x>" % (self.__class__.__name__, len(self.ranges), id(self))
+
+
+class CandleStore:
+    """Column files and range index for one candle key
+
+    Methods of this class are thread-safe
+    """
+
+    __slots__ = ("path", "key", "components", "rows", "coverage", "lock")
+
+    path: Path
+
+    key: CandleKey
+
+    components: Optional[tuple[str, ...]]
+    """Price component labels for the stored prices, or None if no candles have been stored"""
+
+    rows: int
+    """Number of candles stored. The column files may contain additional, partial data"""
+
+    coverage: CoverageIndex
+
+    lock: threading.RLock
+
+    def __init__(self, path: Path, key: CandleKey):
+        self.path = path
+        self.key = key
+        self.components = None
+        self.rows = 0
+        self.coverage = CoverageIndex()
+        self.lock = threading.RLock()
+        self.load_meta()
+
+    def load_meta(self):
+        meta_path = self.path / META_FILE
+        if not meta_path.exists():
+            return
+        try:
+            with meta_path.open("r") as stream:
+                meta = json.load(stream)
+            if meta.get("format") != CACHE_FORMAT:
+                raise ValueError("Unsupported candle cache format", meta.get("format"))
+            components = meta["components"]
+            self.components = tuple(components) if components else None
+            self.rows = meta["rows"]
+            self.coverage = CoverageIndex(meta["ranges"])
+        except Exception:
+            logger.warning("Discarding candle cache metadata %s", meta_path, exc_info=True)
+            self.components = None
+            self.rows = 0
+            self.coverage = CoverageIndex()
+
+    def save_meta(self):
+        meta = dict(format=CACHE_FORMAT, key=self.key._asdict(), components=self.components,
+                    rows=self.rows, ranges=self.coverage.ranges)
+        meta_path = self.path / META_FILE
+        tmp_path = meta_path.with_suffix(".tmp")
+        with tmp_path.open("w") as stream:
+            json.dump(meta, stream)
+        os.replace(tmp_path, meta_path)
+
+    @property
+    def n_prices(self) -> int:
+        return N_QUOTES * len(self.components) if self.components else 0
+
+    def column_files(self, suffix: str = "") -> tuple[Path, Path, Path]:
+        path = self.path
+        return path / (TIME_FILE + suffix), path / (PRICES_FILE + suffix), path / (VOLUME_FILE + suffix)
+
+    def load_columns(self, start: int = 0, end: Optional[int] = None
+                     ) -> tuple[npt.NDArray[np.int64], npt.NDArray[np.double], npt.NDArray[np.uint32]]:
+        ## return a copy of the stored time, prices, and volume arrays, for rows
+        ## `start` to `end`. The prices array will have one row per candle
+        n = self.rows if end is None else end
+        n_prices = self.n_prices
+        if n <= start:
+            return np.empty(0, np.int64), np.empty((0, n_prices), np.double), np.empty(0, np.uint32)
+        time_path, prices_path, volume_path = self.column_files()
+        time = np.fromfile(time_path, np.int64, n - start, offset=start * 8)
+        prices = np.fromfile(prices_path, np.double, (n - start) * n_prices,
+                             offset=start * n_prices * 8).reshape(n - start, n_prices)
+        volume = np.fromfile(volume_path, np.uint32, n - start, offset=start * 4)
+        return time, prices, volume
+
+    def time_index(self) -> npt.NDArray[np.int64]:
+        ## return a read-only view of the stored candle times
+        if self.rows == 0:
+            return np.empty(0, np.int64)
+        return np.memmap(self.column_files()[0], np.int64, "r", shape=(self.rows,))
+
+    def read(self, start: int, end: int
+             ) -> tuple[npt.NDArray[np.int64], npt.NDArray[np.double], npt.NDArray[np.uint32]]:
+        """Return the time, prices, and volume arrays for the stored candles starting
+        within `[start, end)`, in nanoseconds UTC"""
+        with self.lock:
+            time = self.time_index()
+            lo = int(np.searchsorted(time, start, "left"))
+            hi = int(np.searchsorted(time, end, "left"))
+            del time
+            return self.load_columns(lo, hi)
+
+    def write_columns(self, time: npt.NDArray[np.int64], prices: npt.NDArray[np.double],
+                      volume: npt.NDArray[np.uint32], append: bool):
+        ## write or append the column files, truncating any data beyond the stored rows
+        ## before an append
+        n_prices = self.n_prices
+        mode = "r+b" if append else "wb"
+        suffix = "" if append else ".tmp"
+        sizes = (8, 8 * n_prices, 4)
+        arrays = (time, prices, volume)
+        paths = self.column_files(suffix)
+        for path, size, data in zip(paths, sizes, arrays):
+            if append and not path.exists():
+                path.touch()
+            with path.open(mode) as stream:
+                if append:
+                    stream.truncate(self.rows * size)
+                    stream.seek(self.rows * size)
+                stream.write(np.ascontiguousarray(data).tobytes())
+        if not append:
+            for tmp_path, path in zip(paths, self.column_files()):
+                os.replace(tmp_path, path)
+
+    def store(self, columns: CandleColumns, start: int, end: int):
+        """Store the completed candles from `columns` starting within `[start, end)`, adding
+        the range to the coverage index
+
+        The caller should ensure that all completed candles within the range are
+        present in `columns`
+        """
+        self.store_all(((columns, start, end),))
+
+    def store_all(self, windows: Sequence[tuple[CandleColumns, int, int]]):
+        """Store the completed candles for each `(columns, start, end)` window, as under
+        `store()`, with one write to the column files for all windows
+
+        The windows should not overlap. The windows may be provided in any order.
+        """
+        with self.lock:
+            parts = []
+            for columns, start, end in sorted(windows, key=lambda window: window[1]):
+                if self.components is None:
+                    self.components = tuple(columns.components)
+                elif self.components != tuple(columns.components):
+                    logger.warning("Not caching candles with components %r for %r", columns.components, self)
+                    continue
+                c_time = columns.time.view(np.int64)
+                select = columns.complete & (c_time >= start) & (c_time < end)
+                parts.append((c_time[select], columns.prices.T[select],
+                              columns.volume[select].astype(np.uint32, copy=False), start, end))
+            if not parts:
+                return
+            time = np.concatenate([part[0] for part in parts])
+            prices = np.concatenate([part[1] for part in parts])
+            volume = np.concatenate([part[2] for part in parts])
+            if len(time):
+                stored = self.time_index()
+                last = int(stored[-1]) if len(stored) else None
+                del stored
+                if (last is None or time[0] > last) and bool((time[1:] > time[:-1]).all()):
+                    self.path.mkdir(parents=True, exist_ok=True)
+                    self.write_columns(time, prices, volume, append=True)
+                    self.rows += len(time)
+                else:
+                    ## merge the candles with the stored candles, retaining the
+                    ## new candle for any time stored previously
+                    s_time, s_prices, s_volume = self.load_columns()
+                    m_time = np.concatenate((s_time, time))
+                    order = np.argsort(m_time, kind="stable")
+                    m_time = m_time[order]
+                    keep = np.append(m_time[1:] != m_time[:-1], True)
+                    order = order[keep]
+                    m_time = m_time[keep]
+                    self.write_columns(m_time, np.concatenate((s_prices, prices))[order],
+                                       np.concatenate((s_volume, volume))[order], append=False)
+                    self.rows = len(m_time)
+            elif not self.path.exists():
+                self.path.mkdir(parents=True, exist_ok=True)
+            for part in parts:
+                self.coverage.add(part[3], part[4])
+            self.save_meta()
+
+    def __repr__(self) -> str:
+        return "<%s %s %d rows at 0x%x>" % (self.__class__.__name__, self.path, self.rows, id(self))
+
+
+class CandleCache:
+    """On-disk cache for completed candles, with one candle store for each candle key"""
+
+    __slots__ = ("root", "stores", "lock")
+
+    root: Path
+
+    stores: dict[CandleKey, CandleStore]
+
+    lock: threading.Lock
+
+    def __init__(self, root: Pathname):
+        self.root = Path(expand_path(root))
+        self.stores = dict()
+        self.lock = threading.Lock()
+
+    def get_store(self, key: CandleKey) -> CandleStore:
+        with self.lock:
+            store = self.stores.get(key, None)
+            if store is None:
+                store = CandleStore(self.root / key.dirname, key)
+                self.stores[key] = store
+            return store
+
+    def __repr__(self) -> str:
+        return "<%s %s at 0x%x>" % (self.__class__.__name__, self.root, id(self))
+
+
+def concat_columns(instrument: CurrencyPair, granularity: CandlestickGranularity, components: tuple[str, ...],
+                   parts: Sequence[tuple[npt.NDArray[np.int64], npt.NDArray[np.double],
+                                         npt.NDArray[np.uint32], npt.NDArray[np.bool_]]]) -> CandleColumns:
+    ## return a CandleColumns for the time, prices (one row per candle), volume, and
+    ## complete arrays of each part, in order of time, retaining the last candle
+    ## for any time present in more than one part
+    if parts:
+        time = np.concatenate([part[0] for part in parts])
+        prices = np.concatenate([part[1] for part in parts])
+        volume = np.concatenate([part[2] for part in parts])
+        complete = np.concatenate([part[3] for part in parts])
+        order = np.argsort(time, kind="stable")
+        keep = np.append(time[order][1:] != time[order][:-1], True)
+        order = order[keep]
+        time, prices, volume, complete = time[order], prices[order], volume[order], complete[order]
+    else:
+        time = np.empty(0, np.int64)
+        prices = np.empty((0, N_QUOTES * len(components)), np.double)
+        volume = np.empty(0, np.uint32)
+        complete = np.empty(0, np.bool_)
+    return CandleColumns(instrument, granularity, components, time.view("datetime64[ns]"),
+                         UTC, np.ascontiguousarray(prices.T), volume, complete)
+
+
+async def fetch_cached(request: "GetInstrumentCandlesRequest", cache: CandleCache) -> CandleColumns:
+    """Return the candles for a time-range candle request, using the candle cache
+
+    Each missing sub-range in the request's time range will be fetched from the
+    API in windows of at most 5000 candles. The completed candles from each
+    window will be stored in the cache. The result will include the cached
+    candles and any incomplete candle received for the request's time range.
+    """
+    from .candle_backfill import fetch_columns, granularity_span, parse_time, plan_windows, MAX_WINDOW_CANDLES
+    from .api.request.get_instrument_candles import CandleSpec
+
+    controller: "RequestController" = request.controller
+    time_from, time_to = request.time_from, request.time_to
+    if time_from is None:
+        raise ValueError("Request does not provide a time_from value", request)
+    store = cache.get_store(CandleKey.for_request(request))
+    instrument: CurrencyPair = InstrumentName.parse(request.instrument)
+    spec = CandleSpec(instrument, param_value(request, "granularity"), param_value(request, "price"))
+    span = granularity_span(spec.granularity)
+    now = pd.Timestamp.now(UTC)
+    start = parse_time(time_from)
+    open_end = time_to is None
+    end = now if time_to is None else min(parse_time(time_to), now)
+    start_ns = start.value if request.include_first else start.value + 1
+    end_ns = end.value
+
+    ## request args for the missing ranges, as in the original request
+    fields = request.model_fields_set
+    args: dict[str, Any] = {name: getattr(request, name) for name in
+                            ("smooth", "daily_alignment", "alignment_timezone", "weekly_alignment")
+                            if name in fields}
+    args.update(host=request.host, use_cache=False, include_first=True)
+
+    windows = []
+    for gap_start, gap_end in store.coverage.missing(start_ns, end_ns):
+        windows.extend(plan_windows(spec, pd.Timestamp(gap_start, tz=UTC), pd.Timestamp(gap_end, tz=UTC)))
+    if __debug__:
+        logger.debug("candle cache: %d windows to fetch for %r", len(windows), store)
+
+    async def fetch(window) -> tuple[CandleColumns, int, int]:
+        window_args = dict(args)
+        if open_end and window.end == end:
+            ## not providing a `to` time, which may be later than the server time
+            window_args.update(time_to=None, count=MAX_WINDOW_CANDLES)
+        columns = await fetch_columns(controller, window, **window_args)
+        ## the range will be covered through the first incomplete candle, and not
+        ## within the duration of a candle before the current time
+        cover_end = min(window.end, now - span).value
+        incomplete = columns.time[~columns.complete]
+        if len(incomplete):
+            cover_end = min(cover_end, int(incomplete[0].view(np.int64)))
+        return columns, window.start.value, cover_end
+
+    received: list[tuple[CandleColumns, int, int]] = await aio.gather(*(fetch(window) for window in windows))
+    fetched = [columns for columns, _, _ in received]
+
+    def store_and_read():
+        ## store all windows with one write, in order of time, then read the
+        ## request's time range from the store
+        if received:
+            store.store_all(received)
+        return store.read(start_ns, end_ns)
+
+    ## file I/O for the store, in the controller's executor
+    time, prices, volume = await aio.get_running_loop().run_in_executor(None, store_and_read)
+    parts = [(time, prices, volume, np.ones(len(time), np.bool_))]
+    components = store.components or (tuple(fetched[0].components) if fetched else ())
+    last = time[-1] if len(time) else start_ns - 1
+    for columns in fetched:
+        ## incomplete candles, and any completed candles not stored
+        c_time = columns.time.view(np.int64)
+        select = c_time > last
+        if not open_end:
+            select &= c_time < end_ns
+        if select.any() and tuple(columns.components) == components:
+            parts.append((c_time[select], columns.prices.T[select], columns.volume[select], columns.complete[select]))
+    return concat_columns(instrument, spec.granularity, components, parts)
+
+
+__all__ = exporting(__name__, ...)
@@ -0,0 +1,341 @@
+"""Columnar decoding for candlestick responses"""
+
+from collections.abc import Iterator
+import numpy as np
+import numpy.typing as npt
+import pandas as pd
+from typing import Any, BinaryIO, Optional, Sequence, Union
+from typing_extensions import ClassVar
+
+from .fx_const import FxLabel, FxCol
+from .parser import InstanceBuilder, json_backend
+from .models.candlestick import Candlestick
+from .models.candlestick_data import CandlestickData
+from .models.candlestick_granularity import CandlestickGranularity, CandlestickFrequency
+from .models.common_types import InstrumentName, PriceValue, Time
+from .models.currency_pair import CurrencyPair
+from .models.price_component import PriceComponent
+from .transport.timestamps import UTC, parse_rfc3339_ns
+from .util.naming import exporting
+
+
+QUOTE_LABELS: tuple[str, ...] = (FxLabel.OPEN.value, FxLabel.HIGH.value, FxLabel.LOW.value, FxLabel.CLOSE.value)
+"""Quote labels for each price component, in column order"""
+
+COMPONENT_LABELS: tuple[str, ...] = (FxLabel.MID.value, FxLabel.ASK.value, FxLabel.BID.value)
+"""Price component labels, in column order"""
+
+COMPONENT_CODES: dict[str, str] = {"M": FxLabel.MID.value, "A": FxLabel.ASK.value, "B": FxLabel.BID.value}
+"""Mapping of PriceComponent request codes to price component labels"""
+
+QUOTE_OFFSETS: dict[str, int] = {label: n for n, label in enumerate(QUOTE_LABELS)}
+"""Row offset for each quote label, within the rows for a price component"""
+
+N_QUOTES: int = len(QUOTE_LABELS)
+
+DEFAULT_CAPACITY: int = 500
+"""Default initial capacity for a CandleColumnsBuilder, matching the default count for candle requests"""
+
+
+class CandleColumns:
+    """Columnar storage for candlestick data from a GetInstrumentCandles200Response
+
+    Each series of values is stored in a NumPy array:
+    - `time`: datetime64[ns] start time for each candle, UTC
+    - `prices`: float64 array of shape `(4 * len(components), n)`, providing the
+      o, h, l, c quotes for each price component, in row order
+    - `volume`: uint32 volume for each candle
+    - `complete`: bool completion flag for each candle
+
+    The dataframe produced with `to_df()` will use the same layout as for
+    `GetInstrumentCandles200Response.to_df()`, such that can be provided
+    to FxFrame. The dataframe will be initialized without copying the
+    underlying arrays.
+    """
+
+    __slots__ = "instrument", "granularity", "components", "time", "tz", "prices", "volume", "complete"
+
+    instrument: CurrencyPair
+    """The instrument for the candlestick data"""
+
+    granularity: CandlestickGranularity
+    """The granularity for the candlestick data"""
+
+    components: tuple[str, ...]
+    """Price component labels, for each set of four rows in `prices`"""
+
+    time: npt.NDArray[np.datetime64]
+    """Candle start times, as datetime64[ns]"""
+
+    tz: Any
+    """Timezone for candle start times, if the timestamps were received in a timezone-aware format"""
+
+    prices: npt.NDArray[np.double]
+    """Price quotes for each component, as a 2D array of shape `(4 * len(components), n)`"""
+
+    volume: npt.NDArray[np.uint32]
+    """Volume for each candle"""
+
+    complete: npt.NDArray[np.bool_]
+    """Completion flag for each candle"""
+
+    def __init__(self, instrument: CurrencyPair, granularity: CandlestickGranularity,
+                 components: tuple[str, ...], time: npt.NDArray[np.datetime64], tz: Any,
+                 prices: npt.NDArray[np.double], volume: npt.NDArray[np.uint32],
+                 complete: npt.NDArray[np.bool_]):
+        self.instrument = instrument
+        self.granularity = granularity
+        self.components = components
+        self.time = time
+        self.tz = tz
+        self.prices = prices
+        self.volume = volume
+        self.complete = complete
+
+    def __len__(self) -> int:
+        return len(self.time)
+
+    def __repr__(self) -> str:
+        return "<%s [%s, %s, %s] %d candles at 0x%x>" % (
+            self.__class__.__name__, self.instrument.name, self.granularity.value,
+            ", ".join(self.components), len(self), id(self)
+        )
+
+    def component(self, name: Union[str, FxLabel]) -> npt.NDArray[np.double]:
+        """Return a view of the o, h, l, c quotes for a price component, as an array of shape `(4, n)`
+
+        Raises KeyError if the price component is not available in the candle data
+        """
+        label = name.value if isinstance(name, FxLabel) else name
+        if label not in self.components:
+            raise KeyError("Price component not available", name, self.components)
+        start = self.components.index(label) * N_QUOTES
+        return self.prices[start:start + N_QUOTES]
+
+    def get_time_index(self) -> pd.DatetimeIndex:
+        """Return a DatetimeIndex for the candle start times, as a view of the `time` array"""
+        tz = self.tz
+        dtype = pd.DatetimeTZDtype(tz=tz) if tz else self.time.dtype
+        return pd.DatetimeIndex(pd.arrays.DatetimeArray(self.time, dtype=dtype, copy=False), copy=False, name=FxLabel.TIME.value)
+
+    def to_df(self) -> pd.DataFrame:
+        """Return a DataFrame with multi-index columns for the candle data.
+
+        The dataframe will share memory with the arrays of this object.
+        """
+        index = self.get_time_index()
+        columns = pd.MultiIndex.from_tuples(tuple((component, q,) for component in self.components for q in QUOTE_LABELS))
+        ## the transposed prices array provides a column-major view, as stored in the dataframe
+        df_prices = pd.DataFrame(self.prices.T, index=index, columns=columns, copy=False)
+        df_common = pd.DataFrame({FxCol.VOLUME.value: self.volume, FxCol.COMPLETE.value: self.complete}, index=index, copy=False)
+        df: pd.DataFrame = pd.concat([df_prices, df_common], axis=1, copy=False)
+        df.index.name = FxLabel.TIME.value
+        df.attrs['instrument'] = self.instrument.name
+        df.attrs['frequency'] = CandlestickFrequency.get(self.granularity).value.freqstr
+        df.attrs["granularity"] = self.granularity.value
+        df.attrs['tz'] = self.tz
+        return df
+
+    def iter_candles(self) -> Iterator[Candlestick]:
+        """Yield a Candlestick object for each candle in the columnar data"""
+        components = self.components
+        prices = self.prices
+        volume = self.volume
+        complete = self.complete
+        for n, ts in enumerate(self.get_time_index()):
+            fields: dict[str, Any] = dict(time=ts, volume=volume[n], complete=bool(complete[n]))
+            for idx, component in enumerate(components):
+                row = idx * N_QUOTES
+                fields[component] = CandlestickData.model_construct(
+                    o=prices[row, n], h=prices[row + 1, n], l=prices[row + 2, n], c=prices[row + 3, n]
+                )
+            yield Candlestick.model_construct(**fields)
+
+    @property
+    def candles(self) -> Sequence[Candlestick]:
+        """Sequence of Candlestick objects for the columnar data, as in GetInstrumentCandles200Response"""
+        return tuple(self.iter_candles())
+
+    @classmethod
+    def from_json(cls, data: Union[bytes, str], capacity: Optional[int] = None,
+                  components: Optional[Union[PriceComponent, str]] = None) -> "CandleColumns":
+        """Decode a JSON candles response directly to columnar storage"""
+        if isinstance(data, str):
+            data = data.encode()
+        return cls.from_events(json_backend.basic_parse(data, use_float=True), capacity, components)
+
+    @classmethod
+    def from_stream(cls, stream: BinaryIO, capacity: Optional[int] = None,
+                    components: Optional[Union[PriceComponent, str]] = None) -> "CandleColumns":
+        """Decode a JSON candles response from a blocking binary stream, e.g an open file"""
+        return cls.from_events(json_backend.basic_parse(stream, use_float=True), capacity, components)
+
+    @classmethod
+    def from_events(cls, events, capacity: Optional[int] = None,
+                    components: Optional[Union[PriceComponent, str]] = None) -> "CandleColumns":
+        builder = CandleColumnsBuilder(capacity, components)
+        evt = builder.event
+        for event, value in events:
+            evt(event, value)
+        return builder.instance
+
+
+class CandleColumnsBuilder(InstanceBuilder[CandleColumns]):
+    """Event-driven builder for CandleColumns, from ijson basic_parse events
+
+    The builder will decode each candle in the response directly into preallocated
+    arrays, without creating intermediate Candlestick or CandlestickData objects.
+
+    The initial capacity for the arrays may be provided e.g from the `count` for
+    a candles request. If a response provides more candles than the capacity, the
+    arrays will be reallocated with twice the capacity.
+
+    If the price components for the request are known, e.g as from the `price`
+    parameter of the request, storage will be allocated only for those price
+    components. Otherwise, storage will be allocated for all price components,
+    then reduced to the set of price components received in the response.
+    """
+
+    __slots__ = tuple(set(InstanceBuilder.__slots__).union({
+        "depth", "in_candles", "component_row", "capacity", "n_candles",
+        "instrument", "granularity", "components", "component_offsets", "received",
+        "time", "tz", "prices", "volume", "complete"
+    }))
+
+    time_parse: ClassVar = Time.parse
+    price_parse: ClassVar = PriceValue.parse
+
+    def __init__(self, capacity: Optional[int] = None,
+                 components: Optional[Union[PriceComponent, str]] = None):
+        super().__init__(CandleColumns)
+        if components:
+            codes = components.value if isinstance(components, PriceComponent) else components.upper()
+            labels = tuple(label for label in COMPONENT_LABELS if label in frozenset(COMPONENT_CODES[c] for c in codes))
+        else:
+            labels = COMPONENT_LABELS
+        self.components = labels
+        self.component_offsets = {label: n * N_QUOTES for n, label in enumerate(labels)}
+        self.received = set()
+        self.depth = 0
+        self.in_candles = False
+        self.component_row = None
+        self.n_candles = 0
+        self.tz = None
+        self.allocate(max(1, capacity or DEFAULT_CAPACITY))
+
+    def allocate(self, capacity: int):
+        """Allocate storage arrays for the provided capacity, retaining any decoded candle data"""
+        n = self.n_candles
+        ## a candle may not provide every price component received for other
+        ## candles. The storage is initialized such that any missing values will
+        ## be decoded as NaN, with zero volume
+        time = np.full(capacity, np.datetime64("NaT"), dtype="datetime64[ns]")
+        prices = np.full((len(self.components) * N_QUOTES, capacity), np.nan, dtype=PriceValue.storage_class)
+        volume = np.zeros(capacity, dtype=np.uint32)
+        complete = np.zeros(capacity, dtype=np.bool_)
+        if n:
+            time[:n] = self.time[:n]
+            prices[:, :n] = self.prices[:, :n]
+            volume[:n] = self.volume[:n]
+            complete[:n] = self.complete[:n]
+        self.time = time
+        self.prices = prices
+        self.volume = volume
+        self.complete = complete
+        self.capacity = capacity
+
+    def instance_prototype(self) -> CandleColumns:
+        raise NotImplementedError(self.instance_prototype)
+
+    def finalize_builder(self):
+        n = self.n_candles
+        received = self.received
+        labels = self.components
+        prices = self.prices[:, :n]
+        if len(received) != len(labels):
+            ## reduce the price storage to the set of received price components
+            ##
+            ## this will use a view of the price storage, when the received price
+            ## components are contiguous in the storage array
+            used = tuple(label for label in labels if label in received)
+            rows = [self.component_offsets[label] + q for label in used for q in range(N_QUOTES)]
+            if rows and rows == list(range(rows[0], rows[-1] + 1)):
+                prices = prices[rows[0]:rows[-1] + 1]
+            else:
+                prices = prices[rows]
+            labels = used
+        self.instance = CandleColumns(
+            self.instrument, self.granularity, labels,
+            self.time[:n], self.tz, prices, self.volume[:n], self.complete[:n]
+        )
+        self.finalized = True
+
+    def event(self, event: str, value: Any):
+        depth = self.depth
+        if event == "map_key":
+            if depth == 3:
+                ## quote key within a price component, for the current candle
+                row = self.component_row
+                offset = QUOTE_OFFSETS.get(value)
+                self.key = None if (row is None or offset is None) else row + offset
+            else:
+                self.key = value
+        elif event == "string":
+            if depth == 3:
+                key = self.key
+                if key is not None:
+                    self.prices[key, self.n_candles] = self.price_parse(value)
+            elif depth == 2:
+                if self.in_candles and self.key == "time":
+                    ns = parse_rfc3339_ns(value)
+                    if ns is None:
+                        ts = self.time_parse(value)
+                        if self.n_candles == 0:
+                            self.tz = getattr(ts, "tz", None)
+                        self.time[self.n_candles] = ts.value
+                    else:
+                        if self.n_candles == 0:
+                            self.tz = UTC
+                        self.time[self.n_candles] = ns
+            elif depth == 1:
+                key = self.key
+                if key == "instrument":
+                    self.instrument = InstrumentName.parse(value)
+                elif key == "granularity":
+                    self.granularity = CandlestickGranularity(value)
+        elif event == "number":
+            if depth == 2 and self.key == "volume":
+                self.volume[self.n_candles] = value
+        elif event == "boolean":
+            if depth == 2 and self.key == "complete":
+                self.complete[self.n_candles] = value
+        elif event == "start_map":
+            depth = depth + 1
+            self.depth = depth
+            if depth == 3:
+                label = self.key
+                offset = self.component_offsets.get(label)
+                if offset is not None:
+                    self.received.add(label)
+                self.component_row = offset
+            elif depth == 2 and self.in_candles and self.n_candles == self.capacity:
+                self.allocate(self.capacity * 2)
+        elif event == "end_map":
+            self.depth = depth - 1
+            if depth == 3:
+                self.component_row = None
+                self.key = None
+            elif depth == 2:
+                if self.in_candles:
+                    self.n_candles += 1
+            elif depth == 1:
+                self.finalize_builder()
+        elif event == "start_array":
+            if depth == 1 and self.key == "candles":
+                self.in_candles = True
+        elif event == "end_array":
+            if depth == 1:
+                self.in_candles = False
+
+
+__all__ = exporting(__name__, ...)
@@ -211,6 +211,77 @@ class ConfigurationModel(BaseModel):
     retries: int = 5
     '''Connection retry limit, zero for none'''
 
+    trusted_parse: bool = False
+    '''Parse API responses without model validation.
+
+    If True, objects parsed from API responses will be constructed without
+    the pydantic validation for each field. Each field value will have been
+    parsed with the transport type for the field.
+
+    Objects initialized by the application will be validated, in either case.
+    '''
+
+    rate_limit: Optional[float] = 100
+    '''Client-side request rate ceiling for each host, in requests per second.
+
+    Requests will be delayed as needed, such that no more than this number of
+    requests will be sent to any one host within any one-second interval. Delayed
+    requests will be released in order of request priority.
+
+    None means no client-side limit.
+    '''
+
+    rate_limit_burst: int = 5
+    '''Number of requests that may be sent without delay, after an idle interval.
+
+    The sustained request rate for each host will be `rate_limit - rate_limit_burst`
+    '''
+
+    host_rate_limits: Mapping[str, float] = Field(default_factory=dict)
+    '''Request rate ceiling for individual hosts, by hostname, overriding `rate_limit`'''
+
+    coalesce_requests: bool = True
+    '''Share one HTTP request among concurrent, identical GET requests.
+
+    If True, a REST GET request dispatched while an identical request is in
+    flight under the same request controller will not be sent to the server.
+    The request's future will receive the response object or exception for
+    the in-flight request. Requests are identical if they have the same
+    request class, host, path, and query string.
+    '''
+
+    candle_cache_dir: Optional[Pathname] = None
+    '''Directory for the on-disk cache of completed candles.
+
+    If provided, completed candles received for a `GetInstrumentCandlesRequest`
+    with a `time_from` value and no `count` will be stored in this directory.
+    Later requests for the same instrument, granularity, price component, and
+    alignment parameters will fetch only the ranges of time not yet stored, and
+    any trailing incomplete candle.
+
+    None means no candle cache.
+    '''
+
+    response_cache_dir: Optional[Pathname] = None
+    '''Directory for the conditional-request response cache.
+
+    If provided, responses for REST request classes defining a `cache_ttl`, e.g
+    `ListAcccountsRequest` and `GetAccountInstrumentsRequest`, will be cached in
+    memory and stored in this directory. A cached response will be revalidated
+    with `If-None-Match` or `If-Modified-Since` once stale, honoring any
+    `Cache-Control` header in the response.
+
+    None means no response cache.
+    '''
+
+    response_max_stale: float = 86400
+    '''Time in seconds after expiry, during which a stale cached response may be
+    provided while the request is revalidated in the background.
+
+    A response stale for longer than this duration will be revalidated before
+    the request's future is set.
+    '''
+
     proxy: Optional[Union[str, httpx.Proxy, Literal[False]]] = Field(default_factory=environ_proxy)
     '''HTTPS proxy for REST client requests.
 
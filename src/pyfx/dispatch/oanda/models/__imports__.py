@@ -0,0 +1,401 @@
+from pyfx.dispatch.oanda.models.accept_datetime_format import AcceptDatetimeFormat
+from pyfx.dispatch.oanda.models.account import Account
+from pyfx.dispatch.oanda.models.account_changes import AccountChanges
+from pyfx.dispatch.oanda.models.account_changes_state import AccountChangesState
+from pyfx.dispatch.oanda.models.account_financing_mode import AccountFinancingMode
+from pyfx.dispatch.oanda.models.account_mixins import AccountStateBase
+from pyfx.dispatch.oanda.models.account_mixins import AccountSummaryBase
+from pyfx.dispatch.oanda.models.account_properties import AccountProperties
+from pyfx.dispatch.oanda.models.account_summary import AccountSummary
+from pyfx.dispatch.oanda.models.api_enum import ApiEnumType
+from pyfx.dispatch.oanda.models.api_enum import ApiEnum
+from pyfx.dispatch.oanda.models.calculated_account_state import CalculatedAccountState
+from pyfx.dispatch.oanda.models.calculated_position_state import CalculatedPositionState
+from pyfx.dispatch.oanda.models.calculated_trade_state import CalculatedTradeState
+from pyfx.dispatch.oanda.models.cancel_order200_response import CancelOrder200Response
+from pyfx.dispatch.oanda.models.cancel_order404_response import CancelOrder404Response
+from pyfx.dispatch.oanda.models.cancellable_order_type import CancellableOrderType
+from pyfx.dispatch.oanda.models.candlestick import Candlestick
+from pyfx.dispatch.oanda.models.candlestick_data import CandlestickData
+from pyfx.dispatch.oanda.models.candlestick_granularity import CandlestickGranularity
+from pyfx.dispatch.oanda.models.candlestick_granularity import CandlestickFrequency
+from pyfx.dispatch.oanda.models.client_configure_reject_transaction import ClientConfigureRejectTransaction
+from pyfx.dispatch.oanda.models.client_configure_transaction import ClientConfigureTransaction
+from pyfx.dispatch.oanda.models.client_extensions import ClientExtensions
+from pyfx.dispatch.oanda.models.client_price import ClientPriceBase
+from pyfx.dispatch.oanda.models.client_price import StreamingPrice
+from pyfx.dispatch.oanda.models.client_price import ClientPrice
+from pyfx.dispatch.oanda.models.close_position200_response import ClosePosition200Response
+from pyfx.dispatch.oanda.models.close_position400_response import ClosePosition400Response
+from pyfx.dispatch.oanda.models.close_position404_response import ClosePosition404Response
+from pyfx.dispatch.oanda.models.close_position_request import ClosePositionRequest
+from pyfx.dispatch.oanda.models.close_trade200_response import CloseTrade200Response
+from pyfx.dispatch.oanda.models.close_trade400_response import CloseTrade400Response
+from pyfx.dispatch.oanda.models.close_trade404_response import CloseTrade404Response
+from pyfx.dispatch.oanda.models.close_trade_request import CloseTradeRequest
+from pyfx.dispatch.oanda.models.close_transaction import CloseTransaction
+from pyfx.dispatch.oanda.models.common_types import OrderId
+from pyfx.dispatch.oanda.models.common_types import AccountUnits
+from pyfx.dispatch.oanda.models.common_types import PriceValue
+from pyfx.dispatch.oanda.models.common_types import ClientRequestId
+from pyfx.dispatch.oanda.models.common_types import ClientId
+from pyfx.dispatch.oanda.models.common_types import LotsValue
+from pyfx.dispatch.oanda.models.common_types import TransactionId
+from pyfx.dispatch.oanda.models.common_types import Time
+from pyfx.dispatch.oanda.models.common_types import NullableTimeInterface
+from pyfx.dispatch.oanda.models.common_types import TradeId
+from pyfx.dispatch.oanda.models.common_types import DoubleConstants
+from pyfx.dispatch.oanda.models.common_types import InstrumentName
+from pyfx.dispatch.oanda.models.common_types import FloatValue
+from pyfx.dispatch.oanda.models.configure_account200_response import ConfigureAccount200Response
+from pyfx.dispatch.oanda.models.configure_account400_response import ConfigureAccount400Response
+from pyfx.dispatch.oanda.models.configure_account_request import ConfigureAccountRequest
+from pyfx.dispatch.oanda.models.conversion_factor import ConversionFactor
+from pyfx.dispatch.oanda.models.create_order201_response import CreateOrder201Response
+from pyfx.dispatch.oanda.models.create_order400_response import CreateOrder400Response
+from pyfx.dispatch.oanda.models.create_order404_response import CreateOrder404Response
+from pyfx.dispatch.oanda.models.create_order_request import CreateOrderRequest
+from pyfx.dispatch.oanda.models.create_transaction import CreateTransaction
+from pyfx.dispatch.oanda.models.currency import Currency
+from pyfx.dispatch.oanda.models.currency_pair import CurrencyPair
+from pyfx.dispatch.oanda.models.daily_financing_transaction import DailyFinancingTransaction
+from pyfx.dispatch.oanda.models.day_of_week import DayOfWeek
+from pyfx.dispatch.oanda.models.delayed_trade_closure_transaction import DelayedTradeClosureTransaction
+from pyfx.dispatch.oanda.models.direction import Direction
+from pyfx.dispatch.oanda.models.dynamic_order_state import DynamicOrderState
+from pyfx.dispatch.oanda.models.financing_days_of_week import FinancingDaysOfWeek
+from pyfx.dispatch.oanda.models.fixed_price_order import FixedPriceOrder
+from pyfx.dispatch.oanda.models.fixed_price_order_reason import FixedPriceOrderReason
+from pyfx.dispatch.oanda.models.fixed_price_order_transaction import FixedPriceOrderTransaction
+from pyfx.dispatch.oanda.models.funding_reason import FundingReason
+from pyfx.dispatch.oanda.models.get_account200_response import GetAccount200Response
+from pyfx.dispatch.oanda.models.get_account_changes200_response import GetAccountChanges200Response
+from pyfx.dispatch.oanda.models.get_account_instruments200_response import GetAccountInstruments200Response
+from pyfx.dispatch.oanda.models.get_account_summary200_response import GetAccountSummary200Response
+from pyfx.dispatch.oanda.models.get_external_user_info200_response import GetExternalUserInfo200Response
+from pyfx.dispatch.oanda.models.get_instrument_candles200_response import GetInstrumentCandles200Response
+from pyfx.dispatch.oanda.models.get_instrument_price200_response import GetInstrumentPrice200Response
+from pyfx.dispatch.oanda.models.get_instrument_price_range200_response import GetInstrumentPriceRange200Response
+from pyfx.dispatch.oanda.models.get_order200_response import GetOrder200Response
+from pyfx.dispatch.oanda.models.get_position200_response import GetPosition200Response
+from pyfx.dispatch.oanda.models.get_prices200_response import GetPrices200Response
+from pyfx.dispatch.oanda.models.get_trade200_response import GetTrade200Response
+from pyfx.dispatch.oanda.models.get_transaction200_response import GetTransaction200Response
+from pyfx.dispatch.oanda.models.get_transaction_range200_response import GetTransactionRange200Response
+from pyfx.dispatch.oanda.models.get_user_info200_response import GetUserInfo200Response
+from pyfx.dispatch.oanda.models.guaranteed_stop_loss_details import GuaranteedStopLossDetails
+from pyfx.dispatch.oanda.models.guaranteed_stop_loss_order import GuaranteedStopLossOrder
+from pyfx.dispatch.oanda.models.guaranteed_stop_loss_order_entry_data import GuaranteedStopLossOrderEntryData
+from pyfx.dispatch.oanda.models.guaranteed_stop_loss_order_level_restriction import GuaranteedStopLossOrderLevelRestriction
+from pyfx.dispatch.oanda.models.guaranteed_stop_loss_order_mode import GuaranteedStopLossOrderMode
+from pyfx.dispatch.oanda.models.guaranteed_stop_loss_order_mutability import GuaranteedStopLossOrderMutability
+from pyfx.dispatch.oanda.models.guaranteed_stop_loss_order_parameters import GuaranteedStopLossOrderParameters
+from pyfx.dispatch.oanda.models.guaranteed_stop_loss_order_reason import GuaranteedStopLossOrderReason
+from pyfx.dispatch.oanda.models.guaranteed_stop_loss_order_reject_transaction import GuaranteedStopLossOrderRejectTransaction
+from pyfx.dispatch.oanda.models.guaranteed_stop_loss_order_request import GuaranteedStopLossOrderRequest
+from pyfx.dispatch.oanda.models.guaranteed_stop_loss_order_transaction import GuaranteedStopLossOrderTransaction
+from pyfx.dispatch.oanda.models.home_conversion_factors import HomeConversionFactors
+from pyfx.dispatch.oanda.models.home_conversions import HomeConversions
+from pyfx.dispatch.oanda.models.instrument import Instrument
+from pyfx.dispatch.oanda.models.instrument_commission import InstrumentCommission
+from pyfx.dispatch.oanda.models.instrument_financing import InstrumentFinancing
+from pyfx.dispatch.oanda.models.instrument_type import InstrumentType
+from pyfx.dispatch.oanda.models.instruments_instrument_order_book_get200_response import InstrumentsInstrumentOrderBookGet200Response
+from pyfx.dispatch.oanda.models.instruments_instrument_position_book_get200_response import InstrumentsInstrumentPositionBookGet200Response
+from pyfx.dispatch.oanda.models.limit_order import LimitOrder
+from pyfx.dispatch.oanda.models.limit_order_reason import LimitOrderReason
+from pyfx.dispatch.oanda.models.limit_order_reject_transaction import LimitOrderRejectTransaction
+from pyfx.dispatch.oanda.models.limit_order_request import LimitOrderRequest
+from pyfx.dispatch.oanda.models.limit_order_transaction import LimitOrderTransaction
+from pyfx.dispatch.oanda.models.liquidity_regeneration_schedule import LiquidityRegenerationSchedule
+from pyfx.dispatch.oanda.models.liquidity_regeneration_schedule_step import LiquidityRegenerationScheduleStep
+from pyfx.dispatch.oanda.models.list_accounts200_response import ListAccounts200Response
+from pyfx.dispatch.oanda.models.list_open_positions200_response import ListOpenPositions200Response
+from pyfx.dispatch.oanda.models.list_open_trades200_response import ListOpenTrades200Response
+from pyfx.dispatch.oanda.models.list_orders200_response import ListOrders200Response
+from pyfx.dispatch.oanda.models.list_pending_orders200_response import ListPendingOrders200Response
+from pyfx.dispatch.oanda.models.list_positions200_response import ListPositions200Response
+from pyfx.dispatch.oanda.models.list_trades200_response import ListTrades200Response
+from pyfx.dispatch.oanda.models.list_transactions200_response import ListTransactions200Response
+from pyfx.dispatch.oanda.models.margin_call_enter_transaction import MarginCallEnterTransaction
+from pyfx.dispatch.oanda.models.margin_call_exit_transaction import MarginCallExitTransaction
+from pyfx.dispatch.oanda.models.margin_call_extend_transaction import MarginCallExtendTransaction
+from pyfx.dispatch.oanda.models.market_if_touched_order import MarketIfTouchedOrder
+from pyfx.dispatch.oanda.models.market_if_touched_order_reason import MarketIfTouchedOrderReason
+from pyfx.dispatch.oanda.models.market_if_touched_order_reject_transaction import MarketIfTouchedOrderRejectTransaction
+from pyfx.dispatch.oanda.models.market_if_touched_order_request import MarketIfTouchedOrderRequest
+from pyfx.dispatch.oanda.models.market_if_touched_order_transaction import MarketIfTouchedOrderTransaction
+from pyfx.dispatch.oanda.models.market_order import MarketOrder
+from pyfx.dispatch.oanda.models.market_order_delayed_trade_close import MarketOrderDelayedTradeClose
+from pyfx.dispatch.oanda.models.market_order_margin_closeout import MarketOrderMarginCloseout
+from pyfx.dispatch.oanda.models.market_order_margin_closeout_reason import MarketOrderMarginCloseoutReason
+from pyfx.dispatch.oanda.models.market_order_position_closeout import MarketOrderPositionCloseout
+from pyfx.dispatch.oanda.models.market_order_reason import MarketOrderReason
+from pyfx.dispatch.oanda.models.market_order_reject_transaction import MarketOrderRejectTransaction
+from pyfx.dispatch.oanda.models.market_order_request import MarketOrderRequest
+from pyfx.dispatch.oanda.models.market_order_trade_close import MarketOrderTradeClose
+from pyfx.dispatch.oanda.models.market_order_transaction import MarketOrderTransaction
+from pyfx.dispatch.oanda.models.mt4_transaction_heartbeat import MT4TransactionHeartbeat
+from pyfx.dispatch.oanda.models.open_trade_financing import OpenTradeFinancing
+from pyfx.dispatch.oanda.models.order import Order
+from pyfx.dispatch.oanda.models.order_book import OrderBook
+from pyfx.dispatch.oanda.models.order_book_bucket import OrderBookBucket
+from pyfx.dispatch.oanda.models.order_cancel_reason import OrderCancelReason
+from pyfx.dispatch.oanda.models.order_cancel_reject_transaction import OrderCancelRejectTransaction
+from pyfx.dispatch.oanda.models.order_cancel_transaction import OrderCancelTransaction
+from pyfx.dispatch.oanda.models.order_client_extensions_modify_reject_transaction import OrderClientExtensionsModifyRejectTransaction
+from pyfx.dispatch.oanda.models.order_client_extensions_modify_transaction import OrderClientExtensionsModifyTransaction
+from pyfx.dispatch.oanda.models.order_fill_reason import OrderFillReason
+from pyfx.dispatch.oanda.models.order_fill_transaction import OrderFillTransaction
+from pyfx.dispatch.oanda.models.order_identifier import OrderIdentifier
+from pyfx.dispatch.oanda.models.order_mixins import UnitsOrderBase
+from pyfx.dispatch.oanda.models.order_mixins import OrderBase
+from pyfx.dispatch.oanda.models.order_mixins import LimitOrderMixin
+from pyfx.dispatch.oanda.models.order_mixins import ReplacesOrderMixin
+from pyfx.dispatch.oanda.models.order_position_fill import OrderPositionFill
+from pyfx.dispatch.oanda.models.order_state import OrderState
+from pyfx.dispatch.oanda.models.order_state_filter import OrderStateFilter
+from pyfx.dispatch.oanda.models.order_trigger_condition import OrderTriggerCondition
+from pyfx.dispatch.oanda.models.order_type import OrderType
+from pyfx.dispatch.oanda.models.position import Position
+from pyfx.dispatch.oanda.models.position_aggregation_mode import PositionAggregationMode
+from pyfx.dispatch.oanda.models.position_book import PositionBook
+from pyfx.dispatch.oanda.models.position_book_bucket import PositionBookBucket
+from pyfx.dispatch.oanda.models.position_financing import PositionFinancing
+from pyfx.dispatch.oanda.models.position_side import PositionSide
+from pyfx.dispatch.oanda.models.price import Price
+from pyfx.dispatch.oanda.models.price_bucket import PriceBucket
+from pyfx.dispatch.oanda.models.price_component import PriceComponent
+from pyfx.dispatch.oanda.models.price_component import PriceComponentType
+from pyfx.dispatch.oanda.models.price_status import PriceStatus
+from pyfx.dispatch.oanda.models.pricing_heartbeat import PricingHeartbeat
+from pyfx.dispatch.oanda.models.quote_home_conversion_factors import QuoteHomeConversionFactors
+from pyfx.dispatch.oanda.models.reopen_transaction import ReopenTransaction
+from pyfx.dispatch.oanda.models.replace_order201_response import ReplaceOrder201Response
+from pyfx.dispatch.oanda.models.replace_order400_response import ReplaceOrder400Response
+from pyfx.dispatch.oanda.models.replace_order404_response import ReplaceOrder404Response
+from pyfx.dispatch.oanda.models.request_mixins import InstrumentRequestBase
+from pyfx.dispatch.oanda.models.request_mixins import StopsRequestBase
+from pyfx.dispatch.oanda.models.request_mixins import PriceBoundedRequest
+from pyfx.dispatch.oanda.models.request_mixins import CreateOrderRequestBase
+from pyfx.dispatch.oanda.models.reset_resettable_pl_transaction import ResetResettablePLTransaction
+from pyfx.dispatch.oanda.models.response_mixins import ApiResponse
+from pyfx.dispatch.oanda.models.response_mixins import LastTransactionResponse
+from pyfx.dispatch.oanda.models.response_mixins import TransactionResponse
+from pyfx.dispatch.oanda.models.response_mixins import ApiErrorResponse
+from pyfx.dispatch.oanda.models.response_mixins import TransactionErrorResponse
+from pyfx.dispatch.oanda.models.response_mixins import UnknownErrorResponse
+from pyfx.dispatch.oanda.models.set_order_client_extensions200_response import SetOrderClientExtensions200Response
+from pyfx.dispatch.oanda.models.set_order_client_extensions400_response import SetOrderClientExtensions400Response
+from pyfx.dispatch.oanda.models.set_order_client_extensions404_response import SetOrderClientExtensions404Response
+from pyfx.dispatch.oanda.models.set_order_client_extensions_request import SetOrderClientExtensionsRequest
+from pyfx.dispatch.oanda.models.set_trade_client_extensions200_response import SetTradeClientExtensions200Response
+from pyfx.dispatch.oanda.models.set_trade_client_extensions400_response import SetTradeClientExtensions400Response
+from pyfx.dispatch.oanda.models.set_trade_client_extensions404_response import SetTradeClientExtensions404Response
+from pyfx.dispatch.oanda.models.set_trade_client_extensions_request import SetTradeClientExtensionsRequest
+from pyfx.dispatch.oanda.models.set_trade_dependent_orders200_response import SetTradeDependentOrders200Response
+from pyfx.dispatch.oanda.models.set_trade_dependent_orders400_response import SetTradeDependentOrders400Response
+from pyfx.dispatch.oanda.models.set_trade_dependent_orders_request import SetTradeDependentOrdersRequest
+from pyfx.dispatch.oanda.models.stop_loss_details import StopLossDetails
+from pyfx.dispatch.oanda.models.stop_loss_order import StopLossOrder
+from pyfx.dispatch.oanda.models.stop_loss_order_reason import StopLossOrderReason
+from pyfx.dispatch.oanda.models.stop_loss_order_reject_transaction import StopLossOrderRejectTransaction
+from pyfx.dispatch.oanda.models.stop_loss_order_request import StopLossOrderRequest
+from pyfx.dispatch.oanda.models.stop_loss_order_transaction import StopLossOrderTransaction
+from pyfx.dispatch.oanda.models.stop_order import StopOrder
+from pyfx.dispatch.oanda.models.stop_order_reason import StopOrderReason
+from pyfx.dispatch.oanda.models.stop_order_reject_transaction import StopOrderRejectTransaction
+from pyfx.dispatch.oanda.models.stop_order_request import StopOrderRequest
+from pyfx.dispatch.oanda.models.stop_order_transaction import StopOrderTransaction
+from pyfx.dispatch.oanda.models.stream_pricing200_response import StreamPricing200Response
+from pyfx.dispatch.oanda.models.stream_transactions200_response import StreamTransactions200Response
+from pyfx.dispatch.oanda.models.streaming_price_base import StreamingPriceType
+from pyfx.dispatch.oanda.models.streaming_price_base import StreamingPriceObject
+from pyfx.dispatch.oanda.models.tag import Tag
+from pyfx.dispatch.oanda.models.take_profit_details import TakeProfitDetails
+from pyfx.dispatch.oanda.models.take_profit_order import TakeProfitOrder
+from pyfx.dispatch.oanda.models.take_profit_order_reason import TakeProfitOrderReason
+from pyfx.dispatch.oanda.models.take_profit_order_reject_transaction import TakeProfitOrderRejectTransaction
+from pyfx.dispatch.oanda.models.take_profit_order_request import TakeProfitOrderRequest
+from pyfx.dispatch.oanda.models.take_profit_order_transaction import TakeProfitOrderTransaction
+from pyfx.dispatch.oanda.models.time_in_force import TimeInForce
+from pyfx.dispatch.oanda.models.trade import Trade
+from pyfx.dispatch.oanda.models.trade_client_extensions_modify_reject_transaction import TradeClientExtensionsModifyRejectTransaction
+from pyfx.dispatch.oanda.models.trade_client_extensions_modify_transaction import TradeClientExtensionsModifyTransaction
+from pyfx.dispatch.oanda.models.trade_dependent_mixins import TradeDependentObject
+from pyfx.dispatch.oanda.models.trade_dependent_mixins import TradeDependentPriceDetails
+from pyfx.dispatch.oanda.models.trade_dependent_mixins import TradeDependentIntermediate
+from pyfx.dispatch.oanda.models.trade_dependent_mixins import TradeDependentClass
+from pyfx.dispatch.oanda.models.trade_dependent_mixins import TransportTradeDependent
+from pyfx.dispatch.oanda.models.trade_dependent_mixins import TradeDependentDetails
+from pyfx.dispatch.oanda.models.trade_id_mixin import TradeIdMixin
+from pyfx.dispatch.oanda.models.trade_open import TradeOpen
+from pyfx.dispatch.oanda.models.trade_pl import TradePL
+from pyfx.dispatch.oanda.models.trade_reduce import TradeReduce
+from pyfx.dispatch.oanda.models.trade_state import TradeState
+from pyfx.dispatch.oanda.models.trade_state_filter import TradeStateFilter
+from pyfx.dispatch.oanda.models.trade_summary import TradeSummary
+from pyfx.dispatch.oanda.models.trailing_stop_loss_details import TrailingStopLossDetails
+from pyfx.dispatch.oanda.models.trailing_stop_loss_order import TrailingStopLossOrder
+from pyfx.dispatch.oanda.models.trailing_stop_loss_order_reason import TrailingStopLossOrderReason
+from pyfx.dispatch.oanda.models.trailing_stop_loss_order_reject_transaction import TrailingStopLossOrderRejectTransaction
+from pyfx.dispatch.oanda.models.trailing_stop_loss_order_request import TrailingStopLossOrderRequest
+from pyfx.dispatch.oanda.models.trailing_stop_loss_order_transaction import TrailingStopLossOrderTransaction
+from pyfx.dispatch.oanda.models.transaction import Transaction
+from pyfx.dispatch.oanda.models.transaction_filter import TransactionFilter
+from pyfx.dispatch.oanda.models.transaction_heartbeat import TransactionHeartbeat
+from pyfx.dispatch.oanda.models.transaction_mixins import OrderStopsTransaction
+from pyfx.dispatch.oanda.models.transaction_mixins import OrderDistanceStopsTransaction
+from pyfx.dispatch.oanda.models.transaction_mixins import TimeInForceTxn
+from pyfx.dispatch.oanda.models.transaction_mixins import ClientExtensionsTxn
+from pyfx.dispatch.oanda.models.transaction_mixins import PriceBoundEntryTransaction
+from pyfx.dispatch.oanda.models.transaction_mixins import InstrumentTxn
+from pyfx.dispatch.oanda.models.transaction_mixins import ReplacementTxn
+from pyfx.dispatch.oanda.models.transaction_mixins import RejectTxn
+from pyfx.dispatch.oanda.models.transaction_mixins import OrderFillTxn
+from pyfx.dispatch.oanda.models.transaction_mixins import PositionEntryTxn
+from pyfx.dispatch.oanda.models.transaction_mixins import PriceEntryTransaction
+from pyfx.dispatch.oanda.models.transaction_reject_reason import TransactionRejectReason
+from pyfx.dispatch.oanda.models.transaction_type import TransactionType
+from pyfx.dispatch.oanda.models.transfer_funds_reject_transaction import TransferFundsRejectTransaction
+from pyfx.dispatch.oanda.models.transfer_funds_transaction import TransferFundsTransaction
+from pyfx.dispatch.oanda.models.transport_types import TransportDecmialAll
+from pyfx.dispatch.oanda.models.transport_types import TransportDecimalAllNone
+from pyfx.dispatch.oanda.models.units_available import UnitsAvailable
+from pyfx.dispatch.oanda.models.units_available_details import UnitsAvailableDetails
+from pyfx.dispatch.oanda.models.user_info import UserInfo
+from pyfx.dispatch.oanda.models.user_info_external import UserInfoExternal
+from pyfx.dispatch.oanda.models.weekly_alignment import WeeklyAlignment
+__all__ = (
+    "AcceptDatetimeFormat", "Account", "AccountChanges",
+    "AccountChangesState", "AccountFinancingMode", "AccountStateBase",
+    "AccountSummaryBase", "AccountProperties", "AccountSummary",
+    "ApiEnumType", "ApiEnum", "CalculatedAccountState",
+    "CalculatedPositionState", "CalculatedTradeState",
+    "CancelOrder200Response", "CancelOrder404Response",
+    "CancellableOrderType", "Candlestick", "CandlestickData",
+    "CandlestickGranularity", "CandlestickFrequency",
+    "ClientConfigureRejectTransaction", "ClientConfigureTransaction",
+    "ClientExtensions", "ClientPriceBase", "StreamingPrice",
+    "ClientPrice", "ClosePosition200Response",
+    "ClosePosition400Response", "ClosePosition404Response",
+    "ClosePositionRequest", "CloseTrade200Response",
+    "CloseTrade400Response", "CloseTrade404Response",
+    "CloseTradeRequest", "CloseTransaction", "OrderId",
+    "AccountUnits", "PriceValue", "ClientRequestId", "ClientId",
+    "LotsValue", "TransactionId", "Time", "NullableTimeInterface",
+    "TradeId", "DoubleConstants", "InstrumentName", "FloatValue",
+    "ConfigureAccount200Response", "ConfigureAccount400Response",
+    "ConfigureAccountRequest", "ConversionFactor",
+    "CreateOrder201Response", "CreateOrder400Response",
+    "CreateOrder404Response", "CreateOrderRequest",
+    "CreateTransaction", "Currency", "CurrencyPair",
+    "DailyFinancingTransaction", "DayOfWeek",
+    "DelayedTradeClosureTransaction", "Direction",
+    "DynamicOrderState", "FinancingDaysOfWeek", "FixedPriceOrder",
+    "FixedPriceOrderReason", "FixedPriceOrderTransaction",
+    "FundingReason", "GetAccount200Response",
+    "GetAccountChanges200Response",
+    "GetAccountInstruments200Response",
+    "GetAccountSummary200Response", "GetExternalUserInfo200Response",
+    "GetInstrumentCandles200Response",
+    "GetInstrumentPrice200Response",
+    "GetInstrumentPriceRange200Response", "GetOrder200Response",
+    "GetPosition200Response", "GetPrices200Response",
+    "GetTrade200Response", "GetTransaction200Response",
+    "GetTransactionRange200Response", "GetUserInfo200Response",
+    "GuaranteedStopLossDetails", "GuaranteedStopLossOrder",
+    "GuaranteedStopLossOrderEntryData",
+    "GuaranteedStopLossOrderLevelRestriction",
+    "GuaranteedStopLossOrderMode",
+    "GuaranteedStopLossOrderMutability",
+    "GuaranteedStopLossOrderParameters",
+    "GuaranteedStopLossOrderReason",
+    "GuaranteedStopLossOrderRejectTransaction",
+    "GuaranteedStopLossOrderRequest",
+    "GuaranteedStopLossOrderTransaction", "HomeConversionFactors",
+    "HomeConversions", "Instrument", "InstrumentCommission",
+    "InstrumentFinancing", "InstrumentType",
+    "InstrumentsInstrumentOrderBookGet200Response",
+    "InstrumentsInstrumentPositionBookGet200Response", "LimitOrder",
+    "LimitOrderReason", "LimitOrderRejectTransaction",
+    "LimitOrderRequest", "LimitOrderTransaction",
+    "LiquidityRegenerationSchedule",
+    "LiquidityRegenerationScheduleStep", "ListAccounts200Response",
+    "ListOpenPositions200Response", "ListOpenTrades200Response",
+    "ListOrders200Response", "ListPendingOrders200Response",
+    "ListPositions200Response", "ListTrades200Response",
+    "ListTransactions200Response", "MarginCallEnterTransaction",
+    "MarginCallExitTransaction", "MarginCallExtendTransaction",
+    "MarketIfTouchedOrder", "MarketIfTouchedOrderReason",
+    "MarketIfTouchedOrderRejectTransaction",
+    "MarketIfTouchedOrderRequest", "MarketIfTouchedOrderTransaction",
+    "MarketOrder", "MarketOrderDelayedTradeClose",
+    "MarketOrderMarginCloseout", "MarketOrderMarginCloseoutReason",
+    "MarketOrderPositionCloseout", "MarketOrderReason",
+    "MarketOrderRejectTransaction", "MarketOrderRequest",
+    "MarketOrderTradeClose", "MarketOrderTransaction",
+    "MT4TransactionHeartbeat", "OpenTradeFinancing", "Order",
+    "OrderBook", "OrderBookBucket", "OrderCancelReason",
+    "OrderCancelRejectTransaction", "OrderCancelTransaction",
+    "OrderClientExtensionsModifyRejectTransaction",
+    "OrderClientExtensionsModifyTransaction", "OrderFillReason",
+    "OrderFillTransaction", "OrderIdentifier", "UnitsOrderBase",
+    "OrderBase", "LimitOrderMixin", "ReplacesOrderMixin",
+    "OrderPositionFill", "OrderState", "OrderStateFilter",
+    "OrderTriggerCondition", "OrderType", "Position",
+    "PositionAggregationMode", "PositionBook", "PositionBookBucket",
+    "PositionFinancing", "PositionSide", "Price", "PriceBucket",
+    "PriceComponent", "PriceComponentType", "PriceStatus",
+    "PricingHeartbeat", "QuoteHomeConversionFactors",
+    "ReopenTransaction", "ReplaceOrder201Response",
+    "ReplaceOrder400Response", "ReplaceOrder404Response",
+    "InstrumentRequestBase", "StopsRequestBase",
+    "PriceBoundedRequest", "CreateOrderRequestBase",
+    "ResetResettablePLTransaction", "ApiResponse",
+    "LastTransactionResponse", "TransactionResponse",
+    "ApiErrorResponse", "TransactionErrorResponse",
+    "UnknownErrorResponse", "SetOrderClientExtensions200Response",
+    "SetOrderClientExtensions400Response",
+    "SetOrderClientExtensions404Response",
+    "SetOrderClientExtensionsRequest",
+    "SetTradeClientExtensions200Response",
+    "SetTradeClientExtensions400Response",
+    "SetTradeClientExtensions404Response",
+    "SetTradeClientExtensionsRequest",
+    "SetTradeDependentOrders200Response",
+    "SetTradeDependentOrders400Response",
+    "SetTradeDependentOrdersRequest", "StopLossDetails",
+    "StopLossOrder", "StopLossOrderReason",
+    "StopLossOrderRejectTransaction", "StopLossOrderRequest",
+    "StopLossOrderTransaction", "StopOrder", "StopOrderReason",
+    "StopOrderRejectTransaction", "StopOrderRequest",
+    "StopOrderTransaction", "StreamPricing200Response",
+    "StreamTransactions200Response", "StreamingPriceType",
+    "StreamingPriceObject", "Tag", "TakeProfitDetails",
+    "TakeProfitOrder", "TakeProfitOrderReason",
+    "TakeProfitOrderRejectTransaction", "TakeProfitOrderRequest",
+    "TakeProfitOrderTransaction", "TimeInForce", "Trade",
+    "TradeClientExtensionsModifyRejectTransaction",
+    "TradeClientExtensionsModifyTransaction", "TradeDependentObject",
+    "TradeDependentPriceDetails", "TradeDependentIntermediate",
+    "TradeDependentClass", "TransportTradeDependent",
+    "TradeDependentDetails", "TradeIdMixin", "TradeOpen", "TradePL",
+    "TradeReduce", "TradeState", "TradeStateFilter", "TradeSummary",
+    "TrailingStopLossDetails", "TrailingStopLossOrder",
+    "TrailingStopLossOrderReason",
+    "TrailingStopLossOrderRejectTransaction",
+    "TrailingStopLossOrderRequest",
+    "TrailingStopLossOrderTransaction", "Transaction",
+    "TransactionFilter", "TransactionHeartbeat",
+    "OrderStopsTransaction", "OrderDistanceStopsTransaction",
+    "TimeInForceTxn", "ClientExtensionsTxn",
+    "PriceBoundEntryTransaction", "InstrumentTxn", "ReplacementTxn",
+    "RejectTxn", "OrderFillTxn", "PositionEntryTxn",
+    "PriceEntryTransaction", "TransactionRejectReason",
+    "TransactionType", "TransferFundsRejectTransaction",
+    "TransferFundsTransaction", "TransportDecmialAll",
+    "TransportDecimalAllNone", "UnitsAvailable",
+    "UnitsAvailableDetails", "UserInfo", "UserInfoExternal",
+    "WeeklyAlignment",
+)
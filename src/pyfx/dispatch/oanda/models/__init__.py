@@ -4,20 +4,41 @@ from collections.abc import Mapping
 from immutables.map import Map
 
 import os
+import sys
 
 from ..util.paths import expand_path
-from ..util.imports import gen_imports
+from ..util.imports import gen_imports, read_imports, lazy_imports
+
+#
+# Model classes will be imported on demand, at first access to each name
+# in this module (PEP 562)
+#
+# The index of model class names is read from the generated __imports__.py,
+# which is distributed with the package. If the file is not available, it will
+# be generated here, such that every model module will be imported once.
+#
+# After any change in the model modules, the file should be regenerated with
+#   gen_imports("pyfx.dispatch.oanda.models", overwrite=True)
+#
 
 if not os.path.exists(expand_path("__imports__.py", os.path.dirname(__file__))):
     gen_imports(__name__)
 
-from .__imports__ import *
-__all__ = __imports__.__all__
+MODEL_IMPORTS: Mapping[str, str] = Map(read_imports(expand_path("__imports__.py", os.path.dirname(__file__))))
+"""Module name for each model class and type exported from this package"""
+
+__all__ = tuple(MODEL_IMPORTS.keys())
+
+_lazy_getattr, __dir__ = lazy_imports(__name__, MODEL_IMPORTS)
 
 
 #
 # Bindings for concrete implementations of abstract response model classes
 #
+# Each implementation class will be imported at first use of the designator
+# value for the class. The types map for each abstract class will contain the
+# implementation classes imported so far.
+#
 
 from ..transport.data import ApiObject
 
@@ -30,17 +51,16 @@ from .create_order_request import CreateOrderRequest
 # CreateOrderRequest - bind implementing classes
 #
 
-ORDER_REQUEST_TYPES_MAP: Mapping[OrderType, type[ApiObject]] = Map({ # type: ignore
-    OrderType.MARKET: MarketOrderRequest,
-    OrderType.LIMIT: LimitOrderRequest,
-    OrderType.STOP: StopOrderRequest,
-    OrderType.MARKET_IF_TOUCHED: MarketIfTouchedOrderRequest,
-    OrderType.TAKE_PROFIT: TakeProfitOrderRequest,
-    OrderType.STOP_LOSS: StopLossOrderRequest,
-    OrderType.GUARANTEED_STOP_LOSS: GuaranteedStopLossOrderRequest,
-    OrderType.TRAILING_STOP_LOSS: TrailingStopLossOrderRequest
+CreateOrderRequest.bind_lazy_types({
+    OrderType.MARKET: ".market_order_request:MarketOrderRequest",
+    OrderType.LIMIT: ".limit_order_request:LimitOrderRequest",
+    OrderType.STOP: ".stop_order_request:StopOrderRequest",
+    OrderType.MARKET_IF_TOUCHED: ".market_if_touched_order_request:MarketIfTouchedOrderRequest",
+    OrderType.TAKE_PROFIT: ".take_profit_order_request:TakeProfitOrderRequest",
+    OrderType.STOP_LOSS: ".stop_loss_order_request:StopLossOrderRequest",
+    OrderType.GUARANTEED_STOP_LOSS: ".guaranteed_stop_loss_order_request:GuaranteedStopLossOrderRequest",
+    OrderType.TRAILING_STOP_LOSS: ".trailing_stop_loss_order_request:TrailingStopLossOrderRequest",
 })
-CreateOrderRequest.bind_types(ORDER_REQUEST_TYPES_MAP)  # type: ignore
 
 #
 # Order - bind implementing classes
@@ -48,24 +68,18 @@ CreateOrderRequest.bind_types(ORDER_REQUEST_TYPES_MAP)  # type: ignore
 
 from .order import Order
 
-ORDER_TYPE_MAP: Mapping[OrderType, type[ApiObject]] = Map({ # type: ignore
-    OrderType.MARKET: MarketOrder,
-    OrderType.LIMIT: LimitOrder,
-    OrderType.STOP: StopOrder,
-    OrderType.MARKET_IF_TOUCHED: MarketIfTouchedOrder,
-    OrderType.TAKE_PROFIT: TakeProfitOrder,
-    OrderType.STOP_LOSS: StopLossOrder,
-    OrderType.GUARANTEED_STOP_LOSS: GuaranteedStopLossOrder,
-    OrderType.TRAILING_STOP_LOSS: TrailingStopLossOrder,
-    OrderType.FIXED_PRICE: FixedPriceOrder
-})
 # cf. https://developer.oanda.com/rest-live-v20/order-df/#Order
-"""
-Mapping of supported order classes and fixed order type values,
-for order placement with the fxTrade v20 API
-"""
-
-Order.bind_types(ORDER_TYPE_MAP)  # type: ignore
+Order.bind_lazy_types({
+    OrderType.MARKET: ".market_order:MarketOrder",
+    OrderType.LIMIT: ".limit_order:LimitOrder",
+    OrderType.STOP: ".stop_order:StopOrder",
+    OrderType.MARKET_IF_TOUCHED: ".market_if_touched_order:MarketIfTouchedOrder",
+    OrderType.TAKE_PROFIT: ".take_profit_order:TakeProfitOrder",
+    OrderType.STOP_LOSS: ".stop_loss_order:StopLossOrder",
+    OrderType.GUARANTEED_STOP_LOSS: ".guaranteed_stop_loss_order:GuaranteedStopLossOrder",
+    OrderType.TRAILING_STOP_LOSS: ".trailing_stop_loss_order:TrailingStopLossOrder",
+    OrderType.FIXED_PRICE: ".fixed_price_order:FixedPriceOrder",
+})
 
 #
 # Transaction - bind implementing classes
@@ -74,47 +88,75 @@ Order.bind_types(ORDER_TYPE_MAP)  # type: ignore
 from .transaction_type import TransactionType
 from .transaction import Transaction
 
-TRANSACTION_TYPES_MAP: Mapping[TransactionType, type[ApiObject]] = Map({  # type: ignore
-    TransactionType.CREATE: CreateTransaction,
-    TransactionType.CLOSE: CloseTransaction,
-    TransactionType.REOPEN: ReopenTransaction,
-    TransactionType.CLIENT_CONFIGURE: ClientConfigureTransaction,
-    TransactionType.CLIENT_CONFIGURE_REJECT: ClientConfigureRejectTransaction,
-    TransactionType.GUARANTEED_STOP_LOSS_ORDER: GuaranteedStopLossOrderTransaction,
-    TransactionType.GUARANTEED_STOP_LOSS_ORDER_REJECT: GuaranteedStopLossOrderRejectTransaction,
-    TransactionType.TRANSFER_FUNDS: TransferFundsTransaction,
-    TransactionType.TRANSFER_FUNDS_REJECT: TransferFundsRejectTransaction,
-    TransactionType.MARKET_ORDER: MarketOrderTransaction,
-    TransactionType.MARKET_ORDER_REJECT: MarketOrderRejectTransaction,
-    TransactionType.FIXED_PRICE_ORDER: FixedPriceOrderTransaction,
-    TransactionType.LIMIT_ORDER: LimitOrderTransaction,
-    TransactionType.LIMIT_ORDER_REJECT: LimitOrderRejectTransaction,
-    TransactionType.STOP_ORDER: StopOrderTransaction,
-    TransactionType.STOP_ORDER_REJECT: StopOrderRejectTransaction,
-    TransactionType.MARKET_IF_TOUCHED_ORDER: MarketIfTouchedOrderTransaction,
-    TransactionType.MARKET_IF_TOUCHED_ORDER_REJECT: MarketIfTouchedOrderRejectTransaction,
-    TransactionType.TAKE_PROFIT_ORDER: TakeProfitOrderTransaction,
-    TransactionType.TAKE_PROFIT_ORDER_REJECT: TakeProfitOrderRejectTransaction,
-    TransactionType.STOP_LOSS_ORDER: StopLossOrderTransaction,
-    TransactionType.STOP_LOSS_ORDER_REJECT: StopLossOrderRejectTransaction,
-    TransactionType.TRAILING_STOP_LOSS_ORDER: TrailingStopLossOrderTransaction,
-    TransactionType.TRAILING_STOP_LOSS_ORDER_REJECT: TrailingStopLossOrderRejectTransaction,
-    TransactionType.ORDER_FILL: OrderFillTransaction,
-    TransactionType.ORDER_CANCEL: OrderCancelTransaction,
-    TransactionType.ORDER_CANCEL_REJECT: OrderCancelRejectTransaction,
-    TransactionType.ORDER_CLIENT_EXTENSIONS_MODIFY: OrderClientExtensionsModifyTransaction,
-    TransactionType.ORDER_CLIENT_EXTENSIONS_MODIFY_REJECT: OrderClientExtensionsModifyRejectTransaction,
-    TransactionType.TRADE_CLIENT_EXTENSIONS_MODIFY: TradeClientExtensionsModifyTransaction,
-    TransactionType.TRADE_CLIENT_EXTENSIONS_MODIFY_REJECT: TradeClientExtensionsModifyRejectTransaction,
-    TransactionType.MARGIN_CALL_ENTER: MarginCallEnterTransaction,
-    TransactionType.MARGIN_CALL_EXTEND: MarginCallExtendTransaction,
-    TransactionType.MARGIN_CALL_EXIT: MarginCallExitTransaction,
-    TransactionType.DELAYED_TRADE_CLOSURE: DelayedTradeClosureTransaction,
-    TransactionType.DAILY_FINANCING: DailyFinancingTransaction,
-    TransactionType.RESET_RESETTABLE_PL: ResetResettablePLTransaction,
+Transaction.bind_lazy_types({
+    TransactionType.CREATE: ".create_transaction:CreateTransaction",
+    TransactionType.CLOSE: ".close_transaction:CloseTransaction",
+    TransactionType.REOPEN: ".reopen_transaction:ReopenTransaction",
+    TransactionType.CLIENT_CONFIGURE: ".client_configure_transaction:ClientConfigureTransaction",
+    TransactionType.CLIENT_CONFIGURE_REJECT: ".client_configure_reject_transaction:ClientConfigureRejectTransaction",
+    TransactionType.GUARANTEED_STOP_LOSS_ORDER: ".guaranteed_stop_loss_order_transaction:GuaranteedStopLossOrderTransaction",
+    TransactionType.GUARANTEED_STOP_LOSS_ORDER_REJECT: ".guaranteed_stop_loss_order_reject_transaction:GuaranteedStopLossOrderRejectTransaction",
+    TransactionType.TRANSFER_FUNDS: ".transfer_funds_transaction:TransferFundsTransaction",
+    TransactionType.TRANSFER_FUNDS_REJECT: ".transfer_funds_reject_transaction:TransferFundsRejectTransaction",
+    TransactionType.MARKET_ORDER: ".market_order_transaction:MarketOrderTransaction",
+    TransactionType.MARKET_ORDER_REJECT: ".market_order_reject_transaction:MarketOrderRejectTransaction",
+    TransactionType.FIXED_PRICE_ORDER: ".fixed_price_order_transaction:FixedPriceOrderTransaction",
+    TransactionType.LIMIT_ORDER: ".limit_order_transaction:LimitOrderTransaction",
+    TransactionType.LIMIT_ORDER_REJECT: ".limit_order_reject_transaction:LimitOrderRejectTransaction",
+    TransactionType.STOP_ORDER: ".stop_order_transaction:StopOrderTransaction",
+    TransactionType.STOP_ORDER_REJECT: ".stop_order_reject_transaction:StopOrderRejectTransaction",
+    TransactionType.MARKET_IF_TOUCHED_ORDER: ".market_if_touched_order_transaction:MarketIfTouchedOrderTransaction",
+    TransactionType.MARKET_IF_TOUCHED_ORDER_REJECT: ".market_if_touched_order_reject_transaction:MarketIfTouchedOrderRejectTransaction",
+    TransactionType.TAKE_PROFIT_ORDER: ".take_profit_order_transaction:TakeProfitOrderTransaction",
+    TransactionType.TAKE_PROFIT_ORDER_REJECT: ".take_profit_order_reject_transaction:TakeProfitOrderRejectTransaction",
+    TransactionType.STOP_LOSS_ORDER: ".stop_loss_order_transaction:StopLossOrderTransaction",
+    TransactionType.STOP_LOSS_ORDER_REJECT: ".stop_loss_order_reject_transaction:StopLossOrderRejectTransaction",
+    TransactionType.TRAILING_STOP_LOSS_ORDER: ".trailing_stop_loss_order_transaction:TrailingStopLossOrderTransaction",
+    TransactionType.TRAILING_STOP_LOSS_ORDER_REJECT: ".trailing_stop_loss_order_reject_transaction:TrailingStopLossOrderRejectTransaction",
+    TransactionType.ORDER_FILL: ".order_fill_transaction:OrderFillTransaction",
+    TransactionType.ORDER_CANCEL: ".order_cancel_transaction:OrderCancelTransaction",
+    TransactionType.ORDER_CANCEL_REJECT: ".order_cancel_reject_transaction:OrderCancelRejectTransaction",
+    TransactionType.ORDER_CLIENT_EXTENSIONS_MODIFY: ".order_client_extensions_modify_transaction:OrderClientExtensionsModifyTransaction",
+    TransactionType.ORDER_CLIENT_EXTENSIONS_MODIFY_REJECT: ".order_client_extensions_modify_reject_transaction:OrderClientExtensionsModifyRejectTransaction",
+    TransactionType.TRADE_CLIENT_EXTENSIONS_MODIFY: ".trade_client_extensions_modify_transaction:TradeClientExtensionsModifyTransaction",
+    TransactionType.TRADE_CLIENT_EXTENSIONS_MODIFY_REJECT: ".trade_client_extensions_modify_reject_transaction:TradeClientExtensionsModifyRejectTransaction",
+    TransactionType.MARGIN_CALL_ENTER: ".margin_call_enter_transaction:MarginCallEnterTransaction",
+    TransactionType.MARGIN_CALL_EXTEND: ".margin_call_extend_transaction:MarginCallExtendTransaction",
+    TransactionType.MARGIN_CALL_EXIT: ".margin_call_exit_transaction:MarginCallExitTransaction",
+    TransactionType.DELAYED_TRADE_CLOSURE: ".delayed_trade_closure_transaction:DelayedTradeClosureTransaction",
+    TransactionType.DAILY_FINANCING: ".daily_financing_transaction:DailyFinancingTransaction",
+    TransactionType.RESET_RESETTABLE_PL: ".reset_resettable_pl_transaction:ResetResettablePLTransaction",
+})
+
+
+TYPES_MAP_CLASSES: Mapping[str, type[ApiObject]] = Map({
+    "ORDER_REQUEST_TYPES_MAP": CreateOrderRequest,
+    "ORDER_TYPE_MAP": Order,
+    "TRANSACTION_TYPES_MAP": Transaction,
 })
+"""Abstract class for each designator/class mapping provided from this package
+
+Each mapping will be computed at first access, importing all implementation
+classes for the abstract class
+"""
+
+
+def load_models():
+    """Import all model classes, including the implementation classes for each abstract model class
 
-Transaction.bind_types(TRANSACTION_TYPES_MAP)
+    This will be called before the transport types repository is finalized, such that
+    a transport type will be defined for each model class.
+    """
+    module = sys.modules[__name__]
+    for name in MODEL_IMPORTS.keys():
+        getattr(module, name)
+    for cls in TYPES_MAP_CLASSES.values():
+        cls.load_types()  # type: ignore[attr-defined]
 
 
-__all__ = tuple(__all__)  # type: ignore
+def __getattr__(name: str):
+    if name in TYPES_MAP_CLASSES:
+        types_map = Map(TYPES_MAP_CLASSES[name].load_types())  # type: ignore[attr-defined]
+        globals()[name] = types_map
+        return types_map
+    return _lazy_getattr(name)
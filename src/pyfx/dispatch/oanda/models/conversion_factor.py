@@ -1,6 +1,7 @@
 """ConversionFactor model definition"""
 
 from typing import Annotated, Optional
+from typing_extensions import ClassVar
 
 from ..transport.data import ApiObject
 from ..transport.transport_fields import TransportField
@@ -14,6 +15,8 @@ class ConversionFactor(ApiObject):
     supplemental to the fxTrade v20 API 3.0.25
     """
 
+    immutable: ClassVar[bool] = True
+
     factor: Annotated[Optional[FloatValue], TransportField(None)]
     """
     The factor by which to multiply the amount in the given currency to
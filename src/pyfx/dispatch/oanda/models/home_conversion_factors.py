@@ -1,6 +1,7 @@
 """HomeConversionFactors model definition"""
 
 from typing import Annotated, Optional
+from typing_extensions import ClassVar
 
 from ..transport.data import ApiObject
 from ..transport.transport_fields import TransportField
@@ -13,6 +14,8 @@ class HomeConversionFactors(ApiObject):
     supplemental to the fxTrade v20 API 3.0.25
     """
 
+    immutable: ClassVar[bool] = True
+
     gainQuoteHome: Optional[ConversionFactor] = TransportField(None, alias="gainQuoteHome")
     """
     The ConversionFactor in effect for the Account for converting any gains
@@ -1,6 +1,7 @@
 """HomeConversions model definition for OANDA v20 REST API (3.0.25)"""
 
 from typing import Annotated, Optional
+from typing_extensions import ClassVar
 
 from ..transport.data import ApiObject
 from ..transport.transport_fields import TransportField
@@ -17,6 +18,8 @@ class HomeConversions(ApiObject):
     The conversion factor depends on the scenario the conversion is required for.
     """
 
+    immutable: ClassVar[bool] = True
+
     currency: Annotated[Currency, TransportField(...)]
     """
     The currency to be converted into the home currency.
@@ -2,6 +2,7 @@
 """QuoteHomeConversionFactors model definition for OANDA v20 REST API (3.0.25)"""
 
 from typing import Annotated, Optional
+from typing_extensions import ClassVar
 
 from ..transport.data import ApiObject
 from ..transport.transport_fields import TransportField
@@ -14,6 +15,8 @@ class QuoteHomeConversionFactors(ApiObject):
 
     """
 
+    immutable: ClassVar[bool] = True
+
     positive_units: Annotated[Optional[FloatValue], TransportField(None, alias="positiveUnits")]
     """
     The factor used to convert a positive amount of the Price's Instrument's quote currency into a positive amount of the Account's home currency.  Conversion is performed by multiplying the quote units by the conversion factor.
@@ -2,21 +2,23 @@
 
 from abc import abstractmethod, ABC
 import asyncio as aio
-from contextlib import closing
+from functools import cache
 import ijson  # type: ignore[import-untyped]
+import json
 import logging
+import numpy as np
 import os
-import sys
-import time
+import re
 
-from typing import Any, Generic, Mapping, Optional, Sequence, Union, TYPE_CHECKING
-from typing_extensions import Generic, Self, TypeVar
+from typing import Any, BinaryIO, Callable, Generic, Iterable, Mapping, NamedTuple, Optional, Sequence, Union, TYPE_CHECKING
+from typing_extensions import Self, TypeAlias, TypeVar
 
 from .io import AsyncSegmentChannel, DataError
 from .transport import (   # type: ignore
-    ApiObject, AbstractApiObject, InterfaceClass,
-    TransportFieldInfo, TransportType, TransportInterface, TransportValuesType
+    ApiObject, AbstractApiObject, InterfaceClass, FieldKind, JsonFieldDispatch,
+    TransportFieldInfo, TransportType, TransportValuesType
 )
+from .transport.data import LAZY_FIELDS_ATTR
 
 
 class NoResponse(DataError):
@@ -40,6 +42,64 @@ def model_builder_debug(fmt, *args):
         logger.debug(fmt, *args)
 
 
+def get_json_backend(*names: str):
+    """Return the first available ijson backend, in order of the provided names
+
+    If no names are provided, the yajl2_c backend will be preferred, with
+    fallback to the yajl2_cffi, yajl2, and python backends
+    """
+    for name in (names or ("yajl2_c", "yajl2_cffi", "yajl2", "python")):
+        try:
+            return ijson.get_backend(name)
+        except ImportError:
+            continue
+    return ijson
+
+
+json_backend = get_json_backend()
+"""ijson backend for synchronous parsing of buffered JSON data"""
+
+## optional JSON decoder for buffered JSON data, applied in parse_buffered()
+## when available. The decoder will be provided with the orjson package, if
+## installed
+json_loads: Optional[Callable[[bytes], Any]]
+try:
+    from orjson import loads as json_loads  # type: ignore[import-not-found]
+except ImportError:
+    json_loads = None
+
+
+FieldProjection: TypeAlias = Mapping[str, Optional["FieldProjection"]]
+"""Mapping of JSON field names to nested field projections
+
+A None value will denote that the complete value for the field should be parsed
+"""
+
+
+def get_projection(fields: Any) -> Optional[FieldProjection]:
+    """Return a field projection for the provided field selection
+
+    `fields` may be a mapping of JSON field names to nested field selections,
+    or an iterable of JSON field names, e.g
+
+        {"account": {"balance", "NAV", "lastTransactionID"}}
+
+    In a mapping, a value of None, True, or Ellipsis will denote that the
+    complete value should be parsed for the corresponding JSON field.
+
+    If `fields` is None, returns None
+    """
+    if fields is None:
+        return None
+    elif isinstance(fields, Mapping):
+        return {name: None if (sel is None or sel is True or sel is Ellipsis) else get_projection(sel)
+                for name, sel in fields.items()}
+    elif isinstance(fields, str):
+        return {fields: None}
+    else:
+        return {name: None for name in fields}
+
+
 class InstanceBuilder(Generic[T], ABC):
     '''Specialization of the ijson ObjectBulder pattern, for ApiObject deserialization'''
 
@@ -95,15 +155,29 @@ class InstanceBuilder(Generic[T], ABC):
         raise NotImplementedError(self.instance_prototype)
 
     @abstractmethod
+    def event(self, event: str, value: Any):
+        raise NotImplementedError(self.event)
+
     async def aevent(self, event: str, value: Any, async_callback=None):
-        raise NotImplementedError(self.aevent)
+        ## async interface onto event(), for parsing from a stream
+        ##
+        ## when a callback is provided, the callback will be awaited with
+        ## the instance for this builder, at end of object
+        forwarding = self.builder is not self
+        self.event(event, value)
+        if async_callback and event == "end_map" and not forwarding:
+            if __debug__:
+                model_builder_debug("Dispatch to callback for %r", self.instance)
+            await async_callback(self.instance)
 
     def __repr__(self):
         return "<%s [%s] at 0x%x>" % (self.__class__.__name__, self.instance_class.__name__, id(self),)
 
 
 class ModelBuilder(InstanceBuilder[Tmodel], Generic[Tmodel]):
-    __slots__ = tuple(set(InstanceBuilder.__slots__).union({"json_fields", "designator_key", "realize_abstract"}))
+    __slots__ = tuple(set(InstanceBuilder.__slots__).union({"json_fields", "dispatch", "designator_key", "realize_abstract",
+                                                            "projection", "skipping", "skip_depth", "trusted",
+                                                            "column_origin"}))
 
     json_fields: Mapping[str, TransportFieldInfo]
     """
@@ -111,6 +185,15 @@ class ModelBuilder(InstanceBuilder[Tmodel], Generic[Tmodel]):
     for the instance class.
     """
 
+    dispatch: Optional[Mapping[str, JsonFieldDispatch]]
+    """
+    Mapping of JSON field names to parser dispatch records for the instance class.
+
+    This value will be None when parsing a mapping under an unrealized abstract
+    type. The value will be set for the concrete class, once the abstract type
+    is realized.
+    """
+
     designator_key: Optional[str]
     """
     Storage for the designator key when initializing an abstract API object.
@@ -129,20 +212,65 @@ class ModelBuilder(InstanceBuilder[Tmodel], Generic[Tmodel]):
     value for the designator key.
     """
 
+    projection: Optional[FieldProjection]
+    """
+    Field projection for the instance, or None if all fields should be parsed
+
+    For a JSON field not present in the projection, the field's value will be
+    skipped in the parser event stream. No object will be created for the value
+    """
+
+    skipping: bool
+    """Indicator flag for a field value being skipped, under the field projection"""
+
+    skip_depth: int
+    """Nesting depth within an object or array value being skipped"""
+
+    trusted: bool
+    """Indicator flag for construction without model validation
+
+    When True, each parsed field value will be stored directly in the instance,
+    without the pydantic field validation of `setattr()`. This should be applied
+    only for server data, such that each field value will have been parsed with
+    the transport type for the field.
+    """
+
+    column_origin: Optional["SequenceBuilder"]
+    """The containing sequence builder, when parsing an object in an array with column
+    parsing for decimal fields. Else, None
+
+    For a field with a column dtype, each string value will be provided to the
+    sequence builder, then parsed with the field's values for every object in
+    the array. see also: SequenceBuilder.columns
+    """
+
     if TYPE_CHECKING:
         instance_class: Union[AbstractApiObject, ApiObject]
 
-    def __init__(self, cls: Optional[type[ApiObject]], origin: Optional[InstanceBuilder] = None):
+    def __init__(self, cls: Optional[type[ApiObject]], origin: Optional[InstanceBuilder] = None,
+                 projection: Optional[FieldProjection] = None, trusted: bool = False):
         ## the model class `cls` should be provided at a top level. The value may be None
         ## when parsing a mapping under an unrealized abstract type
+        ##
+        ## `projection` should be provided as a normalized field projection, e.g
+        ## from get_projection()
+        ##
+        ## `trusted` should be true only for data from the v20 API server
         self.realize_abstract = False
+        self.trusted = trusted
+        self.projection = projection
+        self.skipping = False
+        self.skip_depth = 0
+        self.column_origin = None
         if __debug__:
             if cls and not isinstance(cls, type):
               raise AssertionError("Not a type", cls)
         if cls and issubclass(cls, AbstractApiObject):
             self.designator_key = cls.designator_key
+            self.dispatch = None
         else:
             self.designator_key = None
+            self.dispatch = cls.get_json_dispatch() if cls else None
         super().__init__(cls, origin)
         self.json_fields = cls.json_fields if cls else None
 
@@ -153,7 +281,7 @@ class ModelBuilder(InstanceBuilder[Tmodel], Generic[Tmodel]):
         #
         # when parsing under an unrealized abstract type, returns a generic dict
         key = self.key
-        cls: type[ApiObject] = self.instance_class if key is None else self.get_field_transport_type(key).storage_class  # type: ignore
+        cls: type[ApiObject] = self.instance_class if key is None else self.get_field_dispatch(key).storage_class  # type: ignore
         if __debug__:
             model_builder_debug("%s instance_prototype: create %s", self.__class__.__name__, cls.__name__ if cls else "<Abstract>")
         return cls.create_prototype() if cls else {}
@@ -169,6 +297,20 @@ class ModelBuilder(InstanceBuilder[Tmodel], Generic[Tmodel]):
         else:
             raise ValueError("Unknown JSON field name", key, self.instance_class)
 
+    def get_field_dispatch(self, key: str) -> Optional[JsonFieldDispatch]:
+        ## may return None, e.g during 'start_map' under an unrealized abstract type
+        dispatch = self.dispatch
+        if dispatch is None:
+            return None
+        field = dispatch.get(key)
+        if field is None:
+            ## not a transport field with a known transport type.
+            ##
+            ## this will raise an exception, per the JSON field information
+            self.get_field_transport_type(key)
+            raise ValueError("No parser dispatch for JSON field", key, self.instance_class)
+        return field
+
     def get_field_transport_type(self, key: str) -> Optional[TransportType]:
         ## may return None, e.g during 'start_map' under an unrealized abstract type
         if not self.instance_class or issubclass(self.instance_class, AbstractApiObject):
@@ -209,20 +351,34 @@ class ModelBuilder(InstanceBuilder[Tmodel], Generic[Tmodel]):
         else:
             raise ValueError("Unknown JSON field", key, self.instance_class, set(json_fields.keys()), self.instance)
 
-    def set_field(self, value: Any):
+    def set_field(self, value: Any, field: Optional[JsonFieldDispatch] = None):
         key: str = self.key  # type: ignore
-        if isinstance(self.instance, ApiObject):
+        instance = self.instance
+        if self.trusted and isinstance(instance, ApiObject):
+            ## construction without validation, as with BaseModel.model_construct()
+            if field is None:
+                field = self.get_field_dispatch(key)
+            scls = field.storage_class  # type: ignore[union-attr]
+            if scls is not None and not isinstance(value, scls):
+                ## e.g for a JSON number or null value
+                value = field.transport_type.parse(value)  # type: ignore[union-attr]
+            attr_key = field.name  # type: ignore[union-attr]
+            instance.__dict__[attr_key] = value
+            return instance.__pydantic_fields_set__.add(attr_key)
+        elif isinstance(instance, ApiObject):
             # when not deferring initialization with a dict mapping,
             # ensure field tracking for applications onto Pydantic
-            attr_key = self.json_fields[key].name
-            self.instance.model_fields_set.add(attr_key)
+            if field is None:
+                field = self.dispatch.get(key)  # type: ignore[union-attr]
+            attr_key = field.name if field else self.json_fields[key].name
+            instance.model_fields_set.add(attr_key)
             ## setattr via ApiObject and pydantic methods, also ensuring
             ## value translation during init, e.g str => enum
-            return setattr(self.instance, attr_key, value)
+            return setattr(instance, attr_key, value)
         else:
             # assumption: self.instance is a dictionary, or a dict-like  object
             # such that can be accessed with a string subscript
-            self.instance[key] = value  # type: ignore
+            instance[key] = value  # type: ignore
         self.key = None
 
     def realize_instance(self, type):
@@ -231,17 +387,29 @@ class ModelBuilder(InstanceBuilder[Tmodel], Generic[Tmodel]):
         concrete_cls: Tmodel = inst.__class__
         self.instance_class = concrete_cls
         self.json_fields = concrete_cls.json_fields
+        self.dispatch = concrete_cls.get_json_dispatch()
         self.instance = inst
         self.realize_abstract = False
 
-    async def aevent(self, event: str, value: Any, async_callback=None):
+    def event(self, event: str, value: Any):
         # An implementation after ijson.ObjectBuilder.event() as a driver
         # for the ijson tokenizer => builder cycle - generalized mainly
-        # for the ApiObject class provided to this builder's constructor,
-        # furthermore defined as an async method
+        # for the ApiObject class provided to this builder's constructor
+        #
+        # This method is synchronous, such that nested builders will not
+        # require a coroutine per parser event. An async interface is
+        # available with aevent(), e.g for parsing from a response stream
         #
         # An application is illustrated together with the segment channel
-        # stream interface, in cls.from_string_async()
+        # stream interface, in cls.from_text_async()
+        if self.skipping:
+            ## skipping a value not selected in the field projection
+            if event == "start_map" or event == "start_array":
+                self.skip_depth += 1
+            elif event == "end_map" or event == "end_array":
+                self.skip_depth -= 1
+            self.skipping = self.skip_depth != 0
+            return
         builder = self.builder
         if builder is self:
             if __debug__:
@@ -258,12 +426,13 @@ class ModelBuilder(InstanceBuilder[Tmodel], Generic[Tmodel]):
                 else:
                     # create a new model builder for event forwarding at start_map
                     #
-                    # mtyp may be none when parsing a mapping under an unrealized abstract type
-                    mtyp = self.get_field_transport_type(key)
-                    proto_cls: type[ApiObject] = mtyp.storage_class if mtyp else None
-                    builder = self.__class__(proto_cls, self)
+                    # field may be none when parsing a mapping under an unrealized abstract type
+                    field = self.get_field_dispatch(key)
+                    proto_cls: type[ApiObject] = field.storage_class if field else None
+                    projection = self.projection
+                    builder = self.__class__(proto_cls, self, projection[key] if projection else None, self.trusted)
                     self.builder = builder
-                    await builder.aevent(event, value)
+                    builder.event(event, value)
             elif event == 'end_map':
                 # Implementation Note:
                 # Using one model builder per top-level element,
@@ -271,12 +440,14 @@ class ModelBuilder(InstanceBuilder[Tmodel], Generic[Tmodel]):
                 if __debug__:
                     model_builder_debug("Finalizing %r", self.instance)
                 self.finalize_builder()
-                if async_callback:
-                    if __debug__:
-                        model_builder_debug("Dispatch to callback for %r", self.instance)
-                    await async_callback(self.instance)
                 return
             elif event == 'map_key':
+                projection = self.projection
+                if projection is not None and value not in projection and value != self.designator_key:
+                    ## skip the next value, which may be a scalar value or an object or array
+                    self.skipping = True
+                    self.skip_depth = 0
+                    return
                 # try:
                 self.key = value
                 # except ValueError as exc: ## previously ...
@@ -294,16 +465,24 @@ class ModelBuilder(InstanceBuilder[Tmodel], Generic[Tmodel]):
                 # a values-typed field info instance, such that the internal
                 # member class for the field is represented in the provided
                 # field info
-                inst_cls: Tmodel = self.instance_class
-                ## field may be null when parsing a mapping under an unrealized abstract type
-                field: TransportFieldInfo = inst_cls.json_fields.get(self.key, None) if inst_cls else None  # type: ignore
-                member_transport: TransportValuesType = field.transport_type if field else None
-                builder = SequenceBuilder(member_transport, self)
+                dispatch = self.dispatch
+                member_transport: Optional[TransportValuesType]
+                if dispatch is not None:
+                    member_transport = self.get_field_dispatch(self.key).transport_type  # type: ignore
+                else:
+                    inst_cls: Tmodel = self.instance_class
+                    ## field may be null when parsing a mapping under an unrealized abstract type
+                    info: TransportFieldInfo = inst_cls.json_fields.get(self.key, None) if inst_cls else None  # type: ignore
+                    member_transport = info.transport_type if info else None
+                projection = self.projection
+                builder = SequenceBuilder(member_transport, self, projection[self.key] if projection else None,  # type: ignore[index]
+                                          self.trusted)
                 self.builder = builder
-                await builder.aevent(event, value)
+                builder.event(event, value)
             elif event == 'end_array':
                 seq = builder.instance
-                self.set_field(tuple(seq))
+                ## the list from the sequence builder can be stored directly, when trusted
+                self.set_field(seq if self.trusted else tuple(seq))
                 self.builder = self
             elif event == 'string':
                 # if self.realize_abstract:
@@ -311,33 +490,24 @@ class ModelBuilder(InstanceBuilder[Tmodel], Generic[Tmodel]):
                 if self.designator_key is not None and self.key == self.designator_key:
                     ## FIXME TEST UPDATE && remove the realize_abstract field
                     self.realize_instance(value)
-                transport = self.get_field_transport_type(self.key)  # type: ignore
-                parsed = None
-                if __debug__:
-                    # the transport type may not be known when parsing a mapping
-                    # under an unrealized abstract type
-                    if transport and not isinstance(transport, type):
-                        raise AssertionError("Not a class", transport, self.key, self.instance_class, self.instance)
-                if transport is None:
+                # the field dispatch record may not be available when parsing
+                # a mapping under an unrealized abstract type
+                field = self.get_field_dispatch(self.key)  # type: ignore
+                if field is None:
                     # deferring deserialization
-                    if __debug__:
-                            ## state flag for backtrace
-                        parse_deferred = True
-                    parsed = value
+                    self.set_field(value)
+                elif field.column_dtype is not None and self.column_origin is not None:
+                    ## the value will be parsed with the field's values in every
+                    ## object of the containing array
+                    self.column_origin.defer_value(field, self.instance, value)
+                    self.key = None
                 else:
-                    if __debug__:
-                        if not (issubclass(transport, TransportInterface) or isinstance(transport, TransportInterface)):
-                            raise AssertionError("Not a transport type", transport)
-                    parsed = transport.parse(value)
-                    if __debug__:
-                            ## state flag for backtrace
-                        parse_deferred = False
-                self.set_field(parsed)
+                    self.set_field(field.parse(value), field)
             else:
                 self.set_field(value)
         else:
             # dispatch to the forwarded builder
-            await builder.aevent(event, value)
+            builder.event(event, value)
             if builder.builder is builder:
                 # process the builder for finalization
                 if event == 'end_map' or event == 'end_array':
@@ -350,62 +520,110 @@ class ModelBuilder(InstanceBuilder[Tmodel], Generic[Tmodel]):
 
     @classmethod
     async def from_text_async(cls, model_cls: type[Tmodel], data: Union[bytes, str],
-                              loop: Optional[aio.AbstractEventLoop] = None) -> Tmodel:
+                              loop: Optional[aio.AbstractEventLoop] = None, fields: Any = None,
+                              trusted: bool = False) -> Tmodel:
         async with AsyncSegmentChannel(loop=loop or aio.get_running_loop()) as stream:
             await stream.feed(data, True)
-            builder = cls(model_cls)
+            builder = cls(model_cls, None, get_projection(fields), trusted)
             async for event, value in ijson.basic_parse_async(stream, use_float=True):
                 await builder.aevent(event, value)
             return builder.instance
 
+    @classmethod
+    def from_events(cls, model_cls: type[Tmodel], events: Iterable[tuple[str, Any]], fields: Any = None,
+                    trusted: bool = False) -> Tmodel:
+        ## synchronous driver for the builder, for a sequence of ijson basic_parse events
+        ##
+        ## if a field selection is provided, see get_projection()
+        ##
+        ## if trusted, objects will be constructed without validation. see ModelBuilder.trusted
+        builder = cls(model_cls, None, get_projection(fields), trusted)
+        evt = builder.event
+        for event, value in events:
+            evt(event, value)
+        return builder.instance
+
     @classmethod
     def from_text(cls, model_cls: type[Tmodel], data: Union[bytes, str],
-                  loop: Optional[aio.AbstractEventLoop] = None) -> Tmodel:
-        ## generic synchronous interface for the async JSON parser
-        ## used only under tests, locally ... such as under ApiObject.from_json()
-        coro = cls.from_text_async(model_cls, data)
-        if loop:
-            if loop.is_running():
-                task = loop.create_task(coro)
-                delay = sys.getswitchinterval()
-                while not task.done():
-                    time.sleep(delay)
-                return task.result()
-            else:
-                loop.run_until_complete(coro)
-        else:
-            policy = aio.get_event_loop_policy()
-            ctx_loop = policy.get_event_loop()
-            if ctx_loop.is_closed():
-                with closing(policy.new_event_loop()) as new_loop:
-                    ret = new_loop.run_until_complete(coro)
-                    new_loop.stop()
-                    return ret
-            else:
-                return ctx_loop.run_until_complete(coro)
+                  loop: Optional[aio.AbstractEventLoop] = None, fields: Any = None,
+                  trusted: bool = False) -> Tmodel:
+        ## synchronous parser for buffered JSON data, e.g under ApiObject.from_json()
+        ##
+        ## the loop arg is retained for interface compatibility. This method
+        ## does not use an event loop
+        if isinstance(data, str):
+            data = data.encode()
+        return cls.from_events(model_cls, json_backend.basic_parse(data, use_float=True), fields, trusted)
+
+    @classmethod
+    def from_stream(cls, model_cls: type[Tmodel], stream: BinaryIO, fields: Any = None,
+                    trusted: bool = False) -> Tmodel:
+        ## synchronous parser for a blocking binary stream, e.g an open file
+        return cls.from_events(model_cls, json_backend.basic_parse(stream, use_float=True), fields, trusted)
+
+
+def parse_buffered(model_cls: type[Tmodel], data: Union[bytes, str]) -> Tmodel:
+    """Parse a complete JSON object from buffered data, within a single synchronous call
+
+    If a decoder is available in `json_loads`, the JSON data will be decoded to an
+    intermediate mapping, then parsed with the transport type for the model class.
+    Else, the JSON data will be parsed with `ModelBuilder.from_text()`
+    """
+    transport_type = model_cls.ensure_transport_type() if json_loads else None
+    if transport_type is None:
+        return ModelBuilder.from_text(model_cls, data)
+    return transport_type.parse(json_loads(data))  # type: ignore[misc]
 
 
 class SequenceBuilder(InstanceBuilder[Sequence]):
 
-    __slots__ = tuple(set(InstanceBuilder.__slots__).union({"transport_type"}))
+    __slots__ = tuple(set(InstanceBuilder.__slots__).union({"transport_type", "projection", "deferred", "trusted",
+                                                            "columns"}))
 
-    def __init__(self, transport_type: TransportValuesType, origin: ModelBuilder):
+    columns: Optional[dict[str, tuple[JsonFieldDispatch, list[ApiObject], list[Any]]]]
+    """Deferred string values for the column-parsed fields of each object in the array,
+    or None if the objects in the array are not parsed with columns
+
+    For each field name, the mapping provides the field's dispatch record, the objects
+    with a deferred value for the field, and the deferred values. The values for each
+    field will be parsed with one array conversion, at the end of the array, then
+    stored in each object.
+
+    Column parsing is applied for arrays of a concrete, mutable ApiObject class
+    having one or more fields with a column dtype, e.g the buckets of an order book.
+    """
+
+    def __init__(self, transport_type: TransportValuesType, origin: Optional[ModelBuilder],
+                 projection: Optional[FieldProjection] = None, trusted: bool = False):
         super().__init__(list, origin)
+        ## construction without validation, for each object in the sequence. see ModelBuilder.trusted
+        self.trusted = trusted
         ## transport_type may be none when parsing a mapping under an unralized abstract type
         self.transport_type = transport_type
+        ## field projection for each object in the sequence
+        self.projection = projection
+        ## true if scalar values have been collected for parsing at the end of the array
+        self.deferred = False
+        self.columns = dict() if transport_type and columnar_class_p(transport_type.member_transport_type.storage_class) else None
 
     def instance_prototype(self) -> Sequence:
         return []
 
-    async def aevent(self, event: str, value: Any):  # type: ignore
+    def event(self, event: str, value: Any):
         builder = self.builder
         if builder is self:
             if __debug__:
-                model_builder_debug("SequenceBuilder.aevent %s %s (%s)", self.key, event, self.instance_class.__name__ if self.instance_class else None)
+                model_builder_debug("SequenceBuilder.event %s %s (%s)", self.key, event, self.instance_class.__name__ if self.instance_class else None)
             if event == 'start_array':
                 self.instance = []
+                self.deferred = False
                 return
             elif event == 'end_array':
+                if self.deferred:
+                    ## parse all scalar values in the array, e.g with a vectorized parser
+                    self.instance = self.transport_type.parse(self.instance)
+                elif self.columns:
+                    self.set_columns()
                 self.finalized = True
             elif event == 'map_key':
                 raise ValueError("map_key not supported in SequenceBuilder", self)
@@ -416,19 +634,20 @@ class SequenceBuilder(InstanceBuilder[Sequence]):
                 else:
                     ## parsing a mapping under an unrealized abstract type
                     member_type_class = None
-                builder = ModelBuilder(member_type_class, self)
+                builder = ModelBuilder(member_type_class, self, self.projection, self.trusted)
+                if self.columns is not None:
+                    builder.column_origin = self
                 self.builder = builder
-                await builder.aevent(event, value)
+                builder.event(event, value)
             else:
-                parsed = None
+                ## scalar values will be parsed at the end of the array. Under an
+                ## unrealized abstract type, the value will be parsed for the
+                ## realized type
                 if self.transport_type:
-                    parsed = self.transport_type.parse_member(value)
-                else:
-                    # defer deserialization when parsing under an unrealized abstract type
-                    parsed = value
-                self.instance.append(parsed)  # type: ignore
+                    self.deferred = True
+                self.instance.append(value)  # type: ignore
         else:
-            await builder.aevent(event, value)
+            builder.event(event, value)
             if builder.builder is builder:
                 if event == 'end_map' or event == 'end_array':
                     if builder.finalized:
@@ -436,3 +655,214 @@ class SequenceBuilder(InstanceBuilder[Sequence]):
                         self.instance.append(builder.instance)  # type: ignore
                         del builder
                         self.builder = self
+
+    def defer_value(self, field: JsonFieldDispatch, instance: ApiObject, value: Any):
+        """Store a string value for a column-parsed field of an object in the array"""
+        columns: dict = self.columns  # type: ignore[assignment]
+        column = columns.get(field.name)
+        if column is None:
+            column = columns[field.name] = (field, [], [])
+        column[1].append(instance)
+        column[2].append(value)
+
+    def set_columns(self):
+        ## parse the deferred values for each field with one array conversion,
+        ## then store each parsed value in the corresponding object
+        trusted = self.trusted
+        for field, instances, values in self.columns.values():  # type: ignore[union-attr]
+            name = field.name
+            parsed = np.array(values, dtype=field.column_dtype)
+            for inst, value in zip(instances, parsed):
+                if trusted:
+                    inst.__dict__[name] = value
+                    inst.__pydantic_fields_set__.add(name)
+                else:
+                    inst.model_fields_set.add(name)
+                    setattr(inst, name, value)
+        self.columns = dict()
+
+
+@cache
+def columnar_class_p(member_class: Any) -> bool:
+    """Return True if the objects of an array of the member class should be parsed with
+    column parsing, for fields of the class having a column dtype
+
+    see also: SequenceBuilder.columns
+    """
+    if not (isinstance(member_class, type) and issubclass(member_class, ApiObject)) or \
+       issubclass(member_class, AbstractApiObject) or member_class.immutable:
+        ## an immutable object is interned when finalized, and should not be
+        ## modified after the object is parsed
+        return False
+    return any(field.column_dtype is not None for field in member_class.get_json_dispatch().values())
+
+
+##
+## Lazy materialization for buffered JSON data
+##
+
+JSON_MEMBER_KEY_RE = re.compile(rb'[ \t\n\r]*"([^"\\]*(?:\\.[^"\\]*)*)"[ \t\n\r]*:[ \t\n\r]*')
+JSON_STRING_RE = re.compile(rb'"[^"\\]*(?:\\.[^"\\]*)*"')
+JSON_SCALAR_RE = re.compile(rb'-?(?:0|[1-9][0-9]*)(?:\.[0-9]+)?(?:[eE][+-]?[0-9]+)?|true|false|null')
+JSON_START_MAP_RE = re.compile(rb'[ \t\n\r]*{[ \t\n\r]*(})?')
+JSON_NEXT_MEMBER_RE = re.compile(rb'[ \t\n\r]*([,}])')
+
+## matching each bracket character in a JSON value, outside of any string value.
+## String values are consumed within each match, such that no match will be
+## produced for bracket characters within a string
+JSON_BRACKET_RE = re.compile(rb'[^"\[\]{}]*(?:"[^"\\]*(?:\\.[^"\\]*)*"[^"\[\]{}]*)*([\[\]{}])')
+
+JSON_LITERALS: Mapping[bytes, Any] = {b"true": True, b"false": False, b"null": None}
+
+ORD_START_MAP = ord("{")
+ORD_START_ARRAY = ord("[")
+ORD_DQUOTE = ord('"')
+
+
+def scan_json_end(data: bytes, start: int) -> int:
+    """Return the end offset for the JSON object or array at `start` in `data`
+
+    This scans only the structure of the JSON value, without decoding any
+    contained values.
+    """
+    depth = 0
+    for m in JSON_BRACKET_RE.finditer(data, start):
+        if m.group(1) in b"[{":
+            depth += 1
+        else:
+            depth -= 1
+            if depth == 0:
+                return m.end()
+    raise ValueError("Unterminated JSON value", start)
+
+
+def decode_json_string(token: bytes) -> str:
+    ## decode a JSON string token, including the enclosing quote characters
+    return json.loads(token) if b"\\" in token else token[1:-1].decode()
+
+
+def decode_json_scalar(token: bytes) -> Any:
+    ## decode a JSON number or literal token, as with ijson and use_float=True
+    if token in JSON_LITERALS:
+        return JSON_LITERALS[token]
+    elif b"." in token or b"e" in token or b"E" in token:
+        return float(token)
+    else:
+        return int(token)
+
+
+def get_lazy_dispatch(dispatch: Mapping[str, JsonFieldDispatch], key: str, model_cls: type) -> JsonFieldDispatch:
+    ## utility function for parse_lazy()
+    field = dispatch.get(key)
+    if field is None:
+        raise ValueError("Unknown JSON field", key, model_cls)
+    return field
+
+
+class LazyField(NamedTuple):
+    """Deferred value for a model field, as a span of the original JSON data
+
+    The field value will be parsed from the span `data[start:end]` when
+    `realize()` is called, generally on first access to the model field.
+    """
+
+    field: JsonFieldDispatch
+    data: bytes
+    start: int
+    end: int
+    projection: Optional[FieldProjection] = None
+
+    def realize(self) -> Any:
+        field = self.field
+        if field.kind is FieldKind.SEQUENCE:
+            builder = SequenceBuilder(field.transport_type, None, self.projection)  # type: ignore[arg-type]
+            evt = builder.event
+            for event, value in json_backend.basic_parse(self.data[self.start:self.end], use_float=True):
+                evt(event, value)
+            return tuple(builder.instance)
+        else:
+            return parse_lazy(field.storage_class, self.data, self.start, self.projection)
+
+
+def parse_lazy(model_cls: type[Tmodel], data: Union[bytes, str], start: int = 0, fields: Any = None) -> Tmodel:
+    """Parse a JSON object from buffered data, deferring the parse for nested objects and arrays
+
+    Each scalar field will be parsed when the JSON object is scanned. For each field
+    containing a JSON object or array, the field's span in the JSON data will be stored
+    with the instance. That field value will be parsed on first access, then stored as
+    a model field value.
+
+    If a field selection is provided, each JSON field not selected will be skipped
+    within the JSON data, without decoding. see also: get_projection()
+
+    The JSON object will be parsed with ModelBuilder, when `model_cls` is an abstract
+    API object class.
+    """
+    if isinstance(data, str):
+        data = data.encode()
+    projection = get_projection(fields)
+    if issubclass(model_cls, AbstractApiObject):
+        ## the concrete class will be determined during the parse
+        end = scan_json_end(data, start)
+        return ModelBuilder.from_text(model_cls, data[start:end], fields=projection)
+
+    m = JSON_START_MAP_RE.match(data, start)
+    if not m:
+        raise ValueError("Not a JSON object", model_cls, start)
+    inst = model_cls.create_prototype()
+    if m.group(1):
+        ## empty object
+        return model_cls.finalize_prototype(inst)
+
+    dispatch = model_cls.get_json_dispatch()
+    fields_set = inst.model_fields_set
+    lazy: dict[str, LazyField] = {}
+    pos = m.end()
+    while True:
+        m = JSON_MEMBER_KEY_RE.match(data, pos)
+        if not m:
+            raise ValueError("Invalid JSON member syntax", model_cls, pos)
+        key = m.group(1).decode()
+        pos = m.end()
+        c = data[pos]
+        if projection is not None and key not in projection:
+            ## skip the value, without decoding
+            if c == ORD_START_MAP or c == ORD_START_ARRAY:
+                pos = scan_json_end(data, pos)
+            else:
+                m = (JSON_STRING_RE if c == ORD_DQUOTE else JSON_SCALAR_RE).match(data, pos)
+                if not m:
+                    raise ValueError("Invalid JSON value syntax", key, model_cls, pos)
+                pos = m.end()
+        elif c == ORD_START_MAP or c == ORD_START_ARRAY:
+            field = get_lazy_dispatch(dispatch, key, model_cls)
+            if field.kind is FieldKind.SCALAR:
+                raise ValueError("Unsupported JSON value for field", key, model_cls)
+            end = scan_json_end(data, pos)
+            name = field.name
+            lazy[name] = LazyField(field, data, pos, end, projection[key] if projection else None)
+            fields_set.add(name)
+            pos = end
+        else:
+            field = get_lazy_dispatch(dispatch, key, model_cls)
+            name = field.name
+            if c == ORD_DQUOTE:
+                m = JSON_STRING_RE.match(data, pos)
+                value = field.parse(decode_json_string(m.group())) if m else None
+            else:
+                m = JSON_SCALAR_RE.match(data, pos)
+                value = decode_json_scalar(m.group()) if m else None
+            if not m:
+                raise ValueError("Invalid JSON value syntax", key, model_cls, pos)
+            fields_set.add(name)
+            setattr(inst, name, value)
+            pos = m.end()
+        m = JSON_NEXT_MEMBER_RE.match(data, pos)
+        if not m:
+            raise ValueError("Invalid JSON member syntax", model_cls, pos)
+        pos = m.end()
+        if m.group(1) == b"}":
+            break
+    if lazy:
+        inst.__dict__[LAZY_FIELDS_ATTR] = lazy
+    return model_cls.finalize_prototype(inst)
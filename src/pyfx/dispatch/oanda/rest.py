@@ -1,15 +1,17 @@
 
 import asyncio as aio
+from contextlib import asynccontextmanager
 import ijson
 import httpx
 import logging
 import re
-from typing import Any, Awaitable, Callable, Mapping, Optional
+from typing import Any, AsyncIterator, Awaitable, Callable, Iterator, Mapping, Optional, Union
 from typing_extensions import AsyncGenerator, TypeVar
 
 from .util.aio import chain_cancel_callback
 
 from .api.transport_client import TransportClient
+from .api.rate_limit import RequestPriority
 
 from .io import AsyncSegmentChannel
 from .exec_controller import thread_loop
@@ -47,6 +49,55 @@ def th_set_future_result(future: aio.Future, result: Any) -> Optional[aio.Handle
             return loop.call_soon_threadsafe(future.set_result, result)
 
 
+class BufferStream(httpx.AsyncByteStream, httpx.SyncByteStream):
+    """Request body stream for an encoded buffer
+
+    The buffer will be sent as a single memoryview, such that the encoded request
+    body will not be copied into a new bytes object before transport.
+    """
+
+    __slots__ = ("view",)
+
+    view: memoryview
+
+    def __init__(self, buf: Union[bytes, bytearray, memoryview]):
+        self.view = memoryview(buf)
+
+    def __len__(self) -> int:
+        return self.view.nbytes
+
+    def __iter__(self) -> Iterator[bytes]:
+        if self.view:
+            yield self.view  # type: ignore[misc]
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        if self.view:
+            yield self.view  # type: ignore[misc]
+
+
+def with_request_body(request: httpx.Request, body: Union[str, bytes, bytearray, memoryview]) -> httpx.Request:
+    """Return a copy of an HTTP request, with a request body
+
+    A bytes or buffer body will not be copied, for the request
+    """
+    stream = BufferStream(body.encode() if isinstance(body, str) else body)
+    headers = request.headers.copy()
+    headers["Content-Length"] = str(len(stream))
+    if "content-type" not in headers:
+        headers["Content-Type"] = REST_CONTENT_TYPE
+    return httpx.Request(request.method, request.url, headers=headers,
+                         stream=stream, extensions=request.extensions)
+
+
+@asynccontextmanager
+async def send_stream(client: httpx.AsyncClient, request: httpx.Request) -> AsyncIterator[httpx.Response]:
+    ## send a request with a streaming response, closing the response on exit
+    response = await client.send(request, stream=True)
+    try:
+        yield response
+    finally:
+        await response.aclose()
+
 
 class RESTClientObject(TransportClient):
     # request-oriented implementation for ApiClient
@@ -56,7 +107,7 @@ class RESTClientObject(TransportClient):
     async def request(self, method: RequestMethod, url: str,
                       response_types_map: Mapping[int, type[ApiObject]], *,
                       headers: Optional[Mapping[str, str]] = None,
-                      body: Optional[str] = None,
+                      body: Optional[Union[str, bytes, bytearray, memoryview]] = None,
                       receiver: Optional[AsyncGenerator[Any, bytes]] = None,
                       future: Optional[aio.Future[T_co]] = None
                       ) -> Awaitable[Optional[T_co]]:
@@ -68,7 +119,8 @@ class RESTClientObject(TransportClient):
         :param response_types_map: Mapping of HTTP response code to ApiObject classes
         :param headers: http request headers, including the supported content type
                 application/json
-        :param body: JSON-encodable request body, if applicable
+        :param body: JSON-encoded request body, if applicable. A bytearray body,
+                e.g from `ApiObject.write_json()`, will be sent without copying
 
         If a receiving async generator is provided, returns the provided generator,
         else returns a deserialized ApiObject
@@ -78,17 +130,22 @@ class RESTClientObject(TransportClient):
         request_headers = headers
         request_url = url
 
-        request_json = None
         if __debug__:
-            if method.isFormRequest():
-                assert isinstance(body, str), "Request body is not a string"
+            if body is not None:
+                assert method.isFormRequest(), "Request body for a request method without form data"
             logger.debug("request: sending request %s %s", method.name, url)
 
+        client_request = self.client.build_request(request_method, request_url, headers=request_headers)
+        if body is not None:
+            client_request = with_request_body(client_request, body)
+
+        ## requests with form data, e.g order requests, will preempt other requests
+        ## under the client-side rate limit
+        await self.await_rate_limit(client_request, RequestPriority.HIGH if method.isFormRequest() else RequestPriority.NORMAL)
+
         status = None
         reason = None
-        async with self.client.stream(request_method, request_url,
-                                      headers=request_headers,
-                                      json=request_json) as client_response:
+        async with send_stream(self.client, client_request) as client_response:
             if __debug__:
                 logger.debug("request: processing response %s %s", method.name, url)
 
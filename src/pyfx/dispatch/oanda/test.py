@@ -112,7 +112,7 @@ class MockFactory(pydantic_factory.ModelFactory[Timpl], Generic[Timpl], metaclas
         if issubclass(model, AbstractApiObject) and AbstractApiClass in model.__bases__:
             if not args:
                 args = {}
-            types_map = model.types_map
+            types_map = model.load_types()
             nr_concrete_cls = len(types_map)
             rnd = np.random.randint(0, max(nr_concrete_cls - 1, 1))
             designator = tuple(types_map.keys())[rnd]
@@ -183,7 +183,7 @@ class MockFactory(pydantic_factory.ModelFactory[Timpl], Generic[Timpl], metaclas
     def build(cls, factory_use_construct: bool = True, **kwargs: Any) -> Timpl:
         mcls = cls.__model__
         if issubclass(mcls, AbstractApiObject) and ABC in mcls.__bases__:
-            types_map = mcls.types_map
+            types_map = mcls.load_types()
             nr_concrete_cls = len(types_map)
             rnd = np.random.randint(0, max(1, nr_concrete_cls - 1))
             designator = tuple(types_map.keys())[rnd]
@@ -225,7 +225,7 @@ class ModelTest(ComponentTest, TestCase, Generic[Timpl]):
             # concrete class to represent the abstract class in mocks
             #
             # - TBD between gen => parse
-            types_map = mcls.types_map
+            types_map = mcls.load_types()
             nr_concrete_cls = len(types_map)
             rnd = np.random.randint(0, max(1, nr_concrete_cls - 1))
             ccls = tuple(types_map.values())[rnd]
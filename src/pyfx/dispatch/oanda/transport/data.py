@@ -1,9 +1,12 @@
 ## base types for transport data model
 
 from abc import ABC
-from collections.abc import Mapping
+from collections.abc import Hashable, Mapping
 from datetime import datetime
-from enum import Enum
+from enum import Enum, IntEnum
+from functools import cache
+import importlib
+import importlib.util
 # from reprlib import repr
 from immutables import Map
 import ijson
@@ -17,7 +20,7 @@ from pydantic._internal._model_construction import ModelMetaclass
 from reprlib import repr
 import sys
 from types import new_class
-from typing import Any, Generic, Iterable, Iterator, Optional, Union, TYPE_CHECKING
+from typing import Any, Callable, Generic, Iterable, Iterator, NamedTuple, Optional, TYPE_CHECKING
 from typing_extensions import ClassVar, Self, TypeVar, TypeAlias, Union, get_origin, get_type_hints
 
 from ..finalizable import Finalizable, FinalizableClass
@@ -39,6 +42,8 @@ from .transport_base import (
 from .application_fields import ApplicationFieldInfo
 from .repository import TransportBaseRepository
 from .encoder_constants import EncoderConstants
+from .interning import intern_cache
+from .metadata_cache import field_metadata_cache
 
 from ..exec_controller import thread_loop, ExecController
 
@@ -49,6 +54,19 @@ FieldName: TypeAlias = str
 
 T_typ = TypeVar("T_typ", bound=type)
 
+LAZY_FIELDS_ATTR: str = "__lazy_fields__"
+"""Instance dictionary key for deferred field values, in a lazily parsed ApiObject
+
+see also: parser.parse_lazy(), ApiObject.materialize()
+"""
+
+INTERNED_ATTR: str = "__interned__"
+"""Instance dictionary key denoting an interned ApiObject
+
+An interned instance may be shared among many containing objects, and cannot
+be modified. see also: ApiObject.intern()
+"""
+
 
 class TransportModelRepository(TransportBaseRepository):
 
@@ -68,6 +86,16 @@ class TransportModelRepository(TransportBaseRepository):
         })
         return singleton
 
+    def __finalize_instance__(self):
+        if not self.__finalization_state__:
+            ## model and request classes are imported on demand. Each class should
+            ## be defined before the repository is finalized
+            from ..models import load_models
+            from ..api.request import load_requests
+            load_models()
+            load_requests()
+        super().__finalize_instance__()
+
     def make_object_transport_type(self, value_type: "type[ApiObject]") -> type[TransportType]:
         assert issubclass(value_type, ApiObject), "Not an ApiObject type"
         name = "Transport_" + value_type.__name__
@@ -107,6 +135,62 @@ class TransportModelRepository(TransportBaseRepository):
 JsonTypesRepository: TransportModelRepository = TransportModelRepository.__singleton__
 
 
+class FieldKind(IntEnum):
+    """Container kind for a JSON field, for parser dispatch"""
+
+    SCALAR = 0
+    """Field value is parsed from a single JSON scalar value"""
+
+    OBJECT = 1
+    """Field value is an object, parsed from a JSON mapping"""
+
+    SEQUENCE = 2
+    """Field value is a sequence, parsed from a JSON array"""
+
+
+class JsonFieldDispatch(NamedTuple):
+    """Precomputed parser metadata for a JSON field of an InterfaceClass"""
+
+    name: str
+    """Storage attribute name for the field"""
+
+    parse: Callable[[Any], Any]
+    """Parse function for scalar values of the field, or for scalar members of a sequence field"""
+
+    kind: FieldKind
+    """Container kind for the field"""
+
+    transport_type: type[TransportType]
+    """Transport type for the field"""
+
+    storage_class: Optional[type]
+    """Storage class for the field's transport type"""
+
+    column_dtype: Optional[type] = None
+    """NumPy dtype for parsing the string values of a scalar field as a column, across
+    the objects of a JSON array, or None if each value should be parsed individually
+
+    see also: TransportInterface.get_column_dtype()
+    """
+
+
+@cache
+def get_metaclass_hints(mcls: type) -> Mapping[str, Any]:
+    ## type hints for a metaclass, memoized for class initialization
+    return get_type_hints(mcls)
+
+
+@cache
+def get_metaclass_annotations(mcls: type) -> Mapping[str, Any]:
+    ## instance annotations for the classes of a metaclass, as ClassVar annotations
+    annotations = dict()
+    for mcls_base in mcls.__mro__:
+        for attr, annot in get_metaclass_hints(mcls_base).items():
+            if not (get_origin(annot) is ClassVar or attr in annotations):
+                annotations[attr] = ClassVar[annot]
+    return annotations
+
+
 class InterfaceClass(ModelMetaclass, FinalizableClass, ABC):
 
     json_fields: Mapping[str, TransportFieldInfo]
@@ -116,9 +200,25 @@ class InterfaceClass(ModelMetaclass, FinalizableClass, ABC):
     ## used for model object unparse
     """Mapping of each instance field name to its JSON field name"""
 
+    json_dispatch: Mapping[str, JsonFieldDispatch]
+    """Mapping of JSON field names to parser dispatch records, for each transport field
+
+    This mapping will be initialized for each class during finalization, or at first
+    call to `get_json_dispatch()`"""
+
+    json_encoder: Callable[[Any, bytearray], None]
+    """JSON encoder function for instances of the class, writing to a bytearray
+
+    This function will be generated for each class at first call to `get_json_encoder()`"""
+
     transport_type: "TransportObjectType"
     """When bound, the transport type for the class onto the class' types repository"""
 
+    field_hints: Mapping[str, Any]
+    """Mapping of field names to resolved type hints, for each model field in the class
+
+    This mapping will be initialized for each class at first call to `get_field_hints()`"""
+
     types_repository: "TransportModelRepository"
     """This field is Documented as a class variable in ApiObject"""
 
@@ -134,12 +234,7 @@ class InterfaceClass(ModelMetaclass, FinalizableClass, ABC):
 
     @classmethod
     def get_instance_annotations(cls) -> Mapping[str, Any]:
-        annotations = dict()
-        for mcls_base in cls.__mro__:
-            for attr, annot in get_type_hints(mcls_base).items():
-                if not (get_origin(annot) is ClassVar or attr in annotations):
-                    annotations[attr] = ClassVar[annot]
-        return annotations
+        return get_metaclass_annotations(cls)
 
     #
     # instance methods for InterfaceClass initialization
@@ -158,8 +253,126 @@ class InterfaceClass(ModelMetaclass, FinalizableClass, ABC):
                 cls.json_fields = Map(cls.json_fields)
             else:
                 cls.json_fields = Map({})
+            cls.json_dispatch = cls.make_json_dispatch()
             super().__finalize_instance__()
 
+    def make_json_dispatch(cls) -> Mapping[str, JsonFieldDispatch]:
+        """Return a mapping of JSON field names to parser dispatch records for the class
+
+        The mapping will include a record for each field with a TransportFieldInfo and
+        a bound transport type. The mapping is provided as a dict, for lookup under
+        the parser.
+        """
+        dispatch = dict()
+        for json_name, info in cls.json_fields.items():
+            if not isinstance(info, TransportFieldInfo):
+                continue
+            ttyp = info.transport_type
+            if not ttyp or ttyp is TransportTypeInfer:
+                continue
+            storage_cls = ttyp.storage_class if hasattr(ttyp, "storage_class") else None
+            column_dtype = None
+            if issubclass(ttyp, TransportValuesType):
+                kind = FieldKind.SEQUENCE
+                parse = ttyp.parse_member
+            elif InterfaceClass in type(storage_cls).__mro__:
+                kind = FieldKind.OBJECT
+                parse = ttyp.parse
+            else:
+                kind = FieldKind.SCALAR
+                parse = ttyp.parse
+                column_dtype = ttyp.get_column_dtype()
+            dispatch[json_name] = JsonFieldDispatch(info.name, parse, kind, ttyp, storage_cls, column_dtype)
+        return dispatch
+
+    def get_json_dispatch(cls) -> Mapping[str, JsonFieldDispatch]:
+        """Return the parser dispatch mapping for the class, initializing the mapping
+        if the class has not been finalized"""
+        if "json_dispatch" in cls.__dict__:
+            return cls.json_dispatch
+        dispatch = cls.make_json_dispatch()
+        cls.json_dispatch = dispatch
+        return dispatch
+
+    def make_json_encoder(cls) -> Callable[[Any, bytearray], None]:
+        """Return a JSON encoder function for instances of the class
+
+        The function will be generated for the transport fields of the class, with the
+        JSON name and the transport type for each field bound in the function. Each
+        field will be encoded in the order of field definition.
+
+        For each nested object field, the object will be encoded into the same
+        bytearray, using the encoder function for the object's class.
+        """
+        source = [
+            "def encode(obj, buf):",
+            "    fields_set = obj.__pydantic_fields_set__",
+            "    buf += b'{'",
+            "    sep = b''",
+        ]
+        namespace: dict[str, Any] = dict(UNDEFINED=PydanticUndefined, encode_object=encode_json_object, encode_objects=encode_json_objects)
+        required = cls.api_transport_fields
+        for n, (name, info) in enumerate(cls.model_fields.items()):
+            if not isinstance(info, TransportFieldInfo):
+                continue
+            ttyp = info.transport_type
+            default = "default_%d" % n
+            unparse = "unparse_%d" % n
+            namespace[default] = info.default
+            namespace[unparse] = ttyp.unparse_bytes
+            indent = "    "
+            if name not in required:
+                source.append("    if %r in fields_set:" % name)
+                indent = "        "
+            source.extend(indent + line for line in (
+                "value = getattr(obj, %r, %s)" % (name, default),
+                "if value is UNDEFINED:",
+                "    raise ValueError('no value set for required field', %r, obj)" % name,
+                "buf += sep",
+                "buf += %r" % (b'"' + info.json_name_bytes + b'":'),
+                "sep = b','",
+            ))
+            ## the encoding for each object or object sequence will be written directly
+            ## to the buffer, if not provided with a specialized transport type
+            member_type = ttyp.member_transport_type if issubclass(ttyp, TransportValuesType) else None
+            if member_type and getattr(member_type, "unparse_bytes", None) == TransportObject.unparse_bytes.__get__(member_type) and \
+               ttyp.unparse_bytes.__func__ is TransportValuesType.unparse_bytes.__func__:
+                source.extend(indent + line for line in (
+                    "if value is None:",
+                    "    buf += %s(value)" % unparse,
+                    "else:",
+                    "    encode_objects(value, buf)",
+                ))
+            elif issubclass(ttyp, TransportObject) and ttyp.unparse_bytes.__func__ is TransportObject.unparse_bytes.__func__:
+                source.extend(indent + line for line in (
+                    "if value is None:",
+                    "    buf += %s(value)" % unparse,
+                    "else:",
+                    "    encode_object(value, buf)",
+                ))
+            elif issubclass(ttyp, TransportValuesType) or \
+                    ttyp.write_bytes.__func__ is not TransportInterface.write_bytes.__func__:
+                ## values encoded directly into the buffer, under the transport type
+                write = "write_%d" % n
+                namespace[write] = ttyp.write_bytes
+                source.append(indent + "%s(value, buf)" % write)
+            else:
+                source.append(indent + "buf += %s(value)" % unparse)
+        source.append("    buf += b'}'")
+        exec("\n".join(source), namespace)
+        encoder = namespace["encode"]
+        encoder.__name__ = encoder.__qualname__ = "encode_" + cls.__name__
+        return encoder
+
+    def get_json_encoder(cls) -> Callable[[Any, bytearray], None]:
+        """Return the JSON encoder function for the class, initializing the function at first call"""
+        if "json_encoder" in cls.__dict__:
+            return cls.json_encoder
+        encoder = cls.make_json_encoder()
+        ## stored as a static method, such that the function will not be bound to the class
+        cls.json_encoder = staticmethod(encoder)
+        return encoder
+
     def default_types_repository(self) -> TransportBaseRepository:
         """Return the default transport types repository for this class.
 
@@ -196,7 +409,7 @@ class InterfaceClass(ModelMetaclass, FinalizableClass, ABC):
                 raise AssertionError("Not a type", ttype, info, self)
                 # fmt: on
         if (ttype is TransportTypeInfer) or (not ttype):
-            field_hint = get_type_hints(self).get(field_name)
+            field_hint = self.get_field_hints().get(field_name)
             if __debug__:
                 if not field_hint:
                     # generally not reached - pydantic would typically catch the instance
@@ -223,6 +436,23 @@ class InterfaceClass(ModelMetaclass, FinalizableClass, ABC):
                 # assumption: the new_cls may represent a generalized type
                 pass
 
+    def get_field_hints(self) -> Mapping[str, Any]:
+        """Return the resolved type hints for the model fields of the class `self`
+
+        The type hints will be retrieved from the field metadata cache when available,
+        else resolved with `get_type_hints()` and added to the cache. The mapping will
+        be stored in the class at first call.
+        """
+        if "field_hints" in self.__dict__:
+            return self.field_hints
+        hints = field_metadata_cache.get_hints(self)
+        if hints is None:
+            all_hints = get_type_hints(self)
+            hints = {name: all_hints[name] for name in self.model_fields if name in all_hints}
+            field_metadata_cache.put_hints(self, hints)
+        self.field_hints = hints
+        return hints
+
     def get_transport_type(self, value_type: Union[type, TypeRef]) -> TransportType:
         """Forward a transport type query to the types repository of the class `self`
 
@@ -245,7 +475,7 @@ class InterfaceClass(ModelMetaclass, FinalizableClass, ABC):
 
         ## inherit InterfaceClass instance annotations as instance ClassVar annotations
         annotations = namespace["__annotations__"] if "__annotations__" in namespace else {}
-        for attr, annot in get_type_hints(InterfaceClass).items():
+        for attr, annot in get_metaclass_hints(InterfaceClass).items():
             if not (get_origin(annot) is ClassVar or attr in annotations):
                 annotations[attr] = ClassVar[annot]
         namespace["__annotations__"] = annotations
@@ -347,6 +577,8 @@ class ModelState(Generic[T_o]):
         # field-oriented model state construction. implementation for ApiObjbect.__getstate__()
         m_cls: type[T_o] = m_object.__class__
         fields = m_cls.model_fields
+        if LAZY_FIELDS_ATTR in m_object.__dict__:
+            m_object.materialize()
         dct = m_object.__dict__
         ## Implementation Note:
         ##
@@ -442,7 +674,10 @@ class TransportObject(TransportInterface[Tobject, IntermediateObject]):
         else:
             assert isinstance(unparsed, Mapping), "Not a mapping value"
             model_cls: Union[type["ApiObject"], type["AbstractApiObject"]] = cls.storage_class
-            if issubclass(model_cls, AbstractApiObject) and ABC in model_cls.__bases__:
+            if issubclass(model_cls, AbstractApiObject):
+                ## the abstract base class may not be declared with ABC as a direct base
+                ## class, e.g Transaction. For a concrete class, the designator should
+                ## map to the class itself
                 key = model_cls.designator_key
                 designator = unparsed[key]
                 model_cls = model_cls.class_for_designator(designator)
@@ -459,7 +694,7 @@ class TransportObject(TransportInterface[Tobject, IntermediateObject]):
                 attr = info.name
                 setattr(inst, attr, parsed)
                 # object.__setattr__(inst, attr, parsed)
-            return inst
+            return inst.intern() if model_cls.immutable else inst
 
     @classmethod
     def unparse_py(cls, o: Tobject, encoder: JSONEncoder) -> IntermediateObject:
@@ -519,10 +754,19 @@ class TransportObject(TransportInterface[Tobject, IntermediateObject]):
 
     @classmethod
     def unparse_bytes(cls, value: Tobject) -> bytes:
-        sep = EncoderConstants.ITEM_SEPARATOR
-        return EncoderConstants.START_MAP.value + sep.join(
-            expr for expr in cls.iter_transport_field_bytes(value)
-        ) + EncoderConstants.END_MAP.value
+        buf = bytearray()
+        encode_json_object(value, buf)
+        return bytes(buf)
+
+    @classmethod
+    def write_bytes(cls, value: Optional[Tobject], buf: bytearray) -> None:
+        if cls.unparse_bytes.__func__ is not TransportObject.unparse_bytes.__func__:  # type: ignore[attr-defined]
+            ## specialized encoding for the object type
+            buf += cls.unparse_bytes(value)
+        elif value is None:
+            buf += EncoderConstants.NULL.value
+        else:
+            encode_json_object(value, buf)
 
     @classmethod
     def unparse_url_bytes(cls, value: Tobject) -> bytes:
@@ -541,6 +785,43 @@ class TransportObjectType(TransportObject, TransportType[Tobject, IntermediateOb
     pass
 
 
+def get_value_key(value: Any) -> Hashable:
+    ## return a hashable key for a field value under ApiObject.get_intern_key()
+    ##
+    ## raises TypeError if the value is not hashable
+    if isinstance(value, ApiObject):
+        key = value.get_intern_key()
+        if key is None:
+            raise TypeError("Object cannot be interned", value)
+        return key
+    elif isinstance(value, (list, tuple)):
+        return tuple(map(get_value_key, value))
+    hash(value)
+    return value
+
+
+def encode_json_object(value: "ApiObject", buf: bytearray):
+    """Encode an ApiObject as JSON, into the bytearray"""
+    cls = value.__class__
+    encoder = cls.__dict__.get("json_encoder", None)
+    if encoder is None:
+        encoder = cls.get_json_encoder()
+    else:
+        encoder = encoder.__func__
+    encoder(value, buf)
+
+
+def encode_json_objects(values: Iterable["ApiObject"], buf: bytearray):
+    """Encode a sequence of ApiObjects as a JSON array, into the bytearray"""
+    buf += b'['
+    sep = b''
+    for value in values:
+        buf += sep
+        sep = b','
+        encode_json_object(value, buf)
+    buf += b']'
+
+
 class InterfaceModel(BaseModel, ABC, metaclass=InterfaceClass):
 
     if TYPE_CHECKING:
@@ -643,6 +924,8 @@ class InterfaceModel(BaseModel, ABC, metaclass=InterfaceClass):
             return super().__getattr__(attr)  # type: ignore
 
     def __setattr__(self, attr: str, value: Any, assume_model: bool = False) -> Any:
+        if INTERNED_ATTR in self.__dict__:
+            raise TypeError("Interned instance cannot be modified. A copy can be modified", self.__class__, attr)
         fields = self.__class__.model_fields
         if assume_model or attr in fields:
             info = fields[attr]
@@ -675,6 +958,8 @@ class InterfaceModel(BaseModel, ABC, metaclass=InterfaceClass):
         Known Limitations:
         - Not thread-safe for concurrent read and modification of model fields
         """
+        if INTERNED_ATTR in self.__dict__:
+            raise TypeError("Interned instance cannot be modified. A copy can be modified", self.__class__, name)
         fields = self.__class__.model_fields
         if assume_model or name in fields:
             field = fields[name]
@@ -765,6 +1050,14 @@ class ApiObject(InterfaceModel, ABC, metaclass=ApiClass):
     if TYPE_CHECKING:
         model_fields: ClassVar[Mapping[str, TransportFieldInfo]]
 
+    immutable: ClassVar[bool] = False
+    """If True, instances of this class will be treated as immutable values
+
+    Each instance of an immutable class, as parsed from API data, will be interned
+    under `intern()`. Structurally equal instances may then share a single object.
+    An interned instance cannot be modified. A copy of the instance can be modified.
+    """
+
     api_transport_fields: ClassVar[frozenset[str]]
     """Fields to serialize for transport
 
@@ -777,6 +1070,94 @@ class ApiObject(InterfaceModel, ABC, metaclass=ApiClass):
     value or default facdtory.
     """
 
+    #
+    # lazy field materialization
+    #
+
+    def __getattr__(self, attr: str, assume_model: bool = False) -> Any:
+        ## called only when the attribute is not present in the instance dictionary,
+        ## e.g for a deferred field value in an object initialized with parse_lazy()
+        lazy = self.__dict__.get(LAZY_FIELDS_ATTR)
+        if lazy and attr in lazy:
+            return self.materialize_field(attr)
+        return super().__getattr__(attr, assume_model)
+
+    def materialize_field(self, name: str) -> Any:
+        """Parse and store the deferred value for a model field
+
+        Returns the parsed field value.
+
+        For a `name` not matching a deferred field, raises KeyError
+
+        Known Limitations:
+        - Not thread-safe for concurrent access to deferred fields
+        """
+        dct = self.__dict__
+        lazy = dct[LAZY_FIELDS_ATTR]
+        pending = lazy.pop(name)
+        if not lazy:
+            del dct[LAZY_FIELDS_ATTR]
+        if name in dct:
+            ## the field was set after the lazy parse
+            return dct[name]
+        ## setting the value as with the parser, e.g for storage of sequence values.
+        ##
+        ## the instance dictionary may be replaced under pydantic assignment validation
+        setattr(self, name, pending.realize())
+        return self.__dict__[name]
+
+    def materialize(self, deep: bool = False):
+        """Parse and store any deferred field values for this object
+
+        If `deep` is True, any deferred fields in the nested objects of
+        this object will also be materialized. Else, nested objects will
+        not be materialized.
+        """
+        dct = self.__dict__
+        lazy = dct.get(LAZY_FIELDS_ATTR)
+        if lazy:
+            for name in tuple(lazy.keys()):
+                self.materialize_field(name)
+        if deep:
+            for value in self.__dict__.values():
+                if isinstance(value, ApiObject):
+                    value.materialize(True)
+                elif isinstance(value, (list, tuple)):
+                    for item in value:
+                        if isinstance(item, ApiObject):
+                            item.materialize(True)
+
+    def __copy__(self) -> Self:
+        inst = super().__copy__()
+        dct = inst.__dict__
+        lazy = dct.get(LAZY_FIELDS_ATTR)
+        if lazy:
+            ## the copy will materialize its deferred fields independent of this object
+            dct[LAZY_FIELDS_ATTR] = dict(lazy)
+        ## a copy of an interned instance is not shared, and can be modified
+        dct.pop(INTERNED_ATTR, None)
+        return inst
+
+    def __deepcopy__(self, memo: Optional[dict[int, Any]] = None) -> Self:
+        inst = super().__deepcopy__(memo)
+        inst.__dict__.pop(INTERNED_ATTR, None)
+        return inst
+
+    def model_dump(self, **kwargs: Any) -> dict[str, Any]:
+        ## the pydantic serializer will not access deferred fields
+        self.materialize(True)
+        return super().model_dump(**kwargs)
+
+    def model_dump_json(self, **kwargs: Any) -> str:
+        self.materialize(True)
+        return super().model_dump_json(**kwargs)
+
+    @property
+    def lazy_fields(self) -> frozenset[str]:
+        """Names of model fields with deferred values, for this object"""
+        lazy = self.__dict__.get(LAZY_FIELDS_ATTR)
+        return frozenset(lazy.keys()) if lazy else frozenset()
+
     #
     # serialization state and hashing support
     #
@@ -805,6 +1186,29 @@ class ApiObject(InterfaceModel, ABC, metaclass=ApiClass):
                 raise AssertionError("Unsupported state type", state.__class__)
         return state.reify()
 
+    def to_snapshot(self) -> bytes:
+        """Return a compact binary snapshot of the object
+
+        see also: snapshot.dumps(), from_snapshot()
+        """
+        ## localized import, as the snapshot module depends on this module
+        from .snapshot import dumps
+        return dumps(self)
+
+    @classmethod
+    def from_snapshot(cls, data: bytes) -> Self:
+        """Return the object encoded in a binary snapshot
+
+        Raises ValueError if the snapshot does not encode an instance of this class.
+
+        see also: snapshot.loads(), to_snapshot()
+        """
+        from .snapshot import loads
+        inst = loads(data)
+        if not isinstance(inst, cls):
+            raise ValueError("Snapshot does not encode an instance of the class", inst.__class__, cls)
+        return inst
+
     def get_display_string(self, field: str) -> str:
         ## utility method @ ApiObject - dispatch to get_display_string for the field's transport type
         dct = self.__dict__
@@ -834,6 +1238,10 @@ class ApiObject(InterfaceModel, ABC, metaclass=ApiClass):
         builder = ModelBuilder(cls)
 
         async with await open_file(file, "rb") as stream:
+            if encoding is not None:
+                ## transcode the file data for the UTF-8 parser
+                data = await stream.read()
+                return ModelBuilder.from_text(cls, data.decode(encoding).encode())
             async for event, value in ijson.basic_parse_async(stream, use_float=True):
                 ## parse the byte stream
                 await builder.aevent(event, value)
@@ -844,10 +1252,18 @@ class ApiObject(InterfaceModel, ABC, metaclass=ApiClass):
         future = controller.add_cofuture()
 
         def parse_in_thread(cls: Self, file: Pathname, encoding, future: CoFuture):
-            global thread_loop
-            loop = thread_loop.get()
+            # localizing the parser import, to prevent a circular dependency
+            from ..parser import ModelBuilder
             with future:
-                future.set_result(loop.run_until_complete(cls.afrom_file(file, encoding)))
+                ## the file is read with a blocking stream, in the worker thread,
+                ## using the synchronous parser
+                with open(file, "rb") as stream:
+                    if encoding is None:
+                        future.set_result(ModelBuilder.from_stream(cls, stream))
+                    else:
+                        ## transcode the file data for the UTF-8 parser
+                        data = stream.read().decode(encoding).encode()
+                        future.set_result(ModelBuilder.from_text(cls, data))
 
         _ = controller.dispatch(parse_in_thread, cls, file, encoding)
         return future.poll()
@@ -864,12 +1280,37 @@ class ApiObject(InterfaceModel, ABC, metaclass=ApiClass):
         """Return a JSON bytes representation of the object"""
         return self.transport_type.unparse_bytes(self)
 
+    def write_json(self, buf: Optional[bytearray] = None) -> bytearray:
+        """Append the JSON representation of the object to a buffer, returning the buffer
+
+        If no buffer is provided, a new bytearray will be created. The buffer can be
+        provided directly as a request body, e.g under `memoryview(buf)`, without
+        copying the encoded JSON into a new bytes object.
+        """
+        if buf is None:
+            buf = bytearray()
+        self.transport_type.write_bytes(self, buf)
+        return buf
+
     @classmethod
-    def from_json(cls, json_data: Union[str, bytes]) -> Self:
-        """Create an instance of the ApiObject class from a JSON string"""
+    def from_json(cls, json_data: Union[str, bytes], lazy: bool = False, fields: Any = None) -> Self:
+        """Create an instance of the ApiObject class from a JSON string
+
+        If `lazy` is true, each nested object or array field will be parsed
+        on first access to the field, using the field's span in the original
+        JSON data.
+
+        If `fields` is provided, only the selected JSON fields will be parsed,
+        e.g `{"account": {"balance", "NAV", "lastTransactionID"}}`. The
+        resulting object may not provide a value for every required field.
+        see also: parser.get_projection()
+        """
         # localizing the import, to prevent a circular dependency
+        if lazy:
+            from ..parser import parse_lazy
+            return parse_lazy(cls, json_data, fields=fields)
         from ..parser import ModelBuilder
-        return ModelBuilder.from_text(cls, json_data)
+        return ModelBuilder.from_text(cls, json_data, fields=fields)
 
     @classmethod
     def from_dict(cls, obj: Optional[Union[Mapping[str, Any], Self]]) -> Self:
@@ -963,8 +1404,52 @@ class ApiObject(InterfaceModel, ABC, metaclass=ApiClass):
 
     @classmethod
     def finalize_prototype(cls, value: Self) -> Self:
-        ## no further initialization, in the base class
-        return value
+        ## no further initialization in the base class, except for interning
+        ## an instance of an immutable class
+        return value.intern() if value.immutable else value
+
+    #
+    # Interning for immutable instances
+    #
+
+    def get_intern_key(self) -> Optional[Hashable]:
+        """Return a key representing the class and the field values for this instance,
+        or None if the instance cannot be interned
+
+        The key will be None for an instance with deferred field values, or with any
+        field value not hashable.
+        """
+        dct = self.__dict__
+        if LAZY_FIELDS_ATTR in dct:
+            return None
+        fields_set = self.__pydantic_fields_set__
+        key: list[Any] = [self.__class__]
+        try:
+            for name in self.__class__.model_fields:
+                if name in fields_set:
+                    key.append((name, get_value_key(dct.get(name))))
+        except TypeError:
+            return None
+        return tuple(key)
+
+    def intern(self) -> Self:
+        """Return the interned instance structurally equal to this instance
+
+        If no equal instance has been interned, this instance will be interned and
+        returned. If this instance cannot be interned, returns this instance.
+
+        The interned instance may be shared among the values of many objects. The
+        interned instance cannot be modified. A copy of the interned instance, e.g
+        from `model_copy()`, can be modified.
+
+        see also: ApiObject.immutable, interning.intern_cache
+        """
+        key = self.get_intern_key()
+        if key is None:
+            return self
+        inst = intern_cache.intern(key, self)
+        inst.__dict__[INTERNED_ATTR] = True
+        return inst
 
 
 ## fxTrade v20 API uses enum values for denoting the implementation class
@@ -1004,6 +1489,9 @@ class AbstractApiClass(ApiClass):
         if "types_map" not in namespace:
             namespace["types_map"] = {}
 
+        if "lazy_types" not in namespace:
+            namespace["lazy_types"] = {}
+
         namespace["__annotations__"] = annotations
 
         return super().__new__(cls, cls_name, bases, namespace)
@@ -1029,6 +1517,12 @@ class AbstractApiObject(ApiObject, ABC, Generic[Td], metaclass=AbstractApiClass)
     with an immutable mapping.
     """
 
+    lazy_types: ClassVar[dict[Td, tuple[str, str]]]
+    """Module and class names for implementation classes not yet imported, for each designator
+
+    see also: `bind_lazy_types()`
+    """
+
     designator_key: ClassVar[str]
     """Field name for the the designator key, within concrete implementations
     of the abstract API Object class
@@ -1103,7 +1597,7 @@ class AbstractApiObject(ApiObject, ABC, Generic[Td], metaclass=AbstractApiClass)
     def class_for_designator(cls, designator: Td) -> type[ApiObject]:
         ## return the implementation class defined for a given designator value
         if __debug__:
-            if len(cls.types_map) is int(0):
+            if len(cls.types_map) is int(0) and len(cls.lazy_types) is int(0):
                 raise AssertionError("Types map is empty", cls)
             elif not designator:
                 # fmt: off
@@ -1120,8 +1614,50 @@ class AbstractApiObject(ApiObject, ABC, Generic[Td], metaclass=AbstractApiClass)
                 denum = dtyp[designator]
                 if denum in types_map:
                     return types_map[denum]
+                elif denum in cls.lazy_types:
+                    return cls.load_type(denum)
         raise ValueError("No class found for abstract instance designator", designator, cls)
 
+    @classmethod
+    def bind_lazy_types(cls, refs: Mapping[Td, str]):
+        """Bind designator values to implementation classes, to be imported on demand
+
+        Each value in `refs` should be a `module:name` reference for the implementation
+        class. A relative module name will be resolved relative to the package of the
+        module defining the class `cls`.
+
+        For a designator bound in `refs`, the implementation class will be imported
+        at first call to `class_for_designator()` or `load_types()`, unless the class
+        was bound to the designator at import.
+        """
+        package = cls.__module__.rpartition(".")[0]
+        lazy = cls.lazy_types
+        for typ, ref in refs.items():
+            assert isinstance(typ, cls.designator_type)
+            module_name, _, name = ref.partition(":")
+            lazy[typ] = (importlib.util.resolve_name(module_name, package), name)
+
+    @classmethod
+    def load_type(cls, designator: Td) -> type[ApiObject]:
+        """Import and bind the implementation class for a lazy designator binding"""
+        types_map = cls.types_map
+        if designator not in types_map:
+            module_name, name = cls.lazy_types[designator]
+            icls = getattr(importlib.import_module(module_name), name)
+            cls.bind_types({designator: icls})
+        cls.lazy_types.pop(designator, None)
+        return types_map[designator]
+
+    @classmethod
+    def load_types(cls) -> TypesMap:
+        """Import and bind the implementation classes for all lazy designator bindings
+
+        Returns the class' types map
+        """
+        for designator in tuple(cls.lazy_types.keys()):
+            cls.load_type(designator)
+        return cls.types_map
+
     @classmethod
     def create_prototype(cls):
         # subsequently, see ApiObject.realize_map()
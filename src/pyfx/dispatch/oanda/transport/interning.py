@@ -0,0 +1,87 @@
+"""Bounded interning cache for immutable values"""
+
+from collections import OrderedDict
+from collections.abc import Hashable
+import threading
+from typing import Generic, Optional
+from typing_extensions import TypeVar
+
+from ..util.naming import exporting
+
+T = TypeVar("T")
+
+INTERN_CACHE_SIZE: int = 4096
+"""Default maximum number of entries in an InternCache"""
+
+
+class InternCache(Generic[T]):
+    """Bounded cache of interned values, with least-recently-used eviction
+
+    For each key, the first value interned with that key will be returned for
+    any later value interned with an equal key, while the key is retained in
+    the cache. The key should represent the complete structure of the value.
+
+    This class is thread-safe.
+    """
+
+    __slots__ = ("entries", "maxsize", "lock", "hits", "misses")
+
+    entries: OrderedDict[Hashable, T]
+    """Interned values, in order of least recent use"""
+
+    maxsize: int
+    """Maximum number of entries in the cache"""
+
+    lock: threading.Lock
+
+    hits: int
+    """Number of calls to `intern()` returning a previously interned value"""
+
+    misses: int
+    """Number of calls to `intern()` adding a value to the cache"""
+
+    def __init__(self, maxsize: int = INTERN_CACHE_SIZE):
+        if __debug__:
+            if maxsize < 1:
+                raise AssertionError("maxsize must be a positive integer", maxsize)
+        self.entries = OrderedDict()
+        self.maxsize = maxsize
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def intern(self, key: Hashable, value: T) -> T:
+        """Return the value interned for the key, else add and return the provided value"""
+        entries = self.entries
+        with self.lock:
+            interned: Optional[T] = entries.get(key)
+            if interned is not None:
+                entries.move_to_end(key)
+                self.hits += 1
+                return interned
+            entries[key] = value
+            self.misses += 1
+            if len(entries) > self.maxsize:
+                entries.popitem(last=False)
+            return value
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def __repr__(self) -> str:
+        return "<%s %d/%d entries, %d hits, %d misses at 0x%x>" % (
+            self.__class__.__name__, len(self.entries), self.maxsize, self.hits, self.misses, id(self)
+        )
+
+
+intern_cache: InternCache = InternCache()
+"""Interning cache for instances of immutable ApiObject classes"""
+
+
+__all__ = exporting(__name__, ...)
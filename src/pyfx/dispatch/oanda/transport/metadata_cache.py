@@ -0,0 +1,355 @@
+"""Persistent cache for resolved field type hints of transport model classes
+
+At class initialization, each transport model class will resolve the type hint
+for each field that does not provide an explicit transport type. This requires
+a call to `get_type_hints()` for the class, such that each string annotation in
+the class and its base classes will be evaluated. For the model classes in this
+package, this represents a substantial part of the time for initial import.
+
+The FieldMetadataCache stores the resolved field type hints for each class in a
+JSON file, as an encoded form of each type hint. Each class' type hints will be
+stored with the modification time and size of the module file for each class in
+the class' method resolution order that declares annotations, such that the entry
+for a class will be invalidated on any change to the class' module or to the
+module of any annotated base class. The complete cache will be invalidated on any change in the cache format version,
+the package version, or the Python version.
+
+Cached type hints will be decoded only from modules that have already been
+imported. When any class cannot be resolved from a cached type hint, the cache
+will not be used for that class.
+
+The default cache file will be located in the user cache directory. This
+location can be overridden with the `PYFX_FIELD_METADATA_CACHE` environment
+variable. If set to an empty string, the persistent cache will be disabled.
+"""
+
+from appdirs import AppDirs  # type: ignore[import-untyped]
+import atexit
+import json
+import logging
+import os
+import sys
+import tempfile
+import threading
+from types import GenericAlias
+from typing import Any, Literal, Mapping, Optional, Union
+from typing_extensions import get_args, get_origin
+
+from .. import __version__
+from ..util.naming import exporting
+
+logger = logging.getLogger(__name__)
+
+FIELD_METADATA_VERSION: int = 2
+"""Format version for the field metadata cache file"""
+
+FIELD_METADATA_ENV: str = "PYFX_FIELD_METADATA_CACHE"
+"""Environment variable for the path of the field metadata cache file"""
+
+NoneType = type(None)
+
+
+def class_ref(cls: type) -> str:
+    """Return a `module:qualname` reference for a class
+
+    Raises TypeError if the class cannot be resolved from the reference
+    """
+    if cls is NoneType:
+        return "builtins:NoneType"
+    ref = cls.__module__ + ":" + cls.__qualname__
+    if "<" in ref:
+        raise TypeError("Class is not accessible by name", cls)
+    try:
+        resolved = resolve_ref(ref)
+    except LookupError:
+        raise TypeError("Class is not accessible by name", cls) from None
+    if resolved is not cls:
+        raise TypeError("Class reference does not resolve to the class", cls, ref)
+    return ref
+
+
+def resolve_ref(ref: str) -> Any:
+    """Return the object for a `module:qualname` reference, in an imported module
+
+    Raises LookupError if the module has not been imported or does not provide
+    the named object
+    """
+    if ref == "builtins:NoneType":
+        return NoneType
+    module_name, _, qualname = ref.partition(":")
+    obj: Any = sys.modules[module_name]
+    try:
+        for attr in qualname.split("."):
+            obj = getattr(obj, attr)
+    except AttributeError as exc:
+        raise LookupError("Unable to resolve reference", ref) from exc
+    return obj
+
+
+def encode_hint(hint: Any) -> Any:
+    """Encode a resolved type hint as a JSON-compatible value
+
+    A class will be encoded as a `module:qualname` string. A Union, Literal, or
+    builtin generic alias type will be encoded as a list, with a leading tag.
+
+    Raises TypeError for any unsupported type hint
+    """
+    if hint is None:
+        return class_ref(NoneType)
+    origin = get_origin(hint)
+    if origin is None:
+        if isinstance(hint, type):
+            return class_ref(hint)
+        raise TypeError("Unsupported type hint", hint)
+    args = get_args(hint)
+    if origin is Union:
+        return ["union", *(encode_hint(arg) for arg in args)]
+    elif origin is Literal:
+        return ["literal", *(encode_literal(arg) for arg in args)]
+    elif isinstance(hint, GenericAlias):
+        return ["generic", class_ref(origin), *(encode_hint(arg) for arg in args)]
+    raise TypeError("Unsupported type hint", hint)
+
+
+def encode_literal(value: Any) -> list:
+    if isinstance(value, (str, int, bool)) and value.__class__ in (str, int, bool):
+        return ["value", value]
+    member_name = getattr(value, "name", None)
+    if member_name is not None and getattr(value.__class__, member_name, None) is value:
+        ## enum member
+        return ["member", class_ref(value.__class__), member_name]
+    raise TypeError("Unsupported literal value", value)
+
+
+def decode_hint(encoded: Any) -> Any:
+    """Decode a type hint encoded with `encode_hint()`
+
+    Raises LookupError if any class for the type hint cannot be resolved
+    """
+    if isinstance(encoded, str):
+        return resolve_ref(encoded)
+    tag, *args = encoded
+    if tag == "union":
+        return Union[tuple(decode_hint(arg) for arg in args)]
+    elif tag == "literal":
+        return Literal[tuple(decode_literal(arg) for arg in args)]
+    elif tag == "generic":
+        origin = resolve_ref(args[0])
+        return origin[tuple(decode_hint(arg) for arg in args[1:])]
+    raise LookupError("Unknown type hint tag", tag)
+
+
+def decode_literal(encoded: list) -> Any:
+    if encoded[0] == "value":
+        return encoded[1]
+    return getattr(resolve_ref(encoded[1]), encoded[2])
+
+
+def annotation_modules(cls: type) -> list[str]:
+    """Return the names of the modules declaring annotations for a class and
+    its base classes, in method resolution order"""
+    modules = []
+    for base in cls.__mro__:
+        if "__annotations__" in base.__dict__ and base.__module__ not in modules:
+            modules.append(base.__module__)
+    return modules
+
+
+def default_cache_path() -> Optional[str]:
+    """Return the default path for the field metadata cache file
+
+    Returns None if the persistent cache is disabled
+    """
+    path = os.environ.get(FIELD_METADATA_ENV, None)
+    if path is not None:
+        return path or None
+    appdirs = AppDirs(appname="pyfx.dispatch.oanda")
+    return os.path.join(appdirs.user_cache_dir, "field_metadata.json")
+
+
+class FieldMetadataCache:
+    """Persistent cache of resolved field type hints, for transport model classes
+
+    The cache file will be loaded at first call to `get_hints()` and will be
+    written under `save()`, if any entries were added to the cache.
+
+    This class is thread-safe.
+    """
+
+    __slots__ = ("path", "classes", "stamps", "lock", "loaded", "dirty", "hits", "misses")
+
+    path: Optional[str]
+    """Path to the cache file, or None for an in-memory cache"""
+
+    classes: dict[str, dict[str, Any]]
+    """Cache entries, for each `module:qualname` class reference
+
+    Each entry provides the encoded type hints for the class, with the module
+    stamps for each module declaring annotations for the class
+    """
+
+    stamps: dict[str, Optional[list[int]]]
+    """Module file stamps, as computed in this process"""
+
+    lock: threading.RLock
+
+    loaded: bool
+
+    dirty: bool
+    """True if any entries were added since the cache was loaded or saved"""
+
+    hits: int
+    """Number of classes for which cached type hints were used"""
+
+    misses: int
+    """Number of classes for which type hints were not available in the cache"""
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path
+        self.classes = {}
+        self.stamps = {}
+        self.lock = threading.RLock()
+        self.loaded = False
+        self.dirty = False
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def cache_key() -> dict[str, Any]:
+        """Return the values that must match for a cache file to be used"""
+        return {
+            "format": FIELD_METADATA_VERSION,
+            "package": __version__,
+            "python": "%d.%d" % sys.version_info[:2],
+        }
+
+    def module_stamp(self, module_name: str) -> Optional[list[int]]:
+        ## return the modification time and size of the module's file, else None
+        if module_name in self.stamps:
+            return self.stamps[module_name]
+        module = sys.modules.get(module_name)
+        file = getattr(module, "__file__", None)
+        stamp: Optional[list[int]] = None
+        if file:
+            try:
+                st = os.stat(file)
+                stamp = [st.st_mtime_ns, st.st_size]
+            except OSError:
+                pass
+        self.stamps[module_name] = stamp
+        return stamp
+
+    def load(self):
+        """Load the cache file, if available and valid for the cache key"""
+        with self.lock:
+            self.loaded = True
+            path = self.path
+            if not path or not os.path.exists(path):
+                return
+            try:
+                with open(path, "rb") as stream:
+                    data = json.load(stream)
+            except (OSError, ValueError) as exc:
+                logger.debug("Unable to read field metadata cache %s: %s", path, exc)
+                return
+            if not isinstance(data, dict) or data.get("key") != self.cache_key():
+                logger.debug("Field metadata cache %s is not valid for this installation", path)
+                return
+            self.classes.update(data.get("classes", {}))
+
+    def get_hints(self, cls: type) -> Optional[Mapping[str, Any]]:
+        """Return the cached field type hints for a class, or None if not available"""
+        with self.lock:
+            if not self.loaded:
+                self.load()
+            entry = self.classes.get(cls.__module__ + ":" + cls.__qualname__)
+            if entry is None or entry["stamps"] != self.class_stamps(cls):
+                self.misses += 1
+                return None
+            try:
+                hints = {name: decode_hint(hint) for name, hint in entry["hints"].items()}
+            except (LookupError, TypeError, ValueError):
+                self.misses += 1
+                return None
+            self.hits += 1
+            return hints
+
+    def class_stamps(self, cls: type) -> Optional[dict[str, list[int]]]:
+        ## return the module stamps for each module declaring annotations for
+        ## the class, else None if any module stamp is not available
+        stamps = {}
+        for module_name in annotation_modules(cls):
+            stamp = self.module_stamp(module_name)
+            if stamp is None:
+                return None
+            stamps[module_name] = stamp
+        return stamps
+
+    def put_hints(self, cls: type, hints: Mapping[str, Any]):
+        """Add the field type hints for a class to the cache, if each type hint can be encoded"""
+        if "<" in cls.__qualname__:
+            return
+        try:
+            encoded = {name: encode_hint(hint) for name, hint in hints.items()}
+        except TypeError:
+            return
+        with self.lock:
+            stamps = self.class_stamps(cls)
+            if stamps is None:
+                return
+            self.classes[cls.__module__ + ":" + cls.__qualname__] = {"stamps": stamps, "hints": encoded}
+            self.dirty = True
+
+    def save(self):
+        """Write the cache file, if any entries were added to the cache"""
+        with self.lock:
+            path = self.path
+            if not (path and self.dirty):
+                return
+            data = {"key": self.cache_key(), "classes": self.classes}
+            try:
+                dirname = os.path.dirname(path) or "."
+                os.makedirs(dirname, exist_ok=True)
+                ## written under a temporary file, such that concurrent processes
+                ## will not read a partial cache file
+                fd, tmp = tempfile.mkstemp(dir=dirname, prefix=".field_metadata_", suffix=".json")
+                try:
+                    with os.fdopen(fd, "w", encoding="utf-8") as stream:
+                        json.dump(data, stream, separators=(",", ":"))
+                    os.replace(tmp, path)
+                except BaseException:
+                    os.unlink(tmp)
+                    raise
+            except OSError as exc:
+                logger.debug("Unable to write field metadata cache %s: %s", path, exc)
+                return
+            self.dirty = False
+
+    def clear(self):
+        """Clear all entries in the cache and remove the cache file, if any"""
+        with self.lock:
+            self.classes.clear()
+            self.stamps.clear()
+            self.loaded = True
+            self.dirty = False
+            self.hits = 0
+            self.misses = 0
+            if self.path and os.path.exists(self.path):
+                try:
+                    os.unlink(self.path)
+                except OSError:
+                    pass
+
+    def __repr__(self) -> str:
+        return "<%s %r %d classes, %d hits, %d misses at 0x%x>" % (
+            self.__class__.__name__, self.path, len(self.classes), self.hits, self.misses, id(self)
+        )
+
+
+field_metadata_cache: FieldMetadataCache = FieldMetadataCache(default_cache_path())
+"""Field metadata cache for transport model classes"""
+
+atexit.register(field_metadata_cache.save)
+
+
+__all__ = exporting(__name__, ...)
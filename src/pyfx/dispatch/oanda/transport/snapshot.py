@@ -0,0 +1,411 @@
+"""Compact binary snapshots for ApiObject values
+
+A snapshot encodes an ApiObject, or a list of values, in a tagged binary format.
+Each ApiObject is encoded with the set fields for the object, in the order of
+field definition. Each field is denoted by an index into a schema for the
+object's class, such that the class and its schema will be encoded once in each
+snapshot, at first reference. The schema for each class is encoded as the list
+of JSON field names for the class.
+
+Snapshot format, version 1:
+
+    snapshot := MAGIC VERSION value
+    value    := tag payload
+    varint   := unsigned LEB128 integer
+
+Tagged values:
+
+- `NONE`, `TRUE`, `FALSE`
+- `INT` zigzag varint
+- `FLOAT` IEEE 754 double, restored as float
+- `DOUBLE` IEEE 754 double, restored as numpy.double
+- `STR` varint length, UTF-8 bytes
+- `LIST` varint length, values
+- `TIME_NAIVE`, `TIME_UTC` zigzag varint nanoseconds since the UNIX epoch,
+  restored as pandas.Timestamp
+- `NAT`, restored as pandas.NaT
+- `CLASS` varint length, UTF-8 `module:qualname`, then for an ApiObject class,
+  varint count and a STR payload for each JSON field name. The class will be
+  assigned the next class index in the snapshot. A value will follow
+- `ENUM` varint class index, STR payload for the member name
+- `OBJECT` varint class index, varint field count, then for each field, varint
+  field index and value
+- `SHADOW` varint class index, varint length, shadow bytes for a Credential
+  value, restored as a shadowed credential. As with pickle, the text value of
+  a credential will not be encoded in the snapshot
+- `TRANSPORT` value as unparsed under the field's transport type, restored with
+  the field's transport type
+"""
+
+from enum import Enum, IntEnum
+from functools import cache
+import importlib
+import struct
+from typing import Any, Optional
+
+import numpy as np
+import pandas as pd
+
+from ..credential import Credential
+from ..util.naming import exporting
+from .data import ApiObject, LAZY_FIELDS_ATTR
+from .timestamps import UTC
+from .transport_base import TransportFieldInfo, TransportType, TransportValuesType
+
+MAGIC: bytes = b"PFXS"
+
+VERSION: int = 1
+
+
+class SnapshotTag(IntEnum):
+    """Type tags for values in a snapshot"""
+    NONE = 0
+    TRUE = 1
+    FALSE = 2
+    INT = 3
+    FLOAT = 4
+    DOUBLE = 5
+    STR = 6
+    LIST = 7
+    TIME_NAIVE = 8
+    TIME_UTC = 9
+    NAT = 10
+    CLASS = 11
+    ENUM = 12
+    OBJECT = 13
+    TRANSPORT = 14
+    SHADOW = 15
+
+
+## tag values as int, for the encoder and decoder
+TAG_NONE, TAG_TRUE, TAG_FALSE, TAG_INT, TAG_FLOAT, TAG_DOUBLE, TAG_STR, TAG_LIST, \
+    TAG_TIME_NAIVE, TAG_TIME_UTC, TAG_NAT, TAG_CLASS, TAG_ENUM, TAG_OBJECT, TAG_TRANSPORT, TAG_SHADOW = map(int, SnapshotTag)
+
+DOUBLE_STRUCT = struct.Struct("<d")
+
+
+def get_class_name(cls: type) -> str:
+    return cls.__module__ + ":" + cls.__qualname__
+
+
+@cache
+def resolve_class(name: str) -> type:
+    """Return the class for a `module:qualname` class name"""
+    module_name, _, qualname = name.partition(":")
+    obj: Any = importlib.import_module(module_name)
+    for attr in qualname.split("."):
+        obj = getattr(obj, attr)
+    if not isinstance(obj, type):
+        raise ValueError("Not a class", name)
+    return obj
+
+
+def get_member_type(ttyp: Optional[type[TransportType]]) -> Optional[type[TransportType]]:
+    ## return the member transport type for a values transport type, else None
+    return ttyp.member_transport_type if ttyp is not None and issubclass(ttyp, TransportValuesType) else None
+
+
+class SnapshotEncoder:
+    """Encoder for a single snapshot"""
+
+    __slots__ = ("buf", "classes", "schemas")
+
+    buf: bytearray
+
+    classes: dict[type, int]
+    """Class index for each class encoded in the snapshot"""
+
+    schemas: dict[type, dict[str, tuple[int, Optional[type[TransportType]]]]]
+    """Field index and transport type for each field name, per ApiObject class"""
+
+    def __init__(self):
+        self.buf = bytearray(MAGIC)
+        self.buf.append(VERSION)
+        self.classes = {}
+        self.schemas = {}
+
+    def write_varint(self, n: int):
+        buf = self.buf
+        while n >= 0x80:
+            buf.append((n & 0x7f) | 0x80)
+            n >>= 7
+        buf.append(n)
+
+    def write_str(self, value: str):
+        data = value.encode()
+        n = len(data)
+        if n < 0x80:
+            self.buf.append(n)
+        else:
+            self.write_varint(n)
+        self.buf += data
+
+    def write_int(self, n: int):
+        ## zigzag encoding for signed integers
+        self.write_varint(n << 1 if n >= 0 else ((-n) << 1) - 1)
+
+    def ensure_class(self, cls: type) -> int:
+        classes = self.classes
+        idx = classes.get(cls)
+        if idx is not None:
+            return idx
+        idx = len(classes)
+        classes[cls] = idx
+        self.buf.append(TAG_CLASS)
+        self.write_str(get_class_name(cls))
+        if issubclass(cls, ApiObject):
+            schema = {}
+            names = []
+            for name, info in cls.model_fields.items():
+                if isinstance(info, TransportFieldInfo):
+                    schema[name] = (len(names), info.transport_type)
+                    names.append(info.json_name)
+            self.schemas[cls] = schema
+            self.write_varint(len(names))
+            for json_name in names:
+                self.write_str(json_name)
+        return idx
+
+    def write_object(self, value: ApiObject):
+        cls = value.__class__
+        idx = self.ensure_class(cls)
+        schema = self.schemas[cls]
+        if LAZY_FIELDS_ATTR in value.__dict__:
+            value.materialize()
+        dct = value.__dict__
+        fields = [name for name in schema if name in value.__pydantic_fields_set__]
+        buf = self.buf
+        buf.append(TAG_OBJECT)
+        self.write_varint(idx)
+        self.write_varint(len(fields))
+        for name in fields:
+            field_idx, ttyp = schema[name]
+            self.write_varint(field_idx)
+            self.write_value(dct[name] if name in dct else getattr(value, name), ttyp)
+
+    def write_value(self, value: Any, ttyp: Optional[type[TransportType]] = None):
+        buf = self.buf
+        vtyp = value.__class__
+        if value is None:
+            buf.append(TAG_NONE)
+        elif vtyp is np.double:
+            buf.append(TAG_DOUBLE)
+            buf += DOUBLE_STRUCT.pack(value)
+        elif vtyp is str:
+            buf.append(TAG_STR)
+            self.write_str(value)
+        elif vtyp is int:
+            buf.append(TAG_INT)
+            self.write_int(value)
+        elif vtyp is bool:
+            buf.append(TAG_TRUE if value else TAG_FALSE)
+        elif vtyp is float:
+            buf.append(TAG_FLOAT)
+            buf += DOUBLE_STRUCT.pack(value)
+        elif isinstance(value, Enum):
+            idx = self.ensure_class(vtyp)
+            buf.append(TAG_ENUM)
+            self.write_varint(idx)
+            self.write_str(value.name)
+        elif isinstance(value, ApiObject):
+            self.write_object(value)
+        elif vtyp is list or vtyp is tuple:
+            buf.append(TAG_LIST)
+            self.write_varint(len(value))
+            mtyp = get_member_type(ttyp)
+            for member in value:
+                self.write_value(member, mtyp)
+        elif value is pd.NaT:
+            buf.append(TAG_NAT)
+        elif vtyp is pd.Timestamp and (value.tz is None or value.tz is UTC):
+            buf.append(TAG_TIME_NAIVE if value.tz is None else TAG_TIME_UTC)
+            self.write_int(value.value)
+        elif isinstance(value, Credential):
+            ## may raise LookupError if no shadow_encoder is available. see Credential.__getstate__()
+            shadow = value.get_shadow_value()
+            idx = self.ensure_class(vtyp)
+            buf.append(TAG_SHADOW)
+            self.write_varint(idx)
+            self.write_varint(len(shadow))
+            buf += shadow
+        elif ttyp is not None:
+            buf.append(TAG_TRANSPORT)
+            self.write_value(ttyp.unparse_py(value, None))
+        else:
+            raise ValueError("Unsupported value for snapshot", value)
+
+    def finish(self) -> bytes:
+        return bytes(self.buf)
+
+
+class SnapshotDecoder:
+    """Decoder for a single snapshot"""
+
+    __slots__ = ("data", "pos", "classes", "schemas")
+
+    data: bytes
+    pos: int
+
+    classes: list[type]
+    """Class for each class index in the snapshot"""
+
+    schemas: list[Optional[list[tuple[str, Optional[type[TransportType]]]]]]
+    """Field name and transport type for each field index, per class index"""
+
+    def __init__(self, data: bytes):
+        if data[:len(MAGIC)] != MAGIC:
+            raise ValueError("Not a snapshot")
+        version = data[len(MAGIC)]
+        if version != VERSION:
+            raise ValueError("Unsupported snapshot version", version)
+        self.data = data
+        self.pos = len(MAGIC) + 1
+        self.classes = []
+        self.schemas = []
+
+    def read_varint(self) -> int:
+        data = self.data
+        pos = self.pos
+        b = data[pos]
+        pos += 1
+        if b < 0x80:
+            self.pos = pos
+            return b
+        n = b & 0x7f
+        shift = 7
+        while True:
+            b = data[pos]
+            pos += 1
+            n |= (b & 0x7f) << shift
+            if b < 0x80:
+                self.pos = pos
+                return n
+            shift += 7
+
+    def read_str(self) -> str:
+        n = self.read_varint()
+        pos = self.pos
+        end = pos + n
+        self.pos = end
+        return self.data[pos:end].decode()
+
+    def read_int(self) -> int:
+        n = self.read_varint()
+        return -((n + 1) >> 1) if n & 1 else n >> 1
+
+    def read_double(self) -> float:
+        pos = self.pos
+        self.pos = pos + 8
+        return DOUBLE_STRUCT.unpack_from(self.data, pos)[0]
+
+    def read_class(self):
+        cls = resolve_class(self.read_str())
+        schema = None
+        if issubclass(cls, ApiObject):
+            json_fields = cls.json_fields
+            schema = []
+            for _ in range(self.read_varint()):
+                json_name = self.read_str()
+                if json_name not in json_fields:
+                    raise ValueError("Unknown JSON field in snapshot", json_name, cls)
+                info = json_fields[json_name]
+                schema.append((info.name, info.transport_type))
+        self.classes.append(cls)
+        self.schemas.append(schema)
+
+    def read_object(self) -> ApiObject:
+        idx = self.read_varint()
+        cls = self.classes[idx]
+        schema = self.schemas[idx]
+        inst = cls.__new__(cls)
+        dct = inst.__dict__
+        fields_set = inst.__pydantic_fields_set__
+        data = self.data
+        read_value = self.read_value
+        for _ in range(self.read_varint()):
+            ## field indexes will generally be encoded in a single byte
+            pos = self.pos
+            field_idx = data[pos]
+            if field_idx < 0x80:
+                self.pos = pos + 1
+            else:
+                field_idx = self.read_varint()
+            name, ttyp = schema[field_idx]  # type: ignore[index]
+            dct[name] = read_value(ttyp)
+            fields_set.add(name)
+        return cls.finalize_prototype(inst)
+
+    def read_value(self, ttyp: Optional[type[TransportType]] = None) -> Any:
+        data = self.data
+        tag = data[self.pos]
+        self.pos += 1
+        while tag == TAG_CLASS:
+            self.read_class()
+            tag = data[self.pos]
+            self.pos += 1
+        if tag == TAG_DOUBLE:
+            return np.double(self.read_double())
+        elif tag == TAG_STR:
+            pos = self.pos
+            n = data[pos]
+            if n < 0x80:
+                end = pos + 1 + n
+                self.pos = end
+                return data[pos + 1:end].decode()
+            return self.read_str()
+        elif tag == TAG_ENUM:
+            cls = self.classes[self.read_varint()]
+            return cls._member_map_[self.read_str()]  # type: ignore[attr-defined]
+        elif tag == TAG_INT:
+            return self.read_int()
+        elif tag == TAG_OBJECT:
+            return self.read_object()
+        elif tag == TAG_LIST:
+            mtyp = get_member_type(ttyp)
+            read = self.read_value
+            return [read(mtyp) for _ in range(self.read_varint())]
+        elif tag == TAG_NONE:
+            return None
+        elif tag == TAG_TRUE:
+            return True
+        elif tag == TAG_FALSE:
+            return False
+        elif tag == TAG_TIME_UTC:
+            return pd.Timestamp(self.read_int(), tz=UTC)
+        elif tag == TAG_TIME_NAIVE:
+            return pd.Timestamp(self.read_int())
+        elif tag == TAG_NAT:
+            return pd.NaT
+        elif tag == TAG_FLOAT:
+            return self.read_double()
+        elif tag == TAG_SHADOW:
+            cls = self.classes[self.read_varint()]
+            n = self.read_varint()
+            pos = self.pos
+            self.pos = pos + n
+            return cls.create_shadowed(data[pos:pos + n])  # type: ignore[attr-defined]
+        elif tag == TAG_TRANSPORT:
+            if ttyp is None:
+                raise ValueError("No transport type for value in snapshot", self.pos)
+            return ttyp.parse(self.read_value())
+        else:
+            raise ValueError("Unknown tag in snapshot", tag, self.pos - 1)
+
+
+def dumps(value: Any) -> bytes:
+    """Return a snapshot of the value, e.g an ApiObject or a list of ApiObjects"""
+    encoder = SnapshotEncoder()
+    encoder.write_value(value)
+    return encoder.finish()
+
+
+def loads(data: bytes) -> Any:
+    """Return the value encoded in a snapshot"""
+    decoder = SnapshotDecoder(data)
+    value = decoder.read_value()
+    if decoder.pos != len(data):
+        raise ValueError("Extra data in snapshot", decoder.pos, len(data))
+    return value
+
+
+__all__ = exporting(__name__, ...)
@@ -0,0 +1,116 @@
+"""Timestamp parsing for v20 API datetime formats"""
+
+from collections.abc import Sequence
+from datetime import date, timezone
+import re
+from typing import Callable, Optional
+
+import numpy as np
+import numpy.typing as npt
+
+from ..util.naming import exporting
+
+RFC3339_UTC_RE = re.compile(r"(\d{4}-\d{2}-\d{2})T(\d{2}):(\d{2}):(\d{2})(?:\.(\d{1,9}))?Z\Z")
+"""Pattern for RFC3339 timestamps in UTC, as produced for the v20 API RFC3339 datetime format
+
+e.g `2024-01-01T12:34:56.123456789Z`
+"""
+
+UNIX_TIME_RE = re.compile(r"(\d+)(?:\.(\d{1,9}))?\Z")
+"""Pattern for UNIX timestamps, as produced for the v20 API UNIX datetime format
+
+e.g `1704112496.123456789`
+"""
+
+NS_PER_SECOND: int = 1000000000
+
+EPOCH_ORDINAL: int = date(1970, 1, 1).toordinal()
+
+UTC = timezone.utc
+
+
+def get_fraction_ns(frac: Optional[str]) -> int:
+    ## return the nanoseconds for a decimal fraction of up to nine digits
+    return int(frac) * 10 ** (9 - len(frac)) if frac else 0
+
+
+def parse_rfc3339_ns(value: str) -> Optional[int]:
+    """Return the UTC epoch nanoseconds for an RFC3339 timestamp in UTC, or None if not matched
+
+    Returns None for a timestamp with any date or time field out of range, such that
+    the value can be parsed under a more general timestamp parser
+    """
+    m = RFC3339_UTC_RE.match(value)
+    if m is None:
+        return None
+    day, hours, minutes, seconds, frac = m.groups()
+    h, mi, sec = int(hours), int(minutes), int(seconds)
+    if h > 23 or mi > 59 or sec > 59:
+        return None
+    try:
+        ordinal = date.fromisoformat(day).toordinal()
+    except ValueError:
+        return None
+    epoch_s = (ordinal - EPOCH_ORDINAL) * 86400 + h * 3600 + mi * 60 + sec
+    return epoch_s * NS_PER_SECOND + get_fraction_ns(frac)
+
+
+def parse_unix_ns(value: str) -> Optional[int]:
+    """Return the epoch nanoseconds for a UNIX timestamp string, or None if not matched"""
+    m = UNIX_TIME_RE.match(value)
+    if m is None:
+        return None
+    seconds, frac = m.groups()
+    return int(seconds) * NS_PER_SECOND + get_fraction_ns(frac)
+
+
+def parse_epoch_ns(value: str) -> Optional[int]:
+    """Return the epoch nanoseconds for a timestamp in the RFC3339 or UNIX format, or None if not matched"""
+    ns = parse_rfc3339_ns(value)
+    return parse_unix_ns(value) if ns is None else ns
+
+
+def parse_datetime64(value: str) -> Optional[np.datetime64]:
+    """Return a datetime64[ns] value for a timestamp in the RFC3339 or UNIX format, or None if not matched"""
+    ns = parse_epoch_ns(value)
+    return None if ns is None else np.datetime64(ns, "ns")
+
+
+def parse_epoch_ns_array(values: Sequence[str], fallback: Optional[Callable[[str], int]] = None) -> npt.NDArray[np.int64]:
+    """Return an int64 array of epoch nanoseconds for a sequence of timestamp strings
+
+    If every value is an RFC3339 timestamp in UTC, the values will be converted
+    in a single NumPy call. Otherwise, or if any value has a field out of range,
+    each value will be parsed individually.
+
+    `fallback` will be called for any value not in the RFC3339 or UNIX format.
+    If no fallback is provided, a ValueError will be raised for such a value.
+    """
+    match = RFC3339_UTC_RE.match
+    if all(isinstance(v, str) and match(v) for v in values):
+        try:
+            ## NumPy parses the timestamp as UTC, when no offset is provided
+            return np.array([v[:-1] for v in values], dtype="datetime64[ns]").view(np.int64)
+        except ValueError:
+            ## a field out of range
+            pass
+    out = np.empty(len(values), dtype=np.int64)
+    for n, value in enumerate(values):
+        ns = parse_epoch_ns(value)
+        if ns is None:
+            if fallback is None:
+                raise ValueError("Unrecognized timestamp value", value)
+            ns = fallback(value)
+        out[n] = ns
+    return out
+
+
+def parse_datetime64_array(values: Sequence[str], fallback: Optional[Callable[[str], int]] = None) -> npt.NDArray[np.datetime64]:
+    """Return a datetime64[ns] array for a sequence of timestamp strings
+
+    see also: parse_epoch_ns_array()
+    """
+    return parse_epoch_ns_array(values, fallback).view("datetime64[ns]")
+
+
+__all__ = exporting(__name__, ...)
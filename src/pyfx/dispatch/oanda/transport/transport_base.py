@@ -22,6 +22,7 @@ from ..util.typeref import get_type_class, TypeRef
 from ..util.naming import exporting
 
 from .encoder_constants import EncoderConstants
+from .timestamps import RFC3339_UTC_RE, UTC, parse_datetime64_array, parse_rfc3339_ns, parse_unix_ns
 
 
 Ti = TypeVar("Ti")
@@ -173,6 +174,24 @@ class TransportInterface(Generic[Ti, To], metaclass=TransportInterfaceClass):
         ## the default implementation assumes that the value will not need further quoting, for URL syntax
         return value if isinstance(value, str) else str(value)
 
+    @classmethod
+    def write_bytes(cls, value: Ti, buf: bytearray) -> None:
+        """Append the JSON encoding of a value to a shared buffer
+
+        The default implementation appends the return value of `unparse_bytes()`.
+        Transport types for containers will override this method, such that each
+        member value will be encoded directly into the buffer.
+        """
+        buf += cls.unparse_bytes(value)
+
+    @classmethod
+    def write_url_bytes(cls, value: Ti, buf: bytearray) -> None:
+        """Append the URL encoding of a value to a shared buffer
+
+        The default implementation appends the return value of `unparse_url_bytes()`
+        """
+        buf += cls.unparse_url_bytes(value)
+
     @classmethod
     def parse(cls, unparsed: To) -> Ti:
         if __debug__:
@@ -180,6 +199,28 @@ class TransportInterface(Generic[Ti, To], metaclass=TransportInterfaceClass):
                 raise AssertionError("No storage_class defined", cls)
         return cls.storage_class(unparsed)
 
+    @classmethod
+    def parse_batch(cls, values: Sequence[To]) -> list[Ti]:
+        """Parse each value in a JSON array of values of this transport type
+
+        This method may be overridden to provide a vectorized parser for a
+        sequence of transport values.
+        """
+        parse = cls.parse
+        return [parse(elt) for elt in values]
+
+    @classmethod
+    def get_column_dtype(cls) -> Optional[type]:
+        """Return the NumPy dtype for parsing a column of JSON string values of this
+        transport type with one array conversion, or None if each value should be
+        parsed individually
+
+        The parser may apply the column dtype when parsing the values of one field
+        across the objects of a JSON array, e.g for the price of each bucket in an
+        order book
+        """
+        return None
+
     @classmethod
     def get_display_string(cls, value: Ti) -> str:
         return str(value)
@@ -386,6 +427,9 @@ class TransportValuesType(TransportType[TRANSPORT_VALUES_STORAGE_CLASS[Ti], list
 
     @classmethod
     def parse(cls, unparsed: list[To]) -> TRANSPORT_VALUES_STORAGE_CLASS[Ti]:
+        if cls.parse_member.__func__ is TransportValuesType.parse_member.__func__:  # type: ignore[attr-defined]
+            ## parse all members in a batch, under the member transport type
+            return cls.member_transport_type.parse_batch(unparsed)
         return [cls.parse_member(elt) for elt in unparsed]
 
     @classmethod
@@ -408,6 +452,36 @@ class TransportValuesType(TransportType[TRANSPORT_VALUES_STORAGE_CLASS[Ti], list
         mtyp = cls.member_transport_type
         return ','.join(mtyp.unparse_url_str(elt) for elt in value)
 
+    @classmethod
+    def write_bytes(cls, value: Optional[TRANSPORT_VALUES_STORAGE_CLASS[Ti]], buf: bytearray) -> None:
+        if cls.unparse_bytes.__func__ is not TransportValuesType.unparse_bytes.__func__:  # type: ignore[attr-defined]
+            ## specialized encoding for the values type
+            buf += cls.unparse_bytes(value)
+            return
+        if value is None:
+            buf += EncoderConstants.NULL.value
+            return
+        write = cls.member_transport_type.write_bytes
+        buf += EncoderConstants.START_ARRAY.value
+        sep = b''
+        for elt in value:
+            buf += sep
+            sep = b','
+            write(elt, buf)
+        buf += EncoderConstants.END_ARRAY.value
+
+    @classmethod
+    def write_url_bytes(cls, value: TRANSPORT_VALUES_STORAGE_CLASS[Ti], buf: bytearray) -> None:
+        if cls.unparse_url_bytes.__func__ is not TransportValuesType.unparse_url_bytes.__func__:  # type: ignore[attr-defined]
+            buf += cls.unparse_url_bytes(value)
+            return
+        write = cls.member_transport_type.write_url_bytes
+        sep = b''
+        for elt in value:
+            buf += sep
+            sep = b','
+            write(elt, buf)
+
     @classmethod
     def get_state(cls, object):
         mtyp = cls.member_transport_type
@@ -513,6 +587,20 @@ class TransportFloatStr(TransportInterface[np.double, str]):
         else:
             return np.double(value)
 
+    @classmethod
+    def parse_batch(cls, values: Sequence[Union[str, Real]]) -> list[np.double]:
+        if cls.get_column_dtype() is None:
+            return super().parse_batch(values)
+        ## convert all decimal strings with a single array conversion
+        return list(np.array(values, dtype=np.double))
+
+    @classmethod
+    def get_column_dtype(cls) -> Optional[type]:
+        if cls.parse.__func__ is not TransportFloatStr.parse.__func__:  # type: ignore[attr-defined]
+            ## the implementation class may interpret symbolic values, e.g "ALL"
+            return None
+        return np.double
+
     @classmethod
     def unparse_py(cls, value: np.double, encoder: Optional[JSONEncoder] = None) -> str:
         if __debug__:
@@ -710,17 +798,37 @@ class TransportTimestamp(TransportInterface[datetime, str]):
                     if dt != "0":
                         raise AssertionError("Unrecognized value", dt)
                 return pd.NaT
-            else:
+            ns = parse_rfc3339_ns(dt)
+            if ns is not None:
+                ## fast path for the v20 API RFC3339 format
+                return pd.Timestamp(ns, tz=UTC)
+            ns = parse_unix_ns(dt)
+            if ns is not None:
+                ## fast path for the v20 API UNIX format
+                return pd.Timestamp(ns)
+            try:
+                ## assumption: ISO format
+                return pd.to_datetime(dt, unit='ns')
+            except:
+                ## assumption: Epoch format
                 try:
-                    ## assumption: ISO format
-                    return pd.to_datetime(dt, unit='ns')
+                    return pd.to_datetime(float(dt), unit='s')
                 except:
-                    ## assumption: Epoch format
-                    try:
-                        return pd.to_datetime(float(dt), unit='s')
-                    except:
-                        logger.critical("Unrecognized timestamp value %r", dt)
-                        return pd.NaT
+                    logger.critical("Unrecognized timestamp value %r", dt)
+                    return pd.NaT
+
+    @classmethod
+    def parse_batch(cls, values: Sequence[str]) -> list[NullableTimesamp]:
+        match = RFC3339_UTC_RE.match
+        if cls.parse.__func__ is TransportTimestamp.parse.__func__ and \
+           all(isinstance(v, str) and match(v) for v in values):  # type: ignore[attr-defined]
+            ## convert all RFC3339 timestamps with a single array conversion,
+            ## else parse each value, for any value with a field out of range
+            try:
+                return list(pd.DatetimeIndex(parse_datetime64_array(values)).tz_localize(UTC))
+            except ValueError:
+                pass
+        return super().parse_batch(values)
 
     @classmethod
     def unparse_py(cls, value: NullableTimesamp,
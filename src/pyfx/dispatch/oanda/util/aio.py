@@ -103,4 +103,49 @@ def chain_cancel_callback(origin: AnyFutureUnion, dest: Union[AnyFutureUnion, ai
     return cb
 
 
-__all__ = "safe_running_loop", "AnyFutureUnion", "AnyFuture", "safe_add_callback", "cancel_when_done", "chain_cancel_callback"
+def wake_event(loop: aio.AbstractEventLoop, event: aio.Event):
+    """Set an asyncio event bound to `loop`, in a thread-safe approach
+
+    If the event is already set, or if the loop is closed, this function
+    will have no effect.
+    """
+    if event.is_set():
+        return
+    elif loop is safe_running_loop():
+        event.set()
+    else:
+        ## the loop may have been closed in another thread
+        with suppress(RuntimeError):
+            loop.call_soon_threadsafe(event.set)
+
+
+def _wake_waiter(waiter: aio.Future, _):
+    if not waiter.done():
+        waiter.set_result(None)
+
+
+async def await_future(future: AnyFutureUnion) -> Any:
+    """Await the result of a concurrent future, or an asyncio future under any loop
+
+    For a future not bound to the running loop, the running loop will be
+    notified from a done callback on the future, via `call_soon_threadsafe()`.
+
+    Cancellation of the awaiting task will not cancel the future.
+    """
+    loop = aio.get_running_loop()
+    if isinstance(future, aio.Future) and future.get_loop() is loop:
+        return await aio.shield(future)
+    if not future.done():
+        waiter = loop.create_future()
+
+        def wake(_):
+            with suppress(RuntimeError):
+                loop.call_soon_threadsafe(_wake_waiter, waiter, None)
+
+        safe_add_callback(future, wake)
+        await waiter
+    return future.result()
+
+
+__all__ = ("safe_running_loop", "AnyFutureUnion", "AnyFuture", "safe_add_callback", "cancel_when_done", "chain_cancel_callback",
+           "wake_event", "await_future")
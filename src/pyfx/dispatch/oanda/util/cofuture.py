@@ -1,6 +1,5 @@
 """CoFuture and CoFuturePool: Awaitable Concurrent Future, with future grouping support"""
 
-import asyncio as aio
 import concurrent.futures as cofutures
 from contextlib import suppress
 from exceptiongroup import ExceptionGroup
@@ -10,7 +9,7 @@ import time
 from typing import Any, Awaitable, Callable, Generator, Mapping, Optional, Generic, Union, TYPE_CHECKING
 from typing_extensions import Self, TypeAlias, TypeVar
 
-from .aio import safe_running_loop
+from .aio import await_future
 
 
 Duration: TypeAlias = Union[int, float]
@@ -54,12 +53,8 @@ class CoFuture(cofutures.Future[T], Generic[T]):
         self.pool = pool
 
     async def apoll(self) -> Awaitable[T]:
-        timeout = self.timeout
-        interval = self.interval
-        while True:
-            with suppress(cofutures.TimeoutError):
-                return self.result(timeout=timeout)
-            await aio.sleep(interval)
+        ## the running loop will be notified from a done callback on this future
+        return await await_future(self)
 
     def poll(self) -> T:
         timeout = self.timeout
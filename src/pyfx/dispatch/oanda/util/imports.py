@@ -2,11 +2,13 @@
 
 import importlib
 import os
+import re
 import sys
 from pathlib import Path
 import stat
 from tempfile import mkstemp
 from textwrap import fill
+from typing import Any, Callable, Mapping
 
 from .paths import Pathname, expand_path
 
@@ -42,7 +44,8 @@ def gen_imports(dst_name, *,
                     names = getattr(src_m, "__all__")
                     for name in names:
                         if hasattr(src_m,  name):
-                            if not hasattr(dst_m, name):
+                            ## not hasattr(), which would import the name under a lazy __getattr__
+                            if name not in dst_m.__dict__:
                                 obj = getattr(src_m, name)
                                 setattr(dst_m, name, obj)
                                 existing_names.append(name)
@@ -61,8 +64,51 @@ def gen_imports(dst_name, *,
     if out_file.exists():
         out_file.unlink()
     tmp_path = Path(tmpf)
-    tmp_path.rename(out_file)
     tmp_path.chmod(stat.S_IRUSR | stat.S_IWUSR | stat.S_IRGRP | stat.S_IROTH)
+    tmp_path.rename(out_file)
+
+
+IMPORT_LINE_RE = re.compile(r"^from\s+([\w.]+)\s+import\s+(\w+)\s*$")
+
+
+def read_imports(file: Pathname) -> dict[str, str]:
+    """Return a mapping of each imported name to its module name, for an imports file
+
+    The imports file should be a file as produced with `gen_imports()`, using the
+    default template. The file will not be evaluated.
+    """
+    imports = dict()
+    with open(file, "r") as stream:
+        for line in stream:
+            match = IMPORT_LINE_RE.match(line)
+            if match:
+                imports[match.group(2)] = match.group(1)
+    return imports
+
+
+def lazy_imports(module_name: str, imports: Mapping[str, str]) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """Return module-level `__getattr__` and `__dir__` functions for lazy import (PEP 562)
+
+    For each name in `imports`, the named object will be imported from the module
+    denoted in `imports` at first access to the name in the module `module_name`.
+    The imported object will then be stored in that module.
+
+    A relative module name in `imports` will be resolved relative to the package
+    `module_name`.
+    """
+
+    def __getattr__(name: str) -> Any:
+        source = imports.get(name)
+        if source is None:
+            raise AttributeError("module %r has no attribute %r" % (module_name, name))
+        value = getattr(importlib.import_module(source, module_name), name)
+        setattr(sys.modules[module_name], name, value)
+        return value
+
+    def __dir__() -> list[str]:
+        return sorted(set(sys.modules[module_name].__dict__).union(imports))
+
+    return __getattr__, __dir__
 
 
-__all__ = ("gen_imports",)
+__all__ = ("gen_imports", "read_imports", "lazy_imports")
@@ -1,3 +1,9 @@
 # package stub for pyfx.dispatch.oanda unit tests
 
+import os
+
+## disable the persistent field metadata cache, such that tests will not write
+## to the user cache directory. This must be set before the package is imported
+os.environ.setdefault("PYFX_FIELD_METADATA_CACHE", "")
+
 from pyfx.dispatch.oanda.test import ComponentTest, ModelTest, MockFactory, MockFactoryClass
@@ -0,0 +1,79 @@
+"""Tests for the parser and encoder benchmark suite"""
+
+from assertpy import assert_that  # type: ignore[import-untyped]
+import os
+
+from pyfx.dispatch.oanda.test import PytestTest, run_tests
+
+from pyfx.dispatch.oanda.benchmark import (
+    count_objects, count_tokens, find_model_class, format_construct, format_result, gen_synthetic, main,
+    measure_construct, read_samples, run_benchmarks
+)
+from pyfx.dispatch.oanda.models import GetInstrumentCandles200Response, ListTrades200Response
+from pyfx.dispatch.oanda.parser import ModelBuilder
+
+SAMPLES_DIR: str = os.path.abspath(os.path.join(os.path.dirname(__file__), "sample_data"))
+
+## scale for synthetic data in tests, generally much less than the default scale
+TEST_SCALE = {"candles": 20, "trades": 4, "transactions": 40}
+
+
+class TestBenchmark(PytestTest):
+    """Tests for the benchmark suite, at a reduced scale"""
+
+    def test_read_samples(self):
+        samples = list(read_samples(SAMPLES_DIR))
+        names = [name for name, _, _ in samples]
+        assert_that(names).contains("GetAccount200Response", "GetAccountCandlesLatest200Response")
+        assert_that(names).does_not_contain("quotes")
+        assert_that(find_model_class("ListTrades200Response")).is_same_as(ListTrades200Response)
+        assert_that(find_model_class("NoSuchResponse")).is_none()
+
+    def test_synthetic(self):
+        samples = {name: (model_cls, data) for name, model_cls, data in gen_synthetic(TEST_SCALE, 2)}
+        assert_that(samples).is_length(3)
+        model_cls, data = samples["Synthetic Candles [20]"]
+        assert_that(model_cls).is_same_as(GetInstrumentCandles200Response)
+        inst = ModelBuilder.from_text(model_cls, data)
+        assert_that(inst.candles).is_length(20)
+        ## one object for the response, and one for each candle and each candle price component
+        assert_that(count_objects(inst)).is_equal_to(1 + 20 + sum(
+            1 for candle in inst.candles for name in ("ask", "bid", "mid") if name in candle.model_fields_set
+        ))
+
+    def test_run_benchmarks(self):
+        samples = [sample for sample in read_samples(SAMPLES_DIR) if sample[0] == "ListTrades200Response"]
+        results = list(run_benchmarks(samples, rounds=1))
+        assert_that([r.operation for r in results]).is_equal_to(
+            ["ModelBuilder", "trusted", "async", "from_stream", "to_json_bytes", "to_dict"]
+        )
+        _, _, data = samples[0]
+        for result in results:
+            assert_that(result.n_tokens).is_equal_to(count_tokens(data))
+            assert_that(result.n_objects).is_greater_than(1)
+            assert_that(result.tokens_per_second).is_positive()
+            assert_that(result.objects_per_second).is_positive()
+            assert_that(result.peak_bytes).is_positive()
+            assert_that(format_result(result)).starts_with("ListTrades200Response")
+
+    def test_measure_construct(self):
+        samples = [sample for sample in read_samples(SAMPLES_DIR) if sample[0] == "ListTrades200Response"]
+        results = {r.model_class: r for r in measure_construct(samples, rounds=1, limit=2)}
+        assert_that(results).contains_key("ListTrades200Response", "Trade")
+        trade = results["Trade"]
+        assert_that(trade.n_objects).is_less_than_or_equal_to(2)
+        assert_that(trade.validated).is_positive()
+        assert_that(trade.trusted).is_positive()
+        assert_that(format_construct(trade)).starts_with("Trade")
+
+    def test_main(self, capsys):
+        args = ["--rounds", "1", "--no-samples"]
+        for name, count in TEST_SCALE.items():
+            args.extend(("--" + name, str(count)))
+        assert_that(main(args)).is_equal_to(0)
+        out = capsys.readouterr().out
+        assert_that(out).contains("Synthetic Candles [20]", "Synthetic Transactions [40]", "to_json_bytes")
+
+
+if __name__ == "__main__":
+    run_tests(__file__)
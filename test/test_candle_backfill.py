@@ -0,0 +1,202 @@
+"""Tests for chunked candlestick backfill"""
+
+from assertpy import assert_that  # type: ignore[import-untyped]
+import asyncio as aio
+import httpx
+import numpy as np
+import pandas as pd
+import pytest
+from types import SimpleNamespace
+
+from pyfx.dispatch.oanda.test import PytestTest, run_tests
+
+from pyfx.dispatch.oanda.api.request.get_instrument_candles import GetInstrumentCandlesRequest
+from pyfx.dispatch.oanda.candle_backfill import (
+    backfill, backfill_spec, fetch_window, granularity_span, parse_spec, plan_windows, stitch_frames
+)
+from pyfx.dispatch.oanda.hosts import FxHostInfo
+from pyfx.dispatch.oanda.models import CandlestickGranularity, PriceComponent
+from pyfx.dispatch.oanda.util.cofuture import CoFuture
+
+pytest_plugins = ('pytest_asyncio',)
+
+SECOND = pd.Timedelta(seconds=1)
+
+
+def candle_frame(start: str, periods: int, value: float) -> pd.DataFrame:
+    index = pd.date_range(start, periods=periods, freq="min", tz="UTC", name="time")
+    return pd.DataFrame({"close": [value] * periods}, index=index)
+
+
+def query_time(value: str) -> pd.Timestamp:
+    ## parse a `from` or `to` query parameter, in RFC3339 or UNIX time format
+    try:
+        return pd.Timestamp(float(value), unit="s", tz="UTC")
+    except ValueError:
+        return pd.Timestamp(value)
+
+
+class MockCandlesApi:
+    """Mock candlestick endpoint for S5 mid candles, recording each request and the
+    greatest number of requests in flight
+
+    Each response will include each candle beginning within the inclusive `from` and
+    `to` times for the request, with the close price being the seconds from the epoch.
+    Later windows will be answered sooner, such that responses are received out of order.
+    """
+
+    def __init__(self):
+        self.requests = []
+        self.inflight = 0
+        self.max_inflight = 0
+
+    async def handler(self, request: httpx.Request) -> httpx.Response:
+        params = request.url.params
+        start, end = query_time(params["from"]), query_time(params["to"])
+        self.requests.append((request.url.path, start, end))
+        self.inflight += 1
+        self.max_inflight = max(self.max_inflight, self.inflight)
+        try:
+            await aio.sleep(0.01 + max(0.0, 5e-7 * (pd.Timestamp("2020-01-02", tz="UTC") - start).total_seconds()))
+        finally:
+            self.inflight -= 1
+        instrument = request.url.path.split("/")[-2]
+        times = pd.date_range(start, end, freq="5s").tz_convert(None).values
+        candles = ",".join(
+            '{"complete":true,"volume":1,"time":"%sZ","mid":{"o":"%s","h":"%s","l":"%s","c":"%s"}}' % (t, p, p, p, p)
+            for t, p in zip(np.datetime_as_string(times, unit="ns"), times.view(np.int64) // SECOND.value)
+        )
+        content = ('{"instrument":"%s","granularity":"S5","candles":[%s]}' % (instrument, candles)).encode()
+        return httpx.Response(200, headers={"content-type": "application/json"}, content=content)
+
+    def controller(self, client: httpx.AsyncClient) -> SimpleNamespace:
+        ## return a request controller for the mock endpoint. Responses will be parsed
+        ## from a buffered response body, with the `buffered_response_limit` patched
+        ## for the test
+        async def no_limit(request, priority):
+            pass
+
+        controller = SimpleNamespace(
+            rest_client=SimpleNamespace(client=client, await_rate_limit=no_limit),
+            main_loop=aio.get_running_loop(), add_task=aio.ensure_future,
+            present_exception=lambda *args: None, trusted_parse=False,
+            coalesce_requests=False, inflight_requests=dict(), candle_cache=None, response_cache=None)
+
+        def get_request_builder(request_cls, args):
+            request = request_cls.model_construct(controller=controller, host=FxHostInfo.FXPRACTICE,
+                                                  future=CoFuture(), **args)
+            return SimpleNamespace(build=lambda: (request, request.future))
+
+        controller.get_request_builder = get_request_builder
+        return controller
+
+
+class TestCandleBackfill(PytestTest):
+    """Tests for backfill window planning, dispatch, and result stitching"""
+
+    def test_granularity_span(self):
+        assert_that(granularity_span(CandlestickGranularity.S5)).is_equal_to(pd.Timedelta(seconds=5))
+        assert_that(granularity_span(CandlestickGranularity.M2)).is_equal_to(pd.Timedelta(minutes=2))
+        assert_that(granularity_span(CandlestickGranularity.H12)).is_equal_to(pd.Timedelta(hours=12))
+        ## calendar granularities should not be confused with minute granularities
+        assert_that(granularity_span(CandlestickGranularity.M) > pd.Timedelta(days=27)).is_true()
+        assert_that(granularity_span(CandlestickGranularity.D) < pd.Timedelta(days=1)).is_true()
+
+    def test_parse_spec(self):
+        spec = parse_spec("EUR_USD:M1:BA")
+        assert_that(spec.granularity).is_equal_to(CandlestickGranularity.M1)
+        assert_that(spec.component).is_equal_to(PriceComponent.get("BA"))
+        spec = parse_spec("EUR_USD")
+        assert_that(spec.granularity).is_equal_to(CandlestickGranularity.S5)
+        assert_that(spec.component).is_equal_to(PriceComponent.MID)
+
+    def test_plan_windows(self):
+        start = pd.Timestamp("2020-01-01", tz="UTC")
+        end = pd.Timestamp("2021-01-01", tz="UTC")
+        windows = plan_windows("EUR_USD:M1:M", start, end)
+        assert_that(windows[0].start).is_equal_to(start)
+        assert_that(windows[-1].end).is_equal_to(end)
+        for prev, window in zip(windows, windows[1:]):
+            assert_that(window.start).is_equal_to(prev.end)
+        for window in windows:
+            ## at most 5000 candle start times within each window, inclusive of the end time
+            assert_that((window.end - window.start) // pd.Timedelta(minutes=1) + 1).is_less_than_or_equal_to(5000)
+        assert_that(windows).is_length(-(-((end - start) // pd.Timedelta(minutes=1)) // 4999))
+        assert_that(windows[0].request_args()).contains_entry({"columnar": True})
+
+        ## naive times are interpreted as UTC
+        windows = plan_windows("EUR_USD:D:M", "2000-01-01", "2024-01-01")
+        assert_that(windows).is_length(2)
+        assert_that(windows[0].start.tzinfo).is_not_none()
+        assert_that(plan_windows("EUR_USD", end, start)).is_empty()
+
+    def test_stitch_frames(self):
+        ## overlapping frames, received out of order
+        frames = [candle_frame("2020-01-01 00:05", 5, 2.0), candle_frame("2020-01-01 00:00", 6, 1.0)]
+        df = stitch_frames(frames)
+        assert_that(df.index.is_monotonic_increasing).is_true()
+        assert_that(df.index.is_unique).is_true()
+        assert_that(df).is_length(10)
+        assert_that(df["close"].iloc[5]).is_equal_to(1.0)
+        assert_that(stitch_frames([candle_frame("2020-01-01", 0, 0.0)])).is_empty()
+
+    @pytest.mark.asyncio
+    async def test_fetch_window(self, monkeypatch):
+        api = MockCandlesApi()
+        monkeypatch.setattr(GetInstrumentCandlesRequest, "buffered_response_limit", 1 << 30)
+        async with httpx.AsyncClient(transport=httpx.MockTransport(api.handler)) as client:
+            window = plan_windows("EUR_USD:S5:M", "2020-01-01 00:00", "2020-01-01 00:01")[0]
+            df = await aio.wait_for(fetch_window(api.controller(client), window), 5)
+        assert_that(api.requests).is_equal_to([("/v3/instruments/EUR_USD/candles", window.start, window.end)])
+        assert_that(df).is_length(13)
+        assert_that(df.index[0]).is_equal_to(window.start)
+
+    @pytest.mark.asyncio
+    async def test_backfill_spec(self, monkeypatch):
+        """Test that each window is requested under the bound on concurrency, and that the
+        responses are stitched in time order with no duplicate candles"""
+        api = MockCandlesApi()
+        monkeypatch.setattr(GetInstrumentCandlesRequest, "buffered_response_limit", 1 << 30)
+        start = pd.Timestamp("2020-01-01", tz="UTC")
+        end = start + pd.Timedelta(days=1)
+        windows = plan_windows("EUR_USD:S5:M", start, end)
+        assert_that(windows).is_length(4)
+        async with httpx.AsyncClient(transport=httpx.MockTransport(api.handler)) as client:
+            df = await aio.wait_for(backfill_spec(api.controller(client), "EUR_USD:S5:M", start, end,
+                                                  max_concurrency=2), 30)
+
+        assert_that(sorted(request[1:] for request in api.requests)).is_equal_to(
+            [(window.start, window.end) for window in windows])
+        assert_that(api.max_inflight).is_equal_to(2)
+
+        ## the last candle of each window is also the first candle of the next window
+        assert_that(df.index.is_monotonic_increasing).is_true()
+        assert_that(df.index.is_unique).is_true()
+        assert_that(df).is_length((end - start) // pd.Timedelta(seconds=5) + 1)
+        assert_that(df.index[0]).is_equal_to(start)
+        assert_that(df.index[-1]).is_equal_to(end)
+        seconds = (df.index.asi8 // SECOND.value).astype(np.double)
+        assert_that(bool((df[("mid", "c")].to_numpy() == seconds).all())).is_true()
+
+    @pytest.mark.asyncio
+    async def test_backfill(self, monkeypatch):
+        """Test that the windows for all candle specs share one bound on concurrency"""
+        api = MockCandlesApi()
+        monkeypatch.setattr(GetInstrumentCandlesRequest, "buffered_response_limit", 1 << 30)
+        start = pd.Timestamp("2020-01-01", tz="UTC")
+        end = start + pd.Timedelta(days=1)
+        specs = ["EUR_USD:S5:M", "USD_JPY:S5:M"]
+        async with httpx.AsyncClient(transport=httpx.MockTransport(api.handler)) as client:
+            df = await aio.wait_for(backfill(api.controller(client), specs, start, end, max_concurrency=3), 30)
+
+        assert_that(api.requests).is_length(8)
+        assert_that(api.max_inflight).is_equal_to(3)
+        for spec in specs:
+            spec_df = df.loc[str(parse_spec(spec))]
+            assert_that(spec_df).is_length((end - start) // pd.Timedelta(seconds=5) + 1)
+            assert_that(spec_df.index.is_monotonic_increasing).is_true()
+            assert_that(spec_df.index.is_unique).is_true()
+
+
+if __name__ == "__main__":
+    run_tests(__file__)
@@ -0,0 +1,163 @@
+"""Tests for the on-disk candle cache"""
+
+from assertpy import assert_that  # type: ignore[import-untyped]
+import numpy as np
+import pandas as pd
+import pytest
+from types import SimpleNamespace
+
+from pyfx.dispatch.oanda.test import PytestTest, run_tests
+
+import pyfx.dispatch.oanda.candle_backfill as candle_backfill
+from pyfx.dispatch.oanda.api.request.get_instrument_candles import GetInstrumentCandlesRequest
+from pyfx.dispatch.oanda.candle_cache import CandleCache, CandleKey, CandleStore, CoverageIndex, fetch_cached
+from pyfx.dispatch.oanda.candle_columns import CandleColumns
+from pyfx.dispatch.oanda.hosts import FxHostInfo
+from pyfx.dispatch.oanda.models import CandlestickGranularity, CurrencyPair, PriceComponent
+from pyfx.dispatch.oanda.transport.timestamps import UTC
+
+pytest_plugins = ('pytest_asyncio',)
+
+MINUTE = pd.Timedelta(minutes=1)
+
+
+def synthetic_columns(start: pd.Timestamp, end: pd.Timestamp, now: pd.Timestamp) -> CandleColumns:
+    ## M1 mid candles starting within [start, end], the close price being the
+    ## minute offset from the epoch. A candle not ending before `now` is incomplete
+    times = pd.date_range(start.ceil("min"), min(end, now), freq="min")
+    minutes = (times.asi8 // MINUTE.value).astype(np.double)
+    prices = np.vstack((minutes, minutes, minutes, minutes))
+    complete = np.asarray(times + MINUTE <= now)
+    return CandleColumns(CurrencyPair.get("EUR_USD"), CandlestickGranularity.M1, ("mid",),
+                         times.tz_convert(None).values, UTC, prices, np.ones(len(times), np.uint32), complete)
+
+
+class TestCandleCache(PytestTest):
+    """Tests for the candle cache store and range index"""
+
+    def test_coverage_index(self):
+        index = CoverageIndex([(10, 20), (30, 40)])
+        assert_that(index.missing(0, 50)).is_equal_to([(0, 10), (20, 30), (40, 50)])
+        assert_that(index.missing(12, 18)).is_empty()
+        assert_that(index.missing(15, 35)).is_equal_to([(20, 30)])
+        index.add(20, 30)
+        assert_that(index.ranges).is_equal_to([(10, 40)])
+        assert_that(index.missing(0, 50)).is_equal_to([(0, 10), (40, 50)])
+
+    def test_store(self, tmp_path):
+        cache = CandleCache(tmp_path)
+        key = CandleKey("EUR_USD", "M1", "M", False, 17, "America/New_York", "Friday")
+        assert_that(key.dirname).does_not_contain("/")
+        store = cache.get_store(key)
+        now = pd.Timestamp("2024-01-02", tz=UTC)
+        t0 = pd.Timestamp("2024-01-01 00:00", tz=UTC)
+        t1 = t0 + 60 * MINUTE
+        t2 = t1 + 60 * MINUTE
+        store.store(synthetic_columns(t1, t2, now), t1.value, t2.value)
+        ## an earlier range should be merged into the stored columns
+        store.store(synthetic_columns(t0, t1, now), t0.value, t1.value)
+        assert_that(store.rows).is_equal_to(120)
+        assert_that(store.coverage.ranges).is_equal_to([(t0.value, t2.value)])
+
+        ## partial data beyond the stored rows should be ignored, then overwritten
+        with store.column_files()[0].open("ab") as stream:
+            stream.write(b"\xff" * 4)
+        reloaded = CandleCache(tmp_path).get_store(key)
+        time, prices, volume = reloaded.read(t0.value, t2.value)
+        assert_that(time).is_length(120)
+        assert_that(bool((np.diff(time) == MINUTE.value).all())).is_true()
+        assert_that(prices.shape).is_equal_to((120, 4))
+        assert_that(prices[0, 3]).is_equal_to(t0.value // MINUTE.value)
+        reloaded.store(synthetic_columns(t2, t2 + 10 * MINUTE, now), t2.value, (t2 + 10 * MINUTE).value)
+        assert_that(reloaded.read(t0.value, now.value)[0]).is_length(130)
+
+    def test_store_all(self, tmp_path, monkeypatch):
+        """Test that windows received out of order are stored with one write"""
+        store = CandleCache(tmp_path).get_store(CandleKey("EUR_USD", "M1", "M", False, 17, "America/New_York", "Friday"))
+        now = pd.Timestamp("2024-01-02", tz=UTC)
+        t0 = pd.Timestamp("2024-01-01 00:00", tz=UTC)
+        bounds = [t0 + 60 * n * MINUTE for n in range(5)]
+        store.store(synthetic_columns(bounds[3], bounds[4], now), bounds[3].value, bounds[4].value)
+
+        writes = []
+        write_columns = CandleStore.write_columns
+
+        def spy(store, *args, **kw):
+            writes.append(kw)
+            return write_columns(store, *args, **kw)
+
+        monkeypatch.setattr(CandleStore, "write_columns", spy)
+        ## windows preceding the stored range, in reverse order
+        store.store_all([(synthetic_columns(w_start, w_end, now), w_start.value, w_end.value)
+                         for w_start, w_end in reversed(list(zip(bounds, bounds[1:4])))])
+        assert_that(writes).is_equal_to([dict(append=False)])
+        assert_that(store.rows).is_equal_to(240)
+        assert_that(store.coverage.ranges).is_equal_to([(bounds[0].value, bounds[4].value)])
+        time, prices, _ = store.read(bounds[0].value, bounds[4].value)
+        assert_that(bool((np.diff(time) == MINUTE.value).all())).is_true()
+        assert_that(bool((prices[:, 3] == time // MINUTE.value).all())).is_true()
+
+        ## windows after the stored range should be appended with one write
+        writes.clear()
+        later = [t0 + 60 * n * MINUTE for n in range(4, 7)]
+        store.store_all([(synthetic_columns(w_start, w_end, now), w_start.value, w_end.value)
+                         for w_start, w_end in reversed(list(zip(later, later[1:])))])
+        assert_that(writes).is_equal_to([dict(append=True)])
+        assert_that(store.rows).is_equal_to(360)
+
+    @pytest.mark.asyncio
+    async def test_fetch_cached(self, tmp_path, monkeypatch):
+        """Test that only the missing ranges and the incomplete candle are fetched"""
+        now = pd.Timestamp.now(UTC).floor("min") + pd.Timedelta(seconds=30)
+        fetched = []
+
+        async def fetch_columns(controller, window, request_cls=GetInstrumentCandlesRequest, **args):
+            end = now if args.get("time_to", window.end) is None else window.end
+            fetched.append((window.start, end))
+            return synthetic_columns(window.start, end, now)
+
+        monkeypatch.setattr(candle_backfill, "fetch_columns", fetch_columns)
+        cache = CandleCache(tmp_path)
+        controller = SimpleNamespace(candle_cache=cache)
+
+        def make_request(start, end=None, **kw) -> GetInstrumentCandlesRequest:
+            if end is not None:
+                kw["time_to"] = end
+            return GetInstrumentCandlesRequest.model_construct(
+                controller=controller, host=FxHostInfo.FXPRACTICE, instrument=CurrencyPair.get("EUR_USD"),
+                granularity=CandlestickGranularity.M1, price=PriceComponent.MID, time_from=start, **kw)
+
+        start = now.floor("min") - 9000 * MINUTE
+        end = start + 6000 * MINUTE
+        columns = await fetch_cached(make_request(start, end), cache)
+        assert_that(fetched).is_length(2)
+        assert_that(columns).is_length(6000)
+        assert_that(columns.complete.all()).is_true()
+
+        ## a request for a cached range should not be sent
+        fetched.clear()
+        columns = await fetch_cached(make_request(start + 10 * MINUTE, end - 10 * MINUTE), cache)
+        assert_that(fetched).is_empty()
+        assert_that(columns).is_length(5980)
+        assert_that(columns.time[0]).is_equal_to((start + 10 * MINUTE).tz_convert(None).to_datetime64())
+
+        ## an open-ended request should fetch only the range after the cached range,
+        ## including the incomplete candle
+        columns = await fetch_cached(make_request(start), cache)
+        assert_that(fetched).is_length(1)
+        assert_that(fetched[0][0]).is_equal_to(end)
+        assert_that(columns).is_length(9001)
+        assert_that(bool((np.diff(columns.time.view(np.int64)) == MINUTE.value).all())).is_true()
+        assert_that(columns.complete[:-1].all()).is_true()
+        assert_that(columns.complete[-1]).is_false()
+
+        ## the incomplete candle should be requested again
+        fetched.clear()
+        columns = await fetch_cached(make_request(start, include_first=False), cache)
+        assert_that(fetched).is_length(1)
+        assert_that(columns).is_length(9000)
+        assert_that(cache.get_store(CandleKey.for_request(make_request(start))).rows).is_equal_to(9000)
+
+
+if __name__ == "__main__":
+    run_tests(__file__)
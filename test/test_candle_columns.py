@@ -0,0 +1,108 @@
+"""Tests for columnar candle decoding"""
+
+from assertpy import assert_that  # type: ignore[import-untyped]
+import json
+import numpy as np
+import os
+import pandas as pd
+import pytest
+
+from pyfx.dispatch.oanda.test import PytestTest, run_tests
+
+from pyfx.dispatch.oanda.candle_columns import CandleColumns, CandleColumnsBuilder
+from pyfx.dispatch.oanda.fx_const import FxLabel, FxCol
+from pyfx.dispatch.oanda.models import GetInstrumentCandles200Response, PriceComponent
+from pyfx.dispatch.oanda.api.request.get_instrument_candles import GetInstrumentCandlesRequest
+from pyfx.dispatch.oanda.parser import ModelBuilder
+
+SAMPLES_DIR: str = os.path.abspath(os.path.join(os.path.dirname(__file__), "sample_data"))
+
+
+class TestCandleColumns(PytestTest):
+    """Tests for CandleColumns and CandleColumnsBuilder"""
+
+    @pytest.fixture
+    def candles_json(self) -> bytes:
+        with open(os.path.join(SAMPLES_DIR, "GetInstrumentCandles200Response.json"), "rb") as stream:
+            return stream.read()
+
+    def test_columns_to_df(self, candles_json: bytes):
+        """Test that the columnar dataframe is equivalent to the dataframe from the response model"""
+        model_df: pd.DataFrame = GetInstrumentCandles200Response.from_json(candles_json).to_df()
+        columns = CandleColumns.from_json(candles_json)
+        assert_that(len(columns)).is_equal_to(len(model_df))
+        assert_that(columns.components).is_equal_to((FxLabel.ASK.value, FxLabel.BID.value))
+        assert_that(columns.time.dtype).is_equal_to(np.dtype("datetime64[ns]"))
+        assert_that(columns.prices.dtype).is_equal_to(np.dtype(np.double))
+        assert_that(columns.volume.dtype).is_equal_to(np.dtype(np.uint32))
+        assert_that(columns.complete.dtype).is_equal_to(np.dtype(np.bool_))
+
+        df = columns.to_df()
+        assert_that(df.equals(model_df)).is_true()
+        assert_that(df.index.equals(model_df.index)).is_true()
+        assert_that(df.columns.equals(model_df.columns)).is_true()
+        assert_that(df.attrs).is_equal_to(model_df.attrs)
+
+        ## the dataframe should share memory with the columnar arrays
+        assert_that(np.shares_memory(df[FxCol.ASK_OPEN.value].values, columns.prices)).is_true()
+        assert_that(np.shares_memory(df[FxCol.VOLUME.value].values, columns.volume)).is_true()
+        assert_that(np.shares_memory(df.index.asi8, columns.time)).is_true()
+
+    def test_columns_capacity(self, candles_json: bytes):
+        """Test decoding with an initial capacity less than the number of candles"""
+        columns = CandleColumns.from_json(candles_json, capacity=1)
+        expected = CandleColumns.from_json(candles_json)
+        assert_that(len(columns)).is_equal_to(len(expected))
+        assert_that(np.array_equal(columns.prices, expected.prices)).is_true()
+        assert_that(np.array_equal(columns.time, expected.time)).is_true()
+
+    def test_columns_components(self, candles_json: bytes):
+        """Test decoding with known price components, and access to component quotes"""
+        columns = CandleColumns.from_json(candles_json, components=PriceComponent.ASK_BID)
+        assert_that(columns.components).is_equal_to((FxLabel.ASK.value, FxLabel.BID.value))
+        model = GetInstrumentCandles200Response.from_json(candles_json)
+        ask = columns.component(FxLabel.ASK)
+        assert_that(ask.shape).is_equal_to((4, len(model.candles)))
+        for n, candle in enumerate(model.candles):
+            assert_that(ask[0, n]).is_equal_to(candle.ask.o)
+            assert_that(ask[3, n]).is_equal_to(candle.ask.c)
+        assert_that(columns.component).raises(KeyError).when_called_with(FxLabel.MID)
+
+    def test_columns_missing_component(self, candles_json: bytes):
+        """Test decoding for a candle missing a price component received for other candles"""
+        data = json.loads(candles_json)
+        del data["candles"][1]["bid"]
+        del data["candles"][1]["volume"]
+        columns = CandleColumns.from_json(json.dumps(data).encode(), capacity=1)
+        bid = columns.component(FxLabel.BID)
+        assert_that(bool(np.isnan(bid[:, 1]).all())).is_true()
+        assert_that(bool(np.isnan(bid[:, 0]).any())).is_false()
+        assert_that(int(columns.volume[1])).is_zero()
+
+    def test_columns_candles(self, candles_json: bytes):
+        """Test Candlestick objects produced from columnar data"""
+        model = GetInstrumentCandles200Response.from_json(candles_json)
+        columns = CandleColumns.from_json(candles_json)
+        candles = columns.candles
+        assert_that(len(candles)).is_equal_to(len(model.candles))
+        for candle, expected in zip(candles, model.candles):
+            ## field order in the JSON encoding may differ, per the set of model fields
+            assert_that(json.loads(candle.to_json_bytes())).is_equal_to(json.loads(expected.to_json_bytes()))
+
+    def test_request_builder(self):
+        """Test response builder selection for the columnar request option"""
+        columnar = GetInstrumentCandlesRequest.model_construct(columnar=True, count=5000, price=PriceComponent.MID)
+        builder = columnar.get_response_builder(GetInstrumentCandles200Response)
+        assert_that(isinstance(builder, CandleColumnsBuilder)).is_true()
+        assert_that(builder.capacity).is_equal_to(5000)
+        assert_that(builder.components).is_equal_to((FxLabel.MID.value,))
+
+        default = GetInstrumentCandlesRequest.model_construct()
+        builder = default.get_response_builder(GetInstrumentCandles200Response)
+        assert_that(isinstance(builder, ModelBuilder)).is_true()
+        ## no controller, such that the response would be validated
+        assert_that(builder.trusted).is_false()
+
+
+if __name__ == "__main__":
+    run_tests(__file__)
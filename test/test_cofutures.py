@@ -12,6 +12,7 @@ import time
 from typing import TYPE_CHECKING
 from typing_extensions import ClassVar
 
+from pyfx.dispatch.oanda.util.aio import await_future
 from pyfx.dispatch.oanda.util.cofuture import CoFuture, CoFuturePool
 from pyfx.dispatch.oanda.test import ComponentTest, run_tests
 
@@ -137,6 +138,35 @@ class TestCoFutures(ComponentTest):
 
         assert_that(cf.result(0)).is_equal_to(5)
 
+    @pytest.mark.asyncio
+    async def test_await_cross_loop(self):
+        ## test await for futures completed under another thread, and under another loop
+        cf = CoFuture()
+        thr_future = self.run_threaded(lambda: cf.set_result(1))
+        assert_that(await aio.wait_for(cf, 1)).is_equal_to(1)
+        await thr_future
+
+        other_loop = aio.new_event_loop()
+        try:
+            other_future = other_loop.create_future()
+            thr_future = self.run_threaded(other_loop.run_until_complete, other_future)
+            other_loop.call_soon_threadsafe(other_future.set_result, 2)
+            assert_that(await aio.wait_for(await_future(other_future), 1)).is_equal_to(2)
+            await thr_future
+        finally:
+            other_loop.close()
+
+        ## cancellation for the awaiting task should not cancel the future
+        cf = CoFuture()
+        task = aio.ensure_future(await_future(cf))
+        await aio.sleep(0)
+        task.cancel()
+        with suppress(aio.CancelledError):
+            await task
+        assert_that(cf.cancelled()).is_false()
+        cf.set_result(3)
+        assert_that(await cf).is_equal_to(3)
+
     def test_pool_context_exceptions(self):
         exc_0 = ValueError("Passed [0]")
         exc_1 = ValueError("Passed [1]")
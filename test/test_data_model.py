@@ -15,7 +15,9 @@ from pyfx.dispatch.oanda.models.common_types import AccountUnits, PriceValue, Lo
 from pyfx.dispatch.oanda.test import ModelTest, MockFactory, run_tests
 from pyfx.dispatch.oanda.transport.transport_fields import TransportField
 from pyfx.dispatch.oanda.transport.transport_base import TransportTimestampType
-from pyfx.dispatch.oanda.transport.data import ApiObject
+from pyfx.dispatch.oanda.transport.data import ApiObject, FieldKind, JsonFieldDispatch
+from pyfx.dispatch.oanda.models.transport_types import TransportDecmialAll
+from pyfx.dispatch.oanda.parser import ModelBuilder
 
 from pyfx.dispatch.oanda.transport.transport_base import TransportBoolType, TransportFieldInfo, TransportFloatStrType, TransportIntType, TransportStrType, TransportType, TransportSecretStrType
 
@@ -46,6 +48,10 @@ class TestDataModel(ModelTest):
 
         field_acct: Annotated[AccountId, TransportField(...)]
 
+    class ValuesObject(ApiObject):
+        prices: Annotated[list[PriceValue], TransportField(...)]
+        names: Annotated[list[str], TransportField(...)]
+
     class Factory(MockFactory[FieldsObject]):
         pass
 
@@ -88,6 +94,24 @@ class TestDataModel(ModelTest):
         assert_that('field_str_list' in model_fields).is_true()
         assert_that(model_fields['field_str_list'].transport_type.member_transport_type).is_equal_to(TransportStrType)  # type: ignore[attr-defined]
 
+    @mark.dependency(depends_on=['test_fields_map'])
+    def test_json_dispatch(self):
+        cls = self.__class__
+        mock_cls = cls.FieldsObject
+        dispatch = mock_cls.get_json_dispatch()
+        assert_that(mock_cls.get_json_dispatch()).is_same_as(dispatch)
+        json_fields = mock_cls.json_fields
+        assert_that(len(dispatch)).is_equal_to(len(json_fields))
+        for json_name, info in json_fields.items():
+            field: JsonFieldDispatch = dispatch[json_name]
+            assert_that(field.name).is_equal_to(info.name)
+            assert_that(field.transport_type).is_equal_to(info.transport_type)
+        list_field = dispatch['field_str_list']
+        assert_that(list_field.kind).is_equal_to(FieldKind.SEQUENCE)
+        assert_that(list_field.parse("test")).is_equal_to("test")
+        assert_that(dispatch['fieldInt'].kind).is_equal_to(FieldKind.SCALAR)
+        assert_that(dispatch['field_price'].parse("1.5")).is_equal_to(np.double(1.5))
+
     @mark.dependency(depends_on=['test_fields_map'])
     def test_field_recoding(self):
         cls = self.__class__
@@ -105,6 +129,73 @@ class TestDataModel(ModelTest):
             ## test for equivalence of the original and reparsed values
             assert_that(reparsed).is_equal_to(val)
 
+    def test_parse_batch(self):
+        values = ["1.5", "0.00012", "-3", "12345.6789"]
+        parsed = TransportFloatStrType.parse_batch(values)
+        assert_that(parsed).is_equal_to([TransportFloatStrType.parse(v) for v in values])
+        assert_that(all(isinstance(v, np.double) for v in parsed)).is_true()
+        ## per-member parsing, for symbolic values in an implementation class
+        assert_that(TransportDecmialAll.parse_batch(["ALL", "2"])).is_equal_to([np.inf, 2.0])
+
+        ## batch parsing for scalar arrays in ModelBuilder
+        values_cls = self.__class__.ValuesObject
+        inst = ModelBuilder.from_text(values_cls, b'{"prices": ["1.5", "2.25", "3"], "names": ["a", "b"]}')
+        assert_that(inst.prices).is_equal_to([1.5, 2.25, 3.0])
+        assert_that(isinstance(inst.prices, list)).is_true()
+        assert_that(isinstance(inst.prices[0], np.double)).is_true()
+        assert_that(inst.names).is_equal_to(["a", "b"])
+        assert_that(values_cls.from_json(inst.to_json_bytes()).prices).is_equal_to(inst.prices)
+        assert_that(ModelBuilder.from_text(values_cls, b'{"prices": [], "names": []}').prices).is_empty()
+
+    def test_json_encoder(self):
+        cls = self.__class__
+        mock_cls = cls.FieldsObject
+        mock = cls.gen_mock()
+        encoder = mock_cls.get_json_encoder()
+        assert_that(mock_cls.get_json_encoder()).is_same_as(encoder)
+        ## each subclass should be provided with a distinct encoder
+        values_cls = cls.ValuesObject
+        assert_that(values_cls.get_json_encoder()).is_not_same_as(encoder)
+
+        buf = bytearray()
+        encoder(mock, buf)
+        assert_that(bytes(buf)).is_equal_to(mock.to_json_bytes())
+        ## fields should be encoded in the order of field definition
+        expected = b"{" + b",".join(
+            b'"' + f.json_name_bytes + b'":' + f.transport_type.unparse_bytes(getattr(mock, name))
+            for name, f in mock_cls.model_fields.items()
+        ) + b"}"
+        assert_that(bytes(buf)).is_equal_to(expected)
+
+        ## sequence fields, including empty sequences
+        inst = ModelBuilder.from_text(values_cls, b'{"prices": ["1.5"], "names": []}')
+        encoded = {"prices": b'"prices":["1.5"]', "names": b'"names":[]'}
+        assert_that(inst.to_json_bytes()).is_equal_to(b"{" + b",".join(encoded[name] for name in values_cls.model_fields) + b"}")
+
+    def test_write_json(self):
+        cls = self.__class__
+        mock = cls.gen_mock()
+        values_cls = cls.ValuesObject
+        inst = ModelBuilder.from_text(values_cls, b'{"prices": ["1.5", "2"], "names": ["a"]}')
+
+        ## objects should be appended to a shared buffer
+        buf = bytearray(b"[")
+        assert_that(mock.write_json(buf)).is_same_as(buf)
+        buf += b","
+        inst.write_json(buf)
+        buf += b"]"
+        assert_that(bytes(buf)).is_equal_to(b"[" + mock.to_json_bytes() + b"," + inst.to_json_bytes() + b"]")
+        assert_that(bytes(inst.write_json())).is_equal_to(inst.to_json_bytes())
+
+        ## values types should write each member into the buffer
+        prices_type = values_cls.model_fields["prices"].transport_type
+        buf = bytearray()
+        prices_type.write_bytes(inst.prices, buf)
+        assert_that(bytes(buf)).is_equal_to(prices_type.unparse_bytes(inst.prices))
+        buf = bytearray()
+        prices_type.write_url_bytes(inst.prices, buf)
+        assert_that(bytes(buf)).is_equal_to(prices_type.unparse_url_bytes(inst.prices))
+
     def test_encoding(self):
         cls = self.__class__
         mock = cls.gen_mock()
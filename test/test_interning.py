@@ -0,0 +1,95 @@
+"""Tests for interning of immutable ApiObject instances"""
+
+from assertpy import assert_that  # type: ignore[import-untyped]
+import copy
+
+from pyfx.dispatch.oanda.test import PytestTest, run_tests
+
+from pyfx.dispatch.oanda.models import ClientExtensions, GetPrices200Response, HomeConversions, ListTrades200Response
+from pyfx.dispatch.oanda.parser import ModelBuilder, parse_buffered
+from pyfx.dispatch.oanda.transport.interning import InternCache, intern_cache
+
+CLIENT_EXT_JSON = b'{"id": "client-1", "tag": "strategy-a"}'
+
+CONVERSIONS_JSON = b'{"currency": "USD", "accountGain": "1.5", "accountLoss": "1.6"}'
+
+PRICES_JSON = b'''{"prices": [], "time": "1704112496.123456789", "homeConversions": [
+  {"currency": "USD", "accountGain": "1.5", "accountLoss": "1.6"},
+  {"accountLoss": "1.6", "accountGain": "1.5", "currency": "USD"}
+]}'''
+
+TRADES_JSON = b'''{"trades": [
+  {"id": "1", "instrument": "EUR_USD", "price": "1.1", "openTime": "1704112496.123456789",
+   "state": "OPEN", "initialUnits": "10", "currentUnits": "10", "realizedPL": "0",
+   "clientExtensions": {"id": "client-1", "tag": "strategy-a"}},
+  {"id": "2", "instrument": "EUR_USD", "price": "1.2", "openTime": "1704112497.123456789",
+   "state": "OPEN", "initialUnits": "20", "currentUnits": "20", "realizedPL": "0",
+   "clientExtensions": {"tag": "strategy-a", "id": "client-1"}}
+], "lastTransactionID": "2"}'''
+
+
+class TestInterning(PytestTest):
+    """Tests for InternCache and for interning under the parser"""
+
+    def test_intern_cache(self):
+        cache: InternCache[object] = InternCache(2)
+        a, b, c = object(), object(), object()
+        assert_that(cache.intern("a", a)).is_same_as(a)
+        assert_that(cache.intern("a", b)).is_same_as(a)
+        assert_that(cache.intern("b", b)).is_same_as(b)
+        ## least recently used entry should be evicted
+        cache.intern("a", a)
+        assert_that(cache.intern("c", c)).is_same_as(c)
+        assert_that(cache).is_length(2)
+        assert_that(cache.intern("b", c)).is_same_as(c)
+        assert_that(cache.hits).is_equal_to(2)
+        cache.clear()
+        assert_that(cache).is_length(0)
+        assert_that(cache.misses).is_zero()
+
+    def test_parse_interned(self):
+        first = ModelBuilder.from_text(HomeConversions, CONVERSIONS_JSON)
+        assert_that(ModelBuilder.from_text(HomeConversions, CONVERSIONS_JSON)).is_same_as(first)
+        assert_that(ModelBuilder.from_text(HomeConversions, CONVERSIONS_JSON, trusted=True)).is_same_as(first)
+        assert_that(parse_buffered(HomeConversions, CONVERSIONS_JSON)).is_same_as(first)
+        assert_that(ModelBuilder.from_text(HomeConversions, b'{"currency": "EUR"}')).is_not_same_as(first)
+
+        ## interning for nested objects, in an object not marked immutable
+        conversions = ModelBuilder.from_text(GetPrices200Response, PRICES_JSON).home_conversions
+        assert_that(conversions[0]).is_same_as(conversions[1])
+        assert_that(conversions[0]).is_same_as(first)
+
+    def test_interned_frozen(self):
+        """Test that an interned instance cannot be modified, while a copy can be modified"""
+        inst = ModelBuilder.from_text(HomeConversions, CONVERSIONS_JSON)
+        assert_that(setattr).raises(TypeError).when_called_with(inst, "account_gain", 2.0)
+        assert_that(delattr).raises(TypeError).when_called_with(inst, "account_loss")
+        assert_that(inst.account_gain).is_equal_to(1.5)
+        for inst_copy in (inst.model_copy(), copy.copy(inst), copy.deepcopy(inst)):
+            inst_copy.account_gain = 2.0
+            assert_that(inst_copy.account_gain).is_equal_to(2.0)
+            assert_that(inst.account_gain).is_equal_to(1.5)
+        assert_that(inst.model_copy(update={"account_gain": 3.0}).account_gain).is_equal_to(3.0)
+
+        ## client extensions can be modified by the client, and are not interned
+        trades = ModelBuilder.from_text(ListTrades200Response, TRADES_JSON).trades
+        ext_a, ext_b = trades[0].client_extensions, trades[1].client_extensions
+        assert_that(ext_a).is_not_same_as(ext_b)
+        ext_a.comment = "changed"
+        assert_that(ext_b.comment).is_none()
+        assert_that(ModelBuilder.from_text(ClientExtensions, CLIENT_EXT_JSON)).is_not_same_as(
+            ModelBuilder.from_text(ClientExtensions, CLIENT_EXT_JSON))
+
+    def test_intern_key(self):
+        inst = ModelBuilder.from_text(HomeConversions, b'{"currency": "USD", "accountGain": "1.5"}')
+        key = inst.get_intern_key()
+        assert_that(key).is_equal_to(ModelBuilder.from_text(HomeConversions, b'{"accountGain": "1.5", "currency": "USD"}').get_intern_key())
+        assert_that(hash(key)).is_instance_of(int)
+        ## not interned, for an instance with deferred fields
+        lazy = ListTrades200Response.from_json(TRADES_JSON, lazy=True)
+        assert_that(lazy.get_intern_key()).is_none()
+        assert_that(intern_cache.maxsize).is_positive()
+
+
+if __name__ == "__main__":
+    run_tests(__file__)
@@ -0,0 +1,93 @@
+"""Tests for lazy import of model and request classes"""
+
+from assertpy import assert_that  # type: ignore[import-untyped]
+import importlib
+from pathlib import Path
+import subprocess
+import sys
+
+from pyfx.dispatch.oanda.test import PytestTest, run_tests
+
+import pyfx.dispatch.oanda.models as models
+import pyfx.dispatch.oanda.api.request as request
+
+## model modules imported for the package and the abstract Order and Transaction classes
+MAX_MODEL_MODULES: int = 40
+
+
+def import_times(source: str) -> tuple[dict[str, tuple[int, int]], list[str]]:
+    ## run the source in a new Python process, returning the `-X importtime` timing
+    ## in microseconds (self, cumulative) for each module imported, and the names of
+    ## all model modules loaded in the process
+    ##
+    ## modules imported under importlib.import_module() are not denoted in the
+    ## importtime output, thus the model modules are listed from sys.modules
+    script = source + "\nimport sys\nprint(' '.join(m for m in sys.modules if m.startswith('pyfx.dispatch.oanda.models.')))"
+    proc = subprocess.run([sys.executable, "-X", "importtime", "-c", script],
+                          capture_output=True, text=True, check=True)
+    times = dict()
+    for line in proc.stderr.splitlines():
+        if line.startswith("import time:") and "|" in line:
+            fields = line[len("import time:"):].split("|")
+            if fields[0].strip().isdigit():
+                times[fields[2].strip()] = (int(fields[0]), int(fields[1]))
+    return times, proc.stdout.split()
+
+
+class TestLazyImports(PytestTest):
+    """Tests for lazy import of model and request classes"""
+
+    def test_import_time(self):
+        ## regression test: importing one model class should not import every model module
+        times, loaded = import_times("from pyfx.dispatch.oanda.models import Candlestick")
+        assert_that(loaded).contains("pyfx.dispatch.oanda.models.candlestick")
+        assert_that(len(loaded)).is_less_than_or_equal_to(MAX_MODEL_MODULES)
+        assert_that(loaded).does_not_contain("pyfx.dispatch.oanda.models.order_fill_transaction",
+                                             "pyfx.dispatch.oanda.models.market_order")
+        assert_that(times).does_not_contain_key("pyfx.dispatch.oanda.api.default_api")
+
+        times, loaded = import_times("import pyfx.dispatch.oanda.api.request")
+        assert_that(len(loaded)).is_less_than_or_equal_to(MAX_MODEL_MODULES)
+        assert_that(times).does_not_contain_key("pyfx.dispatch.oanda.api.request.get_account")
+
+    def test_designator_import(self):
+        ## implementation classes should be imported at first use of the designator
+        source = "\n".join((
+            "import sys",
+            "from pyfx.dispatch.oanda.models import Transaction, TransactionType",
+            "module = 'pyfx.dispatch.oanda.models.order_fill_transaction'",
+            "assert module not in sys.modules",
+            "cls = Transaction.class_for_designator('ORDER_FILL')",
+            "assert cls.__module__ == module, cls",
+            "assert Transaction.types_map[TransactionType.ORDER_FILL] is cls",
+            "assert TransactionType.ORDER_FILL not in Transaction.lazy_types",
+        ))
+        subprocess.run([sys.executable, "-c", source], check=True)
+
+    def test_imports_index(self):
+        ## the distributed __imports__.py should index each name exported from the
+        ## model modules, as under gen_imports()
+        expected = dict()
+        for file in sorted(Path(models.__file__).parent.glob("*.py"), key=lambda p: p.name):
+            if "#" not in file.stem and "__" not in file.stem:
+                module = importlib.import_module("." + file.stem, models.__name__)
+                for name in getattr(module, "__all__", ()):
+                    expected.setdefault(name, module.__name__)
+        assert_that(dict(models.MODEL_IMPORTS)).is_equal_to(expected)
+
+    def test_lazy_names(self):
+        assert_that(models.__all__).contains("Candlestick", "Transaction", "OrderFillTransaction")
+        assert_that(dir(models)).contains("OrderFillTransaction")
+        assert_that(models.OrderFillTransaction.__name__).is_equal_to("OrderFillTransaction")
+        assert_that(models.TRANSACTION_TYPES_MAP).is_length(len(models.TransactionType))
+        assert_that(models.Order.load_types()).is_length(len(models.ORDER_TYPE_MAP))
+        assert_that(models.Order.lazy_types).is_empty()
+        assert_that(getattr).raises(AttributeError).when_called_with(models, "NoSuchModel")
+
+        assert_that(request.GetAccountRequest.__name__).is_equal_to("GetAccountRequest")
+        for name in request.__all__:
+            assert_that(hasattr(request, name)).is_true()
+
+
+if __name__ == "__main__":
+    run_tests(__file__)
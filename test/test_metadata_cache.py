@@ -0,0 +1,97 @@
+"""Tests for the field metadata cache"""
+
+from assertpy import assert_that  # type: ignore[import-untyped]
+import json
+import os
+from typing import Literal, Optional
+from typing_extensions import get_type_hints
+
+from pyfx.dispatch.oanda.test import PytestTest, run_tests
+
+from pyfx.dispatch.oanda.models import Account, MarketOrder, OrderType, Trade
+from pyfx.dispatch.oanda.transport.data import ApiObject
+from pyfx.dispatch.oanda.transport.metadata_cache import (
+    FIELD_METADATA_ENV, FieldMetadataCache, annotation_modules, decode_hint, encode_hint, field_metadata_cache
+)
+
+
+class TestMetadataCache(PytestTest):
+    """Tests for FieldMetadataCache and type hint encoding"""
+
+    def test_encode_hint(self):
+        for cls in (Account, MarketOrder, Trade):
+            hints = cls.get_field_hints()
+            all_hints = get_type_hints(cls)
+            assert_that(set(hints)).is_equal_to(set(cls.model_fields))
+            for name, hint in hints.items():
+                assert_that(hint).is_equal_to(all_hints[name])
+                encoded = encode_hint(hint)
+                assert_that(json.loads(json.dumps(encoded))).is_equal_to(encoded)
+                assert_that(decode_hint(encoded)).is_equal_to(hint)
+
+        for hint in (Optional[list[Trade]], Literal[OrderType.MARKET], Literal["a", 1], type(None)):
+            assert_that(decode_hint(encode_hint(hint))).is_equal_to(hint)
+
+        class LocalClass:
+            pass
+
+        assert_that(encode_hint).raises(TypeError).when_called_with(LocalClass)
+        assert_that(encode_hint).raises(TypeError).when_called_with("Trade")
+        assert_that(decode_hint).raises(LookupError).when_called_with("pyfx.dispatch.oanda.models:NoSuchClass")
+        assert_that(decode_hint).raises(LookupError).when_called_with("pyfx.no_such_module:Trade")
+
+    def test_cache_file(self, tmp_path):
+        path = str(tmp_path / "cache" / "field_metadata.json")
+        cache = FieldMetadataCache(path)
+        assert_that(cache.get_hints(Trade)).is_none()
+        cache.put_hints(Trade, Trade.get_field_hints())
+        assert_that(cache.get_hints(Trade)).is_equal_to(Trade.get_field_hints())
+        cache.save()
+        assert_that(cache.dirty).is_false()
+
+        loaded = FieldMetadataCache(path)
+        assert_that(loaded.get_hints(Trade)).is_equal_to(Trade.get_field_hints())
+        assert_that(loaded.get_hints(Account)).is_none()
+        assert_that(loaded.hits).is_equal_to(1)
+        assert_that(loaded.misses).is_equal_to(1)
+
+        ## the entry for a class should be invalidated when the class' module
+        ## or the module of any annotated base class changes
+        modules = annotation_modules(Trade)
+        assert_that(modules[0]).is_equal_to(Trade.__module__)
+        assert_that(modules).contains(ApiObject.__module__)
+        with open(path, "r") as stream:
+            data = json.load(stream)
+        ref = Trade.__module__ + ":" + Trade.__qualname__
+        for module_name in (Trade.__module__, ApiObject.__module__):
+            data["classes"][ref]["stamps"][module_name][0] -= 1
+            with open(path, "w") as stream:
+                json.dump(data, stream)
+            assert_that(FieldMetadataCache(path).get_hints(Trade)).is_none()
+            data["classes"][ref]["stamps"][module_name][0] += 1
+
+        ## the cache file should be invalidated for a different package version
+        data["key"]["package"] = "0.0.0"
+        with open(path, "w") as stream:
+            json.dump(data, stream)
+        assert_that(FieldMetadataCache(path).get_hints(Trade)).is_none()
+
+        loaded.clear()
+        assert_that(loaded.get_hints(Trade)).is_none()
+        assert_that((tmp_path / "cache" / "field_metadata.json").exists()).is_false()
+
+    def test_cache_disabled(self):
+        ## the test session should not write the user's cache file
+        assert_that(os.environ.get(FIELD_METADATA_ENV)).is_equal_to("")
+        assert_that(field_metadata_cache.path).is_none()
+
+        cache = FieldMetadataCache(None)
+        cache.put_hints(Trade, Trade.get_field_hints())
+        assert_that(cache.get_hints(Trade)).is_equal_to(Trade.get_field_hints())
+        ## no cache file should be written
+        cache.save()
+        assert_that(cache.dirty).is_true()
+
+
+if __name__ == "__main__":
+    run_tests(__file__)
@@ -0,0 +1,129 @@
+"""Equivalence tests for the synchronous, async, and buffered ModelBuilder parse modes"""
+
+from assertpy import assert_that  # type: ignore[import-untyped]
+import json
+import os
+import pytest
+from typing_extensions import TypeVar
+
+from pyfx.dispatch.oanda.test import PytestTest, assert_recursive_eq, run_tests
+
+from pyfx.dispatch.oanda.parser import ModelBuilder, get_projection, parse_buffered
+from pyfx.dispatch.oanda.transport.data import ApiObject, JsonTypesRepository
+from pyfx.dispatch.oanda.models import (
+    ListAccounts200Response,
+    GetAccount200Response,
+    GetAccountSummary200Response,
+    GetAccountInstruments200Response,
+    GetInstrumentCandles200Response,
+    GetTransactionRange200Response,
+    ListOrders200Response,
+    ListTrades200Response
+)
+from pyfx.dispatch.oanda.models.get_instrument_candles200_response import GetAccountCandlesLatest200Response
+
+pytest_plugins = ('pytest_asyncio',)
+
+SAMPLES_DIR: str = os.path.abspath(os.path.join(os.path.dirname(__file__), "sample_data"))
+
+SAMPLE_CLASSES: tuple[type[ApiObject], ...] = (
+    ListAccounts200Response,
+    GetAccount200Response,
+    GetAccountSummary200Response,
+    GetAccountInstruments200Response,
+    GetInstrumentCandles200Response,
+    GetAccountCandlesLatest200Response,
+    GetTransactionRange200Response,
+    ListOrders200Response,
+    ListTrades200Response
+)
+
+T_model = TypeVar("T_model", bound=ApiObject)
+
+
+def read_sample(cls: type[ApiObject]) -> bytes:
+    with open(os.path.join(SAMPLES_DIR, cls.__name__ + ".json"), "rb") as stream:
+        return stream.read()
+
+
+def assert_json_eq(inst_a: ApiObject, inst_b: ApiObject):
+    ## field order in the JSON encoding may differ, per the set of model fields
+    assert_that(json.loads(inst_a.to_json_bytes())).is_equal_to(json.loads(inst_b.to_json_bytes()))
+
+
+class TestParseBenchmark(PytestTest):
+    """Equivalence tests for the parse modes"""
+
+    @pytest.fixture(autouse=True)
+    def finalize_types(self):
+        JsonTypesRepository.__finalize_instance__()
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("model_cls", SAMPLE_CLASSES)
+    async def test_parse_modes_equal(self, model_cls: type[T_model]):
+        """Test that the synchronous and async parse modes produce equivalent objects"""
+        data = read_sample(model_cls)
+        inst_sync = ModelBuilder.from_text(model_cls, data)
+        inst_async = await ModelBuilder.from_text_async(model_cls, data)
+        assert_that(isinstance(inst_sync, model_cls)).is_true()
+        assert_recursive_eq(inst_sync, inst_async)
+        assert_json_eq(inst_sync, inst_async)
+        inst_json = model_cls.from_json(data.decode())
+        assert_json_eq(inst_json, inst_async)
+
+    @pytest.mark.parametrize("model_cls", SAMPLE_CLASSES)
+    def test_parse_trusted(self, model_cls: type[T_model]):
+        """Test that construction without validation produces objects equivalent to the validated parse"""
+        data = read_sample(model_cls)
+        inst = ModelBuilder.from_text(model_cls, data)
+        inst_trusted = ModelBuilder.from_text(model_cls, data, trusted=True)
+        assert_that(inst_trusted.model_fields_set).is_equal_to(inst.model_fields_set)
+        assert_recursive_eq(inst, inst_trusted)
+        assert_json_eq(inst_trusted, inst)
+
+    @pytest.mark.parametrize("model_cls", SAMPLE_CLASSES)
+    def test_parse_buffered(self, model_cls: type[T_model]):
+        """Test that the buffered parse produces objects equivalent to the event-driven parse"""
+        data = read_sample(model_cls)
+        inst = ModelBuilder.from_text(model_cls, data)
+        inst_buffered = parse_buffered(model_cls, data)
+        assert_recursive_eq(inst, inst_buffered)
+        assert_json_eq(inst_buffered, inst)
+
+    def test_projection(self):
+        """Test normalization for field selections"""
+        assert_that(get_projection(None)).is_none()
+        assert_that(get_projection("account")).is_equal_to({"account": None})
+        assert_that(get_projection({"account": {"balance", "NAV"}, "lastTransactionID": True})).is_equal_to(
+            {"account": {"balance": None, "NAV": None}, "lastTransactionID": None}
+        )
+
+    @pytest.mark.parametrize("lazy", (False, True))
+    def test_parse_projected(self, lazy: bool):
+        """Test parsing with a field selection, for nested objects and sequence members"""
+        data = read_sample(GetAccount200Response)
+        expected = ModelBuilder.from_text(GetAccount200Response, data)
+        selection = {"account": {"balance": True, "NAV": True, "lastTransactionID": True, "positions": {"instrument"}}}
+        response = GetAccount200Response.from_json(data, lazy=lazy, fields=selection)
+        assert_that(response.model_fields_set).is_equal_to({"account"})
+        account = response.account
+        assert_that(account.balance).is_equal_to(expected.account.balance)
+        assert_that(account.nav).is_equal_to(expected.account.nav)
+        assert_that(account.last_transaction_id).is_equal_to(expected.account.last_transaction_id)
+        assert_that("trades" in account.model_fields_set).is_false()
+        positions = account.positions
+        assert_that(len(positions)).is_equal_to(len(expected.account.positions))
+        for position, expected_position in zip(positions, expected.account.positions):
+            assert_that(position.model_fields_set).is_equal_to({"instrument"})
+            assert_that(position.instrument).is_equal_to(expected_position.instrument)
+
+        ## the designator field should be parsed for abstract types
+        data = read_sample(ListOrders200Response)
+        expected_orders = ModelBuilder.from_text(ListOrders200Response, data).orders
+        orders = ListOrders200Response.from_json(data, lazy=lazy, fields={"orders": {"id"}}).orders
+        assert_that([o.__class__ for o in orders]).is_equal_to([o.__class__ for o in expected_orders])
+        assert_that([o.id for o in orders]).is_equal_to([o.id for o in expected_orders])
+
+
+if __name__ == "__main__":
+    run_tests(__file__)
@@ -1,15 +1,24 @@
 """Parser/Encoder Tests"""
 
 from assertpy import assert_that  # type: ignore[import-untyped]
+import asyncio as aio
+import copy
+import httpx
+import json
 import os
+import numpy as np
 import pandas as pd
 from pprint import pprint
 import pytest
+from types import SimpleNamespace
 from typing import TYPE_CHECKING
 from typing_extensions import TypeVar
 
-from pyfx.dispatch.oanda.test import PytestTest, run_tests
+from pyfx.dispatch.oanda.test import PytestTest, assert_recursive_eq, run_tests
 
+from pyfx.dispatch.oanda.api.request.get_account import GetAccountRequest
+from pyfx.dispatch.oanda.hosts import FxHostInfo
+from pyfx.dispatch.oanda.parser import ModelBuilder, SequenceBuilder, columnar_class_p, parse_lazy
 from pyfx.dispatch.oanda.util.paths import expand_path
 from pyfx.dispatch.oanda.transport.data import ApiObject, JsonTypesRepository
 from pyfx.dispatch.oanda.models import (
@@ -19,8 +28,12 @@ from pyfx.dispatch.oanda.models import (
     GetAccountInstruments200Response,
     GetInstrumentCandles200Response,
     GetTransactionRange200Response,
+    InstrumentsInstrumentOrderBookGet200Response,
+    InstrumentsInstrumentPositionBookGet200Response,
     ListOrders200Response,
-    ListTrades200Response
+    ListTrades200Response,
+    OrderBookBucket,
+    PositionBookBucket
 )
 
 from pyfx.dispatch.oanda.models.get_instrument_candles200_response import GetAccountCandlesLatest200Response
@@ -31,9 +44,31 @@ pytest_plugins = ('pytest_asyncio',)
 
 SAMPLES_DIR: str = os.path.abspath(os.path.join(os.path.dirname(__file__),  "sample_data"))
 
+SAMPLE_CLASSES: tuple[type[ApiObject], ...] = (
+    ListAccounts200Response,
+    GetAccount200Response,
+    GetAccountSummary200Response,
+    GetAccountInstruments200Response,
+    GetInstrumentCandles200Response,
+    GetAccountCandlesLatest200Response,
+    GetTransactionRange200Response,
+    ListOrders200Response,
+    ListTrades200Response
+)
+
 T_model = TypeVar("T_model", bound=ApiObject)
 
 
+def read_sample(cls: type[ApiObject]) -> bytes:
+    with open(os.path.join(SAMPLES_DIR, cls.__name__ + ".json"), "rb") as stream:
+        return stream.read()
+
+
+def assert_json_eq(inst_a: ApiObject, inst_b: ApiObject):
+    ## field order in the JSON encoding may differ, per the set of model fields
+    assert_that(json.loads(inst_a.to_json_bytes())).is_equal_to(json.loads(inst_b.to_json_bytes()))
+
+
 class TestParseUnparse(PytestTest):
     """Component Tests for parser and encoder frameworks"""
 
@@ -187,6 +222,133 @@ class TestParseUnparse(PytestTest):
         assert_that("granularity" in attrs).is_true()
         assert_that(attrs["granularity"]).is_equal_to(rslt.granularity)
 
+    @pytest.mark.parametrize("model_cls", SAMPLE_CLASSES)
+    def test_parse_lazy(self, model_cls: type[T_model]):
+        """Test that the lazy parse produces objects equivalent to the eager parse"""
+        data = read_sample(model_cls)
+        inst = ModelBuilder.from_text(model_cls, data)
+        inst_lazy = model_cls.from_json(data, lazy=True)
+        assert_that(isinstance(inst_lazy, model_cls)).is_true()
+        assert_that(inst_lazy.model_fields_set).is_equal_to(inst.model_fields_set)
+        assert_that(len(inst_lazy.lazy_fields)).is_not_zero()
+        assert_recursive_eq(inst, inst_lazy)
+        assert_that(inst_lazy.lazy_fields).is_empty()
+        assert_json_eq(parse_lazy(model_cls, data), inst)
+
+    def test_parse_lazy_nested(self):
+        """Test deferred field access for a nested object, in a lazily parsed response"""
+        data = read_sample(GetAccount200Response)
+        expected = ModelBuilder.from_text(GetAccount200Response, data).account
+        response = GetAccount200Response.from_json(data, lazy=True)
+        assert_that(response.lazy_fields).is_equal_to({"account"})
+        assert_that("account" in response.__dict__).is_false()
+        account = response.account
+        assert_that(response.lazy_fields).is_empty()
+        assert_that(response.account).is_same_as(account)
+        assert_that(account.lazy_fields).is_equal_to({"positions", "trades", "orders"})
+        assert_that(account.balance).is_equal_to(expected.balance)
+        assert_that(len(account.positions)).is_equal_to(len(expected.positions))
+        assert_that(account.lazy_fields).is_equal_to({"trades", "orders"})
+        ## a field value set before first access should not be replaced
+        account.trades = []
+        assert_that(account["trades"]).is_empty()
+        account.materialize()
+        assert_that(account.lazy_fields).is_empty()
+        assert_that(account.trades).is_empty()
+        assert_that(len(account.orders)).is_equal_to(len(expected.orders))
+
+    def test_parse_lazy_copy(self):
+        """Test that a copy of a lazily parsed object materializes deferred fields independently"""
+        data = read_sample(GetAccount200Response)
+        account = GetAccount200Response.from_json(data, lazy=True).account
+        account_copy = account.model_copy()
+        n_positions = len(account.positions)
+        assert_that(account.lazy_fields).is_equal_to({"trades", "orders"})
+        assert_that(account_copy.lazy_fields).is_equal_to({"positions", "trades", "orders"})
+        assert_that(len(account_copy.positions)).is_equal_to(n_positions)
+        assert_that(len(copy.copy(account).orders)).is_equal_to(len(account.orders))
+
+    def test_parse_lazy_dump(self):
+        """Test that model_dump() includes the deferred fields of a lazily parsed object"""
+        data = read_sample(GetAccount200Response)
+        expected = ModelBuilder.from_text(GetAccount200Response, data).model_dump()
+        response = GetAccount200Response.from_json(data, lazy=True)
+        dump = response.model_dump()
+        assert_that(dump).is_equal_to(expected)
+        assert_that(dump["account"]["positions"]).is_not_empty()
+
+    @pytest.mark.asyncio
+    async def test_parse_lazy_request(self):
+        """Test lazy response parsing for a GetAccountRequest"""
+        data = read_sample(GetAccount200Response)
+        expected = ModelBuilder.from_text(GetAccount200Response, data)
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            ## a response without a content length, as for a chunked response
+            return httpx.Response(200, headers={"content-type": "application/json"},
+                                  stream=httpx.ByteStream(data))
+
+        async def no_limit(request, priority):
+            pass
+
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            controller = SimpleNamespace(
+                rest_client=SimpleNamespace(client=client, await_rate_limit=no_limit),
+                main_loop=aio.get_running_loop(), add_task=aio.ensure_future,
+                present_exception=lambda *args: None, trusted_parse=False,
+                coalesce_requests=False, inflight_requests=dict(), response_cache=None)
+            request = GetAccountRequest.model_construct(
+                controller=controller, host=FxHostInfo.FXPRACTICE,
+                account_id=expected.account.id, lazy_response=True)
+            await aio.wait_for(request.dispatch_request(), 5)
+            response = request.future.result()
+        assert_that(response.lazy_fields).is_equal_to({"account"})
+        assert_recursive_eq(expected, response)
+
+    @pytest.mark.parametrize("model_cls", (InstrumentsInstrumentOrderBookGet200Response,
+                                           InstrumentsInstrumentPositionBookGet200Response))
+    @pytest.mark.parametrize("trusted", (False, True))
+    def test_parse_book_columns(self, model_cls: type[T_model], trusted: bool, monkeypatch):
+        """Test column parsing for the decimal fields of order book and position book buckets"""
+        assert_that(columnar_class_p(OrderBookBucket)).is_true()
+        assert_that(columnar_class_p(PositionBookBucket)).is_true()
+        data = read_sample(model_cls)
+        n_columns = []
+        set_columns = SequenceBuilder.set_columns
+
+        def spy_set_columns(builder: SequenceBuilder):
+            n_columns.append(len(builder.columns))
+            set_columns(builder)
+
+        monkeypatch.setattr(SequenceBuilder, "set_columns", spy_set_columns)
+        rslt = ModelBuilder.from_text(model_cls, data, trusted=trusted)
+        ## one conversion per decimal field, for all buckets in the book
+        assert_that(n_columns).is_equal_to([3])
+
+        book_key = next(iter(json.loads(data)))
+        expected = json.loads(data)[book_key]["buckets"]
+        book = getattr(rslt, model_cls.json_fields[book_key].name)
+        assert_that(book.buckets).is_length(len(expected))
+        for bucket, bucket_json in zip(book.buckets, expected):
+            assert_that(bucket.model_fields_set).is_equal_to({"price", "long_count_percent", "short_count_percent"})
+            assert_that(isinstance(bucket.price, np.double)).is_true()
+            assert_that(bucket.price).is_equal_to(np.double(bucket_json["price"]))
+            assert_that(bucket.long_count_percent).is_equal_to(np.double(bucket_json["longCountPercent"]))
+            assert_that(bucket.short_count_percent).is_equal_to(np.double(bucket_json["shortCountPercent"]))
+        assert_json_eq(model_cls.from_json(rslt.to_json_bytes()), rslt)
+
+    @pytest.mark.asyncio
+    async def test_parse_file_encoding(self, samples_dir, tmp_path):
+        """Test parsing from a file with a non-UTF-8 encoding"""
+        model_cls = ListAccounts200Response
+        expected = await self.run_builder_async(model_cls, samples_dir)
+        with open(expand_path(model_cls.__name__ + ".json", samples_dir), "rb") as stream:
+            data = stream.read().decode()
+        encoded_file = tmp_path / "accounts_utf16.json"
+        encoded_file.write_text(data, encoding="utf-16")
+        rslt = await model_cls.afrom_file(encoded_file, encoding="utf-16")
+        assert_that(self.json_bytes(rslt)).is_equal_to(self.json_bytes(expected))
+
 
 if __name__ == "__main__":
     os.environ["TEST_PRINT_OBJECTS"] = "Defined"
@@ -0,0 +1,108 @@
+"""Tests for client-side request rate limiting"""
+
+from assertpy import assert_that  # type: ignore[import-untyped]
+import asyncio as aio
+import pytest
+import threading
+import time
+
+from pyfx.dispatch.oanda.test import PytestTest, run_tests
+
+from pyfx.dispatch.oanda.api.rate_limit import HostRateLimit, RateLimiter, RequestPriority, TokenBucket
+
+pytest_plugins = ('pytest_asyncio',)
+
+
+class TestRateLimit(PytestTest):
+    """Tests for the token bucket rate limiter and priority lanes"""
+
+    def test_token_bucket(self):
+        bucket = TokenBucket.for_ceiling(100, 5)
+        assert_that(bucket.rate).is_equal_to(95)
+        assert_that(bucket.capacity).is_equal_to(5)
+        now = bucket.stamp
+        for _ in range(5):
+            assert_that(bucket.take(now)).is_equal_to(0)
+        assert_that(bucket.take(now)).is_close_to(1 / 95, 1e-9)
+        assert_that(bucket.take(now + 1 / 95)).is_equal_to(0)
+        ## the bucket should not fill beyond capacity
+        bucket.refill(now + 60)
+        assert_that(bucket.tokens).is_equal_to(5)
+
+    @pytest.mark.asyncio
+    async def test_ceiling(self):
+        """Test that no more than the rate ceiling of requests are released in any interval"""
+        limit = HostRateLimit("localhost", TokenBucket.for_ceiling(200, 5))
+        stamps = []
+
+        async def request():
+            await limit.acquire(RequestPriority.NORMAL)
+            stamps.append(time.monotonic())
+
+        await aio.wait_for(aio.gather(*(request() for _ in range(45))), 5)
+        ## 5 requests without delay, then 195 requests per second
+        elapsed = stamps[-1] - stamps[0]
+        assert_that(elapsed).is_greater_than_or_equal_to(40 / 195 * 0.95)
+        window = 0.1
+        for n, start in enumerate(stamps):
+            count = sum(1 for stamp in stamps[n:] if stamp - start <= window)
+            assert_that(count).is_less_than_or_equal_to(5 + int(195 * window) + 1)
+
+        stats = limit.stats[RequestPriority.NORMAL]
+        assert_that(stats.requests).is_equal_to(45)
+        assert_that(stats.delayed).is_equal_to(40)
+        assert_that(stats.max_wait).is_greater_than(0)
+        assert_that(limit.pump).is_none()
+
+    @pytest.mark.asyncio
+    async def test_priority_lanes(self):
+        """Test that waiting requests are released in priority order"""
+        limit = HostRateLimit("localhost", TokenBucket(50, 1))
+        await limit.acquire()
+        released = []
+
+        async def request(name: str, priority: RequestPriority):
+            await limit.acquire(priority)
+            released.append(name)
+
+        tasks = [aio.ensure_future(request("bulk %d" % n, RequestPriority.BULK)) for n in range(3)]
+        await aio.sleep(0)
+        tasks.append(aio.ensure_future(request("normal", RequestPriority.NORMAL)))
+        tasks.append(aio.ensure_future(request("high", RequestPriority.HIGH)))
+        await aio.sleep(0)
+        assert_that(limit.waiting()).is_equal_to(5)
+        assert_that(limit.waiting(RequestPriority.HIGH)).is_equal_to(1)
+
+        ## a cancelled request should not consume a token
+        cancelled = aio.ensure_future(request("cancelled", RequestPriority.HIGH))
+        await aio.sleep(0)
+        cancelled.cancel()
+
+        await aio.wait_for(aio.gather(*tasks), 5)
+        assert_that(released).is_equal_to(["high", "normal", "bulk 0", "bulk 1", "bulk 2"])
+        assert_that(limit.stats[RequestPriority.HIGH].requests).is_equal_to(1)
+
+    @pytest.mark.asyncio
+    async def test_thread_dispatch(self):
+        """Test rate limiting for a request from another event loop"""
+        limiter = RateLimiter(aio.get_running_loop(), 5, 1, {"stream.localhost": 10})
+        assert_that(limiter.get_host_limit("localhost").bucket.rate).is_equal_to(4)
+        assert_that(limiter.get_host_limit("stream.localhost").bucket.rate).is_equal_to(9)
+        waits = []
+
+        def run():
+            waits.append(aio.run(limiter.acquire("localhost", RequestPriority.HIGH)))
+
+        await limiter.acquire("localhost")
+        thread = threading.Thread(target=run)
+        thread.start()
+        while thread.is_alive():
+            await aio.sleep(0.005)
+        thread.join()
+        assert_that(waits).is_length(1)
+        assert_that(waits[0]).is_greater_than(0)
+        assert_that(limiter.wait_stats("localhost")[RequestPriority.HIGH].delayed).is_equal_to(1)
+
+
+if __name__ == "__main__":
+    run_tests(__file__)
@@ -0,0 +1,236 @@
+"""Tests for the conditional-request response cache"""
+
+from assertpy import assert_that  # type: ignore[import-untyped]
+import asyncio as aio
+import httpx
+import pytest
+import threading
+import time
+from types import SimpleNamespace
+
+from pyfx.dispatch.oanda.test import PytestTest, run_tests
+
+from pyfx.dispatch.oanda.api.response_cache import CachePolicy, ResponseCache
+from pyfx.dispatch.oanda.api.request.list_accounts import ListAcccountsRequest
+from pyfx.dispatch.oanda.hosts import FxHostInfo
+from pyfx.dispatch.oanda.models import ListAccounts200Response
+
+pytest_plugins = ('pytest_asyncio',)
+
+ACCOUNTS_JSON = b'{"accounts": [{"id": "101-001-1-001", "tags": []}]}'
+
+
+class TestResponseCache(PytestTest):
+    """Tests for response caching and revalidation"""
+
+    def test_cache_policy(self):
+        policy = CachePolicy.from_headers({}, 60)
+        assert_that(policy).is_equal_to(CachePolicy(True, 60, False))
+        policy = CachePolicy.from_headers({"cache-control": "private, max-age=30", "age": "10"}, 60)
+        assert_that(policy).is_equal_to(CachePolicy(True, 20, False))
+        policy = CachePolicy.from_headers({"cache-control": "max-age=30, must-revalidate"}, 60)
+        assert_that(policy.revalidate).is_true()
+        assert_that(CachePolicy.from_headers({"cache-control": "no-cache"}, 60)).is_equal_to(CachePolicy(True, 0, True))
+        assert_that(CachePolicy.from_headers({"cache-control": "no-store"}, 60).store).is_false()
+
+    def test_store(self, tmp_path):
+        cache = ResponseCache(tmp_path)
+        key = ResponseCache.request_key("GET", "https://localhost/v3/accounts", {"authorization": "Bearer 1234"})
+        assert_that(key).does_not_contain("1234")
+        assert_that(key).is_not_equal_to(ResponseCache.request_key("GET", "https://localhost/v3/accounts", {}))
+        response = ListAccounts200Response.model_validate_json(ACCOUNTS_JSON)
+        entry = cache.put(key, response, {"etag": '"v1"'}, 60)
+        assert_that(entry.fresh()).is_true()
+        assert_that(entry.validators()).is_equal_to({"If-None-Match": '"v1"'})
+
+        ## the entry should be available from the cache directory, in a new cache
+        loaded = ResponseCache(tmp_path).get(key, ListAccounts200Response)
+        assert_that(loaded.etag).is_equal_to('"v1"')
+        assert_that(bytes(loaded.response.write_json())).is_equal_to(bytes(response.write_json()))
+        assert_that(loaded.expires).is_equal_to(entry.expires)
+
+        assert_that(cache.put(key, response, {"cache-control": "no-store"}, 60)).is_none()
+        assert_that(ResponseCache(tmp_path).get(key, ListAccounts200Response)).is_none()
+
+    @pytest.mark.asyncio
+    async def test_revalidation(self, tmp_path):
+        """Test that a stale response is provided while revalidating in the background"""
+        sent = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            sent.append(request)
+            if request.headers.get("if-none-match") == '"v1"':
+                return httpx.Response(304, headers={"etag": '"v1"'})
+            return httpx.Response(200, headers={"etag": '"v1"', "content-type": "application/json"},
+                                  content=ACCOUNTS_JSON)
+
+        async def no_limit(request, priority):
+            pass
+
+        cache = ResponseCache(tmp_path)
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            controller = SimpleNamespace(
+                rest_client=SimpleNamespace(client=client, await_rate_limit=no_limit),
+                main_loop=aio.get_running_loop(), add_task=aio.ensure_future,
+                present_exception=lambda *args: None, trusted_parse=False,
+                coalesce_requests=False, inflight_requests=dict(),
+                response_cache=cache, config=SimpleNamespace(response_max_stale=3600))
+
+            async def dispatch() -> ListAccounts200Response:
+                request = ListAcccountsRequest.model_construct(controller=controller, host=FxHostInfo.FXPRACTICE)
+                await aio.wait_for(request.dispatch_request(), 5)
+                return request.future.result()
+
+            response = await dispatch()
+            assert_that(sent).is_length(1)
+            assert_that(response.accounts[0].id).is_equal_to("101-001-1-001")
+
+            ## a fresh response should not be requested
+            assert_that(await dispatch()).is_same_as(response)
+            assert_that(sent).is_length(1)
+
+            ## a stale response should be provided, then revalidated
+            entry = next(iter(cache.entries.values()))
+            entry.expires = time.time() - 1
+            assert_that(await dispatch()).is_same_as(response)
+            for _ in range(100):
+                if entry.fresh():
+                    break
+                await aio.sleep(0.01)
+            assert_that(sent).is_length(2)
+            assert_that(sent[1].headers.get("if-none-match")).is_equal_to('"v1"')
+            assert_that(entry.fresh()).is_true()
+            assert_that(entry.revalidating).is_false()
+
+            ## a response stale beyond the max-stale limit should be revalidated
+            ## before the future is set
+            entry.expires = time.time() - 7200
+            assert_that(await dispatch()).is_same_as(response)
+            assert_that(sent).is_length(3)
+            assert_that(entry.fresh()).is_true()
+
+
+    @pytest.mark.asyncio
+    async def test_coalesce_revalidation(self, tmp_path):
+        """Test that concurrent cache misses, and concurrent revalidations before the
+        future is set, share one HTTP request"""
+        sent = []
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            sent.append(request)
+            await aio.sleep(0.05)
+            if request.headers.get("if-none-match") == '"v1"':
+                return httpx.Response(304, headers={"etag": '"v1"', "cache-control": "must-revalidate"})
+            return httpx.Response(200, headers={"etag": '"v1"', "content-type": "application/json",
+                                                "cache-control": "must-revalidate"},
+                                  content=ACCOUNTS_JSON)
+
+        async def no_limit(request, priority):
+            pass
+
+        cache = ResponseCache(tmp_path)
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            controller = SimpleNamespace(
+                rest_client=SimpleNamespace(client=client, await_rate_limit=no_limit),
+                main_loop=aio.get_running_loop(), add_task=aio.ensure_future,
+                present_exception=lambda *args: None, trusted_parse=False,
+                coalesce_requests=True, inflight_requests=dict(),
+                response_cache=cache, config=SimpleNamespace(response_max_stale=3600))
+
+            async def dispatch() -> ListAccounts200Response:
+                request = ListAcccountsRequest.model_construct(controller=controller, host=FxHostInfo.FXPRACTICE)
+                await aio.wait_for(request.dispatch_request(), 5)
+                return await aio.wait_for(aio.wrap_future(request.future), 5)
+
+            responses = await aio.gather(dispatch(), dispatch(), dispatch())
+            assert_that(sent).is_length(1)
+            assert_that(responses[1]).is_same_as(responses[0])
+            assert_that(responses[2]).is_same_as(responses[0])
+            assert_that(controller.inflight_requests).is_empty()
+
+            ## a stale entry received with must-revalidate should be revalidated once
+            entry = next(iter(cache.entries.values()))
+            entry.expires = time.time() - 1
+            responses = await aio.gather(dispatch(), dispatch(), dispatch())
+            assert_that(sent).is_length(2)
+            assert_that(sent[1].headers.get("if-none-match")).is_equal_to('"v1"')
+            for response in responses:
+                assert_that(response).is_same_as(entry.response)
+            assert_that(controller.inflight_requests).is_empty()
+
+    @pytest.mark.asyncio
+    async def test_executor_io(self, tmp_path, monkeypatch):
+        """Test that cache files are read and written in the executor, not in the event loop thread"""
+        sent = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            sent.append(request)
+            if request.headers.get("if-none-match") == '"v1"':
+                return httpx.Response(304, headers={"etag": '"v1"'})
+            return httpx.Response(200, headers={"etag": '"v1"', "content-type": "application/json"},
+                                  content=ACCOUNTS_JSON)
+
+        async def no_limit(request, priority):
+            pass
+
+        io_threads = []
+        load, persist = ResponseCache.load, ResponseCache.persist
+
+        def load_spy(cache, *args):
+            io_threads.append(("load", threading.get_ident()))
+            return load(cache, *args)
+
+        def persist_spy(cache, *args):
+            io_threads.append(("persist", threading.get_ident()))
+            return persist(cache, *args)
+
+        monkeypatch.setattr(ResponseCache, "load", load_spy)
+        monkeypatch.setattr(ResponseCache, "persist", persist_spy)
+
+        async def await_io(n: int):
+            for _ in range(100):
+                if len(io_threads) >= n:
+                    break
+                await aio.sleep(0.01)
+
+        cache = ResponseCache(tmp_path)
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            controller = SimpleNamespace(
+                rest_client=SimpleNamespace(client=client, await_rate_limit=no_limit),
+                main_loop=aio.get_running_loop(), add_task=aio.ensure_future,
+                present_exception=lambda *args: None, trusted_parse=False,
+                coalesce_requests=False, inflight_requests=dict(),
+                response_cache=cache, config=SimpleNamespace(response_max_stale=0))
+
+            async def dispatch() -> ListAccounts200Response:
+                request = ListAcccountsRequest.model_construct(controller=controller, host=FxHostInfo.FXPRACTICE)
+                await aio.wait_for(request.dispatch_request(), 5)
+                return request.future.result()
+
+            ## a cache miss, with the response saved after dispatch
+            response = await dispatch()
+            await await_io(2)
+            assert_that([op for op, _ in io_threads]).is_equal_to(["load", "persist"])
+            key = next(iter(cache.entries))
+            assert_that(cache.entry_path(key).exists()).is_true()
+
+            ## a fresh entry, not loaded, then a fresh entry in memory
+            controller.response_cache = cache = ResponseCache(tmp_path)
+            assert_that(bytes((await dispatch()).write_json())).is_equal_to(bytes(response.write_json()))
+            assert_that(await dispatch()).is_same_as(cache.cached(key).response)
+            assert_that(sent).is_length(1)
+
+            ## a stale entry revalidated before the future is set
+            cache.cached(key).expires = time.time() - 1
+            await dispatch()
+            await await_io(4)
+            assert_that(sent).is_length(2)
+            assert_that([op for op, _ in io_threads]).is_equal_to(["load", "persist", "load", "persist"])
+            loop_thread = threading.get_ident()
+            for op, ident in io_threads:
+                assert_that(ident).described_as(op).is_not_equal_to(loop_thread)
+            assert_that(ResponseCache(tmp_path).get(key, ListAccounts200Response).fresh()).is_true()
+
+
+if __name__ == "__main__":
+    run_tests(__file__)
@@ -1,7 +1,9 @@
 ## unit tests for RESTClientObject
 
 from pyfx.dispatch.oanda.test import ComponentTest
-from pyfx.dispatch.oanda.rest import RESTClientObject, UTF8_RE_MATCH, CHARSET_RE_GROUP
+from pyfx.dispatch.oanda.rest import RESTClientObject, UTF8_RE_MATCH, CHARSET_RE_GROUP, with_request_body
+
+import httpx
 
 import unittest
 from assertpy import assert_that  # type: ignore[import-untyped]
@@ -27,6 +29,18 @@ class TestRESTClientObject(ComponentTest):
         assert_that(html_charset_match).is_not_none()
         assert_that(html_charset_match.group(1)).is_equal_to("ISO-88859-8-I")
 
+    def test_request_body(self):
+        '''test request body streams for RESTClientObject'''
+        buf = bytearray(b'{"order":{}}')
+        request = with_request_body(httpx.Request("POST", "https://localhost/orders"), buf)
+        assert_that(request.headers["Content-Length"]).is_equal_to(str(len(buf)))
+        assert_that(request.headers["Content-Type"]).is_equal_to("application/json")
+        chunks = list(request.stream)
+        assert_that(chunks).is_length(1)
+        ## the buffer should be sent without copying
+        assert_that(chunks[0].obj).is_same_as(buf)
+        assert_that(request.read()).is_equal_to(bytes(buf))
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,287 @@
+"""Tests for response processing in REST requests"""
+
+from assertpy import assert_that  # type: ignore[import-untyped]
+import asyncio as aio
+import httpx
+import json
+import os
+import pytest
+import threading
+import time
+from types import SimpleNamespace
+
+from pyfx.dispatch.oanda.test import PytestTest, run_tests
+
+from pyfx.dispatch.oanda.api.request.get_account import GetAccountRequest
+from pyfx.dispatch.oanda.api.request.get_account_summary import GetAccountSummaryRequest
+from pyfx.dispatch.oanda.api.request.list_trades import ListTradesRequest
+from pyfx.dispatch.oanda.api.request.get_instrument_candles import (
+    GetAccountInstrumentCandlesRequest, GetInstrumentCandlesRequest
+)
+from pyfx.dispatch.oanda.api.request_base import query_cache_key
+from pyfx.dispatch.oanda.configuration import FxHostInfo
+from pyfx.dispatch.oanda.exceptions import ApiException
+from pyfx.dispatch.oanda.transport.account_id import AccountId
+from pyfx.dispatch.oanda.models import CandlestickGranularity, CurrencyPair, GetAccount200Response
+from pyfx.dispatch.oanda.models.response_mixins import UnknownErrorResponse
+from pyfx.dispatch.oanda.parser import ModelBuilder
+
+pytest_plugins = ('pytest_asyncio',)
+
+SAMPLES_DIR: str = os.path.abspath(os.path.join(os.path.dirname(__file__), "sample_data"))
+
+
+def mock_response(status: int, content: bytes, content_type: str = "application/json",
+                  content_length: bool = True) -> tuple[httpx.Response, httpx.Request]:
+    request = httpx.Request("GET", "https://api-fxpractice.oanda.com/v3/accounts/test")
+    headers = {"content-type": content_type}
+    if content_length:
+        headers["content-length"] = str(len(content))
+    return httpx.Response(status, headers=headers, stream=httpx.ByteStream(content), request=request), request
+
+
+class TestRestRequest(PytestTest):
+    """Tests for the buffered response path in ApiRestRequest"""
+
+    @pytest.fixture
+    def account_json(self) -> bytes:
+        with open(os.path.join(SAMPLES_DIR, "GetAccount200Response.json"), "rb") as stream:
+            return stream.read()
+
+    def test_buffered_response_p(self, account_json: bytes):
+        """Test the content length limit for buffered responses"""
+        request = GetAccountRequest.model_construct()
+        response, _ = mock_response(200, account_json)
+        assert_that(request.buffered_response_p(response)).is_true()
+        response, _ = mock_response(200, account_json, content_length=False)
+        assert_that(request.buffered_response_p(response)).is_false()
+        response, _ = mock_response(200, b"")
+        assert_that(request.buffered_response_p(response)).is_false()
+        limit = GetAccountRequest.buffered_response_limit
+        response, _ = mock_response(200, b" " * (limit + 1))
+        assert_that(request.buffered_response_p(response)).is_false()
+
+    @pytest.mark.asyncio
+    async def test_buffered_response(self, account_json: bytes):
+        """Test processing for a buffered response, without a response stream"""
+        expected = ModelBuilder.from_text(GetAccount200Response, account_json)
+        request = GetAccountRequest.model_construct()
+        response, initial_request = mock_response(200, account_json)
+        await request.process_response(response, initial_request)
+        future = request.future
+        assert_that(future.done()).is_true()
+        result = future.result()
+        assert_that(isinstance(result, GetAccount200Response)).is_true()
+        assert_that(json.loads(result.to_json_bytes())).is_equal_to(json.loads(expected.to_json_bytes()))
+
+        ## test with a field selection for the response
+        request = GetAccountRequest.model_construct(response_fields={"account": {"balance"}})
+        response, initial_request = mock_response(200, account_json)
+        await request.process_response(response, initial_request)
+        account = request.future.result().account
+        assert_that(account.model_fields_set).is_equal_to({"balance"})
+        assert_that(account.balance).is_equal_to(expected.account.balance)
+
+    @pytest.mark.asyncio
+    async def test_buffered_unknown_response(self):
+        """Test processing for a buffered response not of any expected response type"""
+        request = GetAccountRequest.model_construct()
+        response, initial_request = mock_response(502, b"Bad Gateway", "text/html")
+        await request.process_response(response, initial_request)
+        exc = request.future.exception()
+        assert_that(isinstance(exc, ApiException)).is_true()
+        assert_that(exc.status).is_equal_to(502)
+        assert_that(isinstance(exc.body, UnknownErrorResponse)).is_true()
+        assert_that(exc.body.content).is_equal_to("Bad Gateway")
+
+    @pytest.mark.asyncio
+    async def test_linked_pages_order(self):
+        """Test that linked response pages are dispatched in link order, when processed out of order"""
+        request = ListTradesRequest.model_construct()
+        pages = request.linked_pages
+        url = "https://api-fxpractice.oanda.com/v3/accounts/test/trades"
+        page_requests = [httpx.Request("GET", url + "?page=%d" % n) for n in range(3)]
+        for n, page_request in enumerate(page_requests):
+            assert_that(pages.add_page(page_request)).is_equal_to(n)
+        assert_that(pages.add_page(page_requests[1])).is_equal_to(1)
+
+        ## the window for prefetching pages is relative to the next page to dispatch
+        window = request.linked_window
+        assert_that(await aio.wait_for(pages.await_window(page_requests[window - 1], window, request.future), 1)).is_true()
+        blocked = aio.ensure_future(pages.await_window(page_requests[2], 2, request.future))
+        await aio.sleep(0.01)
+        assert_that(blocked.done()).is_false()
+
+        page_responses = []
+        for n, page_request in enumerate(page_requests):
+            headers = {"link": "<%s?page=%d>; rel=\"next\"" % (url, n + 1)} if n < 2 else {}
+            page_responses.append(httpx.Response(200, headers=headers, request=page_request))
+        tasks = [aio.ensure_future(request.dispatch_response("page %d" % n, page_responses[n], page_requests[n]))
+                 for n in reversed(range(3))]
+        await aio.wait_for(aio.gather(*tasks), 1)
+        assert_that(blocked.done()).is_true()
+        assert_that(request.future.result()).is_equal_to("page 2")
+        queue = request.response_queue
+        assert_that([queue.get_nowait() for _ in range(queue.qsize())]).is_equal_to(["page 0", "page 1", "page 2"])
+        assert_that(pages.pages).is_empty()
+
+    @pytest.mark.asyncio
+    async def test_linked_page_error(self):
+        """Test that an error in requesting a linked page is set to the request future"""
+        url = "https://api-fxpractice.oanda.com/v3/accounts/test/trades"
+
+        def handler(page_request: httpx.Request):
+            raise httpx.ConnectError("Connection refused", request=page_request)
+
+        async def no_limit(*args):
+            pass
+
+        presented = []
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            controller = SimpleNamespace(rest_client=SimpleNamespace(client=client, await_rate_limit=no_limit),
+                                         main_loop=aio.get_running_loop(), add_task=aio.ensure_future,
+                                         present_exception=lambda *args: presented.append(args[1]))
+            request = ListTradesRequest.model_construct(controller=controller)
+            pages = request.linked_pages
+            page_requests = [httpx.Request("GET", url + "?page=%d" % n) for n in range(3)]
+            for page_request in page_requests:
+                pages.add_page(page_request)
+            blocked = aio.ensure_future(pages.await_window(page_requests[2], 1, request.future))
+
+            ## the linked page is released, and the request future receives the exception
+            await aio.wait_for(request.process_linked_page(page_requests[1]), 1)
+            exc = request.future.exception()
+            assert_that(isinstance(exc, httpx.ConnectError)).is_true()
+            assert_that(presented).is_equal_to([exc])
+            assert_that(pages.pages).does_not_contain_key(id(page_requests[1]))
+            assert_that(await aio.wait_for(blocked, 1)).is_false()
+
+    @pytest.mark.asyncio
+    async def test_aeach_response(self):
+        """Test response iteration, for responses appended from another thread"""
+        request = ListTradesRequest.model_construct()
+
+        def produce():
+            for n in range(5):
+                time.sleep(0.01)
+                request.append_response(n)
+            request.future.set_result(None)
+
+        thread = threading.Thread(target=produce)
+        thread.start()
+        received = [obj async for obj in request.aeach_response()]
+        thread.join()
+        assert_that(received).is_equal_to(list(range(5)))
+        assert_that(request.response_waiters).is_empty()
+
+    def test_path_template(self):
+        cls = GetAccountInstrumentCandlesRequest
+        template = cls.path_template
+        assert_that(template.segments).is_equal_to(("accounts/", "/instruments/", "/candles"))
+        assert_that([info.json_name for info in template.params]).is_equal_to(["accountID", "instrument"])
+        account_id = AccountId("101-001-1-001")
+        values = {"accountID": account_id, "instrument": "EUR_USD"}
+        expected = "/".join(cls.process_param_str(token, values) for token in cls.path_tokens)
+        assert_that(cls.fill_path_str(values)).is_equal_to(expected)
+        assert_that(GetAccountRequest.fill_path_str({"accountID": account_id})).is_equal_to("accounts/101-001-1-001")
+
+    def test_query_cache(self):
+        cls = GetAccountInstrumentCandlesRequest
+        cls.query_cache.clear()
+        values = {"granularity": CandlestickGranularity.H1, "count": 10}
+        query = cls.fill_query_str(values)
+        assert_that(query).is_equal_to("granularity=H1&count=10")
+        assert_that(cls.query_cache["granularity"]).is_length(1)
+        assert_that(cls.query_cache).does_not_contain_key("count")
+        assert_that(cls.fill_query_str(values)).is_equal_to(query)
+        assert_that(cls.query_cache["granularity"]).is_length(1)
+        ## each class provides a distinct cache
+        assert_that(ListTradesRequest.query_cache).is_not_same_as(cls.query_cache)
+
+        assert_that(query_cache_key(["EUR_USD", "USD_JPY"])).is_equal_to(("EUR_USD", "USD_JPY"))
+        assert_that(query_cache_key(CandlestickGranularity.H1)).is_same_as(CandlestickGranularity.H1)
+        assert_that(query_cache_key(1.5)).is_none()
+        assert_that(query_cache_key([["EUR_USD"]])).is_none()
+
+    @pytest.mark.asyncio
+    async def test_coalesce_requests(self):
+        """Test sharing one in-flight request among identical GET requests"""
+        async with httpx.AsyncClient() as client:
+            controller = SimpleNamespace(rest_client=SimpleNamespace(client=client),
+                                         coalesce_requests=True, inflight_requests=dict())
+            account_id = AccountId("101-001-1-001")
+
+            def make_request(**kw) -> GetAccountSummaryRequest:
+                return GetAccountSummaryRequest.model_construct(
+                    controller=controller, host=FxHostInfo.FXPRACTICE, account_id=account_id, **kw)
+
+            leader = make_request()
+            http_request = await leader.prepare_request()
+            key = leader.coalesce_key(http_request)
+            assert_that(leader.join_inflight(key)).is_none()
+            assert_that(controller.inflight_requests[key]).is_same_as(leader)
+
+            follower = make_request()
+            assert_that(follower.coalesce_key(await follower.prepare_request())).is_equal_to(key)
+            assert_that(follower.join_inflight(key)).is_same_as(leader)
+            ## a request with a field selection should not be coalesced
+            selective = make_request(response_fields={"account": {"balance"}})
+            assert_that(selective.coalesce_key(await selective.prepare_request())).is_none()
+            ## a request for a lazily parsed response should not share a response
+            ## parsed for a request without lazy parsing
+            lazy = make_request(lazy_response=True)
+            assert_that(lazy.coalesce_key(await lazy.prepare_request())).is_not_equal_to(key)
+
+            ## the follower should not send an HTTP request
+            dispatched = aio.ensure_future(follower.dispatch_request())
+            await aio.sleep(0.01)
+            assert_that(dispatched.done()).is_false()
+            response = object()
+            leader.future.set_result(response)
+            await aio.wait_for(dispatched, 1)
+            assert_that(follower.future.result()).is_same_as(response)
+            ## the completed request should be released
+            assert_that(controller.inflight_requests).is_empty()
+
+            ## exceptions should be shared with each follower
+            leader = make_request()
+            assert_that(leader.join_inflight(key)).is_none()
+            follower = make_request()
+            follower.follow_response(follower.join_inflight(key))
+            exc = ApiException(status=503, reason="Service Unavailable")
+            leader.future.set_exception(exc)
+            assert_that(follower.future.exception()).is_same_as(exc)
+            assert_that(controller.inflight_requests).is_empty()
+
+    @pytest.mark.asyncio
+    async def test_coalesce_columnar(self):
+        """Test that requests differing in the form of the response object are not coalesced"""
+        async with httpx.AsyncClient() as client:
+            controller = SimpleNamespace(rest_client=SimpleNamespace(client=client),
+                                         coalesce_requests=True, inflight_requests=dict())
+
+            async def key_for(**kw):
+                request = GetInstrumentCandlesRequest.model_construct(
+                    controller=controller, host=FxHostInfo.FXPRACTICE, instrument=CurrencyPair.get("EUR_USD"),
+                    granularity=CandlestickGranularity.M1, count=10, **kw)
+                return request.coalesce_key(await request.prepare_request())
+
+            key = await key_for()
+            assert_that(await key_for(columnar=False)).is_equal_to(key)
+            assert_that(await key_for(columnar=True)).is_not_equal_to(key)
+            assert_that(await key_for(use_cache=False)).is_not_equal_to(key)
+            assert_that(await key_for(columnar=True)).is_equal_to(await key_for(columnar=True))
+
+            leader = GetInstrumentCandlesRequest.model_construct(
+                controller=controller, host=FxHostInfo.FXPRACTICE, instrument=CurrencyPair.get("EUR_USD"),
+                granularity=CandlestickGranularity.M1, count=10)
+            assert_that(leader.join_inflight(key)).is_none()
+            columnar = GetInstrumentCandlesRequest.model_construct(
+                controller=controller, host=FxHostInfo.FXPRACTICE, instrument=CurrencyPair.get("EUR_USD"),
+                granularity=CandlestickGranularity.M1, count=10, columnar=True)
+            assert_that(columnar.join_inflight(await key_for(columnar=True))).is_none()
+            assert_that(controller.inflight_requests).is_length(2)
+
+
+if __name__ == "__main__":
+    run_tests(__file__)
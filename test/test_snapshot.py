@@ -0,0 +1,85 @@
+"""Tests for binary snapshots of ApiObject values"""
+
+from assertpy import assert_that  # type: ignore[import-untyped]
+import json
+import os
+import pandas as pd
+import pickle
+import pytest
+from zope.password.password import SHA1PasswordManager  # type: ignore[import-untyped]
+
+from pyfx.dispatch.oanda.test import PytestTest, assert_recursive_eq, run_tests
+
+from pyfx.dispatch.oanda.credential import shadow_encoder
+from pyfx.dispatch.oanda.benchmark import read_samples
+from pyfx.dispatch.oanda.models import ClientExtensions, GetAccount200Response, HomeConversions, ListTrades200Response
+from pyfx.dispatch.oanda.transport.snapshot import MAGIC, dumps, loads
+
+SAMPLES_DIR: str = os.path.abspath(os.path.join(os.path.dirname(__file__), "sample_data"))
+
+SAMPLES = list(read_samples(SAMPLES_DIR))
+
+
+class TestSnapshot(PytestTest):
+    """Tests for snapshot encoding and decoding"""
+
+    @pytest.fixture(autouse=True)
+    def shadow_credentials(self):
+        ## credentials are encoded as shadow values, as with pickle
+        shadow_encoder.set(SHA1PasswordManager())
+
+    @pytest.mark.parametrize("name,model_cls,data", SAMPLES, ids=[sample[0] for sample in SAMPLES])
+    def test_snapshot_samples(self, name, model_cls, data):
+        inst = model_cls.from_json(data)
+        snapshot = inst.to_snapshot()
+        assert_that(snapshot[:len(MAGIC)]).is_equal_to(MAGIC)
+        restored = model_cls.from_snapshot(snapshot)
+        assert_that(restored).is_instance_of(model_cls)
+        ## equivalent to the state restored from pickle
+        expected = pickle.loads(pickle.dumps(inst))
+        assert_recursive_eq(expected, restored)
+        assert_that(json.loads(restored.to_json_bytes())).is_equal_to(json.loads(expected.to_json_bytes()))
+
+    def test_snapshot_values(self):
+        data = next(data for name, _, data in SAMPLES if name == "ListTrades200Response")
+        trades = ListTrades200Response.from_json(data).trades
+        restored = loads(dumps(trades))
+        assert_that(restored).is_length(len(trades))
+        for trade, expected in zip(restored, trades):
+            assert_that(trade.model_fields_set).is_equal_to(expected.model_fields_set)
+            assert_that(trade.open_time).is_equal_to(expected.open_time)
+            assert_that(trade.price).is_equal_to(expected.price)
+            assert_that(trade.instrument).is_same_as(expected.instrument)
+
+        ## scalar values, timestamps, and immutable objects
+        values = [None, True, False, -1, 2 ** 70, 1.5, "", "é", pd.NaT,
+                  pd.Timestamp(1704112496123456789), pd.Timestamp(-1, tz="UTC")]
+        assert_that(loads(dumps(values))).is_equal_to(values)
+        conversions = HomeConversions.from_json(b'{"currency": "USD", "accountGain": "1.5"}')
+        assert_that(loads(dumps([conversions]))[0]).is_same_as(conversions)
+        ## a mutable object should be restored as a new object
+        ext = ClientExtensions.from_json(b'{"id": "snapshot-client", "tag": "a"}')
+        restored_ext = loads(dumps([ext]))[0]
+        assert_that(restored_ext).is_not_same_as(ext)
+        assert_that(restored_ext.to_json_bytes()).is_equal_to(ext.to_json_bytes())
+
+    def test_snapshot_lazy(self):
+        data = next(data for name, _, data in SAMPLES if name == "GetAccount200Response")
+        expected = GetAccount200Response.from_json(data)
+        lazy = GetAccount200Response.from_json(data, lazy=True)
+        restored = GetAccount200Response.from_snapshot(lazy.to_snapshot())
+        assert_that(restored.lazy_fields).is_empty()
+        assert_that(restored.account.balance).is_equal_to(expected.account.balance)
+        assert_that(len(restored.account.trades)).is_equal_to(len(expected.account.trades))
+
+    def test_snapshot_errors(self):
+        assert_that(loads).raises(ValueError).when_called_with(b"{}")
+        snapshot = dumps(None)
+        assert_that(loads).raises(ValueError).when_called_with(snapshot + b"\x00")
+        assert_that(loads).raises(ValueError).when_called_with(MAGIC + b"\xff\x00")
+        assert_that(ListTrades200Response.from_snapshot).raises(ValueError).when_called_with(snapshot)
+        assert_that(dumps).raises(ValueError).when_called_with({"a": 1})
+
+
+if __name__ == "__main__":
+    run_tests(__file__)
@@ -0,0 +1,105 @@
+"""Tests for timestamp parsing in v20 API datetime formats"""
+
+from assertpy import assert_that  # type: ignore[import-untyped]
+import numpy as np
+import pandas as pd
+
+from pyfx.dispatch.oanda.test import PytestTest, run_tests
+
+from pyfx.dispatch.oanda.models.common_types import Time
+from pyfx.dispatch.oanda.transport.timestamps import (
+    UTC, parse_datetime64, parse_datetime64_array, parse_epoch_ns, parse_epoch_ns_array, parse_rfc3339_ns, parse_unix_ns
+)
+
+RFC3339_SAMPLES = (
+    "2024-01-01T12:34:56.123456789Z",
+    "1970-01-01T00:00:00.000000000Z",
+    "1969-12-31T23:59:59.999999999Z",
+    "2024-02-29T00:00:00Z",
+    "2023-06-14T21:00:00.5Z",
+)
+
+
+class TestTimestamps(PytestTest):
+    """Tests for the RFC3339 and UNIX timestamp parsers"""
+
+    def test_parse_rfc3339(self):
+        for value in RFC3339_SAMPLES:
+            expected = pd.to_datetime(value, unit="ns")
+            assert_that(parse_rfc3339_ns(value)).is_equal_to(expected.value)
+            assert_that(parse_epoch_ns(value)).is_equal_to(expected.value)
+            assert_that(parse_datetime64(value)).is_equal_to(np.datetime64(expected.value, "ns"))
+            ts = Time.parse(value)
+            assert_that(ts).is_equal_to(expected)
+            assert_that(ts.tz).is_equal_to(UTC)
+        for value in ("2024-01-01T12:34:56+01:00", "2024-01-01 12:34:56Z", "2024-01-01T12:34:56.1234567890Z", "0"):
+            assert_that(parse_rfc3339_ns(value)).is_none()
+
+    def test_parse_rfc3339_timestamp(self):
+        """Test that the transport type's RFC3339 path is identical to the general ISO path"""
+        for value in RFC3339_SAMPLES:
+            expected = pd.to_datetime(value, unit="ns")
+            ts = Time.parse(value)
+            assert_that(ts).is_equal_to(expected)
+            assert_that(ts.value).is_equal_to(expected.value)
+            assert_that(ts.tz).is_equal_to(expected.tz)
+            assert_that(ts.unit).is_equal_to(expected.unit)
+            assert_that(ts.isoformat()).is_equal_to(expected.isoformat())
+
+    def test_parse_out_of_range(self):
+        """Test that values with a field out of range are parsed in the original path"""
+        invalid = ("2024-01-01T25:61:61Z", "2024-01-01T25:00:00Z", "2024-01-01T00:60:00Z",
+                   "2024-01-01T23:59:60Z", "2024-02-30T00:00:00Z", "2023-13-01T00:00:00Z")
+        for value in invalid:
+            assert_that(parse_rfc3339_ns(value)).is_none()
+            assert_that(parse_epoch_ns(value)).is_none()
+            assert_that(Time.parse(value) is pd.NaT).is_true()
+
+        values = [RFC3339_SAMPLES[0], *invalid]
+        parsed = Time.parse_batch(values)
+        assert_that(parsed[0]).is_equal_to(Time.parse(values[0]))
+        for ts in parsed[1:]:
+            assert_that(ts is pd.NaT).is_true()
+        assert_that(parse_epoch_ns_array).raises(ValueError).when_called_with(values)
+        arr = parse_epoch_ns_array(values, fallback=lambda v: -1)
+        assert_that(arr.tolist()).is_equal_to([parse_rfc3339_ns(values[0])] + [-1] * len(invalid))
+
+    def test_parse_unix(self):
+        assert_that(parse_unix_ns("1704112496.123456789")).is_equal_to(1704112496123456789)
+        assert_that(parse_unix_ns("1704112496")).is_equal_to(1704112496000000000)
+        assert_that(parse_unix_ns("1704112496.5")).is_equal_to(1704112496500000000)
+        assert_that(parse_unix_ns("-1.5")).is_none()
+        assert_that(parse_datetime64("not a timestamp")).is_none()
+        ts = Time.parse("1704112496.123456789")
+        assert_that(ts.value).is_equal_to(1704112496123456789)
+        assert_that(ts.tz).is_none()
+
+    def test_fallback(self):
+        ## values in other formats are parsed in the original path
+        value = "2024-01-01T12:34:56+01:00"
+        assert_that(Time.parse(value)).is_equal_to(pd.to_datetime(value))
+        assert_that(Time.parse("0") is pd.NaT).is_true()
+
+    def test_parse_array(self):
+        values = list(RFC3339_SAMPLES)
+        expected = [pd.to_datetime(v, unit="ns").value for v in values]
+        arr = parse_epoch_ns_array(values)
+        assert_that(arr.dtype).is_equal_to(np.dtype(np.int64))
+        assert_that(arr.tolist()).is_equal_to(expected)
+        dt_arr = parse_datetime64_array(values)
+        assert_that(dt_arr.dtype).is_equal_to(np.dtype("datetime64[ns]"))
+        assert_that(dt_arr.view(np.int64).tolist()).is_equal_to(expected)
+
+        ## mixed formats, with a fallback for unrecognized values
+        mixed = [values[0], "1704112496.5", "2024-01-01T12:34:56+01:00"]
+        assert_that(parse_epoch_ns_array).raises(ValueError).when_called_with(mixed)
+        arr = parse_epoch_ns_array(mixed, fallback=lambda v: Time.parse(v).value)
+        assert_that(arr.tolist()).is_equal_to([expected[0], 1704112496500000000, pd.to_datetime(mixed[2]).value])
+
+        ## batch parsing under the transport type
+        assert_that(Time.parse_batch(values)).is_equal_to([Time.parse(v) for v in values])
+        assert_that(Time.parse_batch(["0", "1704112496.5"])).is_equal_to([pd.NaT, pd.Timestamp(1704112496500000000)])
+
+
+if __name__ == "__main__":
+    run_tests(__file__)